@@ -0,0 +1,99 @@
+"""
+Compare the ffmpeg CPU cost of always re-encoding to MP3 with the format-aware plan.
+
+For every sample under ``tests/assets`` the script runs both strategies and reports the
+CPU seconds spent in ffmpeg/ffprobe child processes (user + system, from
+``getrusage(RUSAGE_CHILDREN)``) and the number of bytes that would be sent to Whisper.
+
+Usage::
+
+    uv run python benchmarks/bench_conversion.py [--repeat 5] [files ...]
+
+Requires ``ffmpeg`` and ``ffprobe`` on the PATH; without ffprobe MP4/Matroska files fall
+back to re-encoding, exactly as in production.
+"""
+
+import argparse
+import asyncio
+import resource
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from returns.pipeline import is_successful
+from returns.unsafe import unsafe_perform_io
+
+from transcribo_backend.services.audio_converter import (
+    ConversionAction,
+    convert_to_mp3,
+    extract_audio,
+    plan_conversion,
+)
+from transcribo_backend.utils.app_config import AppConfig
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "tests" / "assets"
+PASSTHROUGH = AppConfig.model_fields["passthrough_formats"].get_default(call_default_factory=True)
+
+
+def _child_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def _always_encode(path: Path) -> tuple[str, int]:
+    result = await convert_to_mp3(str(path))
+    if not is_successful(result):
+        raise RuntimeError(result.failure())
+    output = Path(unsafe_perform_io(result.unwrap()))
+    size = output.stat().st_size
+    output.unlink()
+    return "transcode", size
+
+
+async def _planned(path: Path) -> tuple[str, int]:
+    with open(path, "rb") as fh:
+        header = fh.read(1024)
+    plan = await plan_conversion(str(path), header, PASSTHROUGH)
+    if plan.action == ConversionAction.PASSTHROUGH:
+        return plan.action, path.stat().st_size
+    if plan.action == ConversionAction.REMUX and plan.audio_codec is not None:
+        result = await extract_audio(str(path), plan.audio_codec)
+    else:
+        result = await convert_to_mp3(str(path))
+    if not is_successful(result):
+        raise RuntimeError(result.failure())
+    output = Path(unsafe_perform_io(result.unwrap()))
+    size = output.stat().st_size
+    output.unlink()
+    return plan.action, size
+
+
+async def _measure(strategy: Callable[[Path], Awaitable[tuple[str, int]]], path: Path, repeat: int):
+    before = _child_cpu_seconds()
+    for _ in range(repeat):
+        action, size = await strategy(path)
+    return action, size, (_child_cpu_seconds() - before) / repeat
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path, help="Input files (default: tests/assets/*)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per file and strategy")
+    args = parser.parse_args()
+    files = args.files or sorted(ASSETS_DIR.iterdir())
+
+    print(f"{'file':<18} {'encode cpu s':>12} {'encode bytes':>13} {'plan':>11} {'plan cpu s':>10} {'plan bytes':>11}")
+    total_encode = total_planned = 0.0
+    for path in files:
+        _, encode_size, encode_cpu = await _measure(_always_encode, path, args.repeat)
+        action, planned_size, planned_cpu = await _measure(_planned, path, args.repeat)
+        total_encode += encode_cpu
+        total_planned += planned_cpu
+        print(
+            f"{path.name:<18} {encode_cpu:>12.3f} {encode_size:>13} {action:>11} {planned_cpu:>10.3f} {planned_size:>11}"
+        )
+    saved = 1 - total_planned / total_encode if total_encode else 0.0
+    print(f"{'total':<18} {total_encode:>12.3f} {'':>13} {'':>11} {total_planned:>10.3f}   ({saved:.0%} less CPU)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
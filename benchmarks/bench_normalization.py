@@ -0,0 +1,110 @@
+"""
+Compare the normalization targets (MP3, Opus, FLAC, WAV) uploads can be re-encoded to.
+
+For every sample under ``tests/assets`` and every target the script reports the wall
+time and ffmpeg CPU seconds of the encode (user + system, from
+``getrusage(RUSAGE_CHILDREN)``), the output size, and the time it takes to send that
+output to Whisper. The upload time is computed from the size at ``--link-mbps``; with
+``--upload-url`` each output is additionally POSTed there and the measured time is shown.
+
+Usage::
+
+    uv run python benchmarks/bench_normalization.py [--repeat 5] [--link-mbps 100] [--upload-url URL] [files ...]
+
+Requires ``ffmpeg`` on the PATH.
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+from pathlib import Path
+
+import httpx
+from returns.pipeline import is_successful
+from returns.unsafe import unsafe_perform_io
+
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.services.audio_converter import normalize_audio, normalized_format
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "tests" / "assets"
+
+
+def _child_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def _encode(path: Path, target: NormalizationTarget) -> Path:
+    result = await normalize_audio(str(path), target)
+    if not is_successful(result):
+        raise RuntimeError(result.failure())
+    return Path(unsafe_perform_io(result.unwrap()))
+
+
+async def _upload_seconds(client: httpx.AsyncClient, url: str, output: Path, target: NormalizationTarget) -> float:
+    fmt = normalized_format(target)
+    start = time.perf_counter()
+    with open(output, "rb") as fh:
+        response = await client.post(url, files={"file": (fmt.filename, fh, fmt.content_type)})
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def _measure(path: Path, target: NormalizationTarget, repeat: int, client: httpx.AsyncClient | None, url: str):
+    wall = cpu = upload = 0.0
+    size = 0
+    for _ in range(repeat):
+        cpu_before = _child_cpu_seconds()
+        wall_before = time.perf_counter()
+        output = await _encode(path, target)
+        wall += time.perf_counter() - wall_before
+        cpu += _child_cpu_seconds() - cpu_before
+        try:
+            size = output.stat().st_size
+            if client is not None:
+                upload += await _upload_seconds(client, url, output, target)
+        finally:
+            output.unlink()
+    return wall / repeat, cpu / repeat, size, upload / repeat if client is not None else None
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path, help="Input files (default: tests/assets/*)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per file and target")
+    parser.add_argument("--link-mbps", type=float, default=100.0, help="Bandwidth to Whisper for the upload estimate")
+    parser.add_argument("--upload-url", default="", help="Also POST every output here and time it")
+    args = parser.parse_args()
+    files = args.files or sorted(ASSETS_DIR.iterdir())
+    client = httpx.AsyncClient(timeout=300.0) if args.upload_url else None
+
+    print(
+        f"{'file':<18} {'target':>6} {'wall s':>8} {'cpu s':>8} {'bytes':>9} {'upload s':>9}"
+        + (f" {'measured s':>10}" if client else "")
+    )
+    totals: dict[NormalizationTarget, list[float]] = {target: [0.0, 0.0, 0.0, 0.0] for target in NormalizationTarget}
+    try:
+        for path in files:
+            for target in NormalizationTarget:
+                wall, cpu, size, measured = await _measure(path, target, args.repeat, client, args.upload_url)
+                estimated = size * 8 / (args.link_mbps * 1_000_000)
+                for index, value in enumerate((wall, cpu, size, estimated)):
+                    totals[target][index] += value
+                line = f"{path.name:<18} {target:>6} {wall:>8.3f} {cpu:>8.3f} {size:>9} {estimated:>9.4f}"
+                print(line + (f" {measured:>10.4f}" if measured is not None else ""))
+    finally:
+        if client is not None:
+            await client.aclose()
+
+    print()
+    for target, (wall, cpu, size, estimated) in totals.items():
+        total = wall + estimated
+        print(
+            f"{'total':<18} {target:>6} {wall:>8.3f} {cpu:>8.3f} {int(size):>9} {estimated:>9.4f}"
+            f"   (encode + upload {total:.3f}s)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
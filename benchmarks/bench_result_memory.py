@@ -0,0 +1,151 @@
+"""
+Measure the peak memory of serving a very large transcription result.
+
+Whisper is simulated with an ``httpx.MockTransport`` that generates a result of
+``--segments`` segments (50,000 by default, about a full day of speech) on the fly and
+sends it in 64 KiB pieces, so the payload itself never sits in the benchmark's memory.
+
+Two paths are compared:
+
+* ``buffered``: ``transcribe_get_task_result`` parses the whole response, cleans the
+  model, and the JSON is rendered at once, as FastAPI does for a returned model
+* ``streamed``: ``transcribe_stream_task_result`` parses, cleans and re-encodes one
+  segment at a time, as ``GET /task/{task_id}/result`` does
+
+For each path the script prints the peak of Python allocations (``tracemalloc``) while
+the result is produced and consumed, next to the size of the payload. Both paths also
+keep the compressed result for the result cache.
+
+Usage::
+
+    uv run python benchmarks/bench_result_memory.py [--segments 50000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import cast
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.services.task_store import TaskRecord
+from transcribo_backend.services.whisper_service import WhisperService
+from transcribo_backend.utils.app_config import AppConfig
+
+_PIECE_BYTES = 64 * 1024
+
+
+def _segment(index: int) -> bytes:
+    segment = {
+        "start": index * 1.7,
+        "end": index * 1.7 + 1.6,
+        "text": f" Und dann haben wir über den Punkt {index} der Traktandenliste gesprochen. ",
+        "speaker": f"speaker_{index % 4:02d}",
+    }
+    return json.dumps(segment, ensure_ascii=False).encode()
+
+
+async def _result_body(segments: int) -> AsyncIterator[bytes]:
+    piece = bytearray(b'{"segments":[')
+    for index in range(segments):
+        piece += (b"," if index else b"") + _segment(index)
+        if len(piece) >= _PIECE_BYTES:
+            yield bytes(piece)
+            piece.clear()
+    piece += b"]}"
+    yield bytes(piece)
+
+
+def _payload_bytes(segments: int) -> int:
+    return len(b'{"segments":[]}') + sum(len(_segment(index)) for index in range(segments)) + segments - 1
+
+
+def _make_service(segments: int) -> WhisperService:
+    cfg = SimpleNamespace(
+        whisper_url="http://whisper.bench",
+        llm_api_key="bench",
+        max_upload_bytes=0,
+        streaming_transcode=False,
+        memory_spool_bytes=0,
+        dedup_index_size=1024,
+        ffmpeg_slots=1,
+        ffmpeg_queue_size=0,
+        passthrough_formats=[],
+        normalization_target=NormalizationTarget.MP3,
+        chunk_minutes=10,
+        chunk_overlap_seconds=4,
+        realtime_factor=0.2,
+        task_store_path="",
+        task_ttl_seconds=3600,
+        status_cache_seconds=0.5,
+        event_poll_seconds=1.0,
+        batch_status_concurrency=8,
+        result_cache_bytes=64 * 1024 * 1024,
+        result_cache_dir="",
+        result_cache_disk_bytes=0,
+        segment_replacements={},
+        segment_filler_words=[],
+        whisper_backend_urls=[],
+        whisper_backend_cooldown_seconds=30.0,
+        whisper_retry_attempts=3,
+        whisper_retry_backoff_seconds=0.5,
+        whisper_breaker_failures=3,
+        whisper_hedge_seconds=0.0,
+    )
+    service = WhisperService(cast(AppConfig, cfg))
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_result_body(segments))
+
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    service.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    return service
+
+
+async def _buffered(service: WhisperService) -> int:
+    result = await service.transcribe_get_task_result("task-1")
+    transcription = result.unwrap()._inner_value
+    return len(json.dumps(jsonable_encoder(transcription)).encode())
+
+
+async def _streamed(service: WhisperService) -> int:
+    result = await service.transcribe_stream_task_result("task-1")
+    return sum([len(chunk) async for chunk in result.unwrap()._inner_value])
+
+
+async def _measure(mode: str, segments: int) -> tuple[int, int, float]:
+    service = _make_service(segments)
+    tracemalloc.start()
+    start = time.perf_counter()
+    sent = await (_buffered(service) if mode == "buffered" else _streamed(service))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await service.aclose()
+    return sent, peak, elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=50_000, help="Segments of the largest synthetic result")
+    args = parser.parse_args()
+
+    print(f"{'segments':>9} {'payload MiB':>12} {'mode':<9} {'peak MiB':>9} {'x payload':>10} {'seconds':>8}")
+    for segments in (args.segments // 10, args.segments):
+        payload = _payload_bytes(segments)
+        for mode in ("buffered", "streamed"):
+            _, peak, elapsed = await _measure(mode, segments)
+            print(
+                f"{segments:>9} {payload / 2**20:>12.1f} {mode:<9} {peak / 2**20:>9.1f}"
+                f" {peak / payload:>10.2f} {elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
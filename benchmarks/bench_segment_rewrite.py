@@ -0,0 +1,113 @@
+"""
+Compare the segment cleanup loop with the single-pass rewrite rules.
+
+For 10,000 and 100,000 synthetic segments the script times turning the raw segments of a
+Whisper result into a cleaned ``TranscriptionResponse``:
+
+* ``loop``: build the models, then clean them one attribute assignment at a time, as
+  ``transcribe_get_task_result`` used to; configured rules cost one ``re.sub`` each
+* ``rewriter``: ``SegmentRewriter.rewrite`` cleans the raw segments of the whole batch
+  with one combined regex, then the models are built
+
+Both run once with the built-in cleanup only and once with ``--rules`` site-specific
+replacements plus a handful of filler words.
+
+Usage::
+
+    uv run python benchmarks/bench_segment_rewrite.py [--rules 40] [--repeat 3]
+"""
+
+import argparse
+import copy
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+from transcribo_backend.models.transcription_response import TranscriptionResponse
+from transcribo_backend.services.segment_rewriter import SegmentRewriter
+
+_FILLER_WORDS = ["äh", "ähm", "öh", "hm", "halt", "quasi"]
+_SENTENCE = "Der Grossrat hat äh die Vorlage vom Regierungsrat quasi mit grosser Mehrheit an die Kommission überwiesen"
+_WORDS = _SENTENCE.split(" ")
+
+
+def _replacements(count: int) -> dict[str, str]:
+    rules = {f"Amt{index}": f"Amt für Dienstleistung {index}" for index in range(count - 2)}
+    rules.update({"Grossrat": "Grosser Rat", "Regierungsrat": "Regierungsrat Basel-Stadt"})
+    return rules
+
+
+def _segments(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "start": index * 2.0,
+            "end": index * 2.0 + 1.8,
+            "text": f"  {' '.join(_WORDS[index % 5 :])} Straße {index} ",
+            "speaker": f"speaker_{index % 3:02d}",
+        }
+        for index in range(count)
+    ]
+
+
+def _loop(segments: list[dict[str, Any]], replacements: dict[str, str], fillers: list[str]) -> TranscriptionResponse:
+    rules = [(re.compile(rf"(?<!\w){re.escape(key)}(?!\w)"), value) for key, value in replacements.items()]
+    rules += [(re.compile(rf"(?i)(?<!\w){re.escape(word)}(?!\w)[,;]?\s*"), "") for word in fillers]
+    transcription = TranscriptionResponse(segments=segments)
+    for segment in transcription.segments:
+        segment.text = segment.text.strip()
+        segment.text = segment.text.replace("ß", "ss")
+        for pattern, value in rules:
+            segment.text = pattern.sub(value, segment.text)
+        segment.text = segment.text.strip()
+        segment.speaker = segment.speaker or "Unknown"
+        segment.speaker = segment.speaker.strip().capitalize()
+    return transcription
+
+
+def _rewriter(
+    segments: list[dict[str, Any]], replacements: dict[str, str], fillers: list[str]
+) -> TranscriptionResponse:
+    return TranscriptionResponse(segments=SegmentRewriter(replacements, fillers).rewrite(segments))
+
+
+def _best_of(
+    repeat: int,
+    run: Callable[[list[dict[str, Any]], dict[str, str], list[str]], TranscriptionResponse],
+    segments: list[dict[str, Any]],
+    replacements: dict[str, str],
+    fillers: list[str],
+) -> tuple[float, TranscriptionResponse]:
+    best = float("inf")
+    result = TranscriptionResponse(segments=[])
+    for _ in range(repeat):
+        batch = copy.deepcopy(segments)
+        start = time.perf_counter()
+        result = run(batch, replacements, fillers)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, default=40, help="Number of configured replacements")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest counts")
+    args = parser.parse_args()
+
+    print(f"{'segments':>9} {'rules':>6} {'loop ms':>9} {'rewriter ms':>12} {'speedup':>8}")
+    for count in (10_000, 100_000):
+        segments = _segments(count)
+        for replacements, fillers in (({}, []), (_replacements(args.rules), _FILLER_WORDS)):
+            loop_seconds, expected = _best_of(args.repeat, _loop, segments, replacements, fillers)
+            rewriter_seconds, actual = _best_of(args.repeat, _rewriter, segments, replacements, fillers)
+            if actual != expected:
+                print("The rewriter and the loop disagree")
+                raise SystemExit(1)
+            print(
+                f"{count:>9} {len(replacements) + len(fillers):>6} {loop_seconds * 1000:>9.1f}"
+                f" {rewriter_seconds * 1000:>12.1f} {loop_seconds / rewriter_seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
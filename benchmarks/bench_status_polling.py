@@ -0,0 +1,146 @@
+"""
+Measure what many clients polling task statuses cost the Whisper API.
+
+``--clients`` pollers (500 by default) each watch one of ``--tasks`` tasks and ask for its
+status every ``--interval`` seconds, like browser tabs do. Whisper is simulated with an
+``httpx.MockTransport`` that answers after ``--upstream-latency-ms`` and serves at most
+``--upstream-concurrency`` requests at once, so surplus requests queue up as they would
+on a busy backend.
+
+Three modes are compared:
+
+* ``direct``: every poll fetches status and progress itself (no coalescing)
+* ``coalesced``: concurrent polls of a task share one fetch (``STATUS_CACHE_SECONDS=0``)
+* ``cached``: coalesced, and the result is served for ``--cache-seconds``
+
+For each mode the script prints the number of upstream requests and the p50/p99 latency
+of a status poll.
+
+Usage::
+
+    uv run python benchmarks/bench_status_polling.py [--clients 500] [--tasks 10] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import cast
+
+import httpx
+
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.services.task_store import TaskRecord
+from transcribo_backend.services.whisper_service import WhisperService
+from transcribo_backend.utils.app_config import AppConfig
+
+
+class _FakeWhisper:
+    """Answers status and progress requests after a fixed latency, with bounded concurrency."""
+
+    def __init__(self, latency: float, concurrency: int) -> None:
+        self.latency = latency
+        self.requests = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        async with self._semaphore:
+            await asyncio.sleep(self.latency)
+        if request.url.path.endswith("/status"):
+            task_id = request.url.params["task_id"]
+            return httpx.Response(200, json={"task_id": task_id, "status": "in_progress"})
+        return httpx.Response(200, json={"progress": 0.5, "currentTime": 30.0, "duration": 60.0})
+
+
+def _make_service(cache_seconds: float, whisper: _FakeWhisper, tasks: int) -> WhisperService:
+    cfg = SimpleNamespace(
+        whisper_url="http://whisper.bench",
+        llm_api_key="bench",
+        max_upload_bytes=0,
+        streaming_transcode=False,
+        memory_spool_bytes=0,
+        dedup_index_size=1024,
+        ffmpeg_slots=1,
+        ffmpeg_queue_size=0,
+        passthrough_formats=[],
+        normalization_target=NormalizationTarget.MP3,
+        chunk_minutes=10,
+        chunk_overlap_seconds=4,
+        realtime_factor=0.2,
+        task_store_path="",
+        task_ttl_seconds=3600,
+        status_cache_seconds=cache_seconds,
+        event_poll_seconds=1.0,
+        batch_status_concurrency=8,
+        result_cache_bytes=64 * 1024 * 1024,
+        result_cache_dir="",
+        result_cache_disk_bytes=0,
+        segment_replacements={},
+        segment_filler_words=[],
+        whisper_backend_urls=[],
+        whisper_backend_cooldown_seconds=30.0,
+        whisper_retry_attempts=3,
+        whisper_retry_backoff_seconds=0.5,
+        whisper_breaker_failures=3,
+        whisper_hedge_seconds=0.0,
+    )
+    service = WhisperService(cast(AppConfig, cfg))
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(whisper.handle))
+    for index in range(tasks):
+        service.task_store.put(TaskRecord(task_id=f"task-{index}", progress_id=f"progress-{index}"))
+    return service
+
+
+async def _run(mode: str, args: argparse.Namespace) -> tuple[int, list[float]]:
+    whisper = _FakeWhisper(args.upstream_latency_ms / 1000, args.upstream_concurrency)
+    service = _make_service(args.cache_seconds if mode == "cached" else 0.0, whisper, args.tasks)
+    latencies: list[float] = []
+    deadline = time.perf_counter() + args.seconds
+
+    async def _poller(task_id: str) -> None:
+        # Pollers start at random points of the interval, like independently opened tabs.
+        await asyncio.sleep(random.uniform(0, args.interval))  # noqa: S311
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if mode == "direct":
+                await service._get_task_status(task_id)
+            else:
+                await service.transcribe_get_task_status(task_id)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(args.interval)
+
+    await asyncio.gather(*(_poller(f"task-{index % args.tasks}") for index in range(args.clients)))
+    await service.aclose()
+    return whisper.requests, latencies
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500, help="Number of polling clients")
+    parser.add_argument("--tasks", type=int, default=10, help="Number of distinct tasks being watched")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between the polls of a client")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of each run")
+    parser.add_argument("--cache-seconds", type=float, default=0.5, help="Status cache TTL of the cached mode")
+    parser.add_argument("--upstream-latency-ms", type=float, default=20.0, help="Latency of one Whisper request")
+    parser.add_argument("--upstream-concurrency", type=int, default=8, help="Requests Whisper serves at once")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'polls':>7} {'upstream':>9} {'per poll':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode in ("direct", "coalesced", "cached"):
+        requests, latencies = await _run(mode, args)
+        print(
+            f"{mode:<10} {len(latencies):>7} {requests:>9} {requests / max(1, len(latencies)):>9.3f}"
+            f" {statistics.median(latencies) * 1000:>8.1f} {_percentile(latencies, 0.99) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
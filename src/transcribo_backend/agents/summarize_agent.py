@@ -1,13 +1,19 @@
+from collections.abc import AsyncIterator
 from typing import override
 
 from dcc_backend_common.config.app_config import LlmConfig
 from dcc_backend_common.llm_agent import BaseAgent
+from dcc_backend_common.llm_agent.postprocessing import PostprocessingContext, replace_eszett
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models import Model
 
 from transcribo_backend.models.language import get_language_name
 from transcribo_backend.models.summary import SummaryDeps, SummaryType
 
+# Version of the instructions below; bump it whenever they change, so summaries cached
+# from the old instructions are no longer served.
+PROMPT_VERSION = "3"
+
 # Instruction prompts for different summary types
 VERHANDLUNGSPROTOKOLL_INSTRUCTIONS = """
 Du bist ein Experte für Verhandlungsprotokolle.
@@ -49,6 +55,23 @@ Verwende Markdown zur Formatierung mit klaren Abschnitten für Ergebnisse und Ma
 Verwende die gleiche Sprache wie im Transkript. Wenn du unsicher bist, verwende Deutsch.
 """
 
+PART_INSTRUCTIONS = """
+Du bist ein Experte für Besprechungsprotokolle.
+Die Besprechung ist zu lang, um sie auf einmal zu bearbeiten. Du erhältst Abschnitt {part} von {parts},
+entweder einen Teil des Transkripts oder die Notizen zu mehreren aufeinanderfolgenden Teilen.
+Erstelle daraus ausführliche Notizen, aus denen später das Protokoll der ganzen Besprechung erstellt wird.
+Halte in der Reihenfolge des Gesprächs fest: die Namen der Sprecher, die besprochenen Themen,
+die wichtigsten Argumente mit ihren Urhebern, alle Ergebnisse und Beschlüsse sowie alle Maßnahmen mit Verantwortlichen.
+Lass nichts weg, das für ein Protokoll von Bedeutung sein könnte, und erfinde nichts dazu.
+Verwende Markdown und die gleiche Sprache wie im Abschnitt.
+"""
+
+NOTES_INSTRUCTIONS = """
+Du erhältst nicht das Transkript selbst, sondern Notizen zu allen aufeinanderfolgenden Abschnitten der Besprechung,
+in der Reihenfolge des Gesprächs. Fasse sie zu einem einzigen Protokoll der ganzen Besprechung zusammen
+und führe Themen, Teilnehmer und Maßnahmen, die in mehreren Abschnitten vorkommen, zusammen.
+"""
+
 DEFAULT_INSTRUCTIONS = """
 You are a meeting summary expert.
 You are given a transcript of a meeting and you need to summarize it.
@@ -65,6 +88,24 @@ class SummarizeAgent(BaseAgent[SummaryDeps, str]):
     def __init__(self, config: LlmConfig):
         super().__init__(config, deps_type=SummaryDeps, output_type=str, enable_thinking=False)
 
+    async def stream_summary(self, user_prompt: str, deps: SummaryDeps) -> AsyncIterator[str]:
+        """
+        Stream the summary as markdown deltas, post-processed so they add up to what ``run`` returns.
+
+        The text streams of ``BaseAgent`` trim every delta like a whole output, which would
+        drop the spaces between words; here only the leading blank lines of the summary
+        are dropped and "ß" is replaced in every delta.
+        """
+        prompt = self.process_prompt(user_prompt, deps)
+        started = False
+        async with self._agent.run_stream(user_prompt=prompt, deps=deps) as result:
+            async for delta in result.stream_text(delta=True):
+                if not started:
+                    delta = delta.lstrip()
+                    started = bool(delta)
+                if delta:
+                    yield replace_eszett(delta, PostprocessingContext(is_parial=True, index=0))
+
     @override
     def create_agent(self, model: Model) -> Agent[SummaryDeps, str]:
         agent = Agent(model=model, deps_type=self.deps_type, output_type=self.output_type)
@@ -75,6 +116,10 @@ class SummarizeAgent(BaseAgent[SummaryDeps, str]):
             summary_type = deps.summary_type
             language = deps.language
 
+            if deps.part is not None:
+                # Notes on one part of a long transcript; the language is only applied to the final protocol.
+                return PART_INSTRUCTIONS.format(part=deps.part, parts=deps.parts)
+
             instructions_map = {
                 SummaryType.VERHANDLUNGSPROTOKOLL: VERHANDLUNGSPROTOKOLL_INSTRUCTIONS,
                 SummaryType.KURZPROTOKOLL: KURZPROTOKOLL_INSTRUCTIONS,
@@ -82,6 +127,8 @@ class SummarizeAgent(BaseAgent[SummaryDeps, str]):
             }
 
             base_instructions = instructions_map.get(summary_type, DEFAULT_INSTRUCTIONS)
+            if deps.from_notes:
+                base_instructions += NOTES_INSTRUCTIONS
 
             if language is not None:
                 language_name = get_language_name(language)
@@ -1,16 +1,20 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from dcc_backend_common.fastapi_error_handling import inject_api_error_handler
 from dcc_backend_common.fastapi_health_probes import health_probe_router
 from dcc_backend_common.fastapi_health_probes.router import ServiceDependency
 from dcc_backend_common.logger import get_logger, init_logger
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
 from structlog.stdlib import BoundLogger
 
 from transcribo_backend.container import Container
-from transcribo_backend.routes import summarize_route, transcribe_route
+from transcribo_backend.helpers.api_errors import inject_retry_after_error_handler
+from transcribo_backend.routes import metrics_route, summarize_route, transcribe_route, upload_route
+from transcribo_backend.services.whisper_service import WhisperService
 from transcribo_backend.utils.app_config import AppConfig
 
 
@@ -25,8 +29,10 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = get_logger("app")
     logger.info("Shutting down application, closing resources...")
     container: Container = app.state.container
+    await container.upload_session_service().aclose()
     whisper_service = container.whisper_service()
     await whisper_service.aclose()
+    await container.summarization_service().aclose()
     logger.info("Resources closed successfully")
 
 
@@ -46,9 +52,13 @@ def _build_fastapi_app() -> FastAPI:
     return app
 
 
-def _register_health_routes(app: FastAPI, config: AppConfig) -> None:
+def _register_health_routes(app: FastAPI, config: AppConfig, whisper_service: WhisperService) -> None:
     """
     Register health routes for the application.
+
+    The readiness probe also reports whether any Whisper backend's circuit accepts requests.
+    That check is read in process and does not fail the probe, so summarization stays in
+    rotation while transcription is down; ``/health/backends`` answers 503 for that case.
     """
     service_dependencies: list[ServiceDependency] = [
         ServiceDependency(
@@ -62,7 +72,25 @@ def _register_health_routes(app: FastAPI, config: AppConfig) -> None:
             api_key=config.llm_api_key,
         ),
     ]
-    app.include_router(health_probe_router(service_dependencies=service_dependencies))
+    router = health_probe_router(service_dependencies=service_dependencies)
+    readiness = next(
+        route for route in router.routes if isinstance(route, APIRoute) and route.path == "/health/readiness"
+    )
+    router.routes.remove(readiness)
+    dependency_readiness = readiness.endpoint
+
+    @router.get("/readiness")
+    async def readiness_probe(response: Response) -> dict[str, Any]:
+        """
+        Readiness probe of the health router, with the circuit state of the Whisper backends.
+        """
+        readiness_result = await dependency_readiness(response)
+        readiness_result["checks"]["whisper_backends"] = (
+            "healthy" if whisper_service.backends.available else "unavailable (every circuit is open)"
+        )
+        return readiness_result
+
+    app.include_router(router)
 
 
 def _configure_container(app: FastAPI, logger: BoundLogger) -> Container:
@@ -71,7 +99,7 @@ def _configure_container(app: FastAPI, logger: BoundLogger) -> Container:
     """
     logger.debug("Configuring dependency injection container")
     container = Container()
-    container.wire(modules=[transcribe_route, summarize_route])
+    container.wire(modules=[transcribe_route, summarize_route, metrics_route, upload_route])
     container.check_dependencies()
     logger.info("Dependency injection configured")
     app.state.container = container
@@ -85,6 +113,8 @@ def _register_routes(app: FastAPI, logger: BoundLogger) -> None:
     logger.debug("Registering API routers")
     app.include_router(summarize_route.create_router())
     app.include_router(transcribe_route.create_router())
+    app.include_router(upload_route.create_router())
+    app.include_router(metrics_route.create_router())
     logger.info("All routers registered")
 
 
@@ -127,12 +157,13 @@ def create_app() -> FastAPI:
     app = _build_fastapi_app()
 
     inject_api_error_handler(app)
+    inject_retry_after_error_handler(app)
 
     container = _configure_container(app=app, logger=logger)
     config = container.app_config()
     logger.info(f"AppConfig loaded: {config}")
 
-    _register_health_routes(app=app, config=config)
+    _register_health_routes(app=app, config=config, whisper_service=container.whisper_service())
 
     _configure_cors(app=app, client_url=config.client_url, logger=logger)
     _register_routes(app=app, logger=logger)
@@ -3,6 +3,7 @@ from dependency_injector import containers, providers
 
 from transcribo_backend.agents.summarize_agent import SummarizeAgent
 from transcribo_backend.services.summarization_service import SummarizationService
+from transcribo_backend.services.upload_session_service import UploadSessionService
 from transcribo_backend.services.whisper_service import WhisperService
 from transcribo_backend.utils.app_config import AppConfig
 
@@ -20,6 +21,12 @@ class Container(containers.DeclarativeContainer):
         app_config=app_config,
     )
 
+    upload_session_service: providers.Singleton[UploadSessionService] = providers.Singleton(
+        UploadSessionService,
+        app_config=app_config,
+        whisper_service=whisper_service,
+    )
+
     summarize_agent: providers.Singleton[SummarizeAgent] = providers.Singleton(
         SummarizeAgent,
         config=app_config,
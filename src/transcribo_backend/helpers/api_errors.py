@@ -0,0 +1,78 @@
+from http import HTTPStatus
+
+from dcc_backend_common.fastapi_error_handling import ApiErrorCodes, ApiErrorException, api_error_exception
+from dcc_backend_common.fastapi_error_handling.error_handler import api_error_handler
+from fastapi import FastAPI, HTTPException, Request, Response
+
+from transcribo_backend.services.resilience import CircuitOpenError
+
+
+class RetryAfterApiErrorException(ApiErrorException):
+    """An API error that also tells the client when to retry via the ``Retry-After`` header."""
+
+    def __init__(self, errorId: str, status: int, debugMessage: str | None, retry_after: int):
+        super().__init__(error_response={"errorId": errorId, "status": status, "debugMessage": debugMessage})
+        self.retry_after = retry_after
+
+
+def too_many_requests_exception(debugMessage: str, retry_after: int) -> RetryAfterApiErrorException:
+    """Build a 429 API error carrying a ``Retry-After`` hint in seconds."""
+    return RetryAfterApiErrorException(
+        errorId=ApiErrorCodes.RATE_LIMIT_EXCEEDED,
+        status=429,
+        debugMessage=debugMessage,
+        retry_after=retry_after,
+    )
+
+
+def service_unavailable_exception(debugMessage: str, retry_after: int) -> RetryAfterApiErrorException:
+    """Build a 503 API error for a Whisper backend that fails fast, carrying a ``Retry-After`` hint in seconds."""
+    return RetryAfterApiErrorException(
+        errorId=ApiErrorCodes.SERVICE_UNAVAILABLE,
+        status=503,
+        debugMessage=debugMessage,
+        retry_after=retry_after,
+    )
+
+
+def submit_error_exception(error: Exception) -> ApiErrorException:
+    """
+    Map a failed transcription submit to the API error returned to the client.
+
+    Submit can fail with rate-limit (429) and oversized-upload (413) HTTPExceptions that need
+    distinct user-facing messages, and with a 503 while every Whisper backend fails fast;
+    everything else is reported as a generic failure.
+    """
+    if isinstance(error, CircuitOpenError):
+        return service_unavailable_exception("Transcription service is unavailable", error.retry_after)
+    status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+    message = "Failed to submit transcription task"
+
+    if isinstance(error, HTTPException):
+        status_code = error.status_code
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = (error.headers or {}).get("Retry-After")
+            if retry_after is not None:
+                return too_many_requests_exception(str(error.detail), int(retry_after))
+            message = "Too many requests"
+        elif status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE:
+            message = "File is too large"
+
+    return api_error_exception(
+        errorId=ApiErrorCodes.UNEXPECTED_ERROR,
+        status=status_code,
+        debugMessage=message,
+    )
+
+
+def _retry_after_error_handler(request: Request, exc: Exception) -> Response:
+    """Render the error like every other API error and add the ``Retry-After`` header."""
+    response = api_error_handler(request, exc)
+    if isinstance(exc, RetryAfterApiErrorException):
+        response.headers["Retry-After"] = str(exc.retry_after)
+    return response
+
+
+def inject_retry_after_error_handler(app: FastAPI) -> None:
+    """Register the handler for API errors with a ``Retry-After`` header."""
+    app.add_exception_handler(RetryAfterApiErrorException, _retry_after_error_handler)
@@ -1,3 +1,24 @@
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.services.audio_converter import probe_header_streams, requires_seekable_input, sniff_container
+from transcribo_backend.services.audio_duration import mp3_frame_length
+
+# Leading bytes of an upload that are checked before the rest of it is accepted.
+MEDIA_CHECK_BYTES = 256 * 1024
+# How far into a headerless MP3 two consecutive frames are searched for.
+_MP3_FRAME_SEARCH_BYTES = 8 * 1024
+
+# Reasons an upload is rejected with.
+UNRECOGNISED_FORMAT = "unrecognised file format"
+NO_AUDIO_STREAM = "no decodable audio stream"
+
+
+class UnsupportedMediaError(Exception):
+    """Raised when the content of an upload is not decodable audio or video."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Unsupported media: {reason}")
+
+
 def is_audio_file(content_type: str) -> bool:
     """
     Check if the uploaded file is an audio file.
@@ -14,3 +35,69 @@ def is_video_file(content_type: str) -> bool:
     allowed_types = ["video"]
     file_type = content_type.split("/")[0]
     return file_type in allowed_types
+
+
+def _has_consecutive_mp3_frames(header: bytes) -> bool:
+    """Check for an MPEG layer III frame directly followed by another, which a stray sync word is not."""
+    for index in range(min(len(header), _MP3_FRAME_SEARCH_BYTES) - 4):
+        length = mp3_frame_length(header[index : index + 4])
+        if length is None:
+            continue
+        following = header[index + length : index + length + 4]
+        # A file shorter than two frames is given the benefit of the doubt.
+        if len(following) < 4 or mp3_frame_length(following) is not None:
+            return True
+    return False
+
+
+def detect_media_container(header: bytes) -> AudioContainer | None:
+    """
+    Identify the container of an upload from its magic bytes.
+
+    Stricter than ``sniff_container`` for MP3, which has no magic of its own: without an ID3
+    tag the leading bytes must hold two consecutive valid frames.
+
+    Returns:
+        The container, or None if the bytes are not a media format we accept
+    """
+    container = sniff_container(header)
+    if container == AudioContainer.MP3 and not header.startswith(b"ID3") and not _has_consecutive_mp3_frames(header):
+        return None
+    return container
+
+
+async def check_media_content(header: bytes) -> AudioContainer | None:
+    """
+    Check that the leading bytes of an upload are media with an audio stream.
+
+    ffprobe, fed only these bytes, must find an audio stream in them. Formats without
+    magic bytes we know (e.g. ADTS AAC, AIFF, WMA, AMR, CAF) are accepted on that alone,
+    as ffmpeg converts them like any other. MP4 files with the sample index at the end
+    cannot be probed from their beginning and are judged by their magic bytes alone, as
+    are files of a known container when ffprobe is unavailable or cannot decode the
+    truncated bytes; only streams ffprobe did list without an audio one reject them.
+
+    Args:
+        header: The first ``MEDIA_CHECK_BYTES`` of the upload, or all of it if it is smaller
+
+    Returns:
+        The detected container, or None for a format only ffprobe recognised
+
+    Raises:
+        UnsupportedMediaError: If the bytes hold no decodable audio, or are of an unknown
+            format ffprobe cannot check
+    """
+    container = detect_media_container(header)
+    if container is not None and requires_seekable_input(header):
+        return container
+
+    streams = await probe_header_streams(header)
+    if not streams:
+        if container is None:
+            raise UnsupportedMediaError(UNRECOGNISED_FORMAT)
+        # The leading bytes of a known container may be too few to decode, e.g. when a long
+        # recording's ``moov`` box or an ID3 tag with cover art runs past them.
+        return container
+    if not any(stream["codec_type"] == "audio" for stream in streams):
+        raise UnsupportedMediaError(NO_AUDIO_STREAM)
+    return container
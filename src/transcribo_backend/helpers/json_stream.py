@@ -0,0 +1,115 @@
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+MALFORMED_JSON = "malformed JSON stream"
+MISSING_KEY = "JSON object has no such key"
+
+
+class _TextReader:
+    """
+    UTF-8 text of a byte stream, parsed from the front and dropped once consumed.
+
+    Only the unparsed rest of the stream is buffered: usually less than one chunk,
+    at most the value currently being parsed.
+    """
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = aiter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+
+    async def _fill(self, min_length: int = 0) -> bool:
+        """Append chunks until the unparsed text holds ``min_length`` characters; False at the end of the stream."""
+        if self._exhausted:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        while True:
+            try:
+                chunk = await anext(self._chunks)
+            except StopAsyncIteration:
+                self._exhausted = True
+                self._buffer += self._decoder.decode(b"", final=True)
+                return True
+            self._buffer += self._decoder.decode(chunk)
+            if len(self._buffer) >= min_length:
+                return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it; "" at the end."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not await self._fill():
+                return ""
+
+    async def expect(self, char: str) -> None:
+        """Consume ``char``, the next character apart from whitespace."""
+        if await self.peek() != char:
+            raise ValueError(MALFORMED_JSON)
+        self._pos += 1
+
+    async def value(self) -> Any:
+        """Parse and consume the next JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as error:
+                # Most likely the value continues in the next chunks. Double the text before
+                # trying again, so a value spanning many chunks is not re-parsed per chunk.
+                if not await self._fill(2 * (len(self._buffer) - self._pos)):
+                    raise ValueError(MALFORMED_JSON) from error
+                continue
+            # A number at the very end of the text may go on in the next chunk.
+            if end == len(self._buffer) and await self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """
+    Yield the items of the array under ``key`` of a JSON object as the bytes arrive.
+
+    Every item is parsed on its own, so a response with a huge array is never held in
+    memory at once. Keys before ``key`` are parsed and skipped, keys after it are never
+    read.
+
+    Args:
+        chunks: The bytes of a JSON object, e.g. ``response.aiter_bytes()``
+        key: Top-level key of the array
+
+    Raises:
+        ValueError: If the stream is not a JSON object with an array under ``key``
+    """
+    reader = _TextReader(chunks)
+    await reader.expect("{")
+    while True:
+        if await reader.peek() != '"':
+            raise ValueError(MISSING_KEY)
+        name = await reader.value()
+        await reader.expect(":")
+        if name == key:
+            break
+        await reader.value()
+        if await reader.peek() == ",":
+            await reader.expect(",")
+
+    await reader.expect("[")
+    if await reader.peek() == "]":
+        return
+    while True:
+        yield await reader.value()
+        if await reader.peek() == "]":
+            return
+        await reader.expect(",")
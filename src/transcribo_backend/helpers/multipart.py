@@ -0,0 +1,53 @@
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+def _quote(value: str) -> str:
+    """Escape a header parameter value the same way httpx does for multipart names."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def encode_multipart_stream(
+    fields: dict[str, str],
+    file_field: str,
+    filename: str,
+    content_type: str,
+    chunks: AsyncIterable[bytes],
+) -> tuple[str, AsyncIterator[bytes]]:
+    """
+    Encode form fields plus one file part as a streamed ``multipart/form-data`` body.
+
+    httpx only streams multipart files from synchronous file handles, so a body whose file
+    part is produced on the fly (e.g. by ffmpeg) has to be encoded by hand. The file part
+    is emitted chunk by chunk as ``chunks`` yields, without buffering it.
+
+    Args:
+        fields: Plain form fields, sent before the file part
+        file_field: Name of the file form field
+        filename: Filename announced for the file part
+        content_type: MIME type of the file part
+        chunks: The file content
+
+    Returns:
+        tuple[str, AsyncIterator[bytes]]: The ``Content-Type`` header value (including the
+        boundary) and the body iterator.
+    """
+    boundary = uuid.uuid4().hex
+    delimiter = f"--{boundary}\r\n".encode()
+
+    async def _body() -> AsyncIterator[bytes]:
+        for name, value in fields.items():
+            yield delimiter
+            yield f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode()
+            yield value.encode()
+            yield b"\r\n"
+        yield delimiter
+        yield (
+            f'Content-Disposition: form-data; name="{_quote(file_field)}"; filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        async for chunk in chunks:
+            yield chunk
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    return f"multipart/form-data; boundary={boundary}", _body()
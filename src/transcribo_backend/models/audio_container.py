@@ -0,0 +1,22 @@
+from enum import StrEnum
+
+
+class AudioContainer(StrEnum):
+    """
+    Enum representing the media containers recognised from their leading bytes.
+
+    Attributes:
+        MP3: MPEG audio, with or without an ID3 tag
+        WAV: RIFF/WAVE
+        FLAC: Native FLAC
+        OGG: Ogg (Vorbis or Opus)
+        MP4: ISO base media (MP4, M4A, MOV)
+        MATROSKA: Matroska or WebM
+    """
+
+    MP3 = "mp3"
+    WAV = "wav"
+    FLAC = "flac"
+    OGG = "ogg"
+    MP4 = "mp4"
+    MATROSKA = "matroska"
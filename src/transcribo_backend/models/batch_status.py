@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+from transcribo_backend.models.task_status import TaskStatus
+
+# Most task ids one batch status request may ask for.
+MAX_BATCH_TASKS = 200
+
+
+class BatchStatusRequest(BaseModel):
+    """Task ids whose statuses are fetched in one request."""
+
+    task_ids: list[str] = Field(min_length=1, max_length=MAX_BATCH_TASKS, description="Tasks to look up")
+
+
+class BatchStatusItem(BaseModel):
+    """The status of one task of a batch, or why it could not be fetched."""
+
+    task_id: str
+    status: TaskStatus | None = Field(default=None, description="Current status, None if the lookup failed")
+    error_code: int | None = Field(default=None, description="HTTP status the single status endpoint would answer")
+    error: str | None = Field(default=None, description="Why the lookup failed")
+
+
+class BatchStatusResponse(BaseModel):
+    """Statuses of a batch, in the order of the requested task ids."""
+
+    results: list[BatchStatusItem]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+from transcribo_backend.models.audio_container import AudioContainer
+
+
+class TranscriptionEstimate(BaseModel):
+    """What a transcription of a file would cost, computed before it is submitted."""
+
+    container: AudioContainer | None = Field(description="Container detected from the leading bytes")
+    duration: float | None = Field(description="Length of the recording in seconds, None if it could not be read")
+    audio_minutes: float | None = Field(description="Length of the recording in minutes, as counted for quotas")
+    estimated_processing_seconds: float | None = Field(
+        description="Expected transcription time once Whisper starts on the file"
+    )
@@ -0,0 +1,18 @@
+from enum import StrEnum
+
+
+class ExportFormat(StrEnum):
+    """
+    File formats a finished transcription can be downloaded in.
+
+    Attributes:
+        SRT: SubRip subtitles, one cue per segment
+        VTT: WebVTT subtitles, one cue per segment with the speaker as voice
+        TXT: Plain text, one paragraph per speaker turn
+        DOCX: Word document, one paragraph per speaker turn
+    """
+
+    SRT = "srt"
+    VTT = "vtt"
+    TXT = "txt"
+    DOCX = "docx"
@@ -0,0 +1,132 @@
+from pydantic import BaseModel, Field
+
+
+class DedupStats(BaseModel):
+    """Counters of the content-addressed upload index."""
+
+    hits: int = Field(description="Uploads answered with an existing task or cached result")
+    misses: int = Field(description="Uploads that had to be transcribed")
+    entries: int = Field(description="Uploads currently indexed")
+
+
+class ConversionStats(BaseModel):
+    """Queue depth and timings of the ffmpeg conversion scheduler."""
+
+    slots: int = Field(description="Maximum number of concurrent ffmpeg processes")
+    running: int = Field(description="Conversions currently running")
+    queued: int = Field(description="Conversions waiting for a slot")
+    max_queue: int = Field(description="Maximum number of waiting conversions before requests are rejected")
+    completed: int = Field(description="Conversions finished (successfully or not)")
+    rejected: int = Field(description="Conversions rejected because the queue was full")
+    avg_wait_seconds: float = Field(description="Average time spent waiting for a slot")
+    max_wait_seconds: float = Field(description="Longest time spent waiting for a slot")
+    avg_run_seconds: float = Field(description="Average time a slot was held")
+    max_run_seconds: float = Field(description="Longest time a slot was held")
+
+
+class SpoolStats(BaseModel):
+    """Where direct uploads were buffered before they were forwarded."""
+
+    in_memory: int = Field(description="Uploads converted and forwarded straight from memory")
+    on_disk: int = Field(description="Uploads spooled to a temporary file first")
+
+
+class StatusCacheStats(BaseModel):
+    """Counters of the single-flight task status cache."""
+
+    fetches: int = Field(description="Status lookups that went to the Whisper API")
+    hits: int = Field(description="Status lookups answered from the cache")
+    coalesced: int = Field(description="Status lookups that joined a fetch already in flight")
+
+
+class ResultCacheStats(BaseModel):
+    """Size and counters of the compressed transcription result cache."""
+
+    hits: int = Field(description="Result lookups answered from memory or disk")
+    misses: int = Field(description="Result lookups that had to go to the Whisper API")
+    entries: int = Field(description="Results held in memory")
+    bytes: int = Field(description="Compressed size of the results held in memory")
+    max_bytes: int = Field(description="Byte budget of the results held in memory")
+    disk_entries: int = Field(description="Results spilled to the disk directory")
+    disk_bytes: int = Field(description="Compressed size of the spilled results")
+    evictions: int = Field(description="Results dropped from memory to stay within the budget")
+
+
+class SummaryCacheStats(BaseModel):
+    """Size and counters of the cache of generated summaries."""
+
+    hits: int = Field(description="Summary requests answered from the cache")
+    misses: int = Field(description="Summary requests that ran the LLM")
+    coalesced: int = Field(description="Summary requests that joined an identical request already running the LLM")
+    entries: int = Field(description="Summaries held in the cache")
+    bytes: int = Field(description="Size of the summaries held in the cache")
+    max_bytes: int = Field(description="Byte budget of the cache")
+
+
+class SummaryQueueStats(BaseModel):
+    """Queue depth and timings of the scheduler admitting summaries to the LLM."""
+
+    slots: int = Field(description="Maximum number of summaries generated at the same time")
+    running: int = Field(description="Summaries currently generated")
+    queued: int = Field(description="Summaries waiting for their turn")
+    clients: int = Field(description="Clients with summaries waiting")
+    max_queue: int = Field(description="Maximum number of waiting summaries before requests are rejected")
+    completed: int = Field(description="Summaries that held a slot and finished (successfully or not)")
+    rejected: int = Field(description="Summary requests rejected because the queue, or the client's share, was full")
+    avg_wait_seconds: float = Field(description="Average time spent waiting for a slot")
+    max_wait_seconds: float = Field(description="Longest time spent waiting for a slot")
+    avg_run_seconds: float = Field(description="Average time a slot was held")
+
+
+class SummaryTokenStats(BaseModel):
+    """Tokens of the transcripts summarized, before and after compaction."""
+
+    requests: int = Field(description="Transcripts prepared for summarization")
+    transcript_tokens: int = Field(description="Tokens of the transcripts as they were posted")
+    prompt_tokens: int = Field(description="Tokens of the transcripts after compaction, as sent to the LLM")
+    saved_tokens: int = Field(description="Tokens compaction saved")
+    model_tokenizer: bool = Field(description="Whether tokens are counted by the model's tokenizer, not estimated")
+
+
+class WhisperBackendStats(BaseModel):
+    """Load and health of one Whisper backend, as seen by this worker."""
+
+    url: str = Field(description="Base URL of the backend")
+    healthy: bool = Field(description="False while the circuit is open and requests fail fast")
+    circuit: str = Field(description="State of the circuit breaker: closed, open or half_open")
+    outstanding_seconds: float = Field(description="Seconds of audio submitted here whose task has not finished")
+    outstanding_tasks: int = Field(description="Tasks (and submits in flight) not finished yet")
+    submitted: int = Field(description="Tasks submitted to the backend")
+    failures: int = Field(description="Requests that failed with a connection error or a 5xx response")
+    circuit_opened: int = Field(description="Times the circuit opened after consecutive failures")
+    rejected: int = Field(description="Requests failed fast because the circuit was open")
+
+
+class WhisperClientStats(BaseModel):
+    """Counters of the retry and hedging policy of the requests to Whisper."""
+
+    retries: int = Field(description="Requests sent again after a connection error or a 502/503/504")
+    hedged: int = Field(description="Status reads that were sent a second time because the first was slow")
+    hedge_wins: int = Field(description="Hedged status reads answered by the second request first")
+
+
+class WhisperHealth(BaseModel):
+    """Whether transcription requests can currently be served by any Whisper backend."""
+
+    status: str = Field(description="ready if at least one backend accepts requests, unavailable otherwise")
+    backends: list[WhisperBackendStats]
+
+
+class ServiceMetrics(BaseModel):
+    """Runtime metrics of the backend, used to size caches and queues."""
+
+    dedup: DedupStats
+    conversion: ConversionStats
+    spool: SpoolStats
+    status: StatusCacheStats
+    results: ResultCacheStats
+    summaries: SummaryCacheStats
+    summary_tokens: SummaryTokenStats
+    summary_queue: SummaryQueueStats
+    backends: list[WhisperBackendStats]
+    whisper_client: WhisperClientStats
@@ -0,0 +1,20 @@
+from enum import StrEnum
+
+
+class NormalizationTarget(StrEnum):
+    """
+    Enum representing the codec uploads are re-encoded to before they are sent to Whisper.
+
+    Every target is mono 16 kHz, the rate Whisper resamples to anyway.
+
+    Attributes:
+        MP3: MP3 at 64 kbit/s
+        OPUS: Opus at 24 kbit/s in Ogg, the smallest output
+        FLAC: Lossless FLAC
+        WAV: Raw signed 16-bit PCM in WAV, the cheapest to encode
+    """
+
+    MP3 = "mp3"
+    OPUS = "opus"
+    FLAC = "flac"
+    WAV = "wav"
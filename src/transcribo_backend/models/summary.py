@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, StrEnum
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -21,14 +21,45 @@ class Summary(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class SummaryEventType(StrEnum):
+    """Kinds of events of a streamed summary."""
+
+    QUEUED = "queued"
+    DELTA = "delta"
+    SUMMARY = "summary"
+    ERROR = "error"
+
+
+class SummaryQueuePosition(BaseModel):
+    """Where a summary request waits for the LLM."""
+
+    position: int | None = Field(description="1 for the next summary to be generated; None if nothing is waiting")
+    eta_seconds: int = Field(description="Estimated seconds until the summary starts being generated")
+    queued: int = Field(description="Summaries waiting, of all clients")
+    running: int = Field(description="Summaries being generated")
+
+
+class SummaryEvent(BaseModel):
+    """A piece of a streamed summary, the complete summary, or why it could not be generated."""
+
+    type: SummaryEventType = Field(
+        description="queued while waiting for the LLM, delta while the summary is written; summary or error end the stream"
+    )
+    queue: SummaryQueuePosition | None = Field(default=None, description="Position in the queue, with a queued event")
+    delta: str | None = Field(default=None, description="Markdown appended to the summary, with a delta event")
+    summary: Summary | None = Field(default=None, description="The complete summary, with a summary event")
+    error: str | None = Field(default=None, description="Why no summary was generated, with an error event")
+
+
 class SummaryRequest(BaseModel):
     """Request model for summarization endpoint."""
 
-    transcript: str = Field(..., min_length=1, max_length=32_000 * 4, description="Transcript to summarize.")
+    transcript: str = Field(..., min_length=1, description="Transcript to summarize.")
     summary_type: SummaryType | None = Field(None, description="Type of summary to generate.")
     language: Language | None = Field(
         None, description="Output language for summary. None = auto-detect from transcript."
     )
+    regenerate: bool = Field(False, description="Generate a new summary even if an identical one is cached.")
 
     model_config = ConfigDict(extra="forbid")
 
@@ -38,5 +69,10 @@ class SummaryDeps(BaseModel):
 
     summary_type: SummaryType
     language: LanguageOrAuto = None
+    # Set when summarizing part ``part`` (1-based) of ``parts`` of a transcript that is too long for one prompt.
+    part: int | None = None
+    parts: int | None = None
+    # Set when the input is the notes of all parts rather than the transcript itself.
+    from_notes: bool = False
 
     model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,23 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.models.transcription_response import TranscriptionResponse
+
+
+class TaskEventType(StrEnum):
+    """Kinds of events pushed to the subscribers of a task."""
+
+    STATUS = "status"
+    RESULT = "result"
+    FAILED = "failed"
+
+
+class TaskEvent(BaseModel):
+    """A change of a task: its new status, its final result, or why it failed."""
+
+    type: TaskEventType = Field(description="status while the task runs; result or failed end the stream")
+    status: TaskStatus | None = Field(default=None, description="Latest status and progress of the task")
+    result: TranscriptionResponse | None = Field(default=None, description="The transcription, with a result event")
+    error: str | None = Field(default=None, description="Why the task failed, with a failed event")
@@ -17,6 +17,8 @@ class TaskStatus(BaseModel):
     created_at: datetime | None = None
     executed_at: datetime | None = None
     progress: float | None = None
+    # Length of the recording in seconds, known from submit time on.
+    duration: float | None = None
 
     class Config:
         use_enum_values = True
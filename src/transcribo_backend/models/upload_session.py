@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from transcribo_backend.models.audio_container import AudioContainer
+
+
+class UploadCreateRequest(BaseModel):
+    """Request model for starting a resumable upload."""
+
+    filename: str = Field(..., min_length=1, description="Name of the file being uploaded.")
+    content_type: str = Field(..., description="MIME type of the file, e.g. audio/mpeg.")
+    size: int = Field(..., gt=0, description="Total size of the file in bytes.")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class UploadSession(BaseModel):
+    """State of a resumable upload, returned after every step."""
+
+    upload_id: str = Field(..., description="Identifier used in the upload URLs.")
+    filename: str
+    content_type: str
+    size: int = Field(..., description="Total size of the file in bytes.")
+    offset: int = Field(..., description="Number of bytes received so far; the next chunk must start here.")
+    container: AudioContainer | None = Field(None, description="Container detected from the leading bytes.")
+    created_at: datetime
+    expires_at: datetime = Field(..., description="When the unfinished upload is discarded.")
+
+
+class UploadFinalizeRequest(BaseModel):
+    """Request model for turning a completed upload into a transcription task."""
+
+    num_speakers: int | None = Field(None, description="Number of speakers for diarization.")
+    language: str | None = Field(None, description="Source language code.")
+    chunked: bool = Field(False, description="Transcribe a long recording in parallel chunks.")
+
+    model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+from dcc_backend_common.logger import get_logger
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Response
+
+from transcribo_backend.container import Container
+from transcribo_backend.models.metrics import ServiceMetrics, WhisperHealth
+from transcribo_backend.services.summarization_service import SummarizationService
+from transcribo_backend.services.whisper_service import WhisperService
+
+logger = get_logger(__name__)
+
+
+@inject
+def create_router(
+    whisper_service: WhisperService = Provide[Container.whisper_service],
+    summarization_service: SummarizationService = Provide[Container.summarization_service],
+) -> APIRouter:
+    """Create the router for the metrics and backend health endpoints."""
+    logger.info("Creating router for metrics endpoint")
+    router = APIRouter()
+
+    @router.get("/metrics")
+    async def get_metrics() -> ServiceMetrics:
+        """
+        Endpoint to get runtime metrics of the caches and queues.
+        """
+        return ServiceMetrics(
+            dedup=whisper_service.dedup_index.stats(),
+            conversion=whisper_service.conversion_scheduler.stats(),
+            spool=whisper_service.spool_stats(),
+            status=whisper_service.status_cache.stats(),
+            results=whisper_service.result_cache.stats(),
+            summaries=summarization_service.summary_cache.stats(),
+            summary_tokens=summarization_service.budget.stats(),
+            summary_queue=summarization_service.scheduler.stats(),
+            backends=whisper_service.backends.stats(),
+            whisper_client=whisper_service.backends.client_stats(),
+        )
+
+    @router.get("/health/backends")
+    async def get_backend_health(response: Response) -> WhisperHealth:
+        """
+        Endpoint to get the circuit state of every Whisper backend.
+
+        Answers 503 while the circuit of every backend is open, so a load balancer can take
+        the worker out of rotation until a backend recovers.
+        """
+        available = whisper_service.backends.available
+        if not available:
+            response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        return WhisperHealth(status="ready" if available else "unavailable", backends=whisper_service.backends.stats())
+
+    return router
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from http import HTTPStatus
 from typing import Annotated
 
@@ -5,18 +6,21 @@ from dcc_backend_common.fastapi_error_handling import ApiErrorCodes, api_error_e
 from dcc_backend_common.logger import get_logger
 from dcc_backend_common.usage_tracking import UsageTrackingService
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Header
+from fastapi import APIRouter, Depends, Header
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from returns.io import IOSuccess
 
 from transcribo_backend.container import Container
-from transcribo_backend.models.summary import Summary, SummaryRequest
+from transcribo_backend.helpers.api_errors import too_many_requests_exception
+from transcribo_backend.models.summary import Summary, SummaryQueuePosition, SummaryRequest
 from transcribo_backend.services.summarization_service import SummarizationService
+from transcribo_backend.services.summary_scheduler import SummaryQueueFullError
 
 logger = get_logger(__name__)
 
 
 @inject
-def create_router(
+def create_router(  # noqa: C901
     summarization_service: SummarizationService = Provide[Container.summarization_service],
     usage_tracking_service: UsageTrackingService = Provide[Container.usage_tracking_service],
 ) -> APIRouter:
@@ -24,12 +28,13 @@ def create_router(
     logger.info("Creating router for summarize endpoint")
     router = APIRouter()
 
-    @router.post("/summarize")
-    async def summarize(request: SummaryRequest, x_client_id: Annotated[str | None, Header()] = None) -> Summary:
+    def _valid_request(request: SummaryRequest) -> SummaryRequest:
         """
-        Endpoint to summarize a text.
+        Reject empty transcripts and transcripts longer than ``summary_max_chars``.
+
+        A dependency, so the event stream can still answer with an error status.
         """
-        model_context_length = 32_000
+        max_chars = summarization_service.app_config.summary_max_chars
 
         if not request.transcript or not request.transcript.strip():
             raise api_error_exception(
@@ -37,12 +42,42 @@ def create_router(
                 status=HTTPStatus.BAD_REQUEST,
                 debugMessage="Transcript cannot be empty",
             )
-        if len(request.transcript) > model_context_length * 4:
+        if len(request.transcript) > max_chars:
             raise api_error_exception(
                 errorId=ApiErrorCodes.INVALID_REQUEST,
                 status=HTTPStatus.BAD_REQUEST,
-                debugMessage=f"Transcript is too long. Maximum length is {model_context_length * 4} characters.",
+                debugMessage=f"Transcript is too long. Maximum length is {max_chars} characters.",
             )
+        return request
+
+    def _admitted_request(
+        request: Annotated[SummaryRequest, Depends(_valid_request)], x_client_id: Annotated[str | None, Header()] = None
+    ) -> SummaryRequest:
+        """Reject a summary with 429 up front if the queue is full, so the event stream is not opened for it."""
+        try:
+            summarization_service.check_admission(
+                request.transcript,
+                request.summary_type,
+                request.language,
+                regenerate=request.regenerate,
+                client_id=x_client_id,
+            )
+        except SummaryQueueFullError as error:
+            raise too_many_requests_exception(str(error), error.retry_after) from error
+        return request
+
+    @router.post("/summarize")
+    async def summarize(
+        request: Annotated[SummaryRequest, Depends(_valid_request)], x_client_id: Annotated[str | None, Header()] = None
+    ) -> Summary:
+        """
+        Endpoint to summarize a text.
+
+        Transcripts longer than one prompt are summarized in parts and the part notes combined.
+        Identical requests are answered from the summary cache unless ``regenerate`` is set.
+        Others wait for their turn at the LLM, taking turns with other clients (X-Client-Id);
+        a full queue is answered with 429 and a Retry-After header.
+        """
         # Extract X-Client-Id from the request headers
         usage_tracking_service.log_event(
             module="summarize_route",
@@ -51,12 +86,20 @@ def create_router(
             transcript_length=len(request.transcript),
         )
 
-        result = await summarization_service.summarize(request.transcript, request.summary_type, request.language)
+        result = await summarization_service.summarize(
+            request.transcript,
+            request.summary_type,
+            request.language,
+            regenerate=request.regenerate,
+            client_id=x_client_id,
+        )
 
         if isinstance(result, IOSuccess):
             return result.unwrap()._inner_value
 
         error = result.failure()._inner_value
+        if isinstance(error, SummaryQueueFullError):
+            raise too_many_requests_exception(str(error), error.retry_after) from error
         logger.exception("Failed to summarize transcript", exc_info=error)
         raise api_error_exception(
             errorId=ApiErrorCodes.UNEXPECTED_ERROR,
@@ -64,4 +107,43 @@ def create_router(
             debugMessage="Failed to generate summary",
         ) from error
 
+    @router.post("/summarize/stream", response_class=EventSourceResponse)
+    async def summarize_stream(
+        request: Annotated[SummaryRequest, Depends(_admitted_request)],
+        x_client_id: Annotated[str | None, Header()] = None,
+    ) -> AsyncIterator[ServerSentEvent]:
+        """
+        Endpoint streaming a summary as server-sent events while it is generated.
+
+        ``queued`` events report the position in the queue and the estimated start while
+        the summary waits for the LLM, ``delta`` events carry the markdown to append; the
+        stream ends with a ``summary`` event holding the complete ``Summary`` or an
+        ``error`` event. A full queue is answered with 429 and a Retry-After header.
+        """
+        usage_tracking_service.log_event(
+            module="summarize_route",
+            func="summarize_stream",
+            user_id=x_client_id or "unknown",
+            transcript_length=len(request.transcript),
+        )
+
+        events = summarization_service.summarize_stream(
+            request.transcript,
+            request.summary_type,
+            request.language,
+            regenerate=request.regenerate,
+            client_id=x_client_id,
+        )
+        async for event in events:
+            yield ServerSentEvent(event=event.type, data=event)
+
+    @router.get("/summarize/queue")
+    async def summary_queue(x_client_id: Annotated[str | None, Header()] = None) -> SummaryQueuePosition:
+        """
+        Endpoint reporting where the next waiting summary of the client (X-Client-Id) is in the queue.
+
+        Without a waiting summary, the position and estimated start a new one would get at most.
+        """
+        return summarization_service.scheduler.client_position(x_client_id)
+
     return router
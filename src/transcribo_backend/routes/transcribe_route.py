@@ -1,3 +1,6 @@
+import gzip
+import re
+from collections.abc import AsyncIterator
 from http import HTTPStatus
 from typing import Annotated, Any
 
@@ -6,15 +9,43 @@ from dcc_backend_common.fastapi_error_handling import ApiErrorCodes, api_error_e
 from dcc_backend_common.logger import get_logger
 from dcc_backend_common.usage_tracking import UsageTrackingService
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Form, Header, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from returns.io import IOSuccess
 
 from transcribo_backend.container import Container
-from transcribo_backend.helpers.file_type import is_audio_file, is_video_file
+from transcribo_backend.helpers.api_errors import service_unavailable_exception, submit_error_exception
+from transcribo_backend.helpers.file_type import (
+    MEDIA_CHECK_BYTES,
+    UnsupportedMediaError,
+    check_media_content,
+    is_audio_file,
+    is_video_file,
+)
+from transcribo_backend.models.batch_status import BatchStatusItem, BatchStatusRequest, BatchStatusResponse
+from transcribo_backend.models.estimate import TranscriptionEstimate
+from transcribo_backend.models.export_format import ExportFormat
 from transcribo_backend.models.task_status import TaskStatus
 from transcribo_backend.models.transcription_response import TranscriptionResponse
+from transcribo_backend.services.resilience import CircuitOpenError
+from transcribo_backend.services.transcript_export import EXPORT_MEDIA_TYPES
 from transcribo_backend.services.whisper_service import WhisperService
 
+# Characters replaced in a task id when it names a downloaded file.
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+
 
 def _is_not_found_error(error: Exception) -> bool:
     """Check if the error represents a 'not found' condition (404)."""
@@ -25,6 +56,15 @@ def _is_not_found_error(error: Exception) -> bool:
     return False
 
 
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Check whether an ``Accept-Encoding`` header allows a gzip-encoded response."""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
 @inject
 def create_router(  # noqa: C901
     whisper_service: WhisperService = Provide[Container.whisper_service],
@@ -44,6 +84,8 @@ def create_router(  # noqa: C901
 
         error = result.failure()._inner_value
         logger.exception(log_message, exc_info=error)
+        if isinstance(error, CircuitOpenError):
+            raise service_unavailable_exception(error_message, error.retry_after) from error
         if _is_not_found_error(error):
             raise api_error_exception(
                 errorId=ApiErrorCodes.RESOURCE_NOT_FOUND,
@@ -70,28 +112,141 @@ def create_router(  # noqa: C901
             error_message="Failed to get task status",
         )
 
-    @router.get("/task/{task_id}/result")
-    async def get_task_result(task_id: str) -> TranscriptionResponse:
+    @router.post("/tasks/status")
+    async def get_task_statuses(request: BatchStatusRequest) -> BatchStatusResponse:
+        """
+        Endpoint to get the statuses of many tasks in one request.
+
+        Every requested task gets an entry, in request order: its status, or the error code
+        and message the single status endpoint would have answered with.
+        """
+        statuses = await whisper_service.transcribe_get_task_statuses(request.task_ids)
+        results: list[BatchStatusItem] = []
+        for task_id in request.task_ids:
+            status = statuses[task_id]
+            if isinstance(status, TaskStatus):
+                results.append(BatchStatusItem(task_id=task_id, status=status))
+            elif _is_not_found_error(status):
+                results.append(
+                    BatchStatusItem(task_id=task_id, error_code=HTTPStatus.NOT_FOUND, error=f"Task {task_id} not found")
+                )
+            elif isinstance(status, CircuitOpenError):
+                results.append(
+                    BatchStatusItem(
+                        task_id=task_id,
+                        error_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                        error="Transcription service is unavailable",
+                    )
+                )
+            else:
+                logger.warning(f"Failed to get task status for {task_id}: {status}")
+                results.append(
+                    BatchStatusItem(
+                        task_id=task_id,
+                        error_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                        error="Failed to get task status",
+                    )
+                )
+        return BatchStatusResponse(results=results)
+
+    @router.get("/task/{task_id}/result", response_model=TranscriptionResponse)
+    async def get_task_result(task_id: str, accept_encoding: Annotated[str | None, Header()] = None) -> Response:
         """
         Endpoint to get the result of a task by task_id.
+
+        The result is streamed while it is read from Whisper, one segment at a time. A result
+        fetched before is served from the result cache as stored, gzip-compressed if the
+        client accepts it, without asking Whisper or parsing it again.
         """
-        result = await whisper_service.transcribe_get_task_result(task_id)
-        return _unwrap_or_raise(
+        cached = whisper_service.cached_task_result(task_id)
+        if cached is not None:
+            if _accepts_gzip(accept_encoding):
+                return Response(content=cached, media_type="application/json", headers={"Content-Encoding": "gzip"})
+            return Response(content=gzip.decompress(cached), media_type="application/json")
+
+        result = await whisper_service.transcribe_stream_task_result(task_id)
+        chunks = _unwrap_or_raise(
             result,
             log_message=f"Failed to get task result for {task_id}",
             not_found_message=f"Task result for {task_id} not found",
             error_message="Failed to get task result",
         )
+        return StreamingResponse(chunks, media_type="application/json")
 
-    @router.post("/transcribe")
-    async def submit_transcribe(
-        audio_file: UploadFile,
-        num_speakers: Annotated[int | None, Form()] = None,
-        language: Annotated[str | None, Form()] = None,
-        x_client_id: Annotated[str | None, Header()] = None,
-    ) -> TaskStatus:
+    @router.get("/task/{task_id}/export")
+    async def export_task_result(
+        task_id: str, export_format: Annotated[ExportFormat, Query(alias="format")]
+    ) -> StreamingResponse:
         """
-        Endpoint to submit a transcription task.
+        Endpoint to download the result of a task as SRT, VTT, TXT or DOCX.
+
+        The file is rendered on the server while the result streams, with the speaker of
+        every cue or paragraph, so large transcripts download without ever being held in
+        memory whole, here or in the browser.
+        """
+        result = await whisper_service.transcribe_export_task_result(task_id, export_format)
+        chunks = _unwrap_or_raise(
+            result,
+            log_message=f"Failed to export task result for {task_id}",
+            not_found_message=f"Task result for {task_id} not found",
+            error_message="Failed to export task result",
+        )
+        filename = f"{_UNSAFE_FILENAME.sub('_', task_id)}.{export_format}"
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    async def _watched_task(task_id: str) -> str:
+        """Check that a task exists before its event stream is opened, so unknown tasks get a 404."""
+        result = await whisper_service.transcribe_get_task_status(task_id)
+        _unwrap_or_raise(
+            result,
+            log_message=f"Failed to get task status for {task_id}",
+            not_found_message=f"Task {task_id} not found",
+            error_message="Failed to get task status",
+        )
+        return task_id
+
+    @router.get("/task/{task_id}/events", response_class=EventSourceResponse)
+    async def get_task_events(task_id: Annotated[str, Depends(_watched_task)]) -> AsyncIterator[ServerSentEvent]:
+        """
+        Endpoint streaming the status changes of a task as server-sent events.
+
+        ``status`` events carry every change of status or progress; the stream ends with a
+        ``result`` event holding the transcription or a ``failed`` event. All clients
+        watching a task share one poller of the Whisper API.
+        """
+        async for event in whisper_service.watch_task(task_id):
+            yield ServerSentEvent(event=event.type, data=event)
+
+    @router.websocket("/task/{task_id}/ws")
+    async def watch_task_websocket(websocket: WebSocket, task_id: str) -> None:
+        """
+        WebSocket alternative to the event stream of a task.
+
+        Every event is sent as a JSON message shaped like ``TaskEvent``; the server closes
+        the socket after the ``result`` or ``failed`` message.
+        """
+        await websocket.accept()
+        events = whisper_service.watch_task(task_id)
+        try:
+            async for event in events:
+                await websocket.send_json(event.model_dump(mode="json"))
+        except WebSocketDisconnect:
+            logger.info(f"Client stopped watching task {task_id}")
+            return
+        finally:
+            await events.aclose()
+        await websocket.close()
+
+    async def _validate_upload(audio_file: UploadFile) -> int:
+        """
+        Reject uploads without type/name, of an unsupported type, too large, or whose leading
+        bytes are not decodable media; returns the size cap.
+
+        The content check runs before anything is spooled, converted or sent to Whisper.
         """
         if audio_file.content_type is None:
             raise api_error_exception(
@@ -123,12 +278,64 @@ def create_router(  # noqa: C901
                 debugMessage="File is too large",
             )
 
+        header = await audio_file.read(MEDIA_CHECK_BYTES)
+        await audio_file.seek(0)
+        try:
+            await check_media_content(header)
+        except UnsupportedMediaError as error:
+            logger.info(f"Rejected upload {audio_file.filename}: {error}")
+            raise api_error_exception(
+                errorId=ApiErrorCodes.VALIDATION_ERROR,
+                status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                debugMessage=str(error),
+            ) from error
+        return max_upload_bytes
+
+    @router.post("/transcribe/estimate")
+    async def estimate_transcribe(audio_file: UploadFile) -> TranscriptionEstimate:
+        """
+        Endpoint to estimate the duration and processing time of a file before submitting it.
+
+        The duration is read from the container headers (MP3, WAV, FLAC, Ogg, MP4) without
+        decoding the audio; other files fall back to a time-bounded ffprobe.
+        """
+        max_upload_bytes = await _validate_upload(audio_file)
+        try:
+            result = await whisper_service.transcribe_estimate(audio_file, max_upload_bytes=max_upload_bytes)
+        finally:
+            await audio_file.close()
+
+        if isinstance(result, IOSuccess):
+            return result.unwrap()._inner_value
+
+        error = result.failure()._inner_value
+        logger.exception("Failed to estimate transcription", exc_info=error)
+        raise submit_error_exception(error) from error
+
+    @router.post("/transcribe")
+    async def submit_transcribe(
+        audio_file: UploadFile,
+        num_speakers: Annotated[int | None, Form()] = None,
+        language: Annotated[str | None, Form()] = None,
+        chunked: Annotated[bool, Form()] = False,
+        x_client_id: Annotated[str | None, Header()] = None,
+    ) -> TaskStatus:
+        """
+        Endpoint to submit a transcription task.
+
+        With ``chunked`` a long recording is split at pauses and its chunks are transcribed
+        in parallel; the returned task id still tracks the whole recording. The returned
+        status carries the duration of the recording when it could be read.
+        """
+        max_upload_bytes = await _validate_upload(audio_file)
+
         usage_tracking_service.log_event(
             module="transcribe_route",
             func="transcribe",
             user_id=x_client_id or "unknown",
             num_speakers=num_speakers,
             file_size=audio_file.size,
+            chunked=chunked,
         )
 
         # Submit the transcription task. The file is streamed to disk and forwarded to
@@ -139,6 +346,7 @@ def create_router(  # noqa: C901
                 diarization_speaker_count=num_speakers,
                 language=language,
                 max_upload_bytes=max_upload_bytes,
+                chunked=chunked,
             )
         finally:
             await audio_file.close()
@@ -151,22 +359,6 @@ def create_router(  # noqa: C901
         # distinct user-facing messages; the other endpoints only surface generic failures.
         error = result.failure()._inner_value
         logger.exception("Failed to submit transcription task", exc_info=error)
-
-        status_code = HTTPStatus.INTERNAL_SERVER_ERROR
-        error_code = ApiErrorCodes.UNEXPECTED_ERROR
-        message = "Failed to submit transcription task"
-
-        if isinstance(error, HTTPException):
-            status_code = error.status_code
-            if status_code == HTTPStatus.TOO_MANY_REQUESTS:
-                message = "Too many requests"
-            elif status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE:
-                message = "File is too large"
-
-        raise api_error_exception(
-            errorId=error_code,
-            status=status_code,
-            debugMessage=message,
-        ) from error
+        raise submit_error_exception(error) from error
 
     return router
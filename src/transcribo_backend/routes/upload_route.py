@@ -0,0 +1,195 @@
+import re
+from http import HTTPStatus
+from typing import Annotated
+
+from dcc_backend_common.fastapi_error_handling import ApiErrorCodes, api_error_exception
+from dcc_backend_common.logger import get_logger
+from dcc_backend_common.usage_tracking import UsageTrackingService
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Header, Request, Response
+from returns.io import IOSuccess
+
+from transcribo_backend.container import Container
+from transcribo_backend.helpers.api_errors import submit_error_exception
+from transcribo_backend.helpers.file_type import UnsupportedMediaError, is_audio_file, is_video_file
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.models.upload_session import UploadCreateRequest, UploadFinalizeRequest, UploadSession
+from transcribo_backend.services.upload_session_service import (
+    UploadChecksumMismatchError,
+    UploadIncompleteError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadRangeError,
+    UploadSessionService,
+)
+
+logger = get_logger(__name__)
+
+# Content-Range of a chunk: "bytes <first>-<last>/<total>" (inclusive byte positions).
+_CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+def _parse_content_range(content_range: str) -> tuple[int, int]:
+    """Return ``(start, length)`` of a ``Content-Range`` header, or raise a 400 API error."""
+    match = _CONTENT_RANGE_PATTERN.match(content_range.strip())
+    if match is None or int(match.group(2)) < int(match.group(1)):
+        raise api_error_exception(
+            errorId=ApiErrorCodes.INVALID_REQUEST,
+            status=HTTPStatus.BAD_REQUEST,
+            debugMessage="Content-Range must be 'bytes <first>-<last>/<total>'",
+        )
+    start, last = int(match.group(1)), int(match.group(2))
+    return start, last - start + 1
+
+
+@inject
+def create_router(  # noqa: C901
+    upload_session_service: UploadSessionService = Provide[Container.upload_session_service],
+    usage_tracking_service: UsageTrackingService = Provide[Container.usage_tracking_service],
+) -> APIRouter:
+    """Create the router for the resumable upload API."""
+    logger.info("Creating router for resumable uploads")
+    router = APIRouter()
+
+    def _not_found(upload_id: str, error: Exception) -> Exception:
+        logger.info(f"Upload {upload_id} not found")
+        return api_error_exception(
+            errorId=ApiErrorCodes.RESOURCE_NOT_FOUND,
+            status=HTTPStatus.NOT_FOUND,
+            debugMessage=str(error),
+        )
+
+    @router.post("/uploads", status_code=HTTPStatus.CREATED)
+    async def create_upload(
+        request: UploadCreateRequest, x_client_id: Annotated[str | None, Header()] = None
+    ) -> UploadSession:
+        """
+        Endpoint to start a resumable upload.
+
+        Send the file afterwards in one or more ``PATCH /uploads/{upload_id}`` requests and
+        turn it into a transcription task with ``POST /uploads/{upload_id}/finalize``.
+        """
+        if not is_audio_file(request.content_type) and not is_video_file(request.content_type):
+            raise api_error_exception(
+                errorId=ApiErrorCodes.VALIDATION_ERROR,
+                status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                debugMessage="Unsupported file type",
+            )
+        if request.size > upload_session_service.app_config.max_upload_bytes:
+            raise api_error_exception(
+                errorId=ApiErrorCodes.VALIDATION_ERROR,
+                status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                debugMessage="File is too large",
+            )
+
+        usage_tracking_service.log_event(
+            module="upload_route",
+            func="create_upload",
+            user_id=x_client_id or "unknown",
+            file_size=request.size,
+        )
+        return upload_session_service.create(request.filename, request.content_type, request.size)
+
+    @router.get("/uploads/{upload_id}")
+    async def get_upload(upload_id: str) -> UploadSession:
+        """
+        Endpoint to get the state of an upload, e.g. the offset to resume from.
+        """
+        try:
+            return upload_session_service.get(upload_id)
+        except UploadNotFoundError as error:
+            raise _not_found(upload_id, error) from error
+
+    @router.patch("/uploads/{upload_id}")
+    async def append_chunk(
+        upload_id: str,
+        request: Request,
+        content_range: Annotated[str, Header()],
+        x_content_sha256: Annotated[str | None, Header()] = None,
+    ) -> UploadSession:
+        """
+        Endpoint to append a chunk of the file.
+
+        The body holds the bytes announced in ``Content-Range``; the chunk must start at the
+        current offset. ``X-Content-SHA256`` (hex) optionally verifies the chunk. A chunk that
+        is rejected or interrupted leaves the offset unchanged. Once the leading bytes are in,
+        an upload that is not decodable audio or video is aborted with 415.
+        """
+        start, length = _parse_content_range(content_range)
+        try:
+            return await upload_session_service.append(upload_id, start, length, request.stream(), x_content_sha256)
+        except UploadNotFoundError as error:
+            raise _not_found(upload_id, error) from error
+        except UploadOffsetMismatchError as error:
+            raise api_error_exception(
+                errorId=ApiErrorCodes.INVALID_REQUEST,
+                status=HTTPStatus.CONFLICT,
+                debugMessage=str(error),
+            ) from error
+        except UnsupportedMediaError as error:
+            raise api_error_exception(
+                errorId=ApiErrorCodes.VALIDATION_ERROR,
+                status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                debugMessage=str(error),
+            ) from error
+        except (UploadRangeError, UploadChecksumMismatchError) as error:
+            raise api_error_exception(
+                errorId=ApiErrorCodes.VALIDATION_ERROR,
+                status=HTTPStatus.BAD_REQUEST,
+                debugMessage=str(error),
+            ) from error
+
+    @router.post("/uploads/{upload_id}/finalize")
+    async def finalize_upload(
+        upload_id: str,
+        request: UploadFinalizeRequest,
+        x_client_id: Annotated[str | None, Header()] = None,
+    ) -> TaskStatus:
+        """
+        Endpoint to submit a completely uploaded file for transcription.
+        """
+        try:
+            session = upload_session_service.get(upload_id)
+            result = await upload_session_service.finalize(
+                upload_id,
+                diarization_speaker_count=request.num_speakers,
+                language=request.language,
+                chunked=request.chunked,
+            )
+        except UploadNotFoundError as error:
+            raise _not_found(upload_id, error) from error
+        except UploadIncompleteError as error:
+            raise api_error_exception(
+                errorId=ApiErrorCodes.INVALID_REQUEST,
+                status=HTTPStatus.CONFLICT,
+                debugMessage=str(error),
+            ) from error
+
+        usage_tracking_service.log_event(
+            module="upload_route",
+            func="finalize_upload",
+            user_id=x_client_id or "unknown",
+            num_speakers=request.num_speakers,
+            file_size=session.size,
+            chunked=request.chunked,
+        )
+
+        if isinstance(result, IOSuccess):
+            return result.unwrap()._inner_value
+
+        error = result.failure()._inner_value
+        logger.exception(f"Failed to submit upload {upload_id}", exc_info=error)
+        raise submit_error_exception(error) from error
+
+    @router.delete("/uploads/{upload_id}", status_code=HTTPStatus.NO_CONTENT)
+    async def abort_upload(upload_id: str) -> Response:
+        """
+        Endpoint to abort an upload and discard the received bytes.
+        """
+        try:
+            upload_session_service.abort(upload_id)
+        except UploadNotFoundError as error:
+            raise _not_found(upload_id, error) from error
+        return Response(status_code=HTTPStatus.NO_CONTENT)
+
+    return router
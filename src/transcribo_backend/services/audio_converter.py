@@ -1,12 +1,37 @@
-import subprocess
+import asyncio
+import json
+import re
 import tempfile
+from collections.abc import AsyncIterator, Collection
+from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
+from typing import cast
 
 from dcc_backend_common.logger import get_logger
-from returns.io import impure_safe
+from returns.future import FutureResultE, future_safe
+
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.services.audio_duration import header_duration
 
 logger = get_logger(__name__)
 
+# Settings shared by every normalization target: mono 16 kHz, dropping any video stream.
+_NORMALIZE_ARGS = ["-vn", "-ac", "1", "-ar", "16000"]
+# Size of the reads from ffmpeg's stdout in the pipe conversion.
+_PIPE_READ_BYTES = 64 * 1024
+# Upper bound for a single file conversion.
+_FFMPEG_TIMEOUT_SECONDS = 300
+_TIMEOUT_MESSAGE = f"timed out after {_FFMPEG_TIMEOUT_SECONDS} seconds"
+# Upper bound for probing the streams of a file.
+_FFPROBE_TIMEOUT_SECONDS = 15
+# Number of leading bytes inspected to detect the container.
+_SNIFF_BYTES = 1024
+# ffmpeg log lines parsed for silencedetect results.
+_SILENCE_START_PATTERN = re.compile(rb"silence_start: (-?\d+(?:\.\d+)?)")
+_SILENCE_END_PATTERN = re.compile(rb"silence_end: (-?\d+(?:\.\d+)?)")
+
 
 class AudioConversionError(Exception):
     """Custom exception for audio conversion errors."""
@@ -45,75 +70,592 @@ def is_mp3_format(audio_data: bytes) -> bool:
     return False
 
 
-@impure_safe
-def convert_to_mp3(input_path: str) -> str:
+def requires_seekable_input(header: bytes) -> bool:
+    """
+    Check whether ffmpeg needs a seekable input to demux this container.
+
+    ISO-BMFF files (MP4/M4A/MOV) keep their sample index in the ``moov`` box. When it is
+    written after the media data (``mdat``), as most recorders do, ffmpeg cannot read the
+    file from a pipe. Every other container we accept can be demuxed front to back.
+
+    Args:
+        header: The leading bytes of the file
+
+    Returns:
+        True if the file has to be converted from disk rather than from a pipe
+    """
+    if len(header) < 8 or header[4:8] != b"ftyp":
+        return False
+
+    # Walk the top-level boxes until we see which of moov/mdat comes first.
+    offset = 0
+    while offset + 8 <= len(header):
+        size = int.from_bytes(header[offset : offset + 4], "big")
+        box_type = header[offset + 4 : offset + 8]
+        if box_type == b"moov":
+            return False
+        if box_type == b"mdat":
+            return True
+        if size == 1 and offset + 16 <= len(header):  # 64-bit box size
+            size = int.from_bytes(header[offset + 8 : offset + 16], "big")
+        if size < 8:  # 0 means "until end of file"; anything else is malformed
+            break
+        offset += size
+
+    # moov was not found in the leading bytes, so it most likely sits at the end.
+    return True
+
+
+@dataclass(frozen=True)
+class UploadFormat:
+    """Filename and MIME type announced to Whisper for an uploaded file."""
+
+    filename: str
+    content_type: str
+
+
+_UPLOAD_FORMATS: dict[AudioContainer, UploadFormat] = {
+    AudioContainer.MP3: UploadFormat("audio.mp3", "audio/mpeg"),
+    AudioContainer.WAV: UploadFormat("audio.wav", "audio/wav"),
+    AudioContainer.FLAC: UploadFormat("audio.flac", "audio/flac"),
+    AudioContainer.OGG: UploadFormat("audio.ogg", "audio/ogg"),
+    AudioContainer.MP4: UploadFormat("audio.m4a", "audio/mp4"),
+    AudioContainer.MATROSKA: UploadFormat("audio.webm", "audio/webm"),
+}
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    """ffmpeg encoder arguments of a normalization target and the container they produce."""
+
+    codec_args: tuple[str, ...]
+    muxer: str
+    container: AudioContainer
+
+
+_ENCODE_PROFILES: dict[NormalizationTarget, EncodeProfile] = {
+    NormalizationTarget.MP3: EncodeProfile(("-c:a", "libmp3lame", "-b:a", "64k"), "mp3", AudioContainer.MP3),
+    NormalizationTarget.OPUS: EncodeProfile(
+        ("-c:a", "libopus", "-b:a", "24k", "-application", "voip"), "ogg", AudioContainer.OGG
+    ),
+    NormalizationTarget.FLAC: EncodeProfile(("-c:a", "flac"), "flac", AudioContainer.FLAC),
+    NormalizationTarget.WAV: EncodeProfile(("-c:a", "pcm_s16le"), "wav", AudioContainer.WAV),
+}
+
+# Audio codecs that can be stream-copied out of a video container, mapped to the ffmpeg
+# muxer and the resulting audio-only container.
+REMUXABLE_CODECS: dict[str, tuple[str, AudioContainer]] = {
+    "aac": ("ipod", AudioContainer.MP4),
+    "mp3": ("mp3", AudioContainer.MP3),
+    "opus": ("ogg", AudioContainer.OGG),
+    "vorbis": ("ogg", AudioContainer.OGG),
+    "flac": ("flac", AudioContainer.FLAC),
+}
+
+# Containers whose content can be decided from the magic bytes alone (audio only).
+AUDIO_ONLY_CONTAINERS = {AudioContainer.MP3, AudioContainer.WAV, AudioContainer.FLAC, AudioContainer.OGG}
+
+
+def upload_format(container: AudioContainer) -> UploadFormat:
+    """Return the filename and MIME type to announce for a file in ``container``."""
+    return _UPLOAD_FORMATS[container]
+
+
+def encode_args(target: NormalizationTarget) -> list[str]:
+    """Return the ffmpeg output arguments (including the muxer) that normalize audio to ``target``."""
+    profile = _ENCODE_PROFILES[target]
+    return [*_NORMALIZE_ARGS, *profile.codec_args, "-f", profile.muxer]
+
+
+def normalized_format(target: NormalizationTarget) -> UploadFormat:
+    """Return the filename and MIME type to announce for audio normalized to ``target``."""
+    return upload_format(_ENCODE_PROFILES[target].container)
+
+
+def sniff_container(header: bytes) -> AudioContainer | None:
+    """
+    Identify the container from the leading bytes of a file.
+
+    Args:
+        header: The leading bytes of the file
+
+    Returns:
+        The recognised container, or None if the magic bytes are unknown
     """
-    Convert an audio or video file to MP3 using FFmpeg with balanced quality settings.
+    if header.startswith(b"RIFF") and header[8:12] == b"WAVE":
+        return AudioContainer.WAV
+    if header.startswith(b"fLaC"):
+        return AudioContainer.FLAC
+    if header.startswith(b"OggS"):
+        return AudioContainer.OGG
+    if header[4:8] == b"ftyp":
+        return AudioContainer.MP4
+    if header.startswith(b"\x1a\x45\xdf\xa3"):  # EBML: Matroska / WebM
+        return AudioContainer.MATROSKA
+    # Checked last: a stray frame sync in another container must not win.
+    if is_mp3_format(header):
+        return AudioContainer.MP3
+    return None
+
+
+class ConversionAction(StrEnum):
+    """The cheapest way to turn an upload into something Whisper decodes."""
+
+    PASSTHROUGH = "passthrough"
+    REMUX = "remux"
+    TRANSCODE = "transcode"
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """What to do with an upload, and the container/codec the decision was based on."""
+
+    action: ConversionAction
+    container: AudioContainer | None = None
+    audio_codec: str | None = None
+
+
+async def _run_ffprobe(input_path: str, entries: str, stdin_data: bytes | None = None) -> tuple[int, bytes] | None:
+    """
+    Run a time-bounded ffprobe printing ``entries`` as JSON.
+
+    With ``stdin_data`` the input is read from a pipe (``input_path`` should be ``pipe:0``).
+
+    Returns:
+        The exit code and stdout, or None if ffprobe is unavailable or exceeds its time budget
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            entries,
+            "-of",
+            "json",
+            input_path,
+            stdin=asyncio.subprocess.PIPE if stdin_data is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        logger.warning("ffprobe is not available")
+        return None
+
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(stdin_data), timeout=_FFPROBE_TIMEOUT_SECONDS)
+    except TimeoutError:
+        logger.warning(f"ffprobe exceeded {_FFPROBE_TIMEOUT_SECONDS}s")
+        return None
+    except (BrokenPipeError, ConnectionResetError):
+        # ffprobe stopped reading early; what it printed is still valid.
+        stdout = b""
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    return process.returncode or 0, stdout
+
+
+def _parse_streams(stdout: bytes) -> list[dict[str, str]] | None:
+    try:
+        streams = json.loads(stdout).get("streams", [])
+    except ValueError:
+        return None
+    return [{"codec_type": str(s.get("codec_type")), "codec_name": str(s.get("codec_name"))} for s in streams]
+
+
+async def probe_streams(input_path: str) -> list[dict[str, str]] | None:
+    """
+    List the streams of a file with a time-bounded ffprobe call.
+
+    Returns:
+        One ``{"codec_type": ..., "codec_name": ...}`` dict per stream, or None if ffprobe
+        is unavailable, fails or exceeds its time budget
+    """
+    probe = await _run_ffprobe(input_path, "stream=codec_type,codec_name")
+    if probe is None or probe[0] != 0:
+        return None
+    return _parse_streams(probe[1])
+
+
+async def probe_header_streams(header: bytes) -> list[dict[str, str]] | None:
+    """
+    List the streams ffprobe finds in the leading bytes of a file, piped through stdin.
+
+    Returns:
+        The streams as in ``probe_streams``; an empty list if ffprobe could not decode the
+        bytes at all, or None if ffprobe is unavailable or exceeds its time budget
+    """
+    probe = await _run_ffprobe("pipe:0", "stream=codec_type,codec_name", stdin_data=header)
+    if probe is None:
+        return None
+    returncode, stdout = probe
+    if returncode != 0:
+        return []
+    return _parse_streams(stdout) or []
+
+
+async def plan_conversion(input_path: str, header: bytes, passthrough: Collection[AudioContainer]) -> ConversionPlan:
+    """
+    Pick the cheapest action that yields a file Whisper can decode.
+
+    Audio-only containers are decided from their magic bytes: passed through if listed in
+    ``passthrough``, re-encoded otherwise. MP4 and Matroska files are probed with ffprobe:
+    an audio-only MP4 can be passed through, a video with a usable audio track is reduced
+    to that track by stream copy if the container it is copied into is listed in
+    ``passthrough``, and only what is left gets re-encoded.
+
+    Args:
+        input_path: Path to the uploaded file on disk
+        header: The leading bytes of the file
+        passthrough: Containers the Whisper backend should receive unchanged
+
+    Returns:
+        ConversionPlan: The action plus the container/codec it applies to
+    """
+    container = sniff_container(header)
+    if container is None:
+        return ConversionPlan(ConversionAction.TRANSCODE)
+    if container in AUDIO_ONLY_CONTAINERS:
+        action = ConversionAction.PASSTHROUGH if container in passthrough else ConversionAction.TRANSCODE
+        return ConversionPlan(action, container)
+
+    streams = await probe_streams(input_path)
+    if streams is None:
+        return ConversionPlan(ConversionAction.TRANSCODE, container)
+    audio_codecs = [s["codec_name"] for s in streams if s["codec_type"] == "audio"]
+    has_video = any(s["codec_type"] == "video" for s in streams)
+    if not audio_codecs:
+        # Let ffmpeg report the missing audio track.
+        return ConversionPlan(ConversionAction.TRANSCODE, container)
+    if not has_video and container in passthrough:
+        return ConversionPlan(ConversionAction.PASSTHROUGH, container, audio_codecs[0])
+    remux = REMUXABLE_CODECS.get(audio_codecs[0])
+    if remux is not None and remux[1] in passthrough:
+        return ConversionPlan(ConversionAction.REMUX, container, audio_codecs[0])
+    return ConversionPlan(ConversionAction.TRANSCODE, container, audio_codecs[0])
+
+
+async def transcode_stream(
+    chunks: AsyncIterator[bytes], target: NormalizationTarget = NormalizationTarget.MP3
+) -> AsyncIterator[bytes]:
+    """
+    Convert a stream of audio/video bytes to ``target`` by piping it through FFmpeg.
+
+    ``chunks`` is written to ffmpeg's stdin by a background task while the output is yielded
+    from ffmpeg's stdout as soon as it is produced, so the conversion overlaps with both
+    the producer and the consumer and nothing touches the disk. The input must be
+    demuxable from a pipe (see ``requires_seekable_input``).
+
+    Args:
+        chunks: The source audio/video file content
+        target: Codec to convert to
 
-    Streams disk-to-disk: the input is read from ``input_path`` and the converted MP3 is
+    Yields:
+        bytes: Chunks of the converted audio
+
+    Raises:
+        AudioConversionError: If ffmpeg exits with a non-zero status
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        *encode_args(target),
+        "pipe:1",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    # All three pipes were requested above, so they are never None.
+    stdin = cast(asyncio.StreamWriter, process.stdin)
+    stdout = cast(asyncio.StreamReader, process.stdout)
+    stderr = cast(asyncio.StreamReader, process.stderr)
+
+    async def _feed() -> None:
+        try:
+            async for chunk in chunks:
+                stdin.write(chunk)
+                await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg stopped reading; its exit status carries the actual error.
+            return
+        except BaseException:
+            # The producer failed (e.g. upload too large): do not let ffmpeg finish on
+            # a truncated input.
+            process.kill()
+            raise
+        finally:
+            stdin.close()
+
+    logger.info("Starting FFmpeg pipe conversion")
+    feeder = asyncio.create_task(_feed())
+    stderr_reader = asyncio.create_task(stderr.read())
+    try:
+        while data := await stdout.read(_PIPE_READ_BYTES):
+            yield data
+        # Surface producer errors before looking at ffmpeg's exit status.
+        await feeder
+        returncode = await process.wait()
+        if returncode != 0:
+            error_msg = (await stderr_reader).decode(errors="replace") or "Unknown FFmpeg error"
+            logger.error(f"FFmpeg pipe conversion failed: {error_msg}")
+            raise AudioConversionError(error_msg)
+        logger.info("FFmpeg pipe conversion completed")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        feeder.cancel()
+        stderr_reader.cancel()
+
+
+async def _run_ffmpeg_to_file(
+    input_path: str, output_args: list[str], suffix: str, input_args: list[str] | None = None
+) -> str:
+    """
+    Run ffmpeg on ``input_path`` and write its output to a new temporary file.
+
+    ``input_args`` are placed before ``-i`` (e.g. ``-ss``/``-t`` to read only part of the input).
+
+    ffmpeg runs as an asyncio subprocess, so the event loop is never blocked and a
+    cancelled caller kills the process instead of leaving it running.
+
+    Returns:
+        str: Path of the output file, owned by the caller
+
+    Raises:
+        AudioConversionError: If ffmpeg fails or times out
+    """
+    # Create the output temp file (closed immediately; ffmpeg writes to its path).
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as output_temp:
+        output_path = output_temp.name
+
+    cmd = ["ffmpeg", "-y", *(input_args or []), "-i", input_path, *output_args, output_path]
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=_FFMPEG_TIMEOUT_SECONDS)
+        finally:
+            # Timed out or cancelled: do not leave ffmpeg running in the background.
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+    except TimeoutError as e:
+        logger.exception("FFmpeg conversion timed out")
+        Path(output_path).unlink(missing_ok=True)
+        raise AudioConversionError(_TIMEOUT_MESSAGE) from e
+    except BaseException:
+        # Covers cancellation and a missing ffmpeg binary: clean up the partial output.
+        Path(output_path).unlink(missing_ok=True)
+        raise
+
+    if process.returncode != 0:
+        error_msg = stderr.decode(errors="replace") or "Unknown FFmpeg error"
+        logger.error(f"FFmpeg conversion failed: {error_msg}")
+        Path(output_path).unlink(missing_ok=True)
+        raise AudioConversionError(error_msg)
+
+    return output_path
+
+
+def _output_suffix(target: NormalizationTarget) -> str:
+    return Path(normalized_format(target).filename).suffix
+
+
+@future_safe
+async def normalize_audio(input_path: str, target: NormalizationTarget = NormalizationTarget.MP3) -> str:
+    """
+    Convert an audio or video file to mono 16 kHz ``target`` audio using FFmpeg.
+
+    Streams disk-to-disk: the input is read from ``input_path`` and the converted audio is
     written to a freshly created temporary file whose path is returned. Neither the input
     nor the output is loaded into memory here, so it is safe for multi-hour files.
 
     Args:
         input_path: Path to the source audio/video file on disk
+        target: Codec to convert to
 
     Returns:
-        IOResult[str, Exception]: Path to the converted MP3 file, or an error. The caller
+        IOResult[str, Exception]: Path to the converted file, or an error. The caller
         owns the returned file and is responsible for deleting it.
 
     Raises:
         AudioConversionError: If conversion fails (inside the Result)
     """
-    try:
-        input_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
-        logger.info(f"Starting FFmpeg audio conversion, file size: {input_size_mb:.1f}MB")
+    input_size_mb = Path(input_path).stat().st_size / (1024 * 1024)
+    logger.info(f"Starting FFmpeg audio conversion, file size: {input_size_mb:.1f}MB")
+    logger.info(f"Running FFmpeg conversion to {target}")
+
+    output_path = await _run_ffmpeg_to_file(input_path, encode_args(target), _output_suffix(target))
+
+    output_size_mb = Path(output_path).stat().st_size / (1024 * 1024)
+    compression_ratio = input_size_mb / output_size_mb if output_size_mb > 0 else 0
+    logger.info(
+        f"FFmpeg conversion completed. Output size: {output_size_mb:.1f}MB (compression ratio: {compression_ratio:.1f}x)"
+    )
+    return output_path
+
+
+def convert_to_mp3(input_path: str) -> FutureResultE[str]:
+    """
+    Convert an audio or video file to MP3 using FFmpeg with balanced quality settings (64k bitrate).
+
+    Shorthand for ``normalize_audio(input_path, NormalizationTarget.MP3)``.
+    """
+    return normalize_audio(input_path, NormalizationTarget.MP3)
+
+
+@future_safe
+async def extract_audio(input_path: str, audio_codec: str) -> str:
+    """
+    Copy the first audio stream of a (video) container into an audio-only file.
 
-        # Create the output temp file (closed immediately; ffmpeg writes to its path).
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as output_temp:
-            output_path = output_temp.name
+    The audio is stream-copied (``-vn -c:a copy``), so no decoding or encoding happens and
+    the cost is a single pass over the input.
 
-        # Build FFmpeg command with balanced quality settings and resample to 16kHz
-        cmd = [
+    Args:
+        input_path: Path to the source file on disk
+        audio_codec: Codec of the audio stream, as reported by ffprobe; must be one of
+            the codecs in ``REMUXABLE_CODECS``
+
+    Returns:
+        IOResult[str, Exception]: Path to the extracted audio file, or an error. The caller
+        owns the returned file and is responsible for deleting it.
+
+    Raises:
+        AudioConversionError: If extraction fails (inside the Result)
+    """
+    muxer, container = REMUXABLE_CODECS[audio_codec]
+    logger.info(f"Extracting {audio_codec} audio stream without re-encoding")
+    suffix = Path(upload_format(container).filename).suffix
+    return await _run_ffmpeg_to_file(input_path, ["-vn", "-map", "0:a:0", "-c:a", "copy", "-f", muxer], suffix)
+
+
+async def _run_ffmpeg_log(args: list[str], timeout: float) -> bytes | None:
+    """Run ffmpeg for its log output only; returns stderr, or None if it could not run in time."""
+    try:
+        process = await asyncio.create_subprocess_exec(
             "ffmpeg",
-            "-y",
+            "-hide_banner",
+            "-nostats",
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError:
+        logger.warning("ffmpeg is not available")
+        return None
+
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        logger.warning(f"ffmpeg exceeded {timeout}s while analysing the input")
+        return None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return stderr
+
+
+async def probe_duration(input_path: str) -> float | None:
+    """
+    Read the duration of a file without decoding it.
+
+    MP3, WAV, FLAC, Ogg and MP4 durations are parsed from the container headers (see
+    ``header_duration``); anything else, or a header without the duration, falls back to
+    a time-bounded ffprobe call.
+
+    Returns:
+        The duration in seconds, or None if it is unknown
+    """
+    with open(input_path, "rb") as fh:
+        duration = header_duration(fh, sniff_container(fh.read(_SNIFF_BYTES)))
+    if duration is not None:
+        return duration
+
+    probe = await _run_ffprobe(input_path, "format=duration")
+    if probe is None or probe[0] != 0:
+        return None
+    try:
+        return float(json.loads(probe[1])["format"]["duration"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def detect_silences(
+    input_path: str, start: float, length: float, noise_db: int = -30, min_silence_seconds: float = 0.5
+) -> list[tuple[float, float]]:
+    """
+    Find the silent stretches in ``[start, start + length)`` of a file.
+
+    Only the requested window is decoded (ffmpeg seeks to ``start``), so probing a few
+    windows of a multi-hour recording stays cheap.
+
+    Args:
+        input_path: Path to the audio/video file on disk
+        start: Window start in seconds
+        length: Window length in seconds
+        noise_db: Level below which audio counts as silence
+        min_silence_seconds: Shortest pause reported
+
+    Returns:
+        ``(silence_start, silence_end)`` pairs in seconds from the start of the file; empty if
+        there is no silence or the analysis failed
+    """
+    stderr = await _run_ffmpeg_log(
+        [
+            "-ss",
+            f"{start:.3f}",
+            "-t",
+            f"{length:.3f}",
             "-i",
             input_path,
-            "-ac",
-            "1",
-            "-acodec",
-            "libmp3lame",
-            "-b:a",
-            "64k",
-            "-ar",
-            "16000",
-            output_path,
-        ]
-
-        logger.info("Running FFmpeg conversion with balanced quality (64k bitrate)")
-
-        # Run FFmpeg
-        result = subprocess.run(  # noqa: S603
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
+            "-vn",
+            "-af",
+            f"silencedetect=noise={noise_db}dB:d={min_silence_seconds}",
+            "-f",
+            "null",
+            "-",
+        ],
+        _FFMPEG_TIMEOUT_SECONDS,
+    )
+    if stderr is None:
+        return []
 
-        if result.returncode != 0:
-            error_msg = result.stderr or "Unknown FFmpeg error"
-            logger.error(f"FFmpeg conversion failed: {error_msg}")
-            Path(output_path).unlink(missing_ok=True)
-            raise AudioConversionError(error_msg)
+    # silencedetect timestamps are relative to the seek point.
+    starts = [start + float(value) for value in _SILENCE_START_PATTERN.findall(stderr)]
+    ends = [start + float(value) for value in _SILENCE_END_PATTERN.findall(stderr)]
+    # A silence still running at the end of the window has no silence_end.
+    ends += [start + length] * (len(starts) - len(ends))
+    return list(zip(starts, ends, strict=False))
 
-        output_size_mb = Path(output_path).stat().st_size / (1024 * 1024)
-        compression_ratio = input_size_mb / output_size_mb if output_size_mb > 0 else 0
-        logger.info(
-            f"FFmpeg conversion completed. Output size: {output_size_mb:.1f}MB (compression ratio: {compression_ratio:.1f}x)"
-        )
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-        logger.exception("FFmpeg subprocess error")
-        # output_path is set before subprocess.run, so clean up the partial output here too.
-        Path(output_path).unlink(missing_ok=True)
-        raise AudioConversionError(str(e)) from e
-    else:
-        return output_path
+
+@future_safe
+async def cut_audio(
+    input_path: str, start: float, length: float, target: NormalizationTarget = NormalizationTarget.MP3
+) -> str:
+    """
+    Encode ``[start, start + length)`` of a file to ``target`` with the usual conversion settings.
+
+    Args:
+        input_path: Path to the source audio/video file on disk
+        start: Offset of the excerpt in seconds
+        length: Length of the excerpt in seconds
+        target: Codec to convert to
+
+    Returns:
+        IOResult[str, Exception]: Path to the excerpt, or an error. The caller owns the
+        returned file and is responsible for deleting it.
+    """
+    input_args = ["-ss", f"{start:.3f}", "-t", f"{length:.3f}"]
+    return await _run_ffmpeg_to_file(input_path, encode_args(target), _output_suffix(target), input_args=input_args)
@@ -0,0 +1,229 @@
+import struct
+from typing import BinaryIO
+
+from transcribo_backend.models.audio_container import AudioContainer
+
+# How far into an MP3 (after the ID3 tag) the first frame header is searched for.
+_MP3_SYNC_SEARCH_BYTES = 64 * 1024
+# How much of the end of an Ogg stream is searched for the last page.
+_OGG_TAIL_BYTES = 64 * 1024
+
+# MPEG audio layer III bitrates in kbit/s by bitrate index, for MPEG-1 and MPEG-2/2.5.
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by version bits (3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5) and sample rate index.
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _file_size(fh: BinaryIO) -> int:
+    fh.seek(0, 2)
+    return fh.tell()
+
+
+def _read_at(fh: BinaryIO, offset: int, size: int) -> bytes:
+    fh.seek(offset)
+    return fh.read(size)
+
+
+def wav_duration(fh: BinaryIO) -> float | None:
+    """Duration of a RIFF/WAVE file from its ``fmt `` byte rate and ``data`` chunk size."""
+    file_size = _file_size(fh)
+    offset = 12
+    byte_rate = 0
+    while offset + 8 <= file_size:
+        chunk_id, chunk_size = struct.unpack("<4sI", _read_at(fh, offset, 8))
+        if chunk_id == b"fmt ":
+            byte_rate = struct.unpack("<I", _read_at(fh, offset + 16, 4))[0]
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # Streamed WAVs leave the size at 0 or 0xFFFFFFFF; the data then runs to the end.
+            available = file_size - offset - 8
+            data_size = available if chunk_size in (0, 0xFFFFFFFF) else min(chunk_size, available)
+            return data_size / byte_rate
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def flac_duration(fh: BinaryIO) -> float | None:
+    """Duration of a native FLAC file from the sample rate and total samples in STREAMINFO."""
+    block = _read_at(fh, 4, 4 + 34)
+    if len(block) < 38 or block[0] & 0x7F != 0:  # STREAMINFO is always the first block
+        return None
+    packed = int.from_bytes(block[4 + 10 : 4 + 18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _find_box(fh: BinaryIO, start: int, end: int, box_type: bytes) -> tuple[int, int] | None:
+    """Return ``(payload_offset, payload_end)`` of the first ``box_type`` box in ``[start, end)``."""
+    offset = start
+    while offset + 8 <= end:
+        header = _read_at(fh, offset, 16)
+        if len(header) < 8:
+            return None
+        size, current = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1 and len(header) == 16:
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return None
+        if current == box_type:
+            return offset + header_size, min(offset + size, end)
+        offset += size
+    return None
+
+
+def mp4_duration(fh: BinaryIO) -> float | None:
+    """Duration of an ISO-BMFF file from the ``mvhd`` box, wherever ``moov`` sits in the file."""
+    moov = _find_box(fh, 0, _file_size(fh), b"moov")
+    if moov is None:
+        return None
+    mvhd = _find_box(fh, moov[0], moov[1], b"mvhd")
+    if mvhd is None:
+        return None
+    payload = _read_at(fh, mvhd[0], 32)
+    if payload[:1] == b"\x01":
+        if len(payload) < 32:
+            return None
+        timescale, duration = struct.unpack(">IQ", payload[20:32])
+    else:
+        if len(payload) < 20:
+            return None
+        timescale, duration = struct.unpack(">II", payload[12:20])
+    if not timescale:
+        return None
+    return duration / timescale
+
+
+def _id3_size(fh: BinaryIO) -> int:
+    header = _read_at(fh, 0, 10)
+    if len(header) < 10 or not header.startswith(b"ID3"):
+        return 0
+    size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def mp3_frame_length(header: bytes) -> int | None:
+    """Length in bytes of the MPEG layer III frame starting with the 4-byte ``header``, or None if it is not one."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x3
+    layer = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES[1 if version == 3 else 2][bitrate_index] * 1000
+    padding = (header[2] >> 1) & 0x1
+    return (144 if version == 3 else 72) * bitrate // _MP3_SAMPLE_RATES[version][rate_index] + padding
+
+
+def mp3_duration(fh: BinaryIO) -> float | None:
+    """
+    Duration of an MP3 (layer III) stream without decoding it.
+
+    Uses the frame count of a Xing/Info or VBRI header when the encoder wrote one (VBR
+    files); otherwise the stream is treated as constant bitrate and the duration is the
+    audio size divided by the bitrate of the first frame.
+    """
+    file_size = _file_size(fh)
+    audio_start = _id3_size(fh)
+    window = _read_at(fh, audio_start, _MP3_SYNC_SEARCH_BYTES)
+    for index in range(len(window) - 4):
+        if mp3_frame_length(window[index : index + 4]) is not None:
+            frame_start = audio_start + index
+            break
+    else:
+        return None
+
+    version = (window[index + 1] >> 3) & 0x3
+    bitrate_index = window[index + 2] >> 4
+    rate_index = (window[index + 2] >> 2) & 0x3
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples_per_frame = 1152 if version == 3 else 576
+    mono = (window[index + 3] >> 6) == 3
+    side_info = (17 if mono else 32) if version == 3 else (9 if mono else 17)
+
+    frame = _read_at(fh, frame_start, 4 + side_info + 120)
+    xing = frame[4 + side_info : 4 + side_info + 12]
+    if xing[:4] in (b"Xing", b"Info") and len(xing) == 12 and struct.unpack(">I", xing[4:8])[0] & 0x1:
+        frames = struct.unpack(">I", xing[8:12])[0]
+        return frames * samples_per_frame / sample_rate
+    vbri = frame[4 + 32 : 4 + 32 + 18]
+    if vbri[:4] == b"VBRI" and len(vbri) == 18:
+        frames = struct.unpack(">I", vbri[14:18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    bitrate = _MP3_BITRATES[1 if version == 3 else 2][bitrate_index] * 1000
+    audio_end = file_size - 128 if _read_at(fh, file_size - 128, 3) == b"TAG" else file_size
+    return (audio_end - frame_start) * 8 / bitrate
+
+
+def ogg_duration(fh: BinaryIO) -> float | None:
+    """Duration of an Ogg Opus/Vorbis stream from the granule position of its last page."""
+    first_page = _read_at(fh, 0, 27 + 255)
+    if len(first_page) < 28:
+        return None
+    segments = first_page[26]
+    packet = _read_at(fh, 27 + segments, 20)
+    if packet.startswith(b"OpusHead") and len(packet) >= 12:
+        sample_rate, pre_skip = 48000, struct.unpack("<H", packet[10:12])[0]
+    elif packet.startswith(b"\x01vorbis") and len(packet) >= 16:
+        sample_rate, pre_skip = struct.unpack("<I", packet[12:16])[0], 0
+    else:
+        return None
+
+    file_size = _file_size(fh)
+    tail_start = max(0, file_size - _OGG_TAIL_BYTES)
+    tail = _read_at(fh, tail_start, file_size - tail_start)
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or last_page + 14 > len(tail) or not sample_rate:
+        return None
+    granule = struct.unpack("<q", tail[last_page + 6 : last_page + 14])[0]
+    if granule <= 0:
+        return None
+    return max(0, granule - pre_skip) / sample_rate
+
+
+_PARSERS = {
+    AudioContainer.WAV: wav_duration,
+    AudioContainer.FLAC: flac_duration,
+    AudioContainer.MP4: mp4_duration,
+    AudioContainer.MP3: mp3_duration,
+    AudioContainer.OGG: ogg_duration,
+}
+
+
+def header_duration(fh: BinaryIO, container: AudioContainer | None) -> float | None:
+    """
+    Read the duration of a file from its container headers, without decoding any audio.
+
+    Only a few small reads at known offsets are made (plus the tail for Ogg), so this is
+    cheap even for multi-hour files.
+
+    Args:
+        fh: The file, opened in binary mode and seekable
+        container: The container detected from the leading bytes
+
+    Returns:
+        The duration in seconds, or None if the container is not supported or its headers
+        do not carry the duration
+    """
+    parser = _PARSERS.get(container) if container is not None else None
+    if parser is None:
+        return None
+    try:
+        duration = parser(fh)
+    except (struct.error, OSError, ValueError):
+        return None
+    return duration if duration is not None and duration > 0 else None
@@ -0,0 +1,186 @@
+import math
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import pairwise
+
+from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """
+    One excerpt of a long recording, transcribed as its own Whisper task.
+
+    The chunk owns ``[start, end)`` of the recording; its audio runs on until ``audio_end``
+    so the words around the cut are heard by both neighbouring chunks.
+    """
+
+    start: float
+    end: float
+    audio_end: float
+
+    @property
+    def audio_length(self) -> float:
+        """Length of the excerpt sent to Whisper, in seconds."""
+        return self.audio_end - self.start
+
+
+@dataclass
+class ChunkedTask:
+    """A transcription split into chunks, exposed to clients under a single task id."""
+
+    task_id: str
+    chunks: list[AudioChunk]
+    child_task_ids: list[str]
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+def split_targets(duration: float, chunk_seconds: float) -> list[float]:
+    """Evenly spaced ideal cut positions that keep every chunk at most ``chunk_seconds`` long."""
+    count = max(1, math.ceil(duration / chunk_seconds))
+    return [duration * index / count for index in range(1, count)]
+
+
+def pick_cut_point(target: float, silences: Sequence[tuple[float, float]]) -> float:
+    """Cut in the middle of the silence closest to ``target``, or at ``target`` if there is none."""
+    if not silences:
+        return target
+    start, end = min(silences, key=lambda silence: abs((silence[0] + silence[1]) / 2 - target))
+    return (start + end) / 2
+
+
+def plan_chunks(duration: float, cut_points: Sequence[float], overlap_seconds: float) -> list[AudioChunk]:
+    """
+    Turn cut positions into chunks covering the whole recording.
+
+    Args:
+        duration: Length of the recording in seconds
+        cut_points: Positions to cut at, in seconds
+        overlap_seconds: Extra audio each chunk carries past its cut
+
+    Returns:
+        list[AudioChunk]: The chunks in recording order
+    """
+    bounds = [0.0, *sorted(point for point in cut_points if 0.0 < point < duration), duration]
+    return [
+        AudioChunk(start=start, end=end, audio_end=min(duration, end + overlap_seconds))
+        for start, end in pairwise(bounds)
+        if end > start
+    ]
+
+
+def aggregate_status(task: ChunkedTask, statuses: Sequence[TaskStatus]) -> TaskStatus:
+    """
+    Combine the chunk statuses into one status for the parent task.
+
+    Progress is weighted by chunk length. Any failed or cancelled chunk makes the whole
+    task failed/cancelled, so clients can retry it.
+    """
+    states = {status.status for status in statuses}
+    if TaskStatusEnum.FAILED in states:
+        state = TaskStatusEnum.FAILED
+    elif TaskStatusEnum.CANCELLED in states:
+        state = TaskStatusEnum.CANCELLED
+    elif states == {TaskStatusEnum.COMPLETED}:
+        state = TaskStatusEnum.COMPLETED
+    else:
+        state = TaskStatusEnum.IN_PROGRESS
+
+    total = sum(chunk.audio_length for chunk in task.chunks) or 1.0
+    done = sum(
+        chunk.audio_length * (1.0 if status.status == TaskStatusEnum.COMPLETED else status.progress or 0.0)
+        for chunk, status in zip(task.chunks, statuses, strict=True)
+    )
+    executed = [status.executed_at for status in statuses if status.executed_at is not None]
+    return TaskStatus(
+        task_id=task.task_id,
+        status=state,
+        created_at=task.created_at,
+        executed_at=min(executed) if executed else None,
+        progress=round(done / total, 4),
+    )
+
+
+def _overlap(a: Segment, b: Segment) -> float:
+    return max(0.0, min(a.end, b.end) - max(a.start, b.start))
+
+
+def _fresh_label(taken: set[str]) -> str:
+    index = len(taken)
+    while f"SPEAKER_{index:02d}" in taken:
+        index += 1
+    return f"SPEAKER_{index:02d}"
+
+
+def _speaker_mapping(previous: Sequence[Segment], current: Sequence[Segment], known: set[str]) -> dict[str, str]:
+    """
+    Map the chunk-local speaker labels of ``current`` to labels used so far.
+
+    Diarization labels are only consistent within one chunk. Labels are matched by how long
+    the two speakers talk at the same time in the audio both chunks share, largest first.
+    A label without such evidence keeps its name unless that name is already claimed by a
+    match, in which case it gets a fresh one.
+    """
+    shared: dict[tuple[str, str], float] = defaultdict(float)
+    for segment in current:
+        for earlier in previous:
+            if segment.speaker and earlier.speaker:
+                shared[(segment.speaker, earlier.speaker)] += _overlap(segment, earlier)
+
+    mapping: dict[str, str] = {}
+    claimed: set[str] = set()
+    for (local, known_label), seconds in sorted(shared.items(), key=lambda item: item[1], reverse=True):
+        if seconds > 0 and local not in mapping and known_label not in claimed:
+            mapping[local] = known_label
+            claimed.add(known_label)
+
+    for local in dict.fromkeys(segment.speaker for segment in current if segment.speaker):
+        if local not in mapping:
+            mapping[local] = local if local not in claimed else _fresh_label(known | claimed)
+            claimed.add(mapping[local])
+    return mapping
+
+
+def _normalized_text(segment: Segment) -> str:
+    return " ".join(segment.text.lower().split())
+
+
+def merge_chunk_results(
+    chunks: Sequence[AudioChunk], results: Sequence[TranscriptionResponse]
+) -> TranscriptionResponse:
+    """
+    Stitch the chunk transcriptions into one transcription of the whole recording.
+
+    Segment timestamps are shifted by the chunk offset. In the audio shared by two chunks
+    each segment is kept by the chunk that heard it in the middle (decided by the segment
+    midpoint against the middle of the shared audio), and an identical segment repeated
+    right at the seam is dropped. Speaker labels are reconciled across chunks, see
+    ``_speaker_mapping``.
+    """
+    merged: list[Segment] = []
+    previous: list[Segment] = []
+    known_speakers: set[str] = set()
+    for index, (chunk, result) in enumerate(zip(chunks, results, strict=True)):
+        shifted = [
+            segment.model_copy(update={"start": segment.start + chunk.start, "end": segment.end + chunk.start})
+            for segment in result.segments
+        ]
+        # Only the tail of the previous chunk can share audio with this one.
+        previous_tail = [segment for segment in previous if segment.end > chunk.start]
+        mapping = _speaker_mapping(previous_tail, shifted, known_speakers) if index else {}
+        for segment in shifted:
+            if segment.speaker:
+                segment.speaker = mapping.get(segment.speaker, segment.speaker)
+                known_speakers.add(segment.speaker)
+
+        lower = (chunk.start + chunks[index - 1].audio_end) / 2 if index else -math.inf
+        upper = (chunk.end + chunk.audio_end) / 2 if index < len(chunks) - 1 else math.inf
+        owned = [segment for segment in shifted if lower <= (segment.start + segment.end) / 2 < upper]
+        if owned and merged and _normalized_text(owned[0]) == _normalized_text(merged[-1]):
+            owned = owned[1:]
+        merged.extend(owned)
+        previous = shifted
+    return TranscriptionResponse(segments=merged)
@@ -0,0 +1,109 @@
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from dcc_backend_common.logger import get_logger
+
+from transcribo_backend.models.metrics import ConversionStats
+
+logger = get_logger(__name__)
+
+# Assumed conversion run time before the first conversion has finished.
+_DEFAULT_RUN_SECONDS = 10.0
+
+
+class ConversionQueueFullError(Exception):
+    """Raised when every ffmpeg slot is busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Conversion queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class ConversionScheduler:
+    """
+    Admission control for ffmpeg conversions.
+
+    At most ``slots`` conversions run at once; up to ``max_queue`` more wait for a slot
+    and anything beyond that is rejected immediately instead of thrashing the CPU until
+    every conversion hits its timeout. Waiting is cancellation-safe, so a cancelled
+    request leaves the queue right away.
+    """
+
+    def __init__(self, slots: int, max_queue: int) -> None:
+        self.slots = max(1, slots)
+        self.max_queue = max(0, max_queue)
+        self._semaphore = asyncio.Semaphore(self.slots)
+        self._queued = 0
+        self._running = 0
+        self._started = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+        self._max_run_seconds = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether a conversion would get a slot right away."""
+        return not self._semaphore.locked() and not self._queued
+
+    def retry_after(self) -> int:
+        """Estimate in whole seconds until a slot frees up for a newly queued conversion."""
+        avg_run = self._total_run_seconds / self._completed if self._completed else _DEFAULT_RUN_SECONDS
+        return max(1, math.ceil(avg_run * (self._queued / self.slots + 1)))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold an ffmpeg slot for the duration of the ``async with`` block.
+
+        Raises:
+            ConversionQueueFullError: If no slot is free and the wait queue is full
+        """
+        if self._semaphore.locked() and self._queued >= self.max_queue:
+            self._rejected += 1
+            retry_after = self.retry_after()
+            logger.warning(f"Conversion queue full ({self._queued} waiting), rejecting; retry after {retry_after}s")
+            raise ConversionQueueFullError(retry_after)
+
+        enqueued_at = time.monotonic()
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        started_at = time.monotonic()
+        wait_seconds = started_at - enqueued_at
+        self._started += 1
+        self._total_wait_seconds += wait_seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+            run_seconds = time.monotonic() - started_at
+            self._completed += 1
+            self._total_run_seconds += run_seconds
+            self._max_run_seconds = max(self._max_run_seconds, run_seconds)
+
+    def stats(self) -> ConversionStats:
+        """Snapshot of the queue depth and wait/run time counters."""
+        return ConversionStats(
+            slots=self.slots,
+            running=self._running,
+            queued=self._queued,
+            max_queue=self.max_queue,
+            completed=self._completed,
+            rejected=self._rejected,
+            avg_wait_seconds=self._total_wait_seconds / self._started if self._started else 0.0,
+            max_wait_seconds=self._max_wait_seconds,
+            avg_run_seconds=self._total_run_seconds / self._completed if self._completed else 0.0,
+            max_run_seconds=self._max_run_seconds,
+        )
@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import Container
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
+
+from transcribo_backend.models.metrics import DedupStats
+
+
+@dataclass(frozen=True)
+class DedupEntry:
+    """An earlier submission of byte-identical audio with the same parameters."""
+
+    task_id: str
+    # Whether the result of the task is already cached.
+    completed: bool = False
+
+
+class DedupIndex:
+    """
+    Content-addressed index of submitted uploads.
+
+    Maps the SHA-256 of an upload combined with its submit parameters to the task that
+    transcribes it, so a re-upload of the same recording costs neither ffmpeg nor GPU time
+    while that task is pending or its result is cached. A submit reserves its key until it
+    is done, so identical uploads arriving meanwhile wait for its task instead of
+    submitting the recording again.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._task_by_key: TTLCache[str, str] = TTLCache[str, str](maxsize=maxsize, ttl=ttl)
+        self._key_by_task: TTLCache[str, str] = TTLCache[str, str](maxsize=maxsize, ttl=ttl)
+        self._reserved: dict[str, asyncio.Future[None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content_hash: str, params: dict[str, Any]) -> str:
+        """Combine the upload hash with the submit parameters that influence the result."""
+        canonical_params = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f"{content_hash}:{canonical_params}".encode()).hexdigest()
+
+    def lookup(
+        self, key: str, pending_task_ids: Container[str], completed_task_ids: Container[str]
+    ) -> DedupEntry | None:
+        """
+        Find a reusable task for ``key`` and count the hit or miss.
+
+        An entry is only reusable while its task is still pending upstream or its result
+        is cached; anything else is dropped and counted as a miss.
+        """
+        task_id = self._task_by_key.get(key)
+        if task_id is not None:
+            completed = task_id in completed_task_ids
+            if completed or task_id in pending_task_ids:
+                self.hits += 1
+                return DedupEntry(task_id=task_id, completed=completed)
+            self.forget(task_id)
+
+        self.misses += 1
+        return None
+
+    def remember(self, key: str, task_id: str) -> None:
+        """Record that ``task_id`` transcribes the upload identified by ``key``."""
+        self._task_by_key[key] = task_id
+        self._key_by_task[task_id] = key
+
+    def reserve(self, key: str) -> asyncio.Future[None] | None:
+        """Reserve ``key`` for a submit; returns the reservation of a submit already in progress instead."""
+        reserved = self._reserved.get(key)
+        if reserved is not None:
+            return reserved
+        self._reserved[key] = asyncio.get_running_loop().create_future()
+        return None
+
+    def release(self, key: str) -> None:
+        """End the reservation of ``key``, waking the submits waiting for it."""
+        reserved = self._reserved.pop(key, None)
+        if reserved is not None and not reserved.done():
+            reserved.set_result(None)
+
+    def forget(self, task_id: str) -> None:
+        """Drop a task (e.g. failed or cancelled) so the next duplicate is submitted again."""
+        key = self._key_by_task.pop(task_id, None)
+        if key is not None and self._task_by_key.get(key) == task_id:
+            del self._task_by_key[key]
+
+    def stats(self) -> DedupStats:
+        """Snapshot of the index size and hit/miss counters."""
+        return DedupStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._task_by_key),
+        )
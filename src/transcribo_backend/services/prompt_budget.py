@@ -0,0 +1,106 @@
+import math
+import re
+
+import httpx
+from dcc_backend_common.logger import get_logger
+
+from transcribo_backend.models.metrics import SummaryTokenStats
+from transcribo_backend.utils.app_config import AppConfig
+
+logger = get_logger(__name__)
+
+# Words, single punctuation characters and line breaks, roughly as a BPE tokenizer pre-splits text.
+_PIECES = re.compile(r"\w+|[^\w\s]|\n+")
+_WORD = re.compile(r"\w")
+
+
+class PromptBudget:
+    """
+    Token budget of a summarization prompt.
+
+    Tokens are counted by the model's own tokenizer through the ``/tokenize`` endpoint of
+    vLLM when ``tokenize_url`` is set, and estimated locally otherwise, or when that
+    endpoint fails: every punctuation character and line break is a token, and every word
+    takes a token per ``chars_per_token`` characters, non-ASCII characters counting twice
+    (they are rarer in the vocabulary, so German words split into more tokens).
+    """
+
+    def __init__(
+        self,
+        context_tokens: int,
+        reserved_tokens: int,
+        chars_per_token: float,
+        tokenize_url: str = "",
+        model: str = "",
+    ) -> None:
+        self.context_tokens = context_tokens
+        self.reserved_tokens = reserved_tokens
+        self.chars_per_token = max(1.0, chars_per_token)
+        self.tokenize_url = tokenize_url
+        self.model = model
+        self._client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=5.0)) if tokenize_url else None
+        self.requests = 0
+        self.transcript_tokens = 0
+        self.prompt_tokens = 0
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "PromptBudget":
+        return cls(
+            context_tokens=app_config.summary_context_tokens,
+            reserved_tokens=app_config.summary_reserved_tokens,
+            chars_per_token=app_config.summary_chars_per_token,
+            tokenize_url=app_config.summary_tokenize_url,
+            model=app_config.llm_model,
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
+    @property
+    def transcript_budget(self) -> int:
+        """Tokens of transcript one prompt may take."""
+        return max(1, self.context_tokens - self.reserved_tokens)
+
+    def estimate(self, text: str) -> int:
+        """Estimate the tokens of ``text`` without a tokenizer."""
+        tokens = 0
+        for piece in _PIECES.findall(text):
+            if _WORD.match(piece):
+                weight = len(piece) + sum(1 for char in piece if not char.isascii())
+                tokens += math.ceil(weight / self.chars_per_token)
+            else:
+                tokens += 1
+        return tokens
+
+    async def count(self, text: str) -> int:
+        """Count the tokens of ``text`` with the model's tokenizer, or estimate them."""
+        if self._client is None:
+            return self.estimate(text)
+        try:
+            response = await self._client.post(self.tokenize_url, json={"model": self.model, "prompt": text})
+            response.raise_for_status()
+            return int(response.json()["count"])
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as error:
+            logger.warning(f"Counting tokens at {self.tokenize_url} failed, estimating instead: {error}")
+            return self.estimate(text)
+
+    def record(self, transcript_tokens: int, prompt_tokens: int) -> None:
+        """Count a transcript prepared for summarization and the tokens its compaction saved."""
+        self.requests += 1
+        self.transcript_tokens += transcript_tokens
+        self.prompt_tokens += prompt_tokens
+        logger.info(
+            f"Compacted transcript from {transcript_tokens} to {prompt_tokens} tokens "
+            f"({transcript_tokens - prompt_tokens} saved)"
+        )
+
+    def stats(self) -> SummaryTokenStats:
+        """Snapshot of the token counters."""
+        return SummaryTokenStats(
+            requests=self.requests,
+            transcript_tokens=self.transcript_tokens,
+            prompt_tokens=self.prompt_tokens,
+            saved_tokens=self.transcript_tokens - self.prompt_tokens,
+            model_tokenizer=self._client is not None,
+        )
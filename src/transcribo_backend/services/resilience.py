@@ -0,0 +1,176 @@
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+import httpx
+
+# Responses of an overloaded or restarting backend, worth asking again.
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Transport errors raised before Whisper got the whole request, so it cannot have acted on it.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.WriteError, httpx.WriteTimeout)
+
+
+class CircuitState(StrEnum):
+    """State of the circuit breaker of a backend."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class HedgeOutcome(StrEnum):
+    """Whether a hedged call was needed, and which of the two calls answered."""
+
+    NOT_NEEDED = "not_needed"
+    ORIGINAL = "original"
+    HEDGE = "hedge"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a backend whose circuit is open."""
+
+    def __init__(self, url: str, retry_after: float) -> None:
+        super().__init__(f"Whisper backend {url} is unavailable, retry after {math.ceil(retry_after)}s")
+        self.url = url
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    """Whether ``error`` means the backend is unreachable or broken, rather than the request being wrong."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+
+
+def can_resend(error: BaseException) -> bool:
+    """
+    Whether a request that failed with ``error`` can be sent again without doing its work twice.
+
+    True if it never reached the backend completely, or the backend answered with an error
+    status; not if the connection broke while waiting for the answer, as the backend may
+    have acted on the request already.
+    """
+    if isinstance(error, _UNSENT_ERRORS):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an idempotent request that failed with ``error`` is worth sending again."""
+    return isinstance(error, httpx.TransportError) and not isinstance(error, httpx.UnsupportedProtocol)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker of one backend.
+
+    After ``failure_threshold`` failures in a row the circuit opens and requests fail fast
+    for ``reset_seconds``; then a single probe request is let through (half-open), which
+    closes the circuit on success or opens it again on failure.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = max(0.0, reset_seconds)
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened = 0
+        self.rejected = 0
+        self._probing = False
+
+    @property
+    def retry_at(self) -> float:
+        """Monotonic time at which an open circuit lets a probe through."""
+        return self.opened_at + self.reset_seconds
+
+    @property
+    def available(self) -> bool:
+        """Whether a request would be let through now, without letting it through."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return time.monotonic() >= self.retry_at
+        return not self._probing
+
+    def allow(self) -> bool:
+        """Let a request through, or count it as rejected; the first request after the reset time is the probe."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and time.monotonic() < self.retry_at:
+            self.rejected += 1
+            return False
+        if self.state == CircuitState.HALF_OPEN and self._probing:
+            self.rejected += 1
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probing = False
+        if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                self.opened += 1
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a request that neither proved nor disproved the backend (e.g. it was cancelled)."""
+        self._probing = False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently a failed request is sent again."""
+
+    attempts: int
+    backoff_seconds: float
+    max_backoff_seconds: float = 10.0
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before the ``retry``-th retry: exponential backoff with full jitter."""
+        ceiling = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (retry - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+async def first_completed[T](send: Callable[[], Awaitable[T]], hedge_after: float) -> tuple[T, HedgeOutcome]:
+    """
+    Await ``send()``, and start a second identical call if the first takes longer than ``hedge_after``.
+
+    Whichever call succeeds first wins and the other one is cancelled; an error is only
+    raised once both failed.
+
+    Returns:
+        The result, and whether a second call was made and answered first
+    """
+    calls = [asyncio.ensure_future(send())]
+    try:
+        done, _ = await asyncio.wait(calls, timeout=hedge_after)
+        if done:
+            return calls[0].result(), HedgeOutcome.NOT_NEEDED
+        calls.append(asyncio.ensure_future(send()))
+        pending = set(calls)
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for call in done:
+                error = call.exception()
+                if error is None:
+                    return call.result(), HedgeOutcome.HEDGE if call is calls[1] else HedgeOutcome.ORIGINAL
+                errors.append(error)
+        raise errors[-1]
+    finally:
+        # The slower call, or both if the caller is cancelled.
+        for call in calls:
+            call.cancel()
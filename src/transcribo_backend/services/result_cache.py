@@ -0,0 +1,180 @@
+import gzip
+import hashlib
+import os
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from transcribo_backend.models.metrics import ResultCacheStats
+from transcribo_backend.models.transcription_response import TranscriptionResponse
+
+# gzip level of the cached results; level 6 shrinks transcript JSON about tenfold.
+_COMPRESS_LEVEL = 6
+_SPILL_SUFFIX = ".json.gz"
+# zlib window bits that make a compressor write the gzip format.
+_GZIP_WBITS = 31
+
+
+class ResultCache:
+    """
+    Byte-budgeted LRU cache of post-processed transcription results.
+
+    Results are kept as gzip-compressed JSON, so a repeated fetch can be answered with the
+    stored bytes as they are, and eviction follows the compressed size of the entries
+    rather than their number. With a ``spill_dir``, results evicted from memory move to
+    files in that directory, which has a budget of its own; a directory shared by the
+    workers of a node lets each of them serve the results the others fetched. Every file
+    is a single small write or read, so the calls are made inline.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: str = "", max_disk_bytes: int = 0) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self.max_disk_bytes = max(0, max_disk_bytes)
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        # Spilled files by name, oldest first, with their sizes.
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._index_spilled_files()
+
+    def _index_spilled_files(self) -> None:
+        """Take over the files spilled before a restart, oldest first."""
+        if self.spill_dir is None:
+            return
+        files = sorted(self.spill_dir.glob(f"*{_SPILL_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+        for path in files:
+            self._disk[path.name] = path.stat().st_size
+            self._disk_bytes += self._disk[path.name]
+        self._shrink_disk()
+
+    @staticmethod
+    def _file_name(task_id: str) -> str:
+        # Task ids come from the client, so they never become paths themselves.
+        return hashlib.sha256(task_id.encode()).hexdigest() + _SPILL_SUFFIX
+
+    def __contains__(self, task_id: object) -> bool:
+        if not isinstance(task_id, str):
+            return False
+        if task_id in self._memory:
+            return True
+        return self.spill_dir is not None and (self.spill_dir / self._file_name(task_id)).exists()
+
+    def get_compressed(self, task_id: str) -> bytes | None:
+        """Return the gzip-compressed JSON of the result of ``task_id``, or None if it is not cached."""
+        data = self._memory.get(task_id)
+        if data is not None:
+            self._memory.move_to_end(task_id)
+            self.hits += 1
+            return data
+
+        data = self._read_spilled(task_id)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._keep_in_memory(task_id, data)
+        return data
+
+    def get(self, task_id: str) -> TranscriptionResponse | None:
+        """Return the result of ``task_id``, or None if it is not cached."""
+        data = self.get_compressed(task_id)
+        if data is None:
+            return None
+        return TranscriptionResponse.model_validate_json(gzip.decompress(data))
+
+    @staticmethod
+    def compressor() -> "zlib._Compress":
+        """Incremental compressor producing what ``put_compressed`` expects, for results built piece by piece."""
+        return zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+
+    def put(self, task_id: str, result: TranscriptionResponse) -> None:
+        """Cache ``result``, evicting the least recently used results beyond the budget."""
+        data = gzip.compress(result.model_dump_json().encode(), compresslevel=_COMPRESS_LEVEL, mtime=0)
+        self.put_compressed(task_id, data)
+
+    def put_compressed(self, task_id: str, data: bytes) -> None:
+        """Cache the gzip-compressed JSON of a result, evicting the least recently used results beyond the budget."""
+        self.discard(task_id)
+        if len(data) > self.max_bytes:
+            self._spill(task_id, data)
+            return
+        self._keep_in_memory(task_id, data)
+
+    def discard(self, task_id: str) -> None:
+        """Forget the result of ``task_id``, e.g. because the task is transcribed again."""
+        data = self._memory.pop(task_id, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+        if self.spill_dir is not None:
+            name = self._file_name(task_id)
+            self._disk_bytes -= self._disk.pop(name, 0)
+            (self.spill_dir / name).unlink(missing_ok=True)
+
+    def _keep_in_memory(self, task_id: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        self._memory[task_id] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_bytes:
+            evicted_id, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+            self._spill(evicted_id, evicted)
+
+    def _spill(self, task_id: str, data: bytes) -> None:
+        if self.spill_dir is None or len(data) > self.max_disk_bytes:
+            return
+        name = self._file_name(task_id)
+        if name in self._disk:
+            # Promoted from disk earlier; the file is still there.
+            self._disk.move_to_end(name)
+            return
+        partial = self.spill_dir / f"{name}.{os.getpid()}.tmp"
+        partial.write_bytes(data)
+        # Readers in other workers see either no file or the complete one.
+        partial.replace(self.spill_dir / name)
+        self._disk[name] = len(data)
+        self._disk_bytes += len(data)
+        self._shrink_disk()
+
+    def _shrink_disk(self) -> None:
+        while self.spill_dir is not None and self._disk_bytes > self.max_disk_bytes and self._disk:
+            name, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            (self.spill_dir / name).unlink(missing_ok=True)
+
+    def _read_spilled(self, task_id: str) -> bytes | None:
+        if self.spill_dir is None:
+            return None
+        name = self._file_name(task_id)
+        try:
+            data = (self.spill_dir / name).read_bytes()
+        except FileNotFoundError:
+            self._disk_bytes -= self._disk.pop(name, 0)
+            return None
+        if name not in self._disk:
+            # Spilled by another worker sharing the directory; it now counts against this budget too.
+            self._disk[name] = len(data)
+            self._disk_bytes += len(data)
+        self._disk.move_to_end(name)
+        self._shrink_disk()
+        return data
+
+    def stats(self) -> ResultCacheStats:
+        """Snapshot of the cache size and hit, miss and eviction counters."""
+        return ResultCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._memory),
+            bytes=self._memory_bytes,
+            max_bytes=self.max_bytes,
+            disk_entries=len(self._disk),
+            disk_bytes=self._disk_bytes,
+            evictions=self.evictions,
+        )
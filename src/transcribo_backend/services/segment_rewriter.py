@@ -0,0 +1,127 @@
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from transcribo_backend.utils.app_config import AppConfig
+
+# Replacements every transcript gets, whatever is configured: Swiss German has no ß.
+_BUILTIN_REPLACEMENTS = {"ß": "ss"}
+# Joins the texts of a batch so one regex pass covers all of them; never part of a transcript.
+_SEPARATOR = "\x00"
+_DEFAULT_SPEAKER = "Unknown"
+# Cleaned speaker labels remembered before the memo is reset.
+_MAX_SPEAKERS = 1024
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex matching any of ``words``, factored into a prefix tree.
+
+    Python's ``re`` tries the branches of an alternation one after the other at every
+    position; as a tree, a position is rejected after a single character and only the
+    words sharing the prefix read so far are followed. Longer words win over their prefixes.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _emit(node: dict[str, Any]) -> str:
+        ends = "" in node
+        branches = [re.escape(char) + _emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{group})?" if ends else group
+
+    return _emit(trie)
+
+
+def _words_pattern(words: Iterable[str]) -> str:
+    """Pattern matching any of ``words``, as a whole word where it starts or ends with a word character."""
+    groups: dict[tuple[bool, bool], list[str]] = {}
+    for word in words:
+        groups.setdefault((bool(_WORD_CHAR.match(word)), bool(_WORD_CHAR.match(word[-1]))), []).append(word)
+    patterns = [
+        ("(?<!\\w)" if starts_word else "") + _trie_pattern(group) + ("(?!\\w)" if ends_word else "")
+        for (starts_word, ends_word), group in sorted(groups.items())
+    ]
+    return "|".join(patterns)
+
+
+class SegmentRewriter:
+    """
+    Cleans the segments of a transcription in one regex pass per batch.
+
+    All replacements (the built-in ones plus ``replacements``) and the removal of
+    ``filler_words`` are compiled into a single regex, with the words factored into prefix
+    trees, and the texts of a batch are joined so they are rewritten by one ``re.sub`` call
+    instead of one per segment and rule. Configured words match whole words only; longer
+    keys win over keys they start with. Texts are stripped, and speaker labels default to
+    "Unknown" and are capitalized.
+    """
+
+    def __init__(self, replacements: Mapping[str, str] | None = None, filler_words: Sequence[str] = ()) -> None:
+        configured = {key: value for key, value in (replacements or {}).items() if key}
+        self.replacements = {**_BUILTIN_REPLACEMENTS, **configured}
+        self.filler_words = [word for word in filler_words if word]
+        alternatives: list[str] = []
+        if self.filler_words:
+            # Fillers match in any case and take the punctuation and spaces after them along, but never a separator.
+            fillers = _words_pattern(self.filler_words)
+            alternatives.append(rf"(?P<filler>(?i:{fillers})[,;]?[^\S{_SEPARATOR}]*)")
+        # Configured words before the built-in characters they may contain.
+        if configured:
+            alternatives.append(_words_pattern(configured))
+        alternatives += [re.escape(key) for key in _BUILTIN_REPLACEMENTS if key not in configured]
+        self._pattern = re.compile("|".join(alternatives))
+        self._speakers: dict[str | None, str] = {}
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "SegmentRewriter":
+        """Build the rewriter configured by ``segment_replacements`` and ``segment_filler_words``."""
+        return cls(app_config.segment_replacements, app_config.segment_filler_words)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        if match.lastgroup == "filler":
+            return ""
+        return self.replacements[match.group(0)]
+
+    def rewrite_text(self, text: str) -> str:
+        """Apply the replacements to a single text and strip it."""
+        return self._pattern.sub(self._replace, text.strip()).strip()
+
+    def _speaker(self, speaker: str | None) -> str:
+        # A transcript has a handful of speakers, so their labels are cleaned once each.
+        cleaned = self._speakers.get(speaker)
+        if cleaned is None:
+            if len(self._speakers) >= _MAX_SPEAKERS:
+                self._speakers.clear()
+            cleaned = (speaker or _DEFAULT_SPEAKER).strip().capitalize()
+            self._speakers[speaker] = cleaned
+        return cleaned
+
+    def rewrite(self, segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Clean raw segments in place, before they are turned into models.
+
+        Args:
+            segments: Segments as parsed from the Whisper JSON
+
+        Returns:
+            The same list, for chaining into the model constructor
+        """
+        texts = [str(segment.get("text") or "") for segment in segments]
+        joined = _SEPARATOR.join(texts)
+        if joined.count(_SEPARATOR) == len(texts) - 1:
+            rewritten = [text.strip() for text in self._pattern.sub(self._replace, joined).split(_SEPARATOR)]
+        else:
+            # A text holds the separator itself; rewrite one text at a time instead.
+            rewritten = [self.rewrite_text(text) for text in texts]
+        for segment, text in zip(segments, rewritten, strict=True):
+            segment["text"] = text
+            segment["speaker"] = self._speaker(segment.get("speaker"))
+        return segments
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from transcribo_backend.models.metrics import StatusCacheStats
+from transcribo_backend.models.task_status import TaskStatus
+
+
+class StatusCache:
+    """
+    Single-flight cache of task statuses.
+
+    Concurrent lookups of the same task share one upstream fetch, and its result is
+    served to every lookup within ``ttl`` seconds after it arrived. Failures are never
+    cached: every waiter of a failed fetch gets the error and the next lookup fetches
+    again. With a ``ttl`` of 0 only concurrent lookups are coalesced.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = max(0.0, ttl)
+        self._cached: dict[str, tuple[float, TaskStatus]] = {}
+        self._in_flight: dict[str, asyncio.Future[TaskStatus]] = {}
+        self.fetches = 0
+        self.hits = 0
+        self.coalesced = 0
+
+    async def get(self, task_id: str, fetch: Callable[[], Awaitable[TaskStatus]]) -> TaskStatus:
+        """
+        Return the status of ``task_id``, calling ``fetch`` only if no fresh or in-flight one exists.
+
+        Every caller gets its own copy, so callers can adjust the status without affecting others.
+        """
+        now = time.monotonic()
+        cached = self._cached.get(task_id)
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1].model_copy()
+
+        in_flight = self._in_flight.get(task_id)
+        if in_flight is None:
+            self.fetches += 1
+            in_flight = asyncio.ensure_future(fetch())
+            self._in_flight[task_id] = in_flight
+            in_flight.add_done_callback(lambda future: self._fetched(task_id, future))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the fetch the other callers wait for.
+        status = await asyncio.shield(in_flight)
+        return status.model_copy()
+
+    def _fetched(self, task_id: str, future: asyncio.Future[TaskStatus]) -> None:
+        if self._in_flight.get(task_id) is future:
+            del self._in_flight[task_id]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._expire()
+        if self.ttl > 0:
+            self._cached[task_id] = (time.monotonic() + self.ttl, future.result())
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for task_id in [task_id for task_id, (expires_at, _) in self._cached.items() if expires_at <= now]:
+            del self._cached[task_id]
+
+    def invalidate(self, task_id: str) -> None:
+        """Drop the cached status of ``task_id``, e.g. after it was retried or cancelled."""
+        self._cached.pop(task_id, None)
+        # Lookups from now on must not join a fetch that started before the change.
+        self._in_flight.pop(task_id, None)
+
+    def stats(self) -> StatusCacheStats:
+        """Snapshot of the fetch, hit and coalescing counters."""
+        return StatusCacheStats(fetches=self.fetches, hits=self.hits, coalesced=self.coalesced)
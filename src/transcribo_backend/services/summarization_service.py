@@ -1,15 +1,124 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator, Iterable, Iterator
+
+from dcc_backend_common.logger import get_logger
 from returns.future import future_safe
 
-from transcribo_backend.agents.summarize_agent import SummarizeAgent
+from transcribo_backend.agents.summarize_agent import PROMPT_VERSION, SummarizeAgent
 from transcribo_backend.models.language import Language
-from transcribo_backend.models.summary import Summary, SummaryDeps, SummaryType
+from transcribo_backend.models.summary import Summary, SummaryDeps, SummaryEvent, SummaryEventType, SummaryType
+from transcribo_backend.services.prompt_budget import PromptBudget
+from transcribo_backend.services.summary_cache import SummaryCache
+from transcribo_backend.services.summary_scheduler import SummaryQueueFullError, SummaryScheduler
+from transcribo_backend.services.transcript_compaction import TranscriptCompactor
 from transcribo_backend.utils.app_config import AppConfig
 
+logger = get_logger(__name__)
+
+# Places a transcript is split at, best first: speaker turns (paragraphs), lines, sentences, words.
+_BOUNDARIES = (
+    re.compile(r"(?<=\n\n)"),
+    re.compile(r"(?<=\n)"),
+    re.compile(r"(?<=[.!?] )"),
+    re.compile(r"(?<= )"),
+)
+_NOTES_SEPARATOR = "\n\n"
+_GENERATION_FAILED = "Failed to generate summary"
+_STREAM_ABANDONED = "The streamed summary was abandoned before it was complete"
+
+
+def _pieces(text: str, max_chars: int, level: int = 0) -> Iterator[str]:
+    """Cut ``text`` into pieces of at most ``max_chars`` at the best boundary that makes them fit."""
+    if len(text) <= max_chars:
+        yield text
+    elif level == len(_BOUNDARIES):
+        for start in range(0, len(text), max_chars):
+            yield text[start : start + max_chars]
+    else:
+        for piece in _BOUNDARIES[level].split(text):
+            yield from _pieces(piece, max_chars, level + 1)
+
+
+def _pack(pieces: Iterable[str], max_chars: int, separator: str = "") -> list[str]:
+    """Join consecutive pieces into as few parts of at most ``max_chars`` as their order allows."""
+    parts: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        added = len(piece) + (len(separator) if current else 0)
+        if current and size + added > max_chars:
+            parts.append(separator.join(current))
+            current, size = [], 0
+            added = len(piece)
+        current.append(piece)
+        size += added
+    if current:
+        parts.append(separator.join(current))
+    return parts
+
+
+def split_transcript(transcript: str, max_chars: int) -> list[str]:
+    """
+    Split a transcript into consecutive parts of at most ``max_chars`` characters.
+
+    Parts end at speaker turns (blank lines) where possible, then at line ends, sentence
+    ends and words; only a single word longer than ``max_chars`` is cut.
+    """
+    parts = _pack(_pieces(transcript, max(1, max_chars)), max(1, max_chars))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _shorten(notes: list[str], max_chars: int, separator: str = "") -> list[str]:
+    """Cut every note to an equal share of ``max_chars``, at the best boundary within it."""
+    share = max(1, (max_chars - len(separator) * (len(notes) - 1)) // len(notes))
+    return [next(iter(split_transcript(note, share)), "") for note in notes]
+
 
 class SummarizationService:
     def __init__(self, app_config: AppConfig, summarize_agent: SummarizeAgent):
         self.app_config = app_config
         self.agent = summarize_agent
+        # Keyed by transcript, summary type, language, model and prompt version.
+        self.summary_cache = SummaryCache(
+            max_bytes=self.app_config.summary_cache_bytes, ttl=self.app_config.summary_cache_ttl_seconds
+        )
+        self.budget = PromptBudget.from_config(self.app_config)
+        self.scheduler = SummaryScheduler(
+            slots=self.app_config.summary_slots,
+            max_queue=self.app_config.summary_queue_size,
+            max_per_client=self.app_config.summary_queue_per_client,
+        )
+        self.compactor = TranscriptCompactor.from_config(self.app_config)
+        # Every request to the LLM takes one of these, so the part notes of a long transcript
+        # stay within ``summary_slots`` as well, together with the other summaries.
+        self._llm_calls = asyncio.Semaphore(self.scheduler.slots)
+
+    async def aclose(self) -> None:
+        await self.budget.aclose()
+
+    def _key(self, transcript: str, summary_type: SummaryType, language: Language | None) -> str:
+        return SummaryCache.make_key(transcript, summary_type, language, self.app_config.llm_model, PROMPT_VERSION)
+
+    def check_admission(
+        self,
+        transcript: str,
+        summary_type: SummaryType | None = None,
+        language: Language | None = None,
+        *,
+        regenerate: bool = False,
+        client_id: str | None = None,
+    ) -> None:
+        """
+        Check that a summary request would not be rejected, before a streamed answer starts.
+
+        Raises:
+            SummaryQueueFullError: If the summary is not cached and the queue, or the client's share of it, is full
+        """
+        key = self._key(transcript, summary_type or SummaryType.ERGEBNISPROTOKOLL, language)
+        served = (not regenerate and key in self.summary_cache) or self.summary_cache.is_generating(key)
+        if not served and not self.scheduler.admits(client_id):
+            raise SummaryQueueFullError(self.scheduler.retry_after())
 
     @future_safe
     async def summarize(
@@ -17,13 +126,175 @@ class SummarizationService:
         transcript: str,
         summary_type: SummaryType | None = None,
         language: Language | None = None,
+        *,
+        regenerate: bool = False,
+        client_id: str | None = None,
     ) -> Summary:
         """
         Summarize a transcript of a meeting.
+
+        Summaries are cached: a request for a summary that was generated recently, or is
+        being generated, gets it without another LLM run, unless ``regenerate`` is set.
+        Otherwise the summary waits for its turn at the LLM in the queue of ``client_id``;
+        it fails with ``SummaryQueueFullError`` if the queue is full.
+        """
+        if summary_type is None:
+            summary_type = SummaryType.ERGEBNISPROTOKOLL
+
+        key = self._key(transcript, summary_type, language)
+        summary = await self.summary_cache.get(
+            key, lambda: self._generate(transcript, summary_type, language, client_id), refresh=regenerate
+        )
+        return Summary(summary=summary)
+
+    async def summarize_stream(
+        self,
+        transcript: str,
+        summary_type: SummaryType | None = None,
+        language: Language | None = None,
+        *,
+        regenerate: bool = False,
+        client_id: str | None = None,
+    ) -> AsyncIterator[SummaryEvent]:
+        """
+        Summarize a transcript of a meeting, yielding the summary while the LLM writes it.
+
+        While the summary waits for its turn at the LLM, ``queued`` events report its
+        position and estimated start. ``delta`` events carry the markdown as it is generated
+        and a final ``summary`` event the complete summary, which is then cached; a failure,
+        or a full queue, ends the stream with an ``error`` event. A cached summary is sent
+        as a single delta unless ``regenerate`` is set, and so is one that an identical
+        request is generating, once it is complete; identical requests in turn wait for
+        this stream. A long transcript streams its final protocol once the notes on its
+        parts were taken.
         """
         if summary_type is None:
             summary_type = SummaryType.ERGEBNISPROTOKOLL
 
+        key = self._key(transcript, summary_type, language)
+        cached = None if regenerate else self.summary_cache.lookup(key)
+        if cached is not None:
+            yield SummaryEvent(type=SummaryEventType.DELTA, delta=cached)
+            yield SummaryEvent(type=SummaryEventType.SUMMARY, summary=Summary(summary=cached))
+            return
+
+        in_flight = self.summary_cache.join(key)
+        if in_flight is not None:
+            try:
+                # A client going away must not cancel the run the other requests wait for.
+                summary = await asyncio.shield(in_flight)
+            except Exception:
+                yield SummaryEvent(type=SummaryEventType.ERROR, error=_GENERATION_FAILED)
+                return
+            yield SummaryEvent(type=SummaryEventType.DELTA, delta=summary)
+            yield SummaryEvent(type=SummaryEventType.SUMMARY, summary=Summary(summary=summary))
+            return
+
+        try:
+            ticket = self.scheduler.enqueue(client_id)
+        except SummaryQueueFullError as error:
+            yield SummaryEvent(type=SummaryEventType.ERROR, error=str(error))
+            return
+
+        # Identical requests wait for this stream rather than running the LLM again.
+        generated = self.summary_cache.start(key)
+        deltas: list[str] = []
+        try:
+            async for position in self.scheduler.positions(ticket):
+                yield SummaryEvent(type=SummaryEventType.QUEUED, queue=position)
+            prompt, deps = await self._prepare(transcript, summary_type, language)
+            async with self._llm_calls:
+                async for delta in self.agent.stream_summary(prompt, deps):
+                    deltas.append(delta)
+                    yield SummaryEvent(type=SummaryEventType.DELTA, delta=delta)
+            summary = "".join(deltas)
+            generated.set_result(summary)
+        except Exception as error:
+            logger.exception("Failed to stream summary")
+            generated.set_exception(error)
+            yield SummaryEvent(type=SummaryEventType.ERROR, error=_GENERATION_FAILED)
+            return
+        finally:
+            # Also when the client went away while waiting or streaming.
+            self.scheduler.release(ticket)
+            if not generated.done():
+                generated.set_exception(RuntimeError(_STREAM_ABANDONED))
+
+        yield SummaryEvent(type=SummaryEventType.SUMMARY, summary=Summary(summary=summary))
+
+    async def _generate(
+        self, transcript: str, summary_type: SummaryType, language: Language | None, client_id: str | None = None
+    ) -> str:
+        """Wait for a turn at the LLM, then run the agent on a transcript, or on the notes on its parts."""
+        async with self.scheduler.slot(client_id):
+            prompt, deps = await self._prepare(transcript, summary_type, language)
+            return await self._run(prompt, deps)
+
+    async def _run(self, prompt: str, deps: SummaryDeps) -> str:
+        """Run the agent once a request to the LLM is allowed."""
+        async with self._llm_calls:
+            return await self.agent.run(prompt, deps=deps)
+
+    async def _prepare(
+        self, transcript: str, summary_type: SummaryType, language: Language | None
+    ) -> tuple[str, SummaryDeps]:
+        """
+        Return the prompt and deps of the run that writes the protocol.
+
+        The transcript is compacted first (fillers dropped, turns of a speaker merged,
+        repeated speaker labels aliased) and the tokens that saved are recorded. A compacted
+        transcript over the token budget of one prompt (``summary_context_tokens`` less
+        ``summary_reserved_tokens``) is summarized map-reduce: it is split at speaker turns
+        into parts that fit one prompt, notes on the parts are taken concurrently
+        (``summary_concurrency`` at a time), and the notes are combined into the requested
+        protocol. Notes too long for one prompt are condensed the same way first, so the
+        latency is that of a few rounds of parallel prompts; should a round not make them
+        shorter, each note is cut to its share of the prompt instead.
+        """
         deps = SummaryDeps(summary_type=summary_type, language=language)
-        result = await self.agent.run(transcript, deps=deps)
-        return Summary(summary=result)
+        compact = self.compactor.compact(transcript)
+        prompt = compact.text
+        transcript_tokens, prompt_tokens = await asyncio.gather(
+            self.budget.count(transcript), self.budget.count(prompt)
+        )
+        self.budget.record(transcript_tokens, prompt_tokens)
+        budget = self.budget.transcript_budget
+        if prompt_tokens <= budget:
+            return prompt, deps
+
+        # Parts are cut by characters, at the density of tokens measured on this transcript.
+        chars_per_token = len(prompt) / max(1, prompt_tokens)
+        legend_tokens = self.budget.estimate(compact.legend) if compact.legend else 0
+        max_chars = max(1, int((budget - legend_tokens) * chars_per_token))
+        parts = [compact.with_legend(part) for part in split_transcript(compact.body, max_chars)]
+        notes = await self._take_notes(parts, deps)
+        while True:
+            # A note longer than one prompt is split like the transcript, so every group fits.
+            pieces = [piece for note in notes for piece in split_transcript(note, max_chars)]
+            groups = _pack(pieces, max_chars, _NOTES_SEPARATOR)
+            if len(groups) <= 1:
+                notes = groups
+                break
+            condensed = await self._take_notes([compact.with_legend(group) for group in groups], deps)
+            if len(_NOTES_SEPARATOR.join(condensed)) >= len(_NOTES_SEPARATOR.join(notes)):
+                logger.warning(f"Notes did not get shorter ({len(condensed)} notes), cutting them to fit one prompt")
+                notes = _shorten(condensed, max_chars, _NOTES_SEPARATOR)
+                break
+            notes = condensed
+
+        return compact.with_legend(_NOTES_SEPARATOR.join(notes)), deps.model_copy(update={"from_notes": True})
+
+    async def _take_notes(self, parts: list[str], deps: SummaryDeps) -> list[str]:
+        """
+        Take notes on every part concurrently, in order.
+
+        At most ``summary_concurrency`` parts are in flight, and they share the ``summary_slots``
+        requests to the LLM with every other summary.
+        """
+        slots = asyncio.Semaphore(max(1, self.app_config.summary_concurrency))
+
+        async def _notes(part: int, text: str) -> str:
+            async with slots:
+                return await self._run(text, deps.model_copy(update={"part": part, "parts": len(parts)}))
+
+        return list(await asyncio.gather(*(_notes(part, text) for part, text in enumerate(parts, start=1))))
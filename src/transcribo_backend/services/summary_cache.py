@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import unicodedata
+from collections.abc import Awaitable, Callable
+
+from cachetools import TTLCache
+
+from transcribo_backend.models.language import LanguageOrAuto
+from transcribo_backend.models.metrics import SummaryCacheStats
+from transcribo_backend.models.summary import SummaryType
+
+
+def _size(summary: str) -> int:
+    return len(summary.encode())
+
+
+class SummaryCache:
+    """
+    Single-flight cache of generated summaries.
+
+    Requests for the same summary share one LLM run while it is generated, and the summary
+    is served to every request within ``ttl`` seconds after it was generated. The least
+    recently used summaries are evicted once they exceed ``max_bytes``. Failures are never
+    cached. A ``max_bytes`` of 0 only coalesces concurrent requests.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self._summaries: TTLCache[str, str] = TTLCache[str, str](
+            maxsize=max(1, self.max_bytes), ttl=max(0.0, ttl), getsizeof=_size
+        )
+        self._in_flight: dict[str, asyncio.Future[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(
+        transcript: str, summary_type: SummaryType, language: LanguageOrAuto, model: str, prompt_version: str
+    ) -> str:
+        """
+        Identify a summary by what it is generated from.
+
+        The transcript is compared after Unicode normalization with its whitespace collapsed,
+        so a re-post that only differs in line breaks or trailing spaces hits the cache.
+        """
+        normalized = " ".join(unicodedata.normalize("NFC", transcript).split())
+        digest = hashlib.sha256(normalized.encode()).hexdigest()
+        language_code = language.value if language is not None else "auto"
+        return f"{digest}:{summary_type.value}:{language_code}:{model}:{prompt_version}"
+
+    async def get(self, key: str, generate: Callable[[], Awaitable[str]], *, refresh: bool = False) -> str:
+        """
+        Return the summary for ``key``, calling ``generate`` only if no cached or in-flight one exists.
+
+        With ``refresh`` a cached summary is ignored and replaced by a new one; a summary
+        that is being generated is still shared, as it is new anyway.
+        """
+        if not refresh:
+            cached = self.lookup(key)
+            if cached is not None:
+                return cached
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            self.misses += 1
+            in_flight = asyncio.ensure_future(generate())
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda future: self._generated(key, future))
+        else:
+            self.coalesced += 1
+        # A cancelled request must not cancel the run the other requests wait for; its result is still cached.
+        return await asyncio.shield(in_flight)
+
+    def lookup(self, key: str) -> str | None:
+        """Return the cached summary for ``key``, counted as a hit, or None."""
+        cached = self._summaries.get(key)
+        if cached is not None:
+            self.hits += 1
+        return cached
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a summary for ``key`` is cached, without counting a hit."""
+        return key in self._summaries
+
+    def join(self, key: str) -> asyncio.Future[str] | None:
+        """Return the run generating the summary for ``key``, counted as coalesced, or None."""
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+        return in_flight
+
+    def is_generating(self, key: str) -> bool:
+        """Whether a summary for ``key`` is being generated, without counting it as coalesced."""
+        return key in self._in_flight
+
+    def start(self, key: str) -> asyncio.Future[str]:
+        """
+        Register a run generated outside ``get`` (e.g. streamed), counted as a miss.
+
+        Requests for ``key`` share it until the caller sets its result, which is then
+        cached, or its exception.
+        """
+        self.misses += 1
+        generated: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = generated
+        generated.add_done_callback(lambda future: self._generated(key, future))
+        return generated
+
+    def _generated(self, key: str, future: asyncio.Future[str]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._store(key, future.result())
+
+    def _store(self, key: str, summary: str) -> None:
+        if self.max_bytes > 0 and _size(summary) <= self.max_bytes:
+            self._summaries[key] = summary
+        else:
+            self._summaries.pop(key, None)
+
+    def stats(self) -> SummaryCacheStats:
+        """Snapshot of the cache size and hit, miss and coalescing counters."""
+        self._summaries.expire()
+        return SummaryCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            entries=len(self._summaries),
+            bytes=int(self._summaries.currsize),
+            max_bytes=self.max_bytes,
+        )
@@ -0,0 +1,228 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from dcc_backend_common.logger import get_logger
+
+from transcribo_backend.models.metrics import SummaryQueueStats
+from transcribo_backend.models.summary import SummaryQueuePosition
+
+logger = get_logger(__name__)
+
+# Assumed time a summary holds its slot before the first summary has finished.
+_DEFAULT_RUN_SECONDS = 60.0
+# Requests without an X-Client-Id share one client's turns.
+ANONYMOUS_CLIENT = "unknown"
+
+
+class SummaryQueueFullError(Exception):
+    """Raised when every LLM slot is busy and the queue, or the client's share of it, is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Summary queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass(eq=False)
+class SummaryTicket:
+    """A summary request waiting for, or holding, an LLM slot."""
+
+    client_id: str
+    enqueued_at: float
+    granted: bool = False
+    released: bool = False
+    started_at: float = 0.0
+    # Set whenever the queue changes while the ticket waits, and when it is granted its slot.
+    moved: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class SummaryScheduler:
+    """
+    Admission control and fair scheduling of summaries in front of the LLM.
+
+    At most ``slots`` summaries are generated at once; up to ``max_queue`` more wait for a
+    slot, at most ``max_per_client`` of them from one client, and anything beyond that is
+    rejected immediately instead of piling up in the LLM server until every request times
+    out. Waiting clients take turns round-robin, so a client queueing several summaries
+    does not hold up the others; the summaries of one client start in the order they came.
+    Waiting is cancellation-safe, so a cancelled request leaves the queue right away.
+    """
+
+    def __init__(self, slots: int, max_queue: int, max_per_client: int) -> None:
+        self.slots = max(1, slots)
+        self.max_queue = max(0, max_queue)
+        self.max_per_client = max(1, max_per_client)
+        # Waiting tickets by client, in the order the clients take their turns.
+        self._waiting: dict[str, deque[SummaryTicket]] = {}
+        self._queued = 0
+        self._running = 0
+        self._started = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    def _avg_run_seconds(self) -> float:
+        return self._total_run_seconds / self._completed if self._completed else _DEFAULT_RUN_SECONDS
+
+    def eta_seconds(self, position: int) -> int:
+        """Estimate in whole seconds until the summary at ``position`` in the queue starts."""
+        if position <= 0:
+            return 0
+        return max(1, math.ceil(self._avg_run_seconds() * math.ceil(position / self.slots)))
+
+    def retry_after(self) -> int:
+        """Estimate in whole seconds until a rejected summary would find room in the queue."""
+        return self.eta_seconds(1)
+
+    def admits(self, client_id: str | None) -> bool:
+        """Whether a summary of ``client_id`` would be queued (or started) now rather than rejected."""
+        if self._running < self.slots and not self._queued:
+            return True
+        waiting = len(self._waiting.get(client_id or ANONYMOUS_CLIENT, ()))
+        return self._queued < self.max_queue and waiting < self.max_per_client
+
+    def enqueue(self, client_id: str | None) -> SummaryTicket:
+        """
+        Queue a summary of ``client_id``, starting it at once if a slot is free.
+
+        Raises:
+            SummaryQueueFullError: If the queue, or the client's share of it, is full
+        """
+        if not self.admits(client_id):
+            self._rejected += 1
+            retry_after = self.retry_after()
+            logger.warning(
+                f"Summary queue full ({self._queued} waiting) for client {client_id or ANONYMOUS_CLIENT}, "
+                f"rejecting; retry after {retry_after}s"
+            )
+            raise SummaryQueueFullError(retry_after)
+
+        ticket = SummaryTicket(client_id=client_id or ANONYMOUS_CLIENT, enqueued_at=time.monotonic())
+        self._waiting.setdefault(ticket.client_id, deque()).append(ticket)
+        self._queued += 1
+        self._dispatch()
+        return ticket
+
+    async def wait(self, ticket: SummaryTicket) -> None:
+        """Wait until ``ticket`` holds a slot."""
+        while not ticket.granted:
+            ticket.moved.clear()
+            await ticket.moved.wait()
+
+    async def positions(self, ticket: SummaryTicket) -> AsyncIterator[SummaryQueuePosition]:
+        """Yield the position of ``ticket`` whenever the queue changes, until it holds a slot."""
+        reported = None
+        while not ticket.granted:
+            ticket.moved.clear()
+            position = self.position(ticket)
+            if position != reported:
+                reported = position
+                yield position
+            await ticket.moved.wait()
+
+    def release(self, ticket: SummaryTicket) -> None:
+        """Free the slot ``ticket`` holds, or take it out of the queue; releasing twice does nothing."""
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.granted:
+            self._running -= 1
+            self._completed += 1
+            self._total_run_seconds += time.monotonic() - ticket.started_at
+        else:
+            waiting = self._waiting[ticket.client_id]
+            waiting.remove(ticket)
+            self._queued -= 1
+            if not waiting:
+                del self._waiting[ticket.client_id]
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, client_id: str | None) -> AsyncIterator[SummaryTicket]:
+        """
+        Hold an LLM slot for the duration of the ``async with`` block.
+
+        Raises:
+            SummaryQueueFullError: If no slot is free and the queue, or the client's share of it, is full
+        """
+        ticket = self.enqueue(client_id)
+        try:
+            await self.wait(ticket)
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the waiting clients in turn, then tell the others they moved up."""
+        while self._running < self.slots and self._waiting:
+            client_id = next(iter(self._waiting))
+            waiting = self._waiting.pop(client_id)
+            ticket = waiting.popleft()
+            if waiting:
+                # The client's next summary waits for its next turn, after the other clients.
+                self._waiting[client_id] = waiting
+            self._queued -= 1
+            self._running += 1
+            self._started += 1
+            ticket.granted = True
+            ticket.started_at = time.monotonic()
+            wait_seconds = ticket.started_at - ticket.enqueued_at
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            ticket.moved.set()
+        for waiting in self._waiting.values():
+            for ticket in waiting:
+                ticket.moved.set()
+
+    def _ahead(self, ticket: SummaryTicket) -> int:
+        """Summaries that start before ``ticket``, given the clients keep taking turns."""
+        clients = list(self._waiting)
+        rank = clients.index(ticket.client_id)
+        turn = self._waiting[ticket.client_id].index(ticket)
+        ahead = turn
+        for other_rank, client_id in enumerate(clients):
+            if other_rank != rank:
+                # Clients before this one in the rotation get one more turn before it does.
+                ahead += min(len(self._waiting[client_id]), turn + (1 if other_rank < rank else 0))
+        return ahead
+
+    def position(self, ticket: SummaryTicket | None = None) -> SummaryQueuePosition:
+        """Where ``ticket`` waits; without a ticket, where a new summary would wait at most."""
+        if ticket is None:
+            position = self._queued + 1 if self._running >= self.slots else 0
+        elif ticket.granted or ticket.released:
+            position = 0
+        else:
+            position = self._ahead(ticket) + 1
+        return SummaryQueuePosition(
+            position=position or None,
+            eta_seconds=self.eta_seconds(position),
+            queued=self._queued,
+            running=self._running,
+        )
+
+    def client_position(self, client_id: str | None) -> SummaryQueuePosition:
+        """Where the next waiting summary of ``client_id`` is; where a new one would wait if it has none."""
+        waiting = self._waiting.get(client_id or ANONYMOUS_CLIENT)
+        return self.position(waiting[0] if waiting else None)
+
+    def stats(self) -> SummaryQueueStats:
+        """Snapshot of the queue depth and wait/run time counters."""
+        return SummaryQueueStats(
+            slots=self.slots,
+            running=self._running,
+            queued=self._queued,
+            clients=len(self._waiting),
+            max_queue=self.max_queue,
+            completed=self._completed,
+            rejected=self._rejected,
+            avg_wait_seconds=self._total_wait_seconds / self._started if self._started else 0.0,
+            max_wait_seconds=self._max_wait_seconds,
+            avg_run_seconds=self._total_run_seconds / self._completed if self._completed else 0.0,
+        )
@@ -0,0 +1,150 @@
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from http import HTTPStatus
+
+import httpx
+from dcc_backend_common.logger import get_logger
+from fastapi import HTTPException
+
+from transcribo_backend.models.task_event import TaskEvent, TaskEventType
+from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
+from transcribo_backend.models.transcription_response import TranscriptionResponse
+
+logger = get_logger(__name__)
+
+# Events buffered per subscriber; a subscriber that falls further behind skips the oldest statuses.
+_SUBSCRIBER_BUFFER = 16
+# Consecutive failed polls after which the task is reported as failed.
+_MAX_POLL_ERRORS = 5
+
+
+def _is_not_found(error: Exception) -> bool:
+    if isinstance(error, HTTPException):
+        return error.status_code == HTTPStatus.NOT_FOUND
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == HTTPStatus.NOT_FOUND
+    return False
+
+
+@dataclass
+class _Watch:
+    """The subscribers of one task and the poller serving them."""
+
+    subscribers: set[asyncio.Queue[TaskEvent]] = field(default_factory=set)
+    last_event: TaskEvent | None = None
+    poller: asyncio.Task[None] | None = None
+
+
+class TaskEventHub:
+    """
+    Push task status changes to any number of subscribers with one poller per task.
+
+    The first subscriber of a task starts a background poller that fetches the status
+    every ``interval`` seconds and fans every change of status or progress out to all
+    subscribers of that task. Once the task completed, the result is fetched once and
+    sent as the final event; a failed or cancelled task ends with a failure event. The
+    poller stops when the last subscriber leaves, so the polling load follows the number
+    of watched tasks rather than the number of watching clients.
+    """
+
+    def __init__(
+        self,
+        fetch_status: Callable[[str], Awaitable[TaskStatus]],
+        fetch_result: Callable[[str], Awaitable[TranscriptionResponse]],
+        interval: float,
+    ) -> None:
+        self.fetch_status = fetch_status
+        self.fetch_result = fetch_result
+        self.interval = interval
+        self._watches: dict[str, _Watch] = {}
+
+    @property
+    def active_tasks(self) -> int:
+        """Number of tasks that currently have a poller."""
+        return len(self._watches)
+
+    async def subscribe(self, task_id: str) -> AsyncGenerator[TaskEvent]:
+        """
+        Yield the events of ``task_id`` until its result or failure event.
+
+        A new subscriber immediately gets the latest status already known for the task.
+        """
+        watch = self._watches.get(task_id)
+        if watch is None:
+            watch = _Watch()
+            self._watches[task_id] = watch
+            watch.poller = asyncio.create_task(self._poll(task_id, watch))
+        queue: asyncio.Queue[TaskEvent] = asyncio.Queue(maxsize=_SUBSCRIBER_BUFFER)
+        if watch.last_event is not None:
+            queue.put_nowait(watch.last_event)
+        watch.subscribers.add(queue)
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event.type != TaskEventType.STATUS:
+                    return
+        finally:
+            watch.subscribers.discard(queue)
+            if not watch.subscribers and watch.poller is not None and not watch.poller.done():
+                watch.poller.cancel()
+                with suppress(asyncio.CancelledError):
+                    await watch.poller
+
+    def _publish(self, watch: _Watch, event: TaskEvent) -> None:
+        watch.last_event = event
+        for queue in watch.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _poll(self, task_id: str, watch: _Watch) -> None:
+        try:
+            await self._poll_until_done(task_id, watch)
+        finally:
+            if self._watches.get(task_id) is watch:
+                del self._watches[task_id]
+
+    async def _poll_until_done(self, task_id: str, watch: _Watch) -> None:
+        errors = 0
+        last: tuple[str, float | None] | None = None
+        while True:
+            try:
+                status = await self.fetch_status(task_id)
+                errors = 0
+            except Exception as error:
+                errors += 1
+                if _is_not_found(error) or errors >= _MAX_POLL_ERRORS:
+                    logger.info(f"Stopped watching task {task_id}: {error}")
+                    self._publish(watch, TaskEvent(type=TaskEventType.FAILED, error=str(error) or "Task not found"))
+                    return
+                logger.warning(f"Polling task {task_id} failed ({errors}/{_MAX_POLL_ERRORS}): {error}")
+                await asyncio.sleep(self.interval)
+                continue
+
+            if (status.status, status.progress) != last:
+                last = (status.status, status.progress)
+                self._publish(watch, TaskEvent(type=TaskEventType.STATUS, status=status))
+
+            if status.status == TaskStatusEnum.COMPLETED:
+                try:
+                    result = await self.fetch_result(task_id)
+                except Exception as error:
+                    logger.exception(f"Failed to fetch the result of task {task_id}", exc_info=error)
+                    self._publish(watch, TaskEvent(type=TaskEventType.FAILED, status=status, error=str(error)))
+                    return
+                self._publish(watch, TaskEvent(type=TaskEventType.RESULT, status=status, result=result))
+                return
+            if status.status in (TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED):
+                self._publish(watch, TaskEvent(type=TaskEventType.FAILED, status=status, error=f"Task {status.status}"))
+                return
+            await asyncio.sleep(self.interval)
+
+    async def aclose(self) -> None:
+        """Stop all pollers."""
+        pollers = [watch.poller for watch in self._watches.values() if watch.poller is not None]
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from transcribo_backend.services.chunked_transcription import AudioChunk, ChunkedTask
+from transcribo_backend.utils.app_config import AppConfig
+
+
+@dataclass
+class TaskRecord:
+    """What the backend remembers about a submitted task between requests."""
+
+    task_id: str
+    # Whisper progress id of a single task; None for the parent of a chunked transcription.
+    progress_id: str | None = None
+    # The submit parameters that influence the transcription (model, language, ...).
+    params: dict[str, Any] = field(default_factory=dict)
+    # SHA-256 of the uploaded bytes, if known.
+    content_hash: str | None = None
+    # Duration of the recording in seconds, if it could be read.
+    duration: float | None = None
+    # The chunks and their Whisper tasks, for a chunked transcription.
+    chunked: ChunkedTask | None = None
+    # Base URL of the Whisper backend that owns the task; None for the parent of a chunked transcription.
+    backend: str | None = None
+    # Submits of byte-identical uploads this task answers; a cancel by one of them leaves it to the others.
+    holders: int = 1
+    created_at: float = field(default_factory=time.time)
+
+
+class TaskStore(ABC):
+    """
+    Registry of submitted tasks, so any worker can answer for a task another one submitted.
+
+    Records expire ``ttl`` seconds after they were stored.
+    """
+
+    @abstractmethod
+    def put(self, record: TaskRecord) -> None:
+        """Store ``record``, replacing an earlier record of the same task."""
+
+    @abstractmethod
+    def get(self, task_id: str) -> TaskRecord | None:
+        """Return the record of ``task_id``, or None if it is unknown or expired."""
+
+    @abstractmethod
+    def delete(self, task_id: str) -> None:
+        """Forget ``task_id``; unknown ids are ignored."""
+
+    def __contains__(self, task_id: object) -> bool:
+        return isinstance(task_id, str) and self.get(task_id) is not None
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the store."""
+
+
+class InMemoryTaskStore(TaskStore):
+    """Task registry of a single process; forgets everything on restart."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._records: dict[str, tuple[float, TaskRecord]] = {}
+
+    def _expire(self) -> None:
+        now = time.time()
+        for task_id in [task_id for task_id, (expires_at, _) in self._records.items() if expires_at < now]:
+            del self._records[task_id]
+
+    def put(self, record: TaskRecord) -> None:
+        self._expire()
+        self._records[record.task_id] = (record.created_at + self.ttl, record)
+
+    def get(self, task_id: str) -> TaskRecord | None:
+        entry = self._records.get(task_id)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def delete(self, task_id: str) -> None:
+        self._records.pop(task_id, None)
+
+
+def _chunked_to_json(chunked: ChunkedTask | None) -> str | None:
+    if chunked is None:
+        return None
+    return json.dumps({
+        "task_id": chunked.task_id,
+        "chunks": [[chunk.start, chunk.end, chunk.audio_end] for chunk in chunked.chunks],
+        "child_task_ids": chunked.child_task_ids,
+        "created_at": chunked.created_at.isoformat(),
+    })
+
+
+def _chunked_from_json(raw: str | None) -> ChunkedTask | None:
+    if raw is None:
+        return None
+    data = json.loads(raw)
+    return ChunkedTask(
+        task_id=data["task_id"],
+        chunks=[AudioChunk(start=start, end=end, audio_end=audio_end) for start, end, audio_end in data["chunks"]],
+        child_task_ids=data["child_task_ids"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+class SqliteTaskStore(TaskStore):
+    """
+    Task registry in a SQLite database that all workers on a node share.
+
+    The database runs in WAL mode, so status polls read concurrently with submits writing,
+    and it survives restarts. Every operation is a single autocommitted statement on a
+    local file, which takes well under a millisecond, so the calls are made inline.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.ttl = ttl
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                progress_id TEXT,
+                params TEXT NOT NULL,
+                content_hash TEXT,
+                duration REAL,
+                chunked TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                backend TEXT,
+                holders INTEGER NOT NULL DEFAULT 1
+            )
+            """
+        )
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(tasks)")}
+        if "backend" not in columns:
+            # Databases written before tasks were spread over several Whisper backends.
+            self._connection.execute("ALTER TABLE tasks ADD COLUMN backend TEXT")
+        if "holders" not in columns:
+            # Databases written before cancels of deduplicated tasks were counted.
+            self._connection.execute("ALTER TABLE tasks ADD COLUMN holders INTEGER NOT NULL DEFAULT 1")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tasks_expires_at ON tasks (expires_at)")
+
+    def put(self, record: TaskRecord) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM tasks WHERE expires_at < ?", (time.time(),))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.task_id,
+                    record.progress_id,
+                    json.dumps(record.params, sort_keys=True, default=str),
+                    record.content_hash,
+                    record.duration,
+                    _chunked_to_json(record.chunked),
+                    record.created_at,
+                    record.created_at + self.ttl,
+                    record.backend,
+                    record.holders,
+                ),
+            )
+
+    def get(self, task_id: str) -> TaskRecord | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT progress_id, params, content_hash, duration, chunked, created_at, backend, holders FROM tasks "
+                "WHERE task_id = ? AND expires_at >= ?",
+                (task_id, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        progress_id, params, content_hash, duration, chunked, created_at, backend, holders = row
+        return TaskRecord(
+            task_id=task_id,
+            progress_id=progress_id,
+            params=json.loads(params),
+            content_hash=content_hash,
+            duration=duration,
+            chunked=_chunked_from_json(chunked),
+            backend=backend,
+            holders=holders,
+            created_at=created_at,
+        )
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def create_task_store(app_config: AppConfig) -> TaskStore:
+    """Build the task store configured by ``task_store_path``: SQLite if set, in-memory otherwise."""
+    if app_config.task_store_path:
+        return SqliteTaskStore(app_config.task_store_path, ttl=app_config.task_ttl_seconds)
+    return InMemoryTaskStore(ttl=app_config.task_ttl_seconds)
@@ -0,0 +1,115 @@
+import re
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from transcribo_backend.utils.app_config import AppConfig
+
+# "Speaker: text", optionally with a timestamp before or after the speaker.
+_TURN = re.compile(
+    r"^\s*(?:\[[\d:.,]+\]\s*)?(?P<speaker>[^\s:\[\]][^:\[\]\n]{0,39}?)\s*(?:\[[\d:.,]+\])?\s*:\s*(?P<text>.*)$"
+)
+# A speaker label has at most this many words, so "Punkt 3 der Traktandenliste: ..." stays text.
+_MAX_SPEAKER_WORDS = 4
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w")
+_LEGEND = "Sprecherkürzel (im Protokoll die vollen Namen verwenden): "
+
+
+@dataclass
+class _Turn:
+    speaker: str | None
+    texts: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CompactTranscript:
+    """A compacted transcript: the legend of the speaker aliases, if any, and the turns."""
+
+    legend: str
+    body: str
+
+    def with_legend(self, text: str) -> str:
+        """``text`` (the body or a part of it) headed by the legend, so the aliases can be resolved."""
+        return f"{self.legend}\n\n{text}" if self.legend else text
+
+    @property
+    def text(self) -> str:
+        return self.with_legend(self.body)
+
+
+class TranscriptCompactor:
+    """
+    Shrinks a ``Speaker: text`` transcript before it is summarized, without losing content.
+
+    Filler words and timestamps are dropped, whitespace is collapsed, consecutive turns
+    of a speaker are merged into one, and long speaker labels used often are replaced by
+    short aliases (``S1``, ``S2``, ...), resolved in a legend heading the transcript, when
+    that saves more than the legend costs.
+    Turns are separated by blank lines. Lines without a speaker belong to the turn before.
+    """
+
+    def __init__(self, filler_words: Sequence[str] = ()) -> None:
+        words = sorted({word for word in filler_words if word}, key=len, reverse=True)
+        alternatives = "|".join(re.escape(word) for word in words)
+        self._fillers = re.compile(rf"(?i)(?<!\w)(?:{alternatives})(?!\w)[,;]?") if words else None
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "TranscriptCompactor":
+        return cls(filler_words=app_config.summary_filler_words)
+
+    def _clean(self, text: str) -> str:
+        if self._fillers is not None:
+            text = self._fillers.sub("", text)
+        # Punctuation left of a line of fillers ("Hm.") is dropped with them.
+        return _WHITESPACE.sub(" ", text).strip() if _WORD.search(text) else ""
+
+    def _turns(self, transcript: str) -> list[_Turn]:
+        turns: list[_Turn] = []
+        for line in transcript.splitlines():
+            match = _TURN.match(line)
+            speaker = match["speaker"].strip() if match else None
+            if speaker is not None and len(speaker.split()) > _MAX_SPEAKER_WORDS:
+                speaker = None
+            text = self._clean(match["text"] if match and speaker is not None else line)
+            if not text:
+                continue
+            if (speaker is None and turns) or (turns and turns[-1].speaker == speaker):
+                turns[-1].texts.append(text)
+            else:
+                turns.append(_Turn(speaker=speaker, texts=[text]))
+        return turns
+
+    @staticmethod
+    def _aliases(uses: Counter[str]) -> dict[str, str]:
+        """Short aliases of the speaker labels whose uses save more than their entry in the legend costs."""
+        taken = set(uses)
+        aliases: dict[str, str] = {}
+        saved = 0
+        for speaker, count in uses.most_common():
+            number = len(aliases) + 1
+            while f"S{number}" in taken:
+                number += 1
+            alias = f"S{number}"
+            gain = count * (len(speaker) - len(alias)) - len(f"; {alias} = {speaker}")
+            if gain > 0:
+                aliases[speaker] = alias
+                taken.add(alias)
+                saved += gain
+        return aliases if saved > len(_LEGEND) else {}
+
+    def compact(self, transcript: str) -> CompactTranscript:
+        """Compact ``transcript``; a text without speaker labels only loses fillers and extra whitespace."""
+        turns = self._turns(transcript)
+        uses = Counter(turn.speaker for turn in turns if turn.speaker is not None)
+        aliases = self._aliases(uses)
+        legend = ""
+        if aliases:
+            legend = _LEGEND + "; ".join(f"{alias} = {speaker}" for speaker, alias in aliases.items())
+        body = "\n\n".join(
+            f"{aliases.get(turn.speaker, turn.speaker)}: {' '.join(turn.texts)}"
+            if turn.speaker is not None
+            else " ".join(turn.texts)
+            for turn in turns
+        )
+        return CompactTranscript(legend=legend, body=body)
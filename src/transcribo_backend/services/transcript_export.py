@@ -0,0 +1,196 @@
+import re
+import zipfile
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+from transcribo_backend.models.export_format import ExportFormat
+from transcribo_backend.models.transcription_response import Segment
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.SRT: "application/x-subrip",
+    ExportFormat.VTT: "text/vtt",
+    ExportFormat.TXT: "text/plain; charset=utf-8",
+    ExportFormat.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# Rendered output is handed on in pieces of about this size instead of per segment.
+_PIECE_BYTES = 64 * 1024
+# Control characters XML 1.0 does not allow, even escaped.
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+_DOCX_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+_DOCX_TAIL = "<w:sectPr/></w:body></w:document>"
+
+
+@dataclass
+class _Turn:
+    """Consecutive segments of one speaker."""
+
+    speaker: str
+    start: float
+    texts: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return " ".join(text for text in self.texts if text)
+
+
+def _timestamp(seconds: float, separator: str = ".") -> str:
+    milliseconds = max(0, round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds_part, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds_part:02d}{separator}{milliseconds:03d}"
+
+
+def _speaker(segment: Segment) -> str:
+    return segment.speaker or "Unknown"
+
+
+def _cue_text(segment: Segment) -> str:
+    # A blank line would end the cue early.
+    return " ".join(segment.text.splitlines())
+
+
+async def _turns(segments: AsyncIterable[Segment]) -> AsyncIterator[_Turn]:
+    """Group the segments into speaker turns; only the current turn is held."""
+    turn: _Turn | None = None
+    async for segment in segments:
+        speaker = _speaker(segment)
+        if turn is None or turn.speaker != speaker:
+            if turn is not None:
+                yield turn
+            turn = _Turn(speaker=speaker, start=segment.start)
+        turn.texts.append(segment.text)
+    if turn is not None:
+        yield turn
+
+
+async def _srt(segments: AsyncIterable[Segment]) -> AsyncIterator[str]:
+    index = 0
+    async for segment in segments:
+        index += 1
+        start, end = _timestamp(segment.start, ","), _timestamp(segment.end, ",")
+        yield f"{index}\n{start} --> {end}\n{_speaker(segment)}: {_cue_text(segment)}\n\n"
+
+
+async def _vtt(segments: AsyncIterable[Segment]) -> AsyncIterator[str]:
+    yield "WEBVTT\n\n"
+    async for segment in segments:
+        # The speaker becomes the voice of the cue; "-->" must not appear in a cue payload.
+        speaker = escape(_speaker(segment))
+        text = escape(_cue_text(segment).replace("-->", "->"))
+        yield f"{_timestamp(segment.start)} --> {_timestamp(segment.end)}\n<v {speaker}>{text}\n\n"
+
+
+async def _txt(segments: AsyncIterable[Segment]) -> AsyncIterator[str]:
+    async for turn in _turns(segments):
+        yield f"{turn.speaker} [{_timestamp(turn.start)[:8]}]\n{turn.text}\n\n"
+
+
+async def _encode(lines: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    """Encode rendered text, handed on in pieces of about ``_PIECE_BYTES``."""
+    piece: list[bytes] = []
+    size = 0
+    async for line in lines:
+        data = line.encode()
+        piece.append(data)
+        size += len(data)
+        if size >= _PIECE_BYTES:
+            yield b"".join(piece)
+            piece, size = [], 0
+    if piece:
+        yield b"".join(piece)
+
+
+class _ZipSink:
+    """
+    Write-only file collecting the bytes ``zipfile`` produces until they are drained.
+
+    Having no ``tell``/``seek``, it makes ``zipfile`` write a streamable archive: sizes
+    and checksums follow each member instead of being patched into its header.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts, self.size = [], 0
+        return data
+
+
+def _docx_text(text: str) -> str:
+    return escape(_XML_INVALID.sub("", text))
+
+
+async def _docx(segments: AsyncIterable[Segment]) -> AsyncIterator[bytes]:
+    """Write a minimal Word document, compressed and handed on while the turns are rendered."""
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:  # type: ignore[arg-type]
+        archive.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _DOCX_RELS)
+        with archive.open("word/document.xml", "w") as document:
+            document.write(_DOCX_HEAD.encode())
+            async for turn in _turns(segments):
+                paragraph = (
+                    f"<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>{_docx_text(turn.speaker)}</w:t></w:r>"
+                    f'<w:r><w:t xml:space="preserve"> {_timestamp(turn.start)[:8]}</w:t></w:r></w:p>'
+                    f'<w:p><w:r><w:t xml:space="preserve">{_docx_text(turn.text)}</w:t></w:r></w:p>'
+                )
+                document.write(paragraph.encode())
+                if sink.size >= _PIECE_BYTES:
+                    yield sink.drain()
+            document.write(_DOCX_TAIL.encode())
+    yield sink.drain()
+
+
+def render_transcript(segments: AsyncIterable[Segment], export_format: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Render a transcript in an export format while its segments arrive.
+
+    Subtitles get one cue per segment, documents one paragraph per speaker turn, headed by
+    the speaker and the start of the turn. Only the current turn and one output piece are
+    held in memory, however long the transcript is.
+
+    Args:
+        segments: The cleaned segments of the transcription, in order
+        export_format: Format to render
+
+    Returns:
+        AsyncIterator[bytes]: The file, in pieces
+    """
+    if export_format == ExportFormat.DOCX:
+        return _docx(segments)
+    renderers = {ExportFormat.SRT: _srt, ExportFormat.VTT: _vtt, ExportFormat.TXT: _txt}
+    return _encode(renderers[export_format](segments))
@@ -0,0 +1,378 @@
+import asyncio
+import hashlib
+import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import aclosing, suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from dcc_backend_common.logger import get_logger
+from returns.io import IOResult
+from returns.pipeline import is_successful
+
+from transcribo_backend.helpers.file_type import (
+    MEDIA_CHECK_BYTES,
+    UnsupportedMediaError,
+    check_media_content,
+    detect_media_container,
+)
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.models.upload_session import UploadSession
+from transcribo_backend.services.audio_converter import (
+    AUDIO_ONLY_CONTAINERS,
+    normalized_format,
+    transcode_stream,
+)
+from transcribo_backend.services.whisper_service import AssembledUpload, WhisperService
+from transcribo_backend.utils.app_config import AppConfig
+
+logger = get_logger(__name__)
+
+# Number of leading bytes needed to detect the container.
+_SNIFF_BYTES = 1024
+# Size of the reads when spooling a chunk and when feeding the early conversion.
+_SPOOL_CHUNK_BYTES = 1024 * 1024
+# Suffix of the assembled upload files in the spool directory.
+_PART_SUFFIX = ".part"
+# An early conversion whose upload stalls this long is stopped, freeing its ffmpeg slot;
+# the upload is then converted at finalize.
+_EARLY_CONVERSION_IDLE_SECONDS = 30.0
+
+
+class UploadNotFoundError(Exception):
+    """Raised for an unknown, expired or aborted upload id."""
+
+    def __init__(self, upload_id: str):
+        super().__init__(f"Upload {upload_id} not found")
+
+
+class UploadOffsetMismatchError(Exception):
+    """Raised when a chunk does not start where the received bytes end."""
+
+    def __init__(self, offset: int):
+        super().__init__(f"Chunk must start at offset {offset}")
+        self.offset = offset
+
+
+class UploadRangeError(Exception):
+    """Raised when a chunk does not fit the declared upload size or its announced length."""
+
+    def __init__(self, received: int, expected: int):
+        super().__init__(f"Chunk has {received} bytes where {expected} fit")
+
+
+class UploadChecksumMismatchError(Exception):
+    """Raised when the received chunk does not match the checksum sent with it."""
+
+    def __init__(self) -> None:
+        super().__init__("Chunk checksum mismatch")
+
+
+class UploadIncompleteError(Exception):
+    """Raised when an upload is finalized before all of its bytes arrived."""
+
+    def __init__(self, offset: int, size: int):
+        super().__init__(f"Upload incomplete: {offset} of {size} bytes received")
+        self.offset = offset
+
+
+@dataclass
+class _Session:
+    """Server-side state of one resumable upload."""
+
+    info: UploadSession
+    path: Path
+    deadline: float
+    # SHA-256 of the received bytes, updated only with verified chunks.
+    hasher: "hashlib._Hash" = field(default_factory=hashlib.sha256)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Set whenever more bytes are committed, to wake the early conversion.
+    progressed: asyncio.Event = field(default_factory=asyncio.Event)
+    early_conversion: asyncio.Task[str] | None = None
+    # Whether the magic bytes were looked at; an unknown container is left to the ffprobe check.
+    sniffed: bool = False
+    # Whether the leading bytes passed the ffprobe content check.
+    content_checked: bool = False
+
+
+class UploadSessionService:
+    """
+    Resumable uploads: create a session, append byte ranges, finalize into a transcription.
+
+    Every session is assembled in a file in the spool directory. A chunk has to start
+    exactly where the received bytes end and is only committed once it has arrived in
+    full (and matched its checksum, if one was sent), so a dropped connection costs the
+    current chunk at most; the client asks for the offset and resumes from there.
+
+    The container is detected from the magic bytes as soon as the first kilobyte is in,
+    and ffprobe checks the first ``MEDIA_CHECK_BYTES`` for an audio stream; an upload that
+    fails the check is aborted right there instead of after the whole file arrived. If
+    the container is an audio-only
+    format that will be re-encoded anyway (e.g. WAV), ffmpeg starts converting the
+    committed bytes right away and follows the upload as it grows, so finalizing a large
+    upload does not have to wait for the whole conversion.
+    """
+
+    def __init__(self, app_config: AppConfig, whisper_service: WhisperService) -> None:
+        self.app_config = app_config
+        self.whisper_service = whisper_service
+        self.spool_dir = Path(app_config.upload_spool_dir)
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._sessions: dict[str, _Session] = {}
+        self.early_conversion_idle_seconds = _EARLY_CONVERSION_IDLE_SECONDS
+        self._remove_stale_files()
+
+    def _remove_stale_files(self) -> None:
+        """Delete spool files left behind by sessions that expired before a restart."""
+        cutoff = time.time() - self.app_config.upload_session_ttl_seconds
+        for path in self.spool_dir.glob(f"*{_PART_SUFFIX}"):
+            with suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+
+    def _expire_sessions(self) -> None:
+        now = time.monotonic()
+        for upload_id in [upload_id for upload_id, session in self._sessions.items() if session.deadline < now]:
+            logger.info(f"Discarding expired upload {upload_id}")
+            self._discard(upload_id)
+
+    def _discard(self, upload_id: str) -> None:
+        session = self._sessions.pop(upload_id, None)
+        if session is None:
+            return
+        if session.early_conversion is not None:
+            session.early_conversion.cancel()
+        session.path.unlink(missing_ok=True)
+
+    def _get(self, upload_id: str) -> _Session:
+        self._expire_sessions()
+        session = self._sessions.get(upload_id)
+        if session is None:
+            raise UploadNotFoundError(upload_id)
+        return session
+
+    def create(self, filename: str, content_type: str, size: int) -> UploadSession:
+        """Start a resumable upload of ``size`` bytes."""
+        self._expire_sessions()
+        upload_id = uuid.uuid4().hex
+        ttl = self.app_config.upload_session_ttl_seconds
+        created_at = datetime.now()
+        info = UploadSession(
+            upload_id=upload_id,
+            filename=filename,
+            content_type=content_type,
+            size=size,
+            offset=0,
+            created_at=created_at,
+            expires_at=created_at + timedelta(seconds=ttl),
+        )
+        path = self.spool_dir / f"{upload_id}{_PART_SUFFIX}"
+        path.touch()
+        self._sessions[upload_id] = _Session(info=info, path=path, deadline=time.monotonic() + ttl)
+        return info
+
+    def get(self, upload_id: str) -> UploadSession:
+        """Return the state of an upload, including the offset to resume from."""
+        return self._get(upload_id).info
+
+    async def append(
+        self, upload_id: str, start: int, length: int, chunks: AsyncIterable[bytes], checksum: str | None = None
+    ) -> UploadSession:
+        """
+        Append ``length`` bytes at ``start`` to an upload.
+
+        The chunk is streamed into the spool file and committed only once all ``length``
+        bytes arrived and their SHA-256 matches ``checksum`` (hex), if given; otherwise
+        the file is truncated back and the offset stays where it was.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist
+            UploadOffsetMismatchError: If ``start`` is not the current offset
+            UploadRangeError: If the chunk exceeds the declared size or is shorter than ``length``
+            UploadChecksumMismatchError: If the chunk does not match ``checksum``
+            UnsupportedMediaError: If the leading bytes are not decodable audio; the upload is discarded
+        """
+        session = self._get(upload_id)
+        async with session.lock:
+            offset = session.info.offset
+            if start != offset:
+                raise UploadOffsetMismatchError(offset)
+            if length <= 0 or offset + length > session.info.size:
+                raise UploadRangeError(length, session.info.size - offset)
+
+            hasher = session.hasher.copy()
+            try:
+                digest = await self._write_chunk(session.path, offset, length, chunks, hasher)
+                if checksum is not None and digest != checksum.strip().lower():
+                    raise UploadChecksumMismatchError()  # noqa: TRY301
+            except BaseException:
+                # Includes a dropped connection: forget the partial chunk.
+                with open(session.path, "r+b") as spool:
+                    spool.truncate(offset)
+                raise
+
+            session.hasher = hasher
+            session.info.offset = offset + length
+            session.progressed.set()
+            await self._on_progress(session)
+            return session.info
+
+    @staticmethod
+    async def _write_chunk(
+        path: Path, offset: int, length: int, chunks: AsyncIterable[bytes], hasher: "hashlib._Hash"
+    ) -> str:
+        """Write exactly ``length`` bytes at ``offset``, feeding ``hasher``; returns the chunk's SHA-256."""
+        chunk_hasher = hashlib.sha256()
+        received = 0
+        with open(path, "r+b") as spool:
+            spool.seek(offset)
+            async for data in chunks:
+                received += len(data)
+                if received > length:
+                    raise UploadRangeError(received, length)
+                spool.write(data)
+                hasher.update(data)
+                chunk_hasher.update(data)
+        if received != length:
+            raise UploadRangeError(received, length)
+        return chunk_hasher.hexdigest()
+
+    async def _on_progress(self, session: _Session) -> None:
+        """Check the leading bytes as they come in and start converting early if it pays off."""
+        try:
+            if not session.sniffed:
+                self._detect_container(session)
+            if not session.content_checked and session.info.offset >= min(MEDIA_CHECK_BYTES, session.info.size):
+                with open(session.path, "rb") as spool:
+                    header = spool.read(MEDIA_CHECK_BYTES)
+                await check_media_content(header)
+                session.content_checked = True
+        except UnsupportedMediaError as error:
+            logger.info(f"Aborting upload {session.info.upload_id}: {error}")
+            self._discard(session.info.upload_id)
+            raise
+
+    def _detect_container(self, session: _Session) -> None:
+        """Detect the container once the first bytes are in and start the early conversion for it."""
+        info = session.info
+        if info.offset < min(_SNIFF_BYTES, info.size):
+            return
+        with open(session.path, "rb") as spool:
+            info.container = detect_media_container(spool.read(_SNIFF_BYTES))
+        session.sniffed = True
+
+        if (
+            info.container in AUDIO_ONLY_CONTAINERS
+            and info.container not in self.app_config.passthrough_formats
+            and self.whisper_service.conversion_scheduler.available
+        ):
+            logger.info(f"Converting upload {info.upload_id} ({info.container}) while it arrives")
+            session.early_conversion = asyncio.create_task(self._convert_while_uploading(session))
+            session.early_conversion.add_done_callback(self._early_conversion_done)
+
+    @staticmethod
+    def _early_conversion_done(task: asyncio.Task[str]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Early conversion failed, converting at finalize instead: {task.exception()}")
+
+    async def _follow(self, session: _Session) -> AsyncIterator[bytes]:
+        """
+        Yield the committed bytes of an upload, waiting for more until it is complete.
+
+        Raises:
+            TimeoutError: If no bytes arrive for ``early_conversion_idle_seconds``
+        """
+        position = 0
+        with open(session.path, "rb") as spool:
+            while True:
+                session.progressed.clear()
+                available = session.info.offset - position
+                if available > 0:
+                    spool.seek(position)
+                    data = spool.read(min(available, _SPOOL_CHUNK_BYTES))
+                    position += len(data)
+                    yield data
+                elif position >= session.info.size:
+                    return
+                else:
+                    await asyncio.wait_for(session.progressed.wait(), self.early_conversion_idle_seconds)
+
+    async def _convert_while_uploading(self, session: _Session) -> str:
+        """
+        Pipe the upload through ffmpeg as it grows; returns the path of the normalized audio.
+
+        The ffmpeg process holds a slot of the conversion scheduler it shares with the submit
+        path, and is stopped once the upload stalls for ``early_conversion_idle_seconds``.
+        """
+        target = self.app_config.normalization_target
+        suffix = Path(normalized_format(target).filename).suffix
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=self.spool_dir) as output:
+            output_path = output.name
+            try:
+                async with (
+                    self.whisper_service.conversion_scheduler.slot(),
+                    aclosing(transcode_stream(self._follow(session), target)) as converted_chunks,
+                ):
+                    async for data in converted_chunks:
+                        output.write(data)
+            except BaseException:
+                Path(output_path).unlink(missing_ok=True)
+                raise
+        return output_path
+
+    async def _take_early_conversion(self, session: _Session) -> str | None:
+        """Wait for the early conversion to catch up and return its output, or None if there is none."""
+        task = session.early_conversion
+        if task is None or task.cancelled():
+            return None
+        try:
+            return await task
+        except Exception:
+            return None
+
+    async def finalize(self, upload_id: str, **submit_kwargs: Any) -> IOResult[TaskStatus, Exception]:
+        """
+        Submit a completed upload to the transcription pipeline.
+
+        The assembled file is handed to ``WhisperService.transcribe_submit_task`` together with
+        its hash and the early-converted audio, if any. The upload is discarded once the task is
+        submitted; on failure it is kept so the finalize can be retried without re-uploading.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist
+            UploadIncompleteError: If bytes are still missing
+        """
+        session = self._get(upload_id)
+        async with session.lock:
+            if session.info.offset != session.info.size:
+                raise UploadIncompleteError(session.info.offset, session.info.size)
+
+            converted_path = await self._take_early_conversion(session)
+            assembled = AssembledUpload(
+                path=str(session.path), content_hash=session.hasher.hexdigest(), converted_path=converted_path
+            )
+            try:
+                result = await self.whisper_service.transcribe_submit_task(assembled, **submit_kwargs)
+            finally:
+                if converted_path is not None:
+                    Path(converted_path).unlink(missing_ok=True)
+                # The converted audio is gone, so a retried finalize converts from the assembled file.
+                session.early_conversion = None
+
+        if is_successful(result):
+            self._discard(upload_id)
+        return result
+
+    def abort(self, upload_id: str) -> None:
+        """Discard an upload and its spooled bytes."""
+        self._get(upload_id)
+        self._discard(upload_id)
+
+    async def aclose(self) -> None:
+        """Stop running conversions and drop the spooled files of all open uploads."""
+        for upload_id in list(self._sessions):
+            self._discard(upload_id)
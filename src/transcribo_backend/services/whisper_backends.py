@@ -0,0 +1,309 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+
+import httpx
+from dcc_backend_common.logger import get_logger
+
+from transcribo_backend.models.metrics import WhisperBackendStats, WhisperClientStats
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.services.resilience import (
+    RETRY_STATUS_CODES,
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgeOutcome,
+    RetryPolicy,
+    can_resend,
+    first_completed,
+    is_backend_failure,
+    is_retryable,
+)
+
+logger = get_logger(__name__)
+
+# Audio seconds a submit counts as when the duration of the recording is unknown.
+DEFAULT_WORK_SECONDS = 10 * 60.0
+
+_NO_BACKENDS = "No Whisper backend is configured"
+
+
+@dataclass
+class WhisperBackend:
+    """A Whisper API instance, its circuit breaker and the work this worker has handed to it."""
+
+    url: str
+    breaker: CircuitBreaker
+    # Audio seconds and expiry of every unfinished task (or submit in flight), by task id.
+    outstanding: dict[str, tuple[float, float]] = field(default_factory=dict)
+    submitted: int = 0
+    failures: int = 0
+
+    @property
+    def outstanding_seconds(self) -> float:
+        return sum(seconds for seconds, _ in self.outstanding.values())
+
+    @property
+    def healthy(self) -> bool:
+        return self.breaker.available
+
+    def expire(self, now: float) -> None:
+        for key in [key for key, (_, expires_at) in self.outstanding.items() if expires_at < now]:
+            del self.outstanding[key]
+
+    def record(self, error: BaseException) -> None:
+        """Count a failed request: against the breaker if the backend broke, as proof of life if it answered."""
+        if isinstance(error, Exception) and is_backend_failure(error):
+            self.failures += 1
+            self.breaker.record_failure()
+        elif isinstance(error, httpx.HTTPStatusError):
+            self.breaker.record_success()
+        else:
+            self.breaker.release()
+
+    def unavailable(self) -> CircuitOpenError:
+        return CircuitOpenError(self.url, self.breaker.retry_at - time.monotonic())
+
+
+class WhisperBackendPool:
+    """
+    The Whisper backends submits are spread over, by least outstanding audio, and the
+    retry, circuit breaking and hedging policy of every request sent to them.
+
+    Every submit reserves the seconds of its audio on the backend it goes to as soon as the
+    backend is picked, so concurrent uploads spread out even while they are still being
+    sent; the reservation becomes the task's outstanding work once Whisper accepted it and
+    is released when the task is seen finished (or after ``work_ttl`` seconds, in case
+    nobody asks).
+
+    Each backend has a circuit breaker: after ``failure_threshold`` connection errors or
+    5xx responses in a row it fails fast for ``reset_seconds``, then lets one probe through.
+
+    The counts are per worker: each worker balances the work it submitted itself.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        *,
+        work_ttl: float,
+        retry: RetryPolicy,
+        failure_threshold: int,
+        reset_seconds: float,
+        hedge_after: float = 0.0,
+    ) -> None:
+        unique_urls = list(dict.fromkeys(url.rstrip("/") for url in urls if url))
+        self.backends = [WhisperBackend(url, CircuitBreaker(failure_threshold, reset_seconds)) for url in unique_urls]
+        self.work_ttl = work_ttl
+        self.retry = retry
+        self.hedge_after = max(0.0, hedge_after)
+        self.retries = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        if not self.backends:
+            raise ValueError(_NO_BACKENDS)
+        self._by_url = {backend.url: backend for backend in self.backends}
+
+    @property
+    def primary(self) -> WhisperBackend:
+        """The first configured backend, which answers for tasks not known to be elsewhere."""
+        return self.backends[0]
+
+    @property
+    def available(self) -> bool:
+        """Whether any backend would take a request now."""
+        return any(backend.healthy for backend in self.backends)
+
+    def get(self, url: str | None) -> WhisperBackend:
+        """The backend with base URL ``url``; the primary one if it is unknown or None."""
+        return self._by_url.get((url or "").rstrip("/"), self.primary)
+
+    def candidates(self) -> list[WhisperBackend]:
+        """
+        The backends a submit may go to, in the order it tries them.
+
+        Backends whose circuit is open are left out; of the others, the one with the least
+        outstanding audio (then the fewest submits) comes first.
+
+        Raises:
+            CircuitOpenError: If the circuit of every backend is open
+        """
+        now = time.monotonic()
+        for backend in self.backends:
+            backend.expire(now)
+        available = [backend for backend in self.backends if backend.healthy]
+        if not available:
+            raise min(self.backends, key=lambda backend: backend.breaker.retry_at).unavailable()
+        return sorted(available, key=lambda backend: (backend.outstanding_seconds, backend.submitted))
+
+    def reserve(self, backend: WhisperBackend, seconds: float) -> str:
+        """Count ``seconds`` of audio as outstanding on ``backend`` while it is submitted; returns the reservation."""
+        reservation = f"reservation-{uuid.uuid4().hex}"
+        backend.outstanding[reservation] = (seconds, time.monotonic() + self.work_ttl)
+        return reservation
+
+    def assign(self, backend: WhisperBackend, reservation: str, task_id: str) -> None:
+        """Turn a reservation into the outstanding work of the task Whisper accepted."""
+        seconds, expires_at = backend.outstanding.pop(reservation, (DEFAULT_WORK_SECONDS, 0.0))
+        backend.outstanding[task_id] = (seconds, expires_at or time.monotonic() + self.work_ttl)
+        backend.submitted += 1
+
+    def track(self, backend: WhisperBackend, task_id: str, seconds: float | None) -> None:
+        """Count a task that runs (again) on ``backend``, e.g. after a retry."""
+        work = seconds if seconds is not None else DEFAULT_WORK_SECONDS
+        self.assign(backend, self.reserve(backend, work), task_id)
+
+    def finish(self, task_id: str) -> None:
+        """Stop counting the audio of a finished, failed or cancelled task; unknown ids are ignored."""
+        for backend in self.backends:
+            backend.outstanding.pop(task_id, None)
+
+    async def _backoff(self, retry: int) -> None:
+        self.retries += 1
+        await asyncio.sleep(self.retry.delay(retry))
+
+    async def submit(
+        self,
+        seconds: float | None,
+        send: Callable[[WhisperBackend], Awaitable[TaskStatus]],
+        *,
+        failover: bool = True,
+    ) -> tuple[TaskStatus, WhisperBackend]:
+        """
+        Submit to the backend with the least outstanding audio.
+
+        If the submit did not reach the backend completely, or the backend answered with a
+        5xx, it is sent to the next candidate, and after every backend was tried, again
+        after a jittered backoff, for ``retry.attempts`` rounds; other errors are raised at
+        once, as the backend may have created the task already. Without ``failover`` (the
+        body cannot be produced again) the first error is raised.
+
+        Args:
+            seconds: Duration of the audio, if known
+            send: Sends the submit to the given backend and returns the created task
+            failover: Whether the submit may be sent more than once
+
+        Returns:
+            The created task and the backend that owns it
+
+        Raises:
+            CircuitOpenError: If the circuit of every backend is open
+        """
+        work = seconds if seconds is not None else DEFAULT_WORK_SECONDS
+        last_error: Exception | None = None
+        for round_number in range(1, max(1, self.retry.attempts) + 1):
+            if round_number > 1:
+                await self._backoff(round_number - 1)
+            try:
+                candidates = self.candidates()
+            except CircuitOpenError:
+                if last_error is not None:
+                    raise last_error from None
+                raise
+            for backend in candidates:
+                if not backend.breaker.allow():
+                    continue
+                reservation = self.reserve(backend, work)
+                try:
+                    status = await send(backend)
+                except BaseException as error:
+                    backend.outstanding.pop(reservation, None)
+                    backend.record(error)
+                    if not failover or not isinstance(error, Exception) or not can_resend(error):
+                        raise
+                    logger.warning(f"Whisper backend {backend.url} failed a submit, trying again: {error}")
+                    last_error = error
+                    continue
+                backend.breaker.record_success()
+                self.assign(backend, reservation, status.task_id)
+                return status, backend
+        if last_error is not None:
+            raise last_error
+        raise self.candidates()[0].unavailable()
+
+    async def request(
+        self,
+        backend: WhisperBackend,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        idempotent: bool = True,
+        hedge: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a request about a task to the backend that owns it.
+
+        Fails fast while the backend's circuit is open. An ``idempotent`` request is sent
+        again, after a jittered backoff, on a connection error or a 502/503/504, up to
+        ``retry.attempts`` times in all; the last response is returned whatever its status.
+        With ``hedge`` and a hedge delay configured, a second identical request is sent if
+        the first has not been answered within the delay, and the first answer wins.
+
+        Args:
+            backend: Backend the task runs on
+            send: Sends the request and returns the response
+            idempotent: Whether sending the request twice does no harm
+            hedge: Whether to hedge the request when it is slow
+
+        Returns:
+            The response of the backend
+
+        Raises:
+            CircuitOpenError: If the circuit of the backend is open
+        """
+        attempts = max(1, self.retry.attempts) if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            if attempt > 1:
+                await self._backoff(attempt - 1)
+            if not backend.breaker.allow():
+                raise backend.unavailable()
+            try:
+                response = await self._send(send, hedge=hedge and idempotent)
+            except BaseException as error:
+                backend.record(error)
+                if attempt == attempts or not isinstance(error, Exception) or not is_retryable(error):
+                    raise
+                logger.warning(f"Whisper backend {backend.url} failed a request, trying again: {error}")
+                continue
+            if response.status_code < 500:
+                backend.breaker.record_success()
+                return response
+            backend.failures += 1
+            backend.breaker.record_failure()
+            if attempt == attempts or response.status_code not in RETRY_STATUS_CODES:
+                return response
+            await response.aclose()
+        raise backend.unavailable()
+
+    async def _send(self, send: Callable[[], Awaitable[httpx.Response]], *, hedge: bool) -> httpx.Response:
+        if not hedge or self.hedge_after <= 0:
+            return await send()
+        response, outcome = await first_completed(send, self.hedge_after)
+        if outcome != HedgeOutcome.NOT_NEEDED:
+            self.hedged += 1
+        if outcome == HedgeOutcome.HEDGE:
+            self.hedge_wins += 1
+        return response
+
+    def stats(self) -> list[WhisperBackendStats]:
+        now = time.monotonic()
+        stats = []
+        for backend in self.backends:
+            backend.expire(now)
+            stats.append(
+                WhisperBackendStats(
+                    url=backend.url,
+                    healthy=backend.healthy,
+                    circuit=backend.breaker.state,
+                    outstanding_seconds=round(backend.outstanding_seconds, 1),
+                    outstanding_tasks=len(backend.outstanding),
+                    submitted=backend.submitted,
+                    failures=backend.failures,
+                    circuit_opened=backend.breaker.opened,
+                    rejected=backend.breaker.rejected,
+                )
+            )
+        return stats
+
+    def client_stats(self) -> WhisperClientStats:
+        return WhisperClientStats(retries=self.retries, hedged=self.hedged, hedge_wins=self.hedge_wins)
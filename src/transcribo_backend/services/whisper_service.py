@@ -1,37 +1,143 @@
 import asyncio
+import gzip
+import hashlib
 import json
 import tempfile
 import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, replace
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import httpx
-from cachetools import TTLCache
 from fastapi import HTTPException, UploadFile
+from pydantic import TypeAdapter
 from returns.future import future_safe
+from returns.io import IOResult
 from returns.pipeline import is_successful
 
+from transcribo_backend.helpers.json_stream import iter_json_array
+from transcribo_backend.helpers.multipart import encode_multipart_stream
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.estimate import TranscriptionEstimate
+from transcribo_backend.models.export_format import ExportFormat
+from transcribo_backend.models.metrics import SpoolStats
 from transcribo_backend.models.progress import ProgressResponse
 from transcribo_backend.models.response_format import ResponseFormat
+from transcribo_backend.models.task_event import TaskEvent
 from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
-from transcribo_backend.models.transcription_response import TranscriptionResponse
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
 from transcribo_backend.services.audio_converter import (
-    convert_to_mp3,
-    is_mp3_format,
+    AUDIO_ONLY_CONTAINERS,
+    AudioConversionError,
+    ConversionAction,
+    UploadFormat,
+    cut_audio,
+    detect_silences,
+    extract_audio,
+    normalize_audio,
+    normalized_format,
+    plan_conversion,
+    probe_duration,
+    requires_seekable_input,
+    sniff_container,
+    transcode_stream,
+    upload_format,
 )
+from transcribo_backend.services.audio_duration import header_duration
+from transcribo_backend.services.chunked_transcription import (
+    AudioChunk,
+    ChunkedTask,
+    aggregate_status,
+    merge_chunk_results,
+    pick_cut_point,
+    plan_chunks,
+    split_targets,
+)
+from transcribo_backend.services.conversion_scheduler import ConversionQueueFullError, ConversionScheduler
+from transcribo_backend.services.dedup_index import DedupIndex
+from transcribo_backend.services.resilience import RetryPolicy
+from transcribo_backend.services.result_cache import ResultCache
+from transcribo_backend.services.segment_rewriter import SegmentRewriter
+from transcribo_backend.services.status_cache import StatusCache
+from transcribo_backend.services.task_events import TaskEventHub
+from transcribo_backend.services.task_store import TaskRecord, create_task_store
+from transcribo_backend.services.transcript_export import render_transcript
+from transcribo_backend.services.whisper_backends import WhisperBackend, WhisperBackendPool
 from transcribo_backend.utils.app_config import AppConfig
 
 # Size of chunks streamed from the upload to disk.
 _STREAM_CHUNK_BYTES = 1024 * 1024
-# Number of leading bytes inspected to detect the MP3 container.
+# Number of leading bytes inspected to detect the container.
 _SNIFF_BYTES = 1024
+# Upper bound for the window searched for a pause around each ideal chunk cut.
+_MAX_SILENCE_SEARCH_SECONDS = 30.0
+# Segments of a streamed result rewritten and sent together (about 64 KiB of JSON).
+_RESULT_BATCH_SEGMENTS = 500
+_SEGMENTS = TypeAdapter(list[Segment])
+
+
+@dataclass(frozen=True)
+class AssembledUpload:
+    """An upload that already sits complete on disk, e.g. assembled by the resumable upload API."""
+
+    path: str
+    content_hash: str
+    # Normalized version produced while the upload was still arriving, if any.
+    converted_path: str | None = None
+
+
+@dataclass(frozen=True)
+class _Submission:
+    """The content and parameters of a submit, which identify it for deduplication."""
+
+    content_hash: str
+    params: dict[str, Any]
+
+    @property
+    def dedup_key(self) -> str:
+        return DedupIndex.make_key(self.content_hash, self.params)
 
 
 class WhisperService:
     def __init__(self, app_config: AppConfig) -> None:
         self.app_config = app_config
         one_day = 60 * 60 * 24
-        self.taskId_to_progressId: TTLCache[str, str] = TTLCache[str, str](maxsize=1024, ttl=one_day)
+        # Progress id, parameters and duration of every submitted task, shared by all workers.
+        self.task_store = create_task_store(app_config)
+        # Submits are balanced over the Whisper backends; every task stays with the backend that took it.
+        self.backends = WhisperBackendPool(
+            [self.app_config.whisper_url, *self.app_config.whisper_backend_urls],
+            work_ttl=self.app_config.task_ttl_seconds,
+            retry=RetryPolicy(
+                attempts=self.app_config.whisper_retry_attempts,
+                backoff_seconds=self.app_config.whisper_retry_backoff_seconds,
+            ),
+            failure_threshold=self.app_config.whisper_breaker_failures,
+            reset_seconds=self.app_config.whisper_backend_cooldown_seconds,
+            hedge_after=self.app_config.whisper_hedge_seconds,
+        )
+        self.dedup_index = DedupIndex(maxsize=self.app_config.dedup_index_size, ttl=one_day)
+        self.status_cache = StatusCache(ttl=self.app_config.status_cache_seconds)
+        self.segment_rewriter = SegmentRewriter.from_config(app_config)
+        # Post-processed results, so repeated fetches (reload, export, summary) skip Whisper.
+        self.result_cache = ResultCache(
+            max_bytes=self.app_config.result_cache_bytes,
+            spill_dir=self.app_config.result_cache_dir,
+            max_disk_bytes=self.app_config.result_cache_disk_bytes,
+        )
+        self.task_events = TaskEventHub(
+            fetch_status=self._cached_task_status,
+            fetch_result=self._get_task_result,
+            interval=self.app_config.event_poll_seconds,
+        )
+        self.conversion_scheduler = ConversionScheduler(
+            slots=self.app_config.ffmpeg_slots, max_queue=self.app_config.ffmpeg_queue_size
+        )
+        self.spooled_in_memory = 0
+        self.spooled_on_disk = 0
         # Short connect, but long write/read so large multi-hour uploads do not time out.
         timeout = httpx.Timeout(connect=10.0, write=None, read=300.0, pool=10.0)
         limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
@@ -39,42 +145,132 @@ class WhisperService:
         self.client = httpx.AsyncClient(timeout=timeout, limits=limits, headers=api_key_header)
 
     async def aclose(self) -> None:
-        """Close the HTTP client to prevent connection leaks."""
+        """Stop the task event pollers and close the HTTP client and the task store."""
+        await self.task_events.aclose()
         await self.client.aclose()
+        self.task_store.close()
+
+    def spool_stats(self) -> SpoolStats:
+        """Counters of direct uploads forwarded from memory vs. spooled to disk."""
+        return SpoolStats(in_memory=self.spooled_in_memory, on_disk=self.spooled_on_disk)
 
-    def _task_endpoint(self, path: str) -> str:
-        """Build a Whisper task endpoint URL (e.g. ``status?task_id=...``)."""
-        return f"{self.app_config.whisper_url}/audio/transcriptions/task/{path}"
+    @property
+    def normalized_format(self) -> UploadFormat:
+        """Filename and MIME type of everything re-encoded by ffmpeg, following ``normalization_target``."""
+        return normalized_format(self.app_config.normalization_target)
+
+    def _task_endpoint(self, path: str, backend: WhisperBackend | None = None) -> str:
+        """Build a Whisper task endpoint URL (e.g. ``status?task_id=...``) of ``backend``, the primary one by default."""
+        return f"{(backend or self.backends.primary).url}/audio/transcriptions/task/{path}"
+
+    def _backend_of(self, task_id: str, record: TaskRecord | None = None) -> WhisperBackend:
+        """The backend that owns a single Whisper task (``record`` saves the store lookup)."""
+        record = record or self.task_store.get(task_id)
+        return self.backends.get(record.backend if record is not None else None)
 
     @future_safe
     async def transcribe_get_task_status(self, task_id: str) -> TaskStatus:
         """
         Checks the status of an ongoing transcription task.
 
+        Polls of the same task are coalesced: concurrent polls share one upstream fetch,
+        and its result is served for ``status_cache_seconds`` after it arrived, so many
+        clients watching a task cost Whisper one status and one progress request per
+        interval.
+
         Args:
             task_id: The ID of the task to check
 
         Returns:
             TaskStatus: The current status of the task
         """
-        if task_id not in self.taskId_to_progressId:
+        return await self._cached_task_status(task_id)
+
+    async def transcribe_get_task_statuses(self, task_ids: list[str]) -> dict[str, TaskStatus | Exception]:
+        """
+        Checks the statuses of many tasks at once.
+
+        At most ``batch_status_concurrency`` statuses are fetched from Whisper at a time,
+        through the same cache as single status polls. A failed lookup does not fail the
+        batch: its task maps to the exception instead of a status.
+
+        Args:
+            task_ids: The IDs of the tasks to check; duplicates are looked up once
+
+        Returns:
+            The status or the error of every requested task, by task id
+        """
+        semaphore = asyncio.Semaphore(max(1, self.app_config.batch_status_concurrency))
+
+        async def _lookup(task_id: str) -> TaskStatus | Exception:
+            async with semaphore:
+                try:
+                    return await self._cached_task_status(task_id)
+                except Exception as error:
+                    return error
+
+        unique_ids = list(dict.fromkeys(task_ids))
+        results = await asyncio.gather(*(_lookup(task_id) for task_id in unique_ids))
+        return dict(zip(unique_ids, results, strict=True))
+
+    async def _cached_task_status(self, task_id: str) -> TaskStatus:
+        """Look the status of a task up through the status cache."""
+        return await self.status_cache.get(task_id, lambda: self._get_task_status(task_id))
+
+    async def _get_task_status(self, task_id: str) -> TaskStatus:
+        """Fetch the status of a task from Whisper, aggregating the chunks of a chunked task."""
+        record = self.task_store.get(task_id)
+        if record is not None and record.chunked is not None:
+            chunked = record.chunked
+            statuses = await asyncio.gather(*(self._fetch_task_status(child) for child in chunked.child_task_ids))
+            status = aggregate_status(chunked, statuses)
+            if status.status in (TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED):
+                self.dedup_index.forget(task_id)
+        else:
+            status = await self._fetch_task_status(task_id, record)
+        return self._with_duration(status, record)
+
+    def _with_duration(self, status: TaskStatus, record: TaskRecord | None) -> TaskStatus:
+        """Fill in the duration recorded for the task at submit time, if any."""
+        if status.duration is None and record is not None:
+            status.duration = record.duration
+        return status
+
+    async def _fetch_task_status(self, task_id: str, record: TaskRecord | None = None) -> TaskStatus:
+        """Fetch the status and progress of a single Whisper task (``record`` saves the store lookup)."""
+        record = record or self.task_store.get(task_id)
+        if record is None or record.progress_id is None:
+            # Deduplicated uploads can point at a task whose result is already cached locally.
+            if task_id in self.result_cache:
+                return TaskStatus(task_id=task_id, status=TaskStatusEnum.COMPLETED, progress=1.0)
             raise HTTPException(status_code=404, detail="Task not found")
-        url = self._task_endpoint(f"status?task_id={task_id}")
-        progress_url = f"{self.app_config.whisper_url}/progress/{self.taskId_to_progressId[task_id]}"
+        backend = self._backend_of(task_id, record)
+        url = self._task_endpoint(f"status?task_id={task_id}", backend)
+        progress_url = f"{backend.url}/progress/{record.progress_id}"
 
-        # Get the status of the transcription task
-        response = await self.client.get(url)
+        # Status and progress are independent, so both requests are in flight at once; both are hedged reads.
+        response, progress_response = await asyncio.gather(
+            self.backends.request(backend, lambda: self.client.get(url), hedge=True),
+            self.backends.request(backend, lambda: self.client.get(progress_url), hedge=True),
+        )
         if response.status_code == 404:
+            self.dedup_index.forget(task_id)
+            self.backends.finish(task_id)
             return TaskStatus(task_id=task_id, status=TaskStatusEnum.FAILED)
         response.raise_for_status()
 
-        progress_response = await self.client.get(progress_url)
         if progress_response.status_code == 404:
             raise HTTPException(status_code=404, detail="Progress not found")
         progress_response.raise_for_status()
 
         progress = ProgressResponse(**progress_response.json())
-        return TaskStatus(**response.json(), progress=progress.progress)
+        status = TaskStatus(**response.json(), progress=progress.progress)
+        if status.status in (TaskStatusEnum.COMPLETED, TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED):
+            self.backends.finish(task_id)
+        if status.status in (TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED):
+            # Never hand a failed task to the next upload of the same file.
+            self.dedup_index.forget(task_id)
+        return status
 
     @future_safe
     async def transcribe_get_task_result(self, task_id: str) -> TranscriptionResponse:
@@ -87,69 +283,309 @@ class WhisperService:
         Returns:
             TranscriptionVerboseJsonResponse: The parsed transcription result
         """
-        url = self._task_endpoint(f"get?task_id={task_id}")
+        return await self._get_task_result(task_id)
 
-        # Get the transcription result
-        response = await self.client.get(url)
-        response.raise_for_status()
-        result_data = response.json()
-
-        if task_id in self.taskId_to_progressId:
-            del self.taskId_to_progressId[task_id]
+    async def _get_task_result(self, task_id: str) -> TranscriptionResponse:
+        """Fetch, merge and clean up the result of a task, or serve it from the result cache."""
+        cached = self.result_cache.get(task_id)
+        if cached is not None:
+            return cached
 
-        transcription = TranscriptionResponse(**result_data)
-        for segment in transcription.segments:
-            segment.text = segment.text.strip()
-            segment.text = segment.text.replace("ß", "ss")
-            segment.speaker = segment.speaker or "Unknown"
-            segment.speaker = segment.speaker.strip().capitalize()
+        chunked = self._chunked_task(task_id)
+        if chunked is not None:
+            # The chunk tasks stay tracked, so the parent status keeps resolving after this.
+            results = await asyncio.gather(*(self._fetch_result(child) for child in chunked.child_task_ids))
+            merged = merge_chunk_results(chunked.chunks, results)
+            segments = [segment.model_dump() for segment in merged.segments]
+        else:
+            segments = (await self._fetch_result_json(task_id))["segments"]
+            self.task_store.delete(task_id)
 
+        # Cleaned in bulk on the raw segments, before the models are built.
+        transcription = TranscriptionResponse(segments=self.segment_rewriter.rewrite(segments))
+        self.result_cache.put(task_id, transcription)
         return transcription
 
+    @future_safe
+    async def transcribe_stream_task_result(self, task_id: str) -> AsyncIterator[bytes]:
+        """
+        Opens the result of a completed transcription task as a stream of JSON bytes.
+
+        The result of a single Whisper task is parsed segment by segment while it
+        downloads, and cleaned and re-encoded in batches of ``_RESULT_BATCH_SEGMENTS``, so
+        memory stays flat however long the transcript is. Only the compressed copy for the result cache
+        grows along. Chunked tasks are merged from their complete chunk results first.
+        Errors of the upstream request surface here, before any byte is streamed.
+
+        Args:
+            task_id: The ID of the completed task
+
+        Returns:
+            AsyncIterator[bytes]: The JSON of the normalized transcription
+        """
+        return await self._open_task_result(task_id)
+
+    @future_safe
+    async def transcribe_export_task_result(self, task_id: str, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        """
+        Opens the result of a completed transcription task rendered as a file.
+
+        The file is rendered from the same stream of cleaned segments as the JSON result,
+        served from the result cache when possible, so it is never held in memory whole.
+        Errors of the upstream request surface here, before any byte is streamed.
+
+        Args:
+            task_id: The ID of the completed task
+            export_format: Format of the file (SRT, VTT, TXT or DOCX)
+
+        Returns:
+            AsyncIterator[bytes]: The rendered file
+        """
+        chunks = await self._open_task_result(task_id)
+        return render_transcript(self._iter_segments(chunks), export_format)
+
+    @staticmethod
+    async def _iter_segments(chunks: AsyncIterator[bytes]) -> AsyncIterator[Segment]:
+        """Parse the segments of a streamed result, reading it to the end so it gets cached."""
+        async for item in iter_json_array(chunks, "segments"):
+            yield Segment.model_validate(item)
+        async for _ in chunks:
+            pass
+
+    async def _open_task_result(self, task_id: str) -> AsyncIterator[bytes]:
+        """Open the JSON of a task result: from the result cache, merged from chunks, or streamed from Whisper."""
+        cached = self.result_cache.get_compressed(task_id)
+        if cached is not None:
+            return self._iter_bytes(gzip.decompress(cached))
+        if self._chunked_task(task_id) is not None:
+            transcription = await self._get_task_result(task_id)
+            return self._iter_bytes(transcription.model_dump_json().encode())
+
+        backend = self._backend_of(task_id)
+        url = self._task_endpoint(f"get?task_id={task_id}", backend)
+        response = await self.backends.request(
+            backend, lambda: self.client.send(self.client.build_request("GET", url), stream=True)
+        )
+        if response.is_error:
+            await response.aclose()
+            response.raise_for_status()
+        return self._stream_result(task_id, response)
+
+    async def _stream_result(self, task_id: str, response: httpx.Response) -> AsyncIterator[bytes]:
+        """Clean and re-encode the segments of a streamed Whisper result, compressing a copy for the cache."""
+        compressor = self.result_cache.compressor()
+        compressed: list[bytes] = []
+
+        def _piece(parts: list[bytes]) -> bytes:
+            data = b"".join(parts)
+            compressed.append(compressor.compress(data))
+            return data
+
+        parts = [b'{"segments":[']
+        batch: list[dict[str, Any]] = []
+        try:
+            async for item in iter_json_array(response.aiter_bytes(), "segments"):
+                batch.append(item)
+                if len(batch) == _RESULT_BATCH_SEGMENTS:
+                    parts.append(self._encode_segments(batch))
+                    yield _piece(parts)
+                    parts, batch = [b","], []
+        finally:
+            await response.aclose()
+        if batch:
+            parts.append(self._encode_segments(batch))
+        elif parts == [b","]:
+            parts = []
+        parts.append(b"]}")
+        yield _piece(parts)
+
+        # Only a result streamed to the end is complete enough to be cached.
+        compressed.append(compressor.flush())
+        self.result_cache.put_compressed(task_id, b"".join(compressed))
+        self.task_store.delete(task_id)
+
+    def _encode_segments(self, items: list[dict[str, Any]]) -> bytes:
+        """Clean raw segments and encode them as the comma-separated inside of a JSON array."""
+        segments = _SEGMENTS.validate_python(self.segment_rewriter.rewrite(items))
+        return _SEGMENTS.dump_json(segments)[1:-1]
+
+    def cached_task_result(self, task_id: str) -> bytes | None:
+        """
+        Return the cached result of a task as gzip-compressed JSON, or None if it is not cached.
+
+        Lets a repeated result request be answered without decompressing or parsing anything.
+        """
+        return self.result_cache.get_compressed(task_id)
+
+    def watch_task(self, task_id: str) -> AsyncGenerator[TaskEvent]:
+        """
+        Stream the status changes of a task, ending with its result or a failure event.
+
+        All watchers of a task share one background poller, which reads the status through
+        the status cache every ``event_poll_seconds``.
+        """
+        return self.task_events.subscribe(task_id)
+
+    def _chunked_task(self, task_id: str) -> ChunkedTask | None:
+        """Return the chunks of ``task_id`` if it is a chunked transcription."""
+        record = self.task_store.get(task_id)
+        return record.chunked if record is not None else None
+
+    async def _fetch_result_json(self, task_id: str) -> dict[str, Any]:
+        """Fetch the raw result JSON of a single Whisper task from the backend that owns it."""
+        backend = self._backend_of(task_id)
+        url = self._task_endpoint(f"get?task_id={task_id}", backend)
+
+        # Get the transcription result
+        response = await self.backends.request(backend, lambda: self.client.get(url))
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch_result(self, task_id: str) -> TranscriptionResponse:
+        """Fetch the raw result of a single Whisper task."""
+        return TranscriptionResponse(**await self._fetch_result_json(task_id))
+
     @future_safe
     async def transcribe_retry_task(self, task_id: str) -> TaskStatus:
         """
         Retries a failed transcription task.
 
+        A task its last holder cancelled is deduplicated against again once it is retried.
+
         Args:
             task_id: The ID of the task to retry
 
         Returns:
             TaskStatus: The updated status of the task
         """
-        url = self._task_endpoint(f"retry?task_id={task_id}")
+        self.status_cache.invalidate(task_id)
+        record = self.task_store.get(task_id)
+        if record is not None and record.content_hash is not None:
+            self.dedup_index.remember(DedupIndex.make_key(record.content_hash, record.params), task_id)
+        chunked = self._chunked_task(task_id)
+        if chunked is None:
+            return await self._send_task_command("post", "retry", task_id)
 
-        response = await self.client.post(url)
-        response.raise_for_status()
-        return TaskStatus(**response.json())
+        # Only the chunks that failed are transcribed again.
+        statuses = list(await asyncio.gather(*(self._fetch_task_status(child) for child in chunked.child_task_ids)))
+        for index, (child, status) in enumerate(zip(chunked.child_task_ids, statuses, strict=True)):
+            if status.status in (TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED):
+                statuses[index] = await self._send_task_command("post", "retry", child)
+        return aggregate_status(chunked, statuses)
 
     @future_safe
     async def transcribe_cancel_task(self, task_id: str) -> TaskStatus:
         """
         Cancels an ongoing transcription task.
 
+        A task that byte-identical uploads of several clients were deduplicated onto is only
+        cancelled upstream by the last of them; until then a cancel gives up one client's
+        hold on it and returns its current status, as it goes on for the others.
+
         Args:
             task_id: The ID of the task to cancel
 
         Returns:
             TaskStatus: The updated status of the task
         """
-        url = self._task_endpoint(f"cancel?task_id={task_id}")
+        record = self.task_store.get(task_id)
+        if record is not None and record.holders > 1:
+            self.task_store.put(replace(record, holders=record.holders - 1))
+            return await self._cached_task_status(task_id)
+
+        self.dedup_index.forget(task_id)
+        self.status_cache.invalidate(task_id)
+        chunked = self._chunked_task(task_id)
+        if chunked is None:
+            return await self._send_task_command("put", "cancel", task_id)
 
-        response = await self.client.put(url)
+        statuses = await asyncio.gather(
+            *(self._send_task_command("put", "cancel", child) for child in chunked.child_task_ids)
+        )
+        return aggregate_status(chunked, statuses)
+
+    async def _send_task_command(self, method: str, command: str, task_id: str) -> TaskStatus:
+        """Send a retry/cancel request for a single Whisper task to its backend and parse the returned status."""
+        record = self.task_store.get(task_id)
+        backend = self._backend_of(task_id, record)
+        url = self._task_endpoint(f"{command}?task_id={task_id}", backend)
+        # Cancelling twice does no harm, a retry sent twice would transcribe twice.
+        response = await self.backends.request(
+            backend, lambda: self.client.request(method.upper(), url), idempotent=command == "cancel"
+        )
         response.raise_for_status()
+        if command == "cancel":
+            self.backends.finish(task_id)
+        else:
+            self.backends.track(backend, task_id, record.duration if record is not None else None)
         return TaskStatus(**response.json())
 
-    async def _stream_upload_to_disk(self, audio_file: UploadFile, dest_path: str, max_bytes: int | None) -> None:
-        """Stream the uploaded file to ``dest_path`` in chunks, enforcing ``max_bytes``."""
+    @staticmethod
+    async def _iter_upload(
+        audio_file: UploadFile, max_bytes: int | None, on_chunk: Callable[[bytes], object] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Yield the uploaded file from the start in chunks, enforcing ``max_bytes``; ``on_chunk`` sees every chunk."""
         total = 0
         await audio_file.seek(0)
+        while chunk := await audio_file.read(_STREAM_CHUNK_BYTES):
+            total += len(chunk)
+            if max_bytes is not None and total > max_bytes:
+                raise HTTPException(status_code=413, detail="File is too large")
+            if on_chunk is not None:
+                on_chunk(chunk)
+            yield chunk
+
+    @staticmethod
+    async def _iter_bytes(content: bytes) -> AsyncIterator[bytes]:
+        """Yield an in-memory upload in chunks, like ``_iter_upload``."""
+        for start in range(0, len(content), _STREAM_CHUNK_BYTES):
+            yield content[start : start + _STREAM_CHUNK_BYTES]
+
+    async def _read_small_upload(self, audio_file: UploadFile, max_bytes: int | None) -> bytes | None:
+        """
+        Read the whole upload into memory if it fits ``memory_spool_bytes``, otherwise return None.
+
+        Only uploads that can be handled without a file qualify: an MP4/Matroska upload has
+        to be probed (and may need seeking), so it always takes the disk path.
+        """
+        threshold = self.app_config.memory_spool_bytes
+        if threshold <= 0 or (audio_file.size is not None and audio_file.size > threshold):
+            return None
+        await audio_file.seek(0)
+        content = await audio_file.read(threshold + 1)
+        if len(content) > threshold:
+            return None
+        if max_bytes is not None and len(content) > max_bytes:
+            raise HTTPException(status_code=413, detail="File is too large")
+        container = sniff_container(content[:_SNIFF_BYTES])
+        if container is not None and container not in AUDIO_ONLY_CONTAINERS:
+            return None
+        return content
+
+    @staticmethod
+    async def _read_header(audio_file: UploadFile) -> bytes:
+        """Read the leading bytes of the upload for format sniffing."""
+        await audio_file.seek(0)
+        return await audio_file.read(_SNIFF_BYTES)
+
+    async def _hash_upload(self, audio_file: UploadFile, max_bytes: int | None) -> str:
+        """Return the SHA-256 hex digest of the uploaded file, enforcing ``max_bytes``."""
+        hasher = hashlib.sha256()
+        async for chunk in self._iter_upload(audio_file, max_bytes):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+    async def _stream_upload_to_disk(self, audio_file: UploadFile, dest_path: str, max_bytes: int | None) -> str:
+        """
+        Stream the uploaded file to ``dest_path`` in chunks, enforcing ``max_bytes``.
+
+        Returns the SHA-256 hex digest of the content, computed on the fly.
+        """
+        hasher = hashlib.sha256()
         with open(dest_path, "wb") as dest:
-            while chunk := await audio_file.read(_STREAM_CHUNK_BYTES):
-                total += len(chunk)
-                if max_bytes is not None and total > max_bytes:
-                    raise HTTPException(status_code=413, detail="File is too large")
+            async for chunk in self._iter_upload(audio_file, max_bytes, hasher.update):
                 dest.write(chunk)
+        return hasher.hexdigest()
 
     @staticmethod
     def _build_submit_form(
@@ -188,43 +624,359 @@ class WhisperService:
             data[key] = json.dumps(value) if isinstance(value, list | dict) else str(value)
         return data
 
+    @asynccontextmanager
+    async def _conversion_slot(self) -> AsyncIterator[None]:
+        """Hold an ffmpeg slot, mapping a full conversion queue to HTTP 429 with ``Retry-After``."""
+        try:
+            async with self.conversion_scheduler.slot():
+                yield
+        except ConversionQueueFullError as error:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many concurrent audio conversions",
+                headers={"Retry-After": str(error.retry_after)},
+            ) from error
+
     @staticmethod
-    def _resolve_mp3_path(input_path: str) -> tuple[str, str | None]:
+    def _converted_path_or_raise(result: IOResult[str, Exception]) -> str:
+        """Return the output path of an ffmpeg helper, mapping a failure to HTTP 400."""
+        # The ffmpeg helpers are @future_safe: failures come back as an IOFailure, so inspect
+        # the result instead of calling .unwrap() (which would raise UnwrapFailedError, not
+        # the AudioConversionError, and bypass the 400 mapping).
+        if not is_successful(result):
+            error = result.failure()._inner_value
+            raise HTTPException(status_code=400, detail=f"Audio conversion failed: {error}") from error
+        return result.unwrap()._inner_value
+
+    async def _prepare_upload(self, input_path: str) -> tuple[str, UploadFormat, str | None]:
         """
-        Ensure the audio at ``input_path`` is MP3, converting if needed.
+        Turn the audio at ``input_path`` into something Whisper decodes, as cheaply as possible.
+
+        Passthrough formats are sent unchanged, videos with a stream-copyable audio track are
+        reduced to that track, and everything else is re-encoded to the ``normalization_target``.
 
-        Returns ``(upload_path, converted_path)`` where ``converted_path`` is the
+        Returns ``(upload_path, upload_format, converted_path)`` where ``converted_path`` is the
         ffmpeg output that the caller must delete, or ``None`` if no conversion happened.
         """
         # Sniff only the leading bytes instead of loading the whole file.
         with open(input_path, "rb") as fh:
             header = fh.read(_SNIFF_BYTES)
 
-        if is_mp3_format(header):
-            return input_path, None
+        plan = await plan_conversion(input_path, header, self.app_config.passthrough_formats)
+        if plan.action == ConversionAction.PASSTHROUGH and plan.container is not None:
+            return input_path, upload_format(plan.container), None
 
-        # convert_to_mp3 is @impure_safe: failures come back as an IOFailure, so inspect the
-        # result instead of calling .unwrap() (which would raise UnwrapFailedError, not the
-        # AudioConversionError, and bypass the 400 mapping below).
-        result = convert_to_mp3(input_path)
-        if not is_successful(result):
-            error = result.failure()._inner_value
-            raise HTTPException(status_code=400, detail=f"Audio conversion failed: {error}") from error
-        converted_path: str = result.unwrap()._inner_value
-        return converted_path, converted_path
+        async with self._conversion_slot():
+            if plan.action == ConversionAction.REMUX and plan.audio_codec is not None:
+                result = await extract_audio(input_path, plan.audio_codec)
+            else:
+                result = await normalize_audio(input_path, self.app_config.normalization_target)
+        converted_path = self._converted_path_or_raise(result)
+        if plan.action != ConversionAction.REMUX:
+            return converted_path, self.normalized_format, converted_path
+        with open(converted_path, "rb") as fh:
+            container = sniff_container(fh.read(_SNIFF_BYTES))
+        fmt = upload_format(container) if container is not None else self.normalized_format
+        return converted_path, fmt, converted_path
 
-    async def _post_submit(self, url: str, data: dict[str, Any], upload_path: str) -> TaskStatus:
-        """Stream the MP3 file from disk to the Whisper API and parse the response."""
+    async def _post_submit(self, url: str, data: dict[str, Any], upload_path: str, fmt: UploadFormat) -> TaskStatus:
+        """Stream the audio file from disk to the Whisper API and parse the response."""
         with open(upload_path, "rb") as upload_fh:
-            files = {"file": ("audio.mp3", upload_fh, "audio/mpeg")}
+            files = {"file": (fmt.filename, upload_fh, fmt.content_type)}
             response = await self.client.post(url, data=data, files=files)
         response.raise_for_status()
         return TaskStatus(**response.json())
 
+    async def _post_submit_stream(
+        self, url: str, data: dict[str, Any], chunks: AsyncIterator[bytes], fmt: UploadFormat
+    ) -> TaskStatus:
+        """Stream audio chunks to the Whisper API as they are produced and parse the response."""
+        content_type, body = encode_multipart_stream(data, "file", fmt.filename, fmt.content_type, chunks)
+        response = await self.client.post(url, content=body, headers={"Content-Type": content_type})
+        response.raise_for_status()
+        return TaskStatus(**response.json())
+
+    async def _submit_piped(
+        self, url: str, data: dict[str, Any], chunks: AsyncIterator[bytes], header: bytes
+    ) -> TaskStatus:
+        """
+        Submit the upload while it is being read, without an intermediate file.
+
+        Audio-only uploads in a passthrough format are forwarded as-is; everything else is
+        piped through ffmpeg and its output is streamed into the Whisper request as it is
+        produced.
+        """
+        container = sniff_container(header)
+        if container is not None and container in self._piped_passthrough():
+            async with aclosing(chunks):
+                return await self._post_submit_stream(url, data, chunks, upload_format(container))
+
+        try:
+            # The ffmpeg process lives as long as the forwarding request, so it holds a slot throughout.
+            target = self.app_config.normalization_target
+            async with self._conversion_slot(), aclosing(transcode_stream(chunks, target)) as body:
+                return await self._post_submit_stream(url, data, body, self.normalized_format)
+        except AudioConversionError as error:
+            raise HTTPException(status_code=400, detail=f"Audio conversion failed: {error}") from error
+
+    def _piped_passthrough(self) -> set[AudioContainer]:
+        """Passthrough containers that can be forwarded without probing (never video)."""
+        return AUDIO_ONLY_CONTAINERS.intersection(self.app_config.passthrough_formats)
+
+    async def _plan_audio_chunks(self, input_path: str, duration: float | None) -> list[AudioChunk] | None:
+        """
+        Split a long recording into chunks cut at pauses, or return None if it is short.
+
+        The ideal cut positions are evenly spaced; each one is moved to the middle of the
+        nearest pause found in a window around it, so words are rarely cut in half. At most
+        ``ffmpeg_slots`` windows are searched at once, so a long recording neither fills the
+        shared conversion queue nor is rejected by it.
+        """
+        chunk_seconds = self.app_config.chunk_minutes * 60
+        if duration is None or chunk_seconds <= 0 or duration <= chunk_seconds:
+            return None
+
+        search = min(chunk_seconds / 4, _MAX_SILENCE_SEARCH_SECONDS)
+        jobs = asyncio.Semaphore(self.conversion_scheduler.slots)
+
+        async def _cut_near(target: float) -> float:
+            window_start = max(0.0, target - search)
+            async with jobs, self._conversion_slot():
+                silences = await detect_silences(input_path, window_start, target + search - window_start)
+            return pick_cut_point(target, silences)
+
+        cut_points = await asyncio.gather(*(_cut_near(target) for target in split_targets(duration, chunk_seconds)))
+        return plan_chunks(duration, cut_points, self.app_config.chunk_overlap_seconds)
+
+    async def _submit_chunk(
+        self, data: dict[str, Any], input_path: str, chunk: AudioChunk, jobs: asyncio.Semaphore
+    ) -> TaskStatus:
+        """
+        Encode one chunk and submit it as its own Whisper task with its own progress id, on any backend.
+
+        ``jobs`` bounds the chunks of one recording that are encoded at once.
+        """
+        async with jobs, self._conversion_slot():
+            result = await cut_audio(input_path, chunk.start, chunk.audio_length, self.app_config.normalization_target)
+        chunk_path = self._converted_path_or_raise(result)
+        progress_id = uuid.uuid4().hex
+        chunk_data = {**data, "progress_id": progress_id}
+        try:
+            status, backend = await self.backends.submit(
+                chunk.audio_length,
+                lambda backend: self._post_submit(
+                    self._task_endpoint("submit", backend), chunk_data, chunk_path, self.normalized_format
+                ),
+            )
+        finally:
+            Path(chunk_path).unlink(missing_ok=True)
+        self.task_store.put(
+            TaskRecord(
+                task_id=status.task_id,
+                progress_id=progress_id,
+                params=self._task_params(data),
+                duration=chunk.audio_length,
+                backend=backend.url,
+            )
+        )
+        return status
+
+    async def _submit_chunked(
+        self, data: dict[str, Any], input_path: str, chunks: list[AudioChunk]
+    ) -> tuple[TaskStatus, ChunkedTask]:
+        """
+        Submit every chunk as a concurrent Whisper task and track them under one parent task.
+
+        Chunks are encoded and uploaded concurrently, so the first chunks are transcribing
+        while later ones are still being prepared, and they are balanced over the Whisper
+        backends like any submit. At most ``ffmpeg_slots`` of them are encoded at once, so a
+        long recording neither crowds other uploads out of the shared conversion queue nor
+        is rejected by it. If any chunk cannot be submitted, the chunks already submitted are
+        cancelled.
+
+        Returns:
+            The aggregated status and the parent task, which the caller registers
+        """
+        jobs = asyncio.Semaphore(self.conversion_scheduler.slots)
+        outcomes = await asyncio.gather(
+            *(self._submit_chunk(data, input_path, chunk, jobs) for chunk in chunks), return_exceptions=True
+        )
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            submitted = [outcome.task_id for outcome in outcomes if isinstance(outcome, TaskStatus)]
+            await asyncio.gather(
+                *(self._send_task_command("put", "cancel", child) for child in submitted),
+                return_exceptions=True,
+            )
+            raise errors[0]
+
+        statuses = cast(list[TaskStatus], outcomes)
+        chunked = ChunkedTask(
+            task_id=uuid.uuid4().hex, chunks=chunks, child_task_ids=[status.task_id for status in statuses]
+        )
+        return aggregate_status(chunked, statuses), chunked
+
+    @staticmethod
+    def _task_params(data: dict[str, Any]) -> dict[str, Any]:
+        """Everything in the submit form that influences the transcription, i.e. all but the progress id."""
+        return {key: value for key, value in data.items() if key != "progress_id"}
+
+    def _find_duplicate(self, submission: _Submission) -> TaskStatus | None:
+        """Return the status of an earlier task for the same upload and parameters, if reusable."""
+        entry = self.dedup_index.lookup(submission.dedup_key, self.task_store, self.result_cache)
+        if entry is None:
+            return None
+        record = self.task_store.get(entry.task_id)
+        if record is not None:
+            # One more client holds the task now; it is only cancelled upstream once every holder cancelled it.
+            record = replace(record, holders=record.holders + 1)
+            self.task_store.put(record)
+        if entry.completed:
+            status = TaskStatus(task_id=entry.task_id, status=TaskStatusEnum.COMPLETED, progress=1.0)
+        else:
+            status = TaskStatus(task_id=entry.task_id, status=TaskStatusEnum.IN_PROGRESS)
+        return self._with_duration(status, record)
+
+    @asynccontextmanager
+    async def _deduplicated(self, submission: _Submission) -> AsyncIterator[TaskStatus | None]:
+        """
+        Yield the status of an earlier task for the same upload, or None while this submit reserves it.
+
+        An identical upload being submitted meanwhile is waited for, so its task is reused;
+        should that submit fail, the upload is submitted again.
+        """
+        while (duplicate := self._find_duplicate(submission)) is None:
+            reserved = self.dedup_index.reserve(submission.dedup_key)
+            if reserved is None:
+                try:
+                    yield None
+                finally:
+                    self.dedup_index.release(submission.dedup_key)
+                return
+            # A cancelled waiter must not end the reservation the others wait for.
+            await asyncio.shield(reserved)
+        yield duplicate
+
+    def _register_task(
+        self,
+        status: TaskStatus,
+        submission: _Submission,
+        progress_id: str | None,
+        duration: float | None,
+        backend: WhisperBackend | None = None,
+        chunked: ChunkedTask | None = None,
+    ) -> TaskStatus:
+        """Track a freshly submitted task for status lookups and deduplication; returns it with its duration."""
+        record = TaskRecord(
+            task_id=status.task_id,
+            progress_id=progress_id,
+            params=submission.params,
+            content_hash=submission.content_hash,
+            duration=duration,
+            chunked=chunked,
+            backend=backend.url if backend is not None else None,
+        )
+        self.task_store.put(record)
+        self.dedup_index.remember(submission.dedup_key, status.task_id)
+        return self._with_duration(status, record)
+
+    async def _submit_from_memory(self, data: dict[str, Any], content: bytes, params: dict[str, Any]) -> TaskStatus:
+        """Submit a small upload held in memory: ffmpeg reads it from a pipe and httpx sends the result."""
+        submission = _Submission(hashlib.sha256(content).hexdigest(), params)
+        async with self._deduplicated(submission) as duplicate:
+            if duplicate is not None:
+                return duplicate
+            header = content[:_SNIFF_BYTES]
+            duration = header_duration(BytesIO(content), sniff_container(header))
+            status, backend = await self.backends.submit(
+                duration,
+                lambda backend: self._submit_piped(
+                    self._task_endpoint("submit", backend), data, self._iter_bytes(content), header
+                ),
+            )
+            return self._register_task(status, submission, data["progress_id"], duration, backend)
+
+    async def _submit_from_disk(
+        self,
+        data: dict[str, Any],
+        input_path: str,
+        submission: _Submission,
+        chunked: bool,
+        normalized_path: str | None = None,
+    ) -> TaskStatus:
+        """
+        Submit the audio file at ``input_path`` (owned by the caller).
+
+        ``normalized_path`` is an already re-encoded version of the file, so no conversion
+        is needed for a single-task submit.
+        """
+        async with self._deduplicated(submission) as duplicate:
+            if duplicate is not None:
+                return duplicate
+
+            duration = await probe_duration(input_path)
+            chunks = await self._plan_audio_chunks(input_path, duration) if chunked else None
+            if chunks is not None and len(chunks) > 1:
+                status, chunked_task = await self._submit_chunked(data, input_path, chunks)
+                return self._register_task(status, submission, None, duration, chunked=chunked_task)
+
+            converted_path: str | None = None
+            if normalized_path is not None:
+                upload_path, fmt = normalized_path, self.normalized_format
+            else:
+                upload_path, fmt, converted_path = await self._prepare_upload(input_path)
+            try:
+                status, backend = await self.backends.submit(
+                    duration,
+                    lambda backend: self._post_submit(self._task_endpoint("submit", backend), data, upload_path, fmt),
+                )
+            finally:
+                if converted_path is not None:
+                    Path(converted_path).unlink(missing_ok=True)
+            return self._register_task(status, submission, data["progress_id"], duration, backend)
+
+    @future_safe
+    async def transcribe_estimate(
+        self, audio_file: UploadFile, max_upload_bytes: int | None = None
+    ) -> TranscriptionEstimate:
+        """
+        Estimates the duration and processing time of a file without submitting it.
+
+        The duration is read from the container headers of the upload; only if they do not
+        carry it is the upload spooled to disk for a time-bounded ffprobe.
+
+        Args:
+            audio_file: The uploaded audio/video file
+            max_upload_bytes: Hard cap on accepted upload size in bytes
+
+        Returns:
+            TranscriptionEstimate: Duration, quota minutes and expected processing time
+        """
+        header = await self._read_header(audio_file)
+        container = sniff_container(header)
+        duration = header_duration(audio_file.file, container)
+        if duration is None:
+            with tempfile.NamedTemporaryFile(delete=False) as input_temp:
+                input_path = input_temp.name
+            try:
+                await self._stream_upload_to_disk(audio_file, input_path, max_upload_bytes)
+                duration = await probe_duration(input_path)
+            finally:
+                Path(input_path).unlink(missing_ok=True)
+
+        return TranscriptionEstimate(
+            container=container,
+            duration=duration,
+            audio_minutes=round(duration / 60, 2) if duration is not None else None,
+            estimated_processing_seconds=(
+                round(duration * self.app_config.realtime_factor, 1) if duration is not None else None
+            ),
+        )
+
     @future_safe
     async def transcribe_submit_task(
         self,
-        audio_file: UploadFile,
+        audio_file: UploadFile | AssembledUpload,
         model: str = "large-v2",
         language: str | None = None,
         prompt: str | None = None,
@@ -235,17 +987,43 @@ class WhisperService:
         diarization_speaker_count: int | None = None,
         timestamp_granularities: str = "segment",
         max_upload_bytes: int | None = None,
+        chunked: bool = False,
         **kwargs: Any,
     ) -> TaskStatus:
         """
         Submits a new transcription task with additional parameters.
 
-        The upload is streamed to disk, normalized to MP3 if needed, and forwarded to the
-        Whisper API without ever holding the whole file in memory, so it is safe for
-        multi-hour files under concurrent load.
+        Uploads up to ``memory_spool_bytes`` are kept in memory: they are passed through or
+        piped through ffmpeg straight into the Whisper request, without touching the disk.
+        Larger uploads are streamed to disk, passed through, reduced to their audio track or
+        re-encoded to the ``normalization_target`` (whichever is cheapest, see
+        ``plan_conversion``), and forwarded to the Whisper API without ever holding the whole
+        file in memory, so it is safe for multi-hour files under concurrent load. With
+        ``streaming_transcode`` enabled the upload is instead piped through ffmpeg straight
+        into the Whisper request; containers that ffmpeg can only demux from a seekable file
+        still take the disk path.
+
+        The duration of the recording is read from its container headers before submitting
+        and reported with the task status from then on.
+
+        The upload is hashed while it streams (in streaming mode, before it is piped). A
+        byte-identical upload with the same parameters returns the existing task (or its
+        cached result) without any ffmpeg or Whisper work, and one arriving while the first
+        is still being submitted waits for its task.
+
+        With ``chunked`` a recording longer than ``chunk_minutes`` is cut at pauses into
+        overlapping chunks that are transcribed as concurrent Whisper tasks; the returned
+        task id refers to all of them and its result is the stitched transcription.
+
+        Every Whisper task goes to the backend with the least outstanding audio (see
+        ``WhisperBackendPool``); a backend that is unreachable or answers with a 5xx is
+        skipped and the submit is sent to the next one, unless the upload is piped straight
+        into the request. Status, result, retry and cancel calls then go to the backend
+        that owns the task.
 
         Args:
-            audio_file: The uploaded audio/video file to transcribe
+            audio_file: The uploaded audio/video file to transcribe, or a file already
+                assembled on disk by the resumable upload API
             model: The Whisper model to use
             language: The language code for transcription
             prompt: Optional prompt for the model
@@ -255,13 +1033,12 @@ class WhisperService:
             diarization: Whether to separate speakers
             diarization_speaker_count: Number of speakers to separate
             max_upload_bytes: Hard cap on accepted upload size in bytes
+            chunked: Whether to transcribe long recordings in parallel chunks
             **kwargs: Additional parameters to pass to the API
 
         Returns:
             TaskStatus: The status of the created task
         """
-        url = self._task_endpoint("submit")
-
         progress_id = uuid.uuid4().hex
         data = self._build_submit_form(
             progress_id=progress_id,
@@ -276,21 +1053,50 @@ class WhisperService:
             timestamp_granularities=timestamp_granularities,
             extra=kwargs,
         )
+        params = self._task_params(data)
+        if chunked:
+            params["chunked"] = True
+
+        # Chunking seeks around in the file, so it always takes the disk path.
+        if not chunked and isinstance(audio_file, UploadFile):
+            content = await self._read_small_upload(audio_file, max_upload_bytes)
+            if content is not None:
+                self.spooled_in_memory += 1
+                return await self._submit_from_memory(data, content, params)
+
+        if self.app_config.streaming_transcode and not chunked and isinstance(audio_file, UploadFile):
+            header = await self._read_header(audio_file)
+            if not requires_seekable_input(header):
+                # Starlette spools the upload in a seekable file, so its headers can be read directly.
+                duration = header_duration(audio_file.file, sniff_container(header))
+                # Hashing the spooled file is cheap next to ffmpeg, and finds duplicates before they are piped.
+                submission = _Submission(await self._hash_upload(audio_file, max_upload_bytes), params)
+                async with self._deduplicated(submission) as duplicate:
+                    if duplicate is not None:
+                        return duplicate
+                    chunks = self._iter_upload(audio_file, max_upload_bytes)
+                    # The upload is read while it is sent, so it cannot be sent to another backend if this one fails.
+                    status, backend = await self.backends.submit(
+                        duration,
+                        lambda backend: self._submit_piped(
+                            self._task_endpoint("submit", backend), data, chunks, header
+                        ),
+                        failover=False,
+                    )
+                    return self._register_task(status, submission, progress_id, duration, backend)
+
+        if isinstance(audio_file, AssembledUpload):
+            submission = _Submission(audio_file.content_hash, params)
+            return await self._submit_from_disk(data, audio_file.path, submission, chunked, audio_file.converted_path)
 
         # Stream the upload to a temp file on disk (never fully in memory).
+        self.spooled_on_disk += 1
         with tempfile.NamedTemporaryFile(delete=False) as input_temp:
             input_path = input_temp.name
 
-        converted_path: str | None = None
         try:
-            await self._stream_upload_to_disk(audio_file, input_path, max_upload_bytes)
-            # Sniffing and the ffmpeg subprocess are blocking (up to the 300s ffmpeg timeout);
-            # run them in a worker thread so a single conversion does not stall the event loop.
-            upload_path, converted_path = await asyncio.to_thread(self._resolve_mp3_path, input_path)
-            status = await self._post_submit(url, data, upload_path)
-            self.taskId_to_progressId[status.task_id] = progress_id
-            return status
+            content_hash = await self._stream_upload_to_disk(audio_file, input_path, max_upload_bytes)
+            submission = _Submission(content_hash, params)
+            return await self._submit_from_disk(data, input_path, submission, chunked)
         finally:
             Path(input_path).unlink(missing_ok=True)
-            if converted_path is not None:
-                Path(converted_path).unlink(missing_ok=True)
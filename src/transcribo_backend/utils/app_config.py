@@ -1,14 +1,177 @@
+import json
 import os
+import tempfile
+from pathlib import Path
 
 from dcc_backend_common.config import get_env_or_throw, log_secret
 from dcc_backend_common.config.app_config import LlmConfig
 from dcc_backend_common.logger import get_logger
 from pydantic import Field
 
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
+
 logger = get_logger(__name__)
 
 # Default maximum upload size: 2 GiB
 _DEFAULT_MAX_UPLOAD_BYTES = 2 * 1024 * 1024 * 1024
+# Default size up to which uploads are kept in memory instead of spooled to disk: the
+# size Starlette itself keeps in memory, so such an upload never touches the disk
+_DEFAULT_MEMORY_SPOOL_BYTES = 1024 * 1024
+# Default number of uploads remembered for deduplication
+_DEFAULT_DEDUP_INDEX_SIZE = 1024
+# Default number of concurrent ffmpeg conversions: one per core
+_DEFAULT_FFMPEG_SLOTS = os.cpu_count() or 1
+# Default number of conversions allowed to wait for a free ffmpeg slot
+_DEFAULT_FFMPEG_QUEUE_SIZE = 32
+# Target chunk length and shared audio between chunks for chunked transcription
+_DEFAULT_CHUNK_MINUTES = 10
+_DEFAULT_CHUNK_OVERLAP_SECONDS = 4
+# Where resumable uploads are assembled, and how long an unfinished upload is kept
+_DEFAULT_UPLOAD_SPOOL_DIR = os.path.join(tempfile.gettempdir(), "transcribo-uploads")
+_DEFAULT_UPLOAD_SESSION_TTL_SECONDS = 24 * 60 * 60
+# SQLite database shared by all workers of a node to track submitted tasks, and how long a
+# task is tracked; an empty path keeps the tasks in the memory of each worker
+_DEFAULT_TASK_STORE_PATH = os.path.join(tempfile.gettempdir(), "transcribo-tasks.sqlite3")
+_DEFAULT_TASK_TTL_SECONDS = 24 * 60 * 60
+# How long a fetched task status is served to further polls before Whisper is asked again
+_DEFAULT_STATUS_CACHE_SECONDS = 0.5
+# Seconds between the status polls of a task that has event stream subscribers
+_DEFAULT_EVENT_POLL_SECONDS = 1.0
+# Statuses of a batch status request fetched from Whisper at once
+_DEFAULT_BATCH_STATUS_CONCURRENCY = 8
+# Compressed bytes of transcription results kept in memory, and the directory and byte budget
+# of the results spilled to disk when they no longer fit; an empty directory disables spilling
+_DEFAULT_RESULT_CACHE_BYTES = 64 * 1024 * 1024
+_DEFAULT_RESULT_CACHE_DIR = ""
+_DEFAULT_RESULT_CACHE_DISK_BYTES = 1024 * 1024 * 1024
+# Context of the LLM in tokens, of which instructions and the written protocol get 6000;
+# transcripts that do not fit the rest are summarized in parts, at most 4 at a time, up to
+# a transcript of 2 million characters
+_DEFAULT_SUMMARY_CONTEXT_TOKENS = 32_000
+_DEFAULT_SUMMARY_RESERVED_TOKENS = 6_000
+_DEFAULT_SUMMARY_CONCURRENCY = 4
+# Tokens are counted by the model's tokenizer through vLLM's /tokenize endpoint if its URL is
+# set, otherwise estimated at this many characters of a word per token (umlauts count twice)
+_DEFAULT_SUMMARY_TOKENIZE_URL = ""
+_DEFAULT_SUMMARY_CHARS_PER_TOKEN = 3.5
+# Filler words dropped from transcripts before they are summarized
+_DEFAULT_SUMMARY_FILLER_WORDS = ["äh", "ähm", "öh", "öhm", "eh", "ehm", "hm", "hmm", "mhm", "uh", "uhm", "um"]
+_DEFAULT_SUMMARY_MAX_CHARS = 2_000_000
+# Summaries generated at once (the LLM server runs one sequence at a time), summaries allowed
+# to wait for their turn before requests are rejected with 429, and how many of them may come
+# from one client
+_DEFAULT_SUMMARY_SLOTS = 1
+_DEFAULT_SUMMARY_QUEUE_SIZE = 16
+_DEFAULT_SUMMARY_QUEUE_PER_CLIENT = 4
+# Bytes of generated summaries cached, and for how long, so repeated requests skip the LLM
+_DEFAULT_SUMMARY_CACHE_BYTES = 16 * 1024 * 1024
+_DEFAULT_SUMMARY_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Site-specific text replacements applied to every transcript segment (e.g. spelling, names of
+# authorities) and filler words removed from it; "ß" -> "ss" is always applied
+_DEFAULT_SEGMENT_REPLACEMENTS: dict[str, str] = {}
+_DEFAULT_SEGMENT_FILLER_WORDS: list[str] = []
+# Further Whisper API instances submits are balanced over, besides WHISPER_URL, and how long
+# the circuit of a failing backend stays open before a probe request is let through
+_DEFAULT_WHISPER_BACKEND_URLS: list[str] = []
+_DEFAULT_WHISPER_BACKEND_COOLDOWN_SECONDS = 30.0
+# Requests to Whisper are sent up to 3 times on connection errors and 502/503/504, after a
+# jittered backoff starting at half a second; 3 failures in a row open a backend's circuit
+_DEFAULT_WHISPER_RETRY_ATTEMPTS = 3
+_DEFAULT_WHISPER_RETRY_BACKOFF_SECONDS = 0.5
+_DEFAULT_WHISPER_BREAKER_FAILURES = 3
+# Status reads not answered within this many seconds are sent a second time; 0 disables hedging
+_DEFAULT_WHISPER_HEDGE_SECONDS = 0.0
+# Compressed formats forwarded to Whisper unchanged; raw PCM (WAV) is still re-encoded
+# by default because it is many times larger than the MP3.
+_DEFAULT_PASSTHROUGH_FORMATS = [AudioContainer.MP3, AudioContainer.OGG, AudioContainer.FLAC, AudioContainer.MP4]
+# Default seconds Whisper needs per second of audio, used for the ETA of an estimate
+_DEFAULT_REALTIME_FACTOR = 0.2
+# Codec everything else is re-encoded to
+_DEFAULT_NORMALIZATION_TARGET = NormalizationTarget.MP3
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """Read an optional integer environment variable, falling back to ``default`` if unset or invalid."""
+    raw_value = os.getenv(name, str(default))
+    try:
+        return int(raw_value)
+    except ValueError:
+        logger.warning("Invalid %s=%r; falling back to default %d", name, raw_value, default)
+        return default
+
+
+def _get_containers_env(name: str, default: list[AudioContainer]) -> list[AudioContainer]:
+    """Read an optional comma-separated list of containers, skipping unknown names."""
+    raw_value = os.getenv(name)
+    if raw_value is None:
+        return default
+    containers: list[AudioContainer] = []
+    for item in (part.strip().lower() for part in raw_value.split(",")):
+        if not item:
+            continue
+        try:
+            containers.append(AudioContainer(item))
+        except ValueError:
+            logger.warning("Ignoring unknown container %r in %s", item, name)
+    return containers
+
+
+def _get_replacements_env(name: str, default: dict[str, str]) -> dict[str, str]:
+    """Read an optional JSON object of string replacements, given inline or as the path of a JSON file."""
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        text = raw_value if raw_value.lstrip().startswith("{") else Path(raw_value.strip()).read_text(encoding="utf-8")
+        replacements = json.loads(text)
+    except (OSError, ValueError):
+        logger.warning("Invalid %s=%r; falling back to default", name, raw_value)
+        return default
+    if not isinstance(replacements, dict) or not all(
+        isinstance(key, str) and isinstance(value, str) for key, value in replacements.items()
+    ):
+        logger.warning("%s must map strings to strings; falling back to default", name)
+        return default
+    return replacements
+
+
+def _get_list_env(name: str, default: list[str]) -> list[str]:
+    """Read an optional comma-separated list of strings, skipping empty items."""
+    raw_value = os.getenv(name)
+    if raw_value is None:
+        return default
+    return [item.strip() for item in raw_value.split(",") if item.strip()]
+
+
+def _get_float_env(name: str, default: float) -> float:
+    """Read an optional float environment variable, falling back to ``default`` if unset or invalid."""
+    raw_value = os.getenv(name, str(default))
+    try:
+        return float(raw_value)
+    except ValueError:
+        logger.warning("Invalid %s=%r; falling back to default %s", name, raw_value, default)
+        return default
+
+
+def _get_normalization_target_env(name: str, default: NormalizationTarget) -> NormalizationTarget:
+    """Read an optional normalization target, falling back to ``default`` if unset or unknown."""
+    raw_value = os.getenv(name, default.value)
+    try:
+        return NormalizationTarget(raw_value.strip().lower())
+    except ValueError:
+        logger.warning("Invalid %s=%r; falling back to default %s", name, raw_value, default.value)
+        return default
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """Read an optional boolean environment variable (``1``/``true``/``yes``/``on`` are truthy)."""
+    raw_value = os.getenv(name)
+    if raw_value is None:
+        return default
+    return raw_value.strip().lower() in _TRUE_VALUES
 
 
 class AppConfig(LlmConfig):
@@ -16,11 +179,171 @@ class AppConfig(LlmConfig):
     hmac_secret: str = Field(description="The secret key for HMAC authentication")
     whisper_url: str = Field(description="The URL for the Whisper API")
     whisper_health_check_url: str = Field(description="The URL for the Whisper API health check endpoint")
+    whisper_backend_urls: list[str] = Field(
+        default_factory=lambda: list(_DEFAULT_WHISPER_BACKEND_URLS),
+        description="Further Whisper API URLs; submits go to the backend with the least outstanding audio",
+    )
+    whisper_backend_cooldown_seconds: float = Field(
+        default=_DEFAULT_WHISPER_BACKEND_COOLDOWN_SECONDS,
+        description="Seconds the circuit of a failing Whisper backend stays open before a probe is let through",
+    )
+    whisper_retry_attempts: int = Field(
+        default=_DEFAULT_WHISPER_RETRY_ATTEMPTS,
+        description="Times a request to Whisper is sent at most on connection errors and 502/503/504 responses",
+    )
+    whisper_retry_backoff_seconds: float = Field(
+        default=_DEFAULT_WHISPER_RETRY_BACKOFF_SECONDS,
+        description="Base of the jittered exponential backoff between retries of a request to Whisper",
+    )
+    whisper_breaker_failures: int = Field(
+        default=_DEFAULT_WHISPER_BREAKER_FAILURES,
+        description="Consecutive failures after which requests to a Whisper backend fail fast",
+    )
+    whisper_hedge_seconds: float = Field(
+        default=_DEFAULT_WHISPER_HEDGE_SECONDS,
+        description="Seconds after which a slow status read is sent a second time; 0 disables hedging",
+    )
     llm_health_check_url: str = Field(description="The URL for the LLM API health check endpoint")
     max_upload_bytes: int = Field(
         default=_DEFAULT_MAX_UPLOAD_BYTES,
         description="Maximum accepted upload size in bytes for transcription requests",
     )
+    streaming_transcode: bool = Field(
+        default=False,
+        description="Pipe uploads through ffmpeg straight into the Whisper request instead of converting on disk",
+    )
+    memory_spool_bytes: int = Field(
+        default=_DEFAULT_MEMORY_SPOOL_BYTES,
+        description="Uploads up to this size are converted and forwarded from memory instead of a file on disk",
+    )
+    dedup_index_size: int = Field(
+        default=_DEFAULT_DEDUP_INDEX_SIZE,
+        description="Number of uploads (and their results) remembered to deduplicate identical re-uploads",
+    )
+    ffmpeg_slots: int = Field(
+        default=_DEFAULT_FFMPEG_SLOTS,
+        description="Maximum number of ffmpeg conversions running at the same time",
+    )
+    ffmpeg_queue_size: int = Field(
+        default=_DEFAULT_FFMPEG_QUEUE_SIZE,
+        description="Maximum number of conversions waiting for a free ffmpeg slot before uploads are rejected with 429",
+    )
+    passthrough_formats: list[AudioContainer] = Field(
+        default_factory=lambda: list(_DEFAULT_PASSTHROUGH_FORMATS),
+        description="Containers forwarded to Whisper without conversion (video is always reduced to its audio)",
+    )
+    normalization_target: NormalizationTarget = Field(
+        default=_DEFAULT_NORMALIZATION_TARGET,
+        description="Codec uploads are re-encoded to before they are sent to Whisper (mp3, opus, flac or wav)",
+    )
+    chunk_minutes: int = Field(
+        default=_DEFAULT_CHUNK_MINUTES,
+        description="Maximum chunk length in minutes when a recording is transcribed in chunks",
+    )
+    chunk_overlap_seconds: int = Field(
+        default=_DEFAULT_CHUNK_OVERLAP_SECONDS,
+        description="Audio in seconds shared by neighbouring chunks, used to stitch them together",
+    )
+    realtime_factor: float = Field(
+        default=_DEFAULT_REALTIME_FACTOR,
+        description="Seconds Whisper needs to transcribe one second of audio, used to estimate processing time",
+    )
+    upload_spool_dir: str = Field(
+        default=_DEFAULT_UPLOAD_SPOOL_DIR,
+        description="Directory in which resumable uploads are assembled",
+    )
+    upload_session_ttl_seconds: int = Field(
+        default=_DEFAULT_UPLOAD_SESSION_TTL_SECONDS,
+        description="Seconds an unfinished resumable upload is kept before it is discarded",
+    )
+    task_store_path: str = Field(
+        default=_DEFAULT_TASK_STORE_PATH,
+        description="SQLite database in which submitted tasks are tracked; empty to keep them in memory",
+    )
+    task_ttl_seconds: int = Field(
+        default=_DEFAULT_TASK_TTL_SECONDS,
+        description="Seconds a submitted task is tracked for status and result requests",
+    )
+    status_cache_seconds: float = Field(
+        default=_DEFAULT_STATUS_CACHE_SECONDS,
+        description="Seconds a task status fetched from Whisper is served to further polls; 0 only coalesces",
+    )
+    event_poll_seconds: float = Field(
+        default=_DEFAULT_EVENT_POLL_SECONDS,
+        description="Seconds between the status polls behind the event stream of a task",
+    )
+    batch_status_concurrency: int = Field(
+        default=_DEFAULT_BATCH_STATUS_CONCURRENCY,
+        description="Task statuses of one batch status request fetched from Whisper concurrently",
+    )
+    segment_replacements: dict[str, str] = Field(
+        default_factory=lambda: dict(_DEFAULT_SEGMENT_REPLACEMENTS),
+        description="Text replacements applied to every transcript segment; words match whole words only",
+    )
+    segment_filler_words: list[str] = Field(
+        default_factory=lambda: list(_DEFAULT_SEGMENT_FILLER_WORDS),
+        description="Filler words removed from every transcript segment, in any case",
+    )
+    result_cache_bytes: int = Field(
+        default=_DEFAULT_RESULT_CACHE_BYTES,
+        description="Compressed bytes of transcription results cached in memory",
+    )
+    result_cache_dir: str = Field(
+        default=_DEFAULT_RESULT_CACHE_DIR,
+        description="Directory results evicted from memory are spilled to; empty disables spilling",
+    )
+    result_cache_disk_bytes: int = Field(
+        default=_DEFAULT_RESULT_CACHE_DISK_BYTES,
+        description="Compressed bytes of transcription results kept in the spill directory",
+    )
+    summary_context_tokens: int = Field(
+        default=_DEFAULT_SUMMARY_CONTEXT_TOKENS,
+        description="Context of the LLM in tokens; longer transcripts are summarized in parts",
+    )
+    summary_reserved_tokens: int = Field(
+        default=_DEFAULT_SUMMARY_RESERVED_TOKENS,
+        description="Tokens of the context kept for the instructions and the written summary",
+    )
+    summary_tokenize_url: str = Field(
+        default=_DEFAULT_SUMMARY_TOKENIZE_URL,
+        description="URL of the LLM server's /tokenize endpoint; empty estimates tokens locally",
+    )
+    summary_chars_per_token: float = Field(
+        default=_DEFAULT_SUMMARY_CHARS_PER_TOKEN,
+        description="Characters of a word per token in the local token estimate",
+    )
+    summary_filler_words: list[str] = Field(
+        default_factory=lambda: list(_DEFAULT_SUMMARY_FILLER_WORDS),
+        description="Filler words dropped from transcripts before they are summarized",
+    )
+    summary_concurrency: int = Field(
+        default=_DEFAULT_SUMMARY_CONCURRENCY,
+        description="Parts of a long transcript summarized concurrently, within the summary_slots requests to the LLM",
+    )
+    summary_max_chars: int = Field(
+        default=_DEFAULT_SUMMARY_MAX_CHARS,
+        description="Maximum accepted transcript length in characters for summarization requests",
+    )
+    summary_slots: int = Field(
+        default=_DEFAULT_SUMMARY_SLOTS,
+        description="Summaries generated at the same time; further requests wait for their turn",
+    )
+    summary_queue_size: int = Field(
+        default=_DEFAULT_SUMMARY_QUEUE_SIZE,
+        description="Maximum number of summaries waiting for their turn before requests are rejected with 429",
+    )
+    summary_queue_per_client: int = Field(
+        default=_DEFAULT_SUMMARY_QUEUE_PER_CLIENT,
+        description="Maximum number of waiting summaries of one client (X-Client-Id)",
+    )
+    summary_cache_bytes: int = Field(
+        default=_DEFAULT_SUMMARY_CACHE_BYTES,
+        description="Bytes of generated summaries cached in memory; 0 disables the cache",
+    )
+    summary_cache_ttl_seconds: int = Field(
+        default=_DEFAULT_SUMMARY_CACHE_TTL_SECONDS,
+        description="Seconds a generated summary is served from the cache",
+    )
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -32,16 +355,53 @@ class AppConfig(LlmConfig):
         hmac_secret: str = get_env_or_throw("HMAC_SECRET")
         whisper_url: str = get_env_or_throw("WHISPER_URL")
         whisper_health_check_url: str = get_env_or_throw("WHISPER_HEALTH_CHECK_URL")
-        raw_max_upload_bytes = os.getenv("MAX_UPLOAD_BYTES", str(_DEFAULT_MAX_UPLOAD_BYTES))
-        try:
-            max_upload_bytes: int = int(raw_max_upload_bytes)
-        except ValueError:
-            logger.warning(
-                "Invalid MAX_UPLOAD_BYTES=%r; falling back to default %d",
-                raw_max_upload_bytes,
-                _DEFAULT_MAX_UPLOAD_BYTES,
-            )
-            max_upload_bytes = _DEFAULT_MAX_UPLOAD_BYTES
+        whisper_backend_urls = _get_list_env("WHISPER_BACKEND_URLS", _DEFAULT_WHISPER_BACKEND_URLS)
+        whisper_backend_cooldown_seconds: float = _get_float_env(
+            "WHISPER_BACKEND_COOLDOWN_SECONDS", _DEFAULT_WHISPER_BACKEND_COOLDOWN_SECONDS
+        )
+        whisper_retry_attempts: int = _get_int_env("WHISPER_RETRY_ATTEMPTS", _DEFAULT_WHISPER_RETRY_ATTEMPTS)
+        whisper_retry_backoff_seconds: float = _get_float_env(
+            "WHISPER_RETRY_BACKOFF_SECONDS", _DEFAULT_WHISPER_RETRY_BACKOFF_SECONDS
+        )
+        whisper_breaker_failures: int = _get_int_env("WHISPER_BREAKER_FAILURES", _DEFAULT_WHISPER_BREAKER_FAILURES)
+        whisper_hedge_seconds: float = _get_float_env("WHISPER_HEDGE_SECONDS", _DEFAULT_WHISPER_HEDGE_SECONDS)
+        max_upload_bytes: int = _get_int_env("MAX_UPLOAD_BYTES", _DEFAULT_MAX_UPLOAD_BYTES)
+        streaming_transcode: bool = _get_bool_env("STREAMING_TRANSCODE", False)
+        memory_spool_bytes: int = _get_int_env("MEMORY_SPOOL_BYTES", _DEFAULT_MEMORY_SPOOL_BYTES)
+        dedup_index_size: int = _get_int_env("DEDUP_INDEX_SIZE", _DEFAULT_DEDUP_INDEX_SIZE)
+        ffmpeg_slots: int = _get_int_env("FFMPEG_SLOTS", _DEFAULT_FFMPEG_SLOTS)
+        ffmpeg_queue_size: int = _get_int_env("FFMPEG_QUEUE_SIZE", _DEFAULT_FFMPEG_QUEUE_SIZE)
+        passthrough_formats = _get_containers_env("PASSTHROUGH_FORMATS", _DEFAULT_PASSTHROUGH_FORMATS)
+        normalization_target = _get_normalization_target_env("NORMALIZATION_TARGET", _DEFAULT_NORMALIZATION_TARGET)
+        chunk_minutes: int = _get_int_env("CHUNK_MINUTES", _DEFAULT_CHUNK_MINUTES)
+        chunk_overlap_seconds: int = _get_int_env("CHUNK_OVERLAP_SECONDS", _DEFAULT_CHUNK_OVERLAP_SECONDS)
+        realtime_factor: float = _get_float_env("REALTIME_FACTOR", _DEFAULT_REALTIME_FACTOR)
+        upload_spool_dir: str = os.getenv("UPLOAD_SPOOL_DIR", _DEFAULT_UPLOAD_SPOOL_DIR)
+        upload_session_ttl_seconds: int = _get_int_env(
+            "UPLOAD_SESSION_TTL_SECONDS", _DEFAULT_UPLOAD_SESSION_TTL_SECONDS
+        )
+        task_store_path: str = os.getenv("TASK_STORE_PATH", _DEFAULT_TASK_STORE_PATH)
+        task_ttl_seconds: int = _get_int_env("TASK_TTL_SECONDS", _DEFAULT_TASK_TTL_SECONDS)
+        status_cache_seconds: float = _get_float_env("STATUS_CACHE_SECONDS", _DEFAULT_STATUS_CACHE_SECONDS)
+        event_poll_seconds: float = _get_float_env("EVENT_POLL_SECONDS", _DEFAULT_EVENT_POLL_SECONDS)
+        batch_status_concurrency: int = _get_int_env("BATCH_STATUS_CONCURRENCY", _DEFAULT_BATCH_STATUS_CONCURRENCY)
+        result_cache_bytes: int = _get_int_env("RESULT_CACHE_BYTES", _DEFAULT_RESULT_CACHE_BYTES)
+        segment_replacements = _get_replacements_env("SEGMENT_REPLACEMENTS", _DEFAULT_SEGMENT_REPLACEMENTS)
+        segment_filler_words = _get_list_env("SEGMENT_FILLER_WORDS", _DEFAULT_SEGMENT_FILLER_WORDS)
+        result_cache_dir: str = os.getenv("RESULT_CACHE_DIR", _DEFAULT_RESULT_CACHE_DIR)
+        result_cache_disk_bytes: int = _get_int_env("RESULT_CACHE_DISK_BYTES", _DEFAULT_RESULT_CACHE_DISK_BYTES)
+        summary_context_tokens: int = _get_int_env("SUMMARY_CONTEXT_TOKENS", _DEFAULT_SUMMARY_CONTEXT_TOKENS)
+        summary_reserved_tokens: int = _get_int_env("SUMMARY_RESERVED_TOKENS", _DEFAULT_SUMMARY_RESERVED_TOKENS)
+        summary_tokenize_url: str = os.getenv("SUMMARY_TOKENIZE_URL", _DEFAULT_SUMMARY_TOKENIZE_URL)
+        summary_chars_per_token: float = _get_float_env("SUMMARY_CHARS_PER_TOKEN", _DEFAULT_SUMMARY_CHARS_PER_TOKEN)
+        summary_filler_words = _get_list_env("SUMMARY_FILLER_WORDS", _DEFAULT_SUMMARY_FILLER_WORDS)
+        summary_concurrency: int = _get_int_env("SUMMARY_CONCURRENCY", _DEFAULT_SUMMARY_CONCURRENCY)
+        summary_max_chars: int = _get_int_env("SUMMARY_MAX_CHARS", _DEFAULT_SUMMARY_MAX_CHARS)
+        summary_slots: int = _get_int_env("SUMMARY_SLOTS", _DEFAULT_SUMMARY_SLOTS)
+        summary_queue_size: int = _get_int_env("SUMMARY_QUEUE_SIZE", _DEFAULT_SUMMARY_QUEUE_SIZE)
+        summary_queue_per_client: int = _get_int_env("SUMMARY_QUEUE_PER_CLIENT", _DEFAULT_SUMMARY_QUEUE_PER_CLIENT)
+        summary_cache_bytes: int = _get_int_env("SUMMARY_CACHE_BYTES", _DEFAULT_SUMMARY_CACHE_BYTES)
+        summary_cache_ttl_seconds: int = _get_int_env("SUMMARY_CACHE_TTL_SECONDS", _DEFAULT_SUMMARY_CACHE_TTL_SECONDS)
 
         return cls(
             llm_url=llm_base_url,
@@ -52,7 +412,47 @@ class AppConfig(LlmConfig):
             hmac_secret=hmac_secret,
             whisper_url=whisper_url,
             whisper_health_check_url=whisper_health_check_url,
+            whisper_backend_urls=whisper_backend_urls,
+            whisper_backend_cooldown_seconds=whisper_backend_cooldown_seconds,
+            whisper_retry_attempts=whisper_retry_attempts,
+            whisper_retry_backoff_seconds=whisper_retry_backoff_seconds,
+            whisper_breaker_failures=whisper_breaker_failures,
+            whisper_hedge_seconds=whisper_hedge_seconds,
             max_upload_bytes=max_upload_bytes,
+            streaming_transcode=streaming_transcode,
+            memory_spool_bytes=memory_spool_bytes,
+            dedup_index_size=dedup_index_size,
+            ffmpeg_slots=ffmpeg_slots,
+            ffmpeg_queue_size=ffmpeg_queue_size,
+            passthrough_formats=passthrough_formats,
+            normalization_target=normalization_target,
+            chunk_minutes=chunk_minutes,
+            chunk_overlap_seconds=chunk_overlap_seconds,
+            realtime_factor=realtime_factor,
+            upload_spool_dir=upload_spool_dir,
+            upload_session_ttl_seconds=upload_session_ttl_seconds,
+            task_store_path=task_store_path,
+            task_ttl_seconds=task_ttl_seconds,
+            status_cache_seconds=status_cache_seconds,
+            event_poll_seconds=event_poll_seconds,
+            batch_status_concurrency=batch_status_concurrency,
+            result_cache_bytes=result_cache_bytes,
+            segment_replacements=segment_replacements,
+            segment_filler_words=segment_filler_words,
+            result_cache_dir=result_cache_dir,
+            result_cache_disk_bytes=result_cache_disk_bytes,
+            summary_context_tokens=summary_context_tokens,
+            summary_reserved_tokens=summary_reserved_tokens,
+            summary_tokenize_url=summary_tokenize_url,
+            summary_chars_per_token=summary_chars_per_token,
+            summary_filler_words=summary_filler_words,
+            summary_concurrency=summary_concurrency,
+            summary_max_chars=summary_max_chars,
+            summary_slots=summary_slots,
+            summary_queue_size=summary_queue_size,
+            summary_queue_per_client=summary_queue_per_client,
+            summary_cache_bytes=summary_cache_bytes,
+            summary_cache_ttl_seconds=summary_cache_ttl_seconds,
         )
 
     def __str__(self) -> str:
@@ -66,6 +466,46 @@ class AppConfig(LlmConfig):
             hmac_secret={log_secret(self.hmac_secret)},
             whisper_url={self.whisper_url}
             whisper_health_check_url={self.whisper_health_check_url},
+            whisper_backend_urls={self.whisper_backend_urls},
+            whisper_backend_cooldown_seconds={self.whisper_backend_cooldown_seconds},
+            whisper_retry_attempts={self.whisper_retry_attempts},
+            whisper_retry_backoff_seconds={self.whisper_retry_backoff_seconds},
+            whisper_breaker_failures={self.whisper_breaker_failures},
+            whisper_hedge_seconds={self.whisper_hedge_seconds},
             max_upload_bytes={self.max_upload_bytes},
+            streaming_transcode={self.streaming_transcode},
+            memory_spool_bytes={self.memory_spool_bytes},
+            dedup_index_size={self.dedup_index_size},
+            ffmpeg_slots={self.ffmpeg_slots},
+            ffmpeg_queue_size={self.ffmpeg_queue_size},
+            passthrough_formats={",".join(self.passthrough_formats)},
+            normalization_target={self.normalization_target},
+            chunk_minutes={self.chunk_minutes},
+            chunk_overlap_seconds={self.chunk_overlap_seconds},
+            realtime_factor={self.realtime_factor},
+            upload_spool_dir={self.upload_spool_dir},
+            upload_session_ttl_seconds={self.upload_session_ttl_seconds},
+            task_store_path={self.task_store_path},
+            task_ttl_seconds={self.task_ttl_seconds},
+            status_cache_seconds={self.status_cache_seconds},
+            event_poll_seconds={self.event_poll_seconds},
+            batch_status_concurrency={self.batch_status_concurrency},
+            result_cache_bytes={self.result_cache_bytes},
+            segment_replacements={len(self.segment_replacements)} rules,
+            segment_filler_words={",".join(self.segment_filler_words)},
+            result_cache_dir={self.result_cache_dir},
+            result_cache_disk_bytes={self.result_cache_disk_bytes},
+            summary_context_tokens={self.summary_context_tokens},
+            summary_reserved_tokens={self.summary_reserved_tokens},
+            summary_tokenize_url={self.summary_tokenize_url},
+            summary_chars_per_token={self.summary_chars_per_token},
+            summary_filler_words={",".join(self.summary_filler_words)},
+            summary_concurrency={self.summary_concurrency},
+            summary_max_chars={self.summary_max_chars},
+            summary_slots={self.summary_slots},
+            summary_queue_size={self.summary_queue_size},
+            summary_queue_per_client={self.summary_queue_per_client},
+            summary_cache_bytes={self.summary_cache_bytes},
+            summary_cache_ttl_seconds={self.summary_cache_ttl_seconds},
         )
         """
@@ -7,6 +7,7 @@ takes precedence.
 """
 
 import os
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -28,3 +29,11 @@ for _key, _value in _DUMMY_ENV.items():
 @pytest.fixture
 def anyio_backend() -> str:
     return "asyncio"
+
+
+@pytest.fixture
+def audio_probe():
+    """Let the upload content check find an audio stream without running ffprobe."""
+    streams = [{"codec_type": "audio", "codec_name": "mp3"}]
+    with patch("transcribo_backend.helpers.file_type.probe_header_streams", AsyncMock(return_value=streams)) as probe:
+        yield probe
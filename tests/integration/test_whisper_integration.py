@@ -23,6 +23,8 @@ import pytest
 from fastapi import HTTPException, UploadFile
 from returns.io import IOFailure, IOSuccess
 
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
 from transcribo_backend.models.task_status import TaskStatusEnum
 from transcribo_backend.services.whisper_service import WhisperService
 from transcribo_backend.utils.app_config import AppConfig
@@ -42,6 +44,32 @@ def _make_service(max_upload_bytes: int = 500 * 1024 * 1024) -> WhisperService:
         whisper_url=WHISPER_URL,
         llm_api_key=API_KEY,
         max_upload_bytes=max_upload_bytes,
+        streaming_transcode=False,
+        memory_spool_bytes=0,
+        dedup_index_size=1024,
+        ffmpeg_slots=2,
+        ffmpeg_queue_size=8,
+        passthrough_formats=[AudioContainer.MP3],
+        normalization_target=NormalizationTarget.MP3,
+        chunk_minutes=10,
+        chunk_overlap_seconds=4,
+        realtime_factor=0.2,
+        task_store_path="",
+        task_ttl_seconds=24 * 60 * 60,
+        status_cache_seconds=0.5,
+        event_poll_seconds=1.0,
+        batch_status_concurrency=8,
+        result_cache_bytes=64 * 1024 * 1024,
+        result_cache_dir="",
+        result_cache_disk_bytes=0,
+        segment_replacements={},
+        segment_filler_words=[],
+        whisper_backend_urls=[],
+        whisper_backend_cooldown_seconds=30.0,
+        whisper_retry_attempts=3,
+        whisper_retry_backoff_seconds=0.5,
+        whisper_breaker_failures=3,
+        whisper_hedge_seconds=0.0,
     )
     return WhisperService(cast(AppConfig, cfg))
 
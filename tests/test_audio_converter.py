@@ -3,16 +3,29 @@
 import shutil
 import subprocess
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from returns.io import IOResult
 from returns.pipeline import is_successful
 from returns.unsafe import unsafe_perform_io
 
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
 from transcribo_backend.services.audio_converter import (
     AudioConversionError,
+    ConversionAction,
     convert_to_mp3,
+    encode_args,
+    extract_audio,
     is_mp3_format,
+    normalize_audio,
+    normalized_format,
+    plan_conversion,
+    probe_header_streams,
+    requires_seekable_input,
+    sniff_container,
+    transcode_stream,
 )
 
 ASSETS_DIR = Path(__file__).parent / "assets"
@@ -53,6 +66,112 @@ class TestIsMp3Format:
         assert is_mp3_format(header) is True
 
 
+class TestRequiresSeekableInput:
+    """Only MP4-family files with the moov box after the media data need a seekable input."""
+
+    @staticmethod
+    def _box(box_type: bytes, payload_size: int = 0) -> bytes:
+        return (8 + payload_size).to_bytes(4, "big") + box_type + b"\x00" * payload_size
+
+    def test_trailing_moov_needs_seek(self):
+        header = self._box(b"ftyp", 16) + self._box(b"free") + self._box(b"mdat", 64)
+        assert requires_seekable_input(header) is True
+
+    def test_faststart_moov_is_streamable(self):
+        header = self._box(b"ftyp", 16) + self._box(b"moov", 64) + self._box(b"mdat", 64)
+        assert requires_seekable_input(header) is False
+
+    def test_non_mp4_containers_are_streamable(self):
+        assert requires_seekable_input(b"RIFF" + b"\x00" * 100) is False
+        assert requires_seekable_input(b"ID3" + b"\x00" * 100) is False
+
+    @pytest.mark.parametrize("filename", ["sample-5s.m4a", "sample-5s.mp4"])
+    def test_sample_files_with_trailing_moov(self, filename: str):
+        header = (ASSETS_DIR / filename).read_bytes()[:1024]
+        assert requires_seekable_input(header) is True
+
+
+class TestSniffContainer:
+    """Containers are recognised from their magic bytes alone."""
+
+    @pytest.mark.parametrize(
+        ("filename", "container"),
+        [
+            ("sample-3s.wav", AudioContainer.WAV),
+            ("sample-3s.mp3", AudioContainer.MP3),
+            ("sample-5s.flac", AudioContainer.FLAC),
+            ("sample-5s.m4a", AudioContainer.MP4),
+            ("sample-5s.ogg", AudioContainer.OGG),
+            ("sample-5s.mp4", AudioContainer.MP4),
+        ],
+    )
+    def test_sample_files(self, filename: str, container: AudioContainer):
+        header = (ASSETS_DIR / filename).read_bytes()[:1024]
+        assert sniff_container(header) == container
+
+    def test_matroska(self):
+        assert sniff_container(b"\x1a\x45\xdf\xa3" + b"\x00" * 100) == AudioContainer.MATROSKA
+
+    def test_unknown(self):
+        assert sniff_container(b"RIFF" + b"\x00" * 100) is None
+
+
+PASSTHROUGH = [AudioContainer.MP3, AudioContainer.OGG, AudioContainer.FLAC, AudioContainer.MP4]
+_PROBE = "transcribo_backend.services.audio_converter.probe_streams"
+
+
+class TestPlanConversion:
+    """Only the work that is actually needed gets scheduled."""
+
+    @pytest.mark.anyio
+    async def test_audio_only_passthrough_skips_probe(self):
+        with patch(_PROBE, new_callable=AsyncMock) as probe:
+            plan = await plan_conversion("in.ogg", b"OggS" + b"\x00" * 100, PASSTHROUGH)
+        assert plan.action == ConversionAction.PASSTHROUGH
+        assert plan.container == AudioContainer.OGG
+        probe.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_wav_is_reencoded_by_default(self):
+        plan = await plan_conversion("in.wav", b"RIFF\x00\x00\x00\x00WAVE", PASSTHROUGH)
+        assert plan.action == ConversionAction.TRANSCODE
+
+    @pytest.mark.anyio
+    async def test_audio_only_mp4_is_passed_through(self):
+        streams = [{"codec_type": "audio", "codec_name": "aac"}]
+        with patch(_PROBE, new_callable=AsyncMock, return_value=streams):
+            plan = await plan_conversion("in.m4a", b"\x00\x00\x00\x18ftypM4A ", PASSTHROUGH)
+        assert plan.action == ConversionAction.PASSTHROUGH
+
+    @pytest.mark.anyio
+    async def test_video_with_copyable_audio_is_remuxed(self):
+        streams = [{"codec_type": "video", "codec_name": "h264"}, {"codec_type": "audio", "codec_name": "aac"}]
+        with patch(_PROBE, new_callable=AsyncMock, return_value=streams):
+            plan = await plan_conversion("in.mp4", b"\x00\x00\x00\x18ftypisom", PASSTHROUGH)
+        assert (plan.action, plan.audio_codec) == (ConversionAction.REMUX, "aac")
+
+    @pytest.mark.anyio
+    async def test_video_is_not_remuxed_into_a_container_that_is_not_passed_through(self):
+        streams = [{"codec_type": "video", "codec_name": "h264"}, {"codec_type": "audio", "codec_name": "aac"}]
+        with patch(_PROBE, new_callable=AsyncMock, return_value=streams):
+            plan = await plan_conversion("in.mp4", b"\x00\x00\x00\x18ftypisom", [AudioContainer.MP3])
+        # The AAC track would be copied into an M4A, which the operator did not allow.
+        assert (plan.action, plan.audio_codec) == (ConversionAction.TRANSCODE, "aac")
+
+    @pytest.mark.anyio
+    async def test_video_with_uncommon_audio_is_reencoded(self):
+        streams = [{"codec_type": "video", "codec_name": "h264"}, {"codec_type": "audio", "codec_name": "pcm_s16le"}]
+        with patch(_PROBE, new_callable=AsyncMock, return_value=streams):
+            plan = await plan_conversion("in.mkv", b"\x1a\x45\xdf\xa3", PASSTHROUGH)
+        assert plan.action == ConversionAction.TRANSCODE
+
+    @pytest.mark.anyio
+    async def test_failed_probe_falls_back_to_reencoding(self):
+        with patch(_PROBE, new_callable=AsyncMock, return_value=None):
+            plan = await plan_conversion("in.mp4", b"\x00\x00\x00\x18ftypisom", PASSTHROUGH)
+        assert plan.action == ConversionAction.TRANSCODE
+
+
 class TestAudioConversionError:
     """Test custom exceptions."""
 
@@ -62,13 +181,34 @@ class TestAudioConversionError:
             raise AudioConversionError("Test error message")  # noqa: TRY003
 
 
-def test_convert_to_mp3_returns_io_result():
-    """Test that convert_to_mp3 returns an IOResult.
+# Container and MIME type every normalization target is announced to Whisper with.
+NORMALIZED_CONTAINERS = {
+    NormalizationTarget.MP3: (AudioContainer.MP3, "audio/mpeg"),
+    NormalizationTarget.OPUS: (AudioContainer.OGG, "audio/ogg"),
+    NormalizationTarget.FLAC: (AudioContainer.FLAC, "audio/flac"),
+    NormalizationTarget.WAV: (AudioContainer.WAV, "audio/wav"),
+}
 
-    A non-existent input path makes ffmpeg fail, but the @impure_safe wrapper should
+
+class TestNormalizationTarget:
+    @pytest.mark.parametrize("target", list(NormalizationTarget))
+    def test_every_target_is_mono_16khz_with_matching_upload_format(self, target: NormalizationTarget):
+        args = encode_args(target)
+        _, content_type = NORMALIZED_CONTAINERS[target]
+
+        assert args[args.index("-ac") + 1] == "1"
+        assert args[args.index("-ar") + 1] == "16000"
+        assert normalized_format(target).content_type == content_type
+
+
+@pytest.mark.anyio
+async def test_convert_to_mp3_returns_io_result():
+    """Test that convert_to_mp3 resolves to an IOResult.
+
+    A non-existent input path makes ffmpeg fail, but the @future_safe wrapper should
     still surface that as an IOResult (Failure) rather than raising.
     """
-    result = convert_to_mp3("/nonexistent/path/to/input.bin")
+    result = await convert_to_mp3("/nonexistent/path/to/input.bin")
     assert isinstance(result, IOResult)
     assert not is_successful(result)
 
@@ -77,12 +217,13 @@ def test_convert_to_mp3_returns_io_result():
 class TestConvertRealFiles:
     """Convert real sample files of various formats end-to-end with ffmpeg."""
 
+    @pytest.mark.anyio
     @pytest.mark.parametrize("filename", SAMPLE_FILES)
-    def test_converts_to_valid_mp3(self, filename: str):
+    async def test_converts_to_valid_mp3(self, filename: str):
         input_path = ASSETS_DIR / filename
         assert input_path.exists(), f"missing test asset: {input_path}"
 
-        result = convert_to_mp3(str(input_path))
+        result = await convert_to_mp3(str(input_path))
 
         assert is_successful(result), f"conversion failed for {filename}"
         output_path = Path(unsafe_perform_io(result.unwrap()))
@@ -100,6 +241,72 @@ class TestConvertRealFiles:
         finally:
             output_path.unlink(missing_ok=True)
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("filename", ["sample-3s.wav", "sample-5s.flac", "sample-5s.ogg"])
+    async def test_transcode_stream_produces_mp3(self, filename: str):
+        data = (ASSETS_DIR / filename).read_bytes()
+
+        async def _chunks():
+            for start in range(0, len(data), 64 * 1024):
+                yield data[start : start + 64 * 1024]
+
+        output = b"".join([chunk async for chunk in transcode_stream(_chunks())])
+
+        assert output
+        assert is_mp3_format(output)
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("target", list(NormalizationTarget))
+    async def test_normalizes_to_each_target(self, target: NormalizationTarget):
+        result = await normalize_audio(str(ASSETS_DIR / "sample-5s.m4a"), target)
+
+        assert is_successful(result)
+        output_path = Path(unsafe_perform_io(result.unwrap()))
+        try:
+            assert sniff_container(output_path.read_bytes()[:1024]) == NORMALIZED_CONTAINERS[target][0]
+            stream = self._probe(output_path)
+            assert stream["channels"] == "1"
+            assert stream["sample_rate"] == "16000"
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("target", list(NormalizationTarget))
+    async def test_transcode_stream_produces_each_target(self, target: NormalizationTarget):
+        data = (ASSETS_DIR / "sample-3s.wav").read_bytes()
+
+        async def _chunks():
+            yield data
+
+        output = b"".join([chunk async for chunk in transcode_stream(_chunks(), target)])
+
+        assert sniff_container(output[:1024]) == NORMALIZED_CONTAINERS[target][0]
+
+    @pytest.mark.anyio
+    async def test_extracts_video_audio_track_without_reencoding(self):
+        input_path = ASSETS_DIR / "sample-5s.mp4"
+        plan = await plan_conversion(str(input_path), input_path.read_bytes()[:1024], PASSTHROUGH)
+        assert plan.action == ConversionAction.REMUX
+        assert plan.audio_codec is not None
+
+        result = await extract_audio(str(input_path), plan.audio_codec)
+
+        assert is_successful(result)
+        output_path = Path(unsafe_perform_io(result.unwrap()))
+        try:
+            assert sniff_container(output_path.read_bytes()[:1024]) is not None
+            assert self._probe(output_path)["codec_name"] == plan.audio_codec
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    @pytest.mark.anyio
+    async def test_transcode_stream_rejects_garbage(self):
+        async def _chunks():
+            yield b"definitely not audio" * 100
+
+        with pytest.raises(AudioConversionError):
+            _ = [chunk async for chunk in transcode_stream(_chunks())]
+
     @staticmethod
     def _probe(path: Path) -> dict[str, str]:
         ffprobe = shutil.which("ffprobe")
@@ -127,3 +334,22 @@ class TestConvertRealFiles:
                 key, value = line.split("=", 1)
                 stream[key] = value
         return stream
+
+
+@requires_ffmpeg
+class TestProbeHeaderStreams:
+    """Probe only the leading bytes of a file, as the upload content check does."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("filename", ["sample-3s.mp3", "sample-3s.wav", "sample-5s.flac", "sample-5s.ogg"])
+    async def test_finds_the_audio_stream_in_the_leading_bytes(self, filename: str):
+        header = (ASSETS_DIR / filename).read_bytes()[: 64 * 1024]
+
+        streams = await probe_header_streams(header)
+
+        assert streams is not None
+        assert any(stream["codec_type"] == "audio" for stream in streams)
+
+    @pytest.mark.anyio
+    async def test_undecodable_bytes_have_no_streams(self):
+        assert await probe_header_streams(b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 4096) == []
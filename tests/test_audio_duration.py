@@ -0,0 +1,76 @@
+"""Tests for reading durations from container headers without decoding."""
+
+import struct
+import wave
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.services.audio_converter import sniff_container
+from transcribo_backend.services.audio_duration import header_duration
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+
+def _wav(seconds: float, rate: int = 16000) -> bytes:
+    buf = BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buf.getvalue()
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _duration(data: bytes) -> float | None:
+    return header_duration(BytesIO(data), sniff_container(data[:1024]))
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("sample-3s.mp3", 3.24),
+        ("sample-3s.wav", 3.20),
+        ("sample-5s.flac", 105.77),
+        ("sample-5s.m4a", 5.02),
+        ("sample-5s.mp4", 5.76),
+        ("sample-5s.ogg", 5.00),
+    ],
+)
+def test_reads_duration_of_sample_files(filename: str, expected: float):
+    assert _duration((ASSETS_DIR / filename).read_bytes()) == pytest.approx(expected, abs=0.02)
+
+
+def test_wav_with_unknown_data_size_runs_to_end_of_file():
+    data = bytearray(_wav(2.0))
+    data_chunk = data.index(b"data")
+    data[data_chunk + 4 : data_chunk + 8] = b"\xff\xff\xff\xff"  # written by a streaming encoder
+
+    assert _duration(bytes(data)) == pytest.approx(2.0)
+
+
+def test_mp4_with_moov_after_mdat():
+    mvhd = _box(b"mvhd", b"\x00" * 4 + b"\x00" * 8 + struct.pack(">II", 1000, 90_500) + b"\x00" * 80)
+    data = _box(b"ftyp", b"isom\x00\x00\x02\x00") + _box(b"mdat", b"\x00" * 5000) + _box(b"moov", mvhd)
+
+    assert _duration(data) == pytest.approx(90.5)
+
+
+def test_flac_without_total_samples_is_unknown():
+    streaminfo = bytearray(34)
+    streaminfo[10:18] = (16000 << 44).to_bytes(8, "big")  # sample rate only, no sample count
+    data = b"fLaC" + bytes([0x80, 0, 0, 34]) + bytes(streaminfo)
+
+    assert _duration(data) is None
+
+
+def test_unsupported_or_garbage_input_is_unknown():
+    assert header_duration(BytesIO(b"\x1a\x45\xdf\xa3" + b"\x00" * 100), AudioContainer.MATROSKA) is None
+    assert header_duration(BytesIO(b"RIFF\x00\x00\x00\x00WAVE"), AudioContainer.WAV) is None
+    assert _duration(b"no audio here") is None
@@ -0,0 +1,124 @@
+"""Tests for cutting long recordings into chunks and stitching the chunk results."""
+
+from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
+from transcribo_backend.services.chunked_transcription import (
+    AudioChunk,
+    ChunkedTask,
+    aggregate_status,
+    merge_chunk_results,
+    pick_cut_point,
+    plan_chunks,
+    split_targets,
+)
+
+
+def _segments(*items: tuple[float, float, str, str]) -> TranscriptionResponse:
+    return TranscriptionResponse(
+        segments=[Segment(start=start, end=end, text=text, speaker=speaker) for start, end, text, speaker in items]
+    )
+
+
+class TestPlanning:
+    def test_split_targets_are_evenly_spaced(self):
+        assert split_targets(1500, 600) == [500, 1000]
+
+    def test_short_recording_is_not_split(self):
+        assert split_targets(300, 600) == []
+
+    def test_cut_moves_to_nearest_silence(self):
+        silences = [(480.0, 482.0), (505.0, 506.0), (530.0, 531.0)]
+        assert pick_cut_point(500.0, silences) == 505.5
+
+    def test_cut_without_silence_stays_at_target(self):
+        assert pick_cut_point(500.0, []) == 500.0
+
+    def test_chunks_cover_recording_with_overlap(self):
+        chunks = plan_chunks(1500, [505.5, 1000.0], overlap_seconds=4)
+
+        assert chunks == [
+            AudioChunk(0.0, 505.5, 509.5),
+            AudioChunk(505.5, 1000.0, 1004.0),
+            AudioChunk(1000.0, 1500, 1500),
+        ]
+
+
+class TestMerge:
+    def test_offsets_are_shifted_and_overlap_is_deduplicated(self):
+        chunks = [AudioChunk(0.0, 10.0, 14.0), AudioChunk(10.0, 20.0, 20.0)]
+        first = _segments((0.0, 4.0, "Guten Morgen", "SPEAKER_00"), (10.5, 11.5, "zusammen", "SPEAKER_00"))
+        # The second chunk hears "zusammen" again at its start (10.5s in the recording).
+        second = _segments((0.5, 1.5, "zusammen", "SPEAKER_00"), (5.0, 8.0, "Traktandum eins", "SPEAKER_00"))
+
+        merged = merge_chunk_results(chunks, [first, second])
+
+        assert [(s.start, s.end, s.text) for s in merged.segments] == [
+            (0.0, 4.0, "Guten Morgen"),
+            (10.5, 11.5, "zusammen"),
+            (15.0, 18.0, "Traktandum eins"),
+        ]
+
+    def test_segment_is_kept_by_the_chunk_that_heard_it_in_the_middle(self):
+        chunks = [AudioChunk(0.0, 10.0, 14.0), AudioChunk(10.0, 20.0, 20.0)]
+        # Cut off by the end of the first chunk's audio, heard completely by the second.
+        first = _segments((12.5, 14.0, "Antr", "SPEAKER_00"))
+        second = _segments((2.5, 4.0, "Antrag", "SPEAKER_00"))
+
+        merged = merge_chunk_results(chunks, [first, second])
+
+        assert [s.text for s in merged.segments] == ["Antrag"]
+
+    def test_speaker_labels_are_matched_through_shared_audio(self):
+        chunks = [AudioChunk(0.0, 10.0, 14.0), AudioChunk(10.0, 20.0, 20.0)]
+        first = _segments((0.0, 5.0, "Eins", "SPEAKER_00"), (10.2, 13.8, "Zwei", "SPEAKER_01"))
+        # The diarizer of the second chunk called the same voice SPEAKER_00 and a new one SPEAKER_01.
+        second = _segments((0.2, 3.8, "Zwei", "SPEAKER_00"), (5.0, 9.0, "Drei", "SPEAKER_01"))
+
+        merged = merge_chunk_results(chunks, [first, second])
+
+        assert [(s.text, s.speaker) for s in merged.segments] == [
+            ("Eins", "SPEAKER_00"),
+            ("Zwei", "SPEAKER_01"),
+            ("Drei", "SPEAKER_02"),
+        ]
+
+
+class TestAggregateStatus:
+    def _task(self) -> ChunkedTask:
+        return ChunkedTask(
+            task_id="parent",
+            chunks=[AudioChunk(0.0, 300.0, 300.0), AudioChunk(300.0, 400.0, 400.0)],
+            child_task_ids=["a", "b"],
+        )
+
+    def test_progress_is_weighted_by_chunk_length(self):
+        status = aggregate_status(
+            self._task(),
+            [
+                TaskStatus(task_id="a", status=TaskStatusEnum.IN_PROGRESS, progress=0.5),
+                TaskStatus(task_id="b", status=TaskStatusEnum.COMPLETED),
+            ],
+        )
+
+        assert status.task_id == "parent"
+        assert status.status == TaskStatusEnum.IN_PROGRESS
+        assert status.progress == 0.625
+
+    def test_one_failed_chunk_fails_the_task(self):
+        status = aggregate_status(
+            self._task(),
+            [
+                TaskStatus(task_id="a", status=TaskStatusEnum.FAILED),
+                TaskStatus(task_id="b", status=TaskStatusEnum.COMPLETED),
+            ],
+        )
+
+        assert status.status == TaskStatusEnum.FAILED
+
+    def test_all_completed(self):
+        status = aggregate_status(
+            self._task(),
+            [TaskStatus(task_id=child, status=TaskStatusEnum.COMPLETED) for child in ("a", "b")],
+        )
+
+        assert (status.status, status.progress) == (TaskStatusEnum.COMPLETED, 1.0)
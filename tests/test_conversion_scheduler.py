@@ -0,0 +1,80 @@
+"""Unit tests for the ffmpeg conversion scheduler (admission control + metrics)."""
+
+import asyncio
+
+import pytest
+
+from transcribo_backend.services.conversion_scheduler import ConversionQueueFullError, ConversionScheduler
+
+
+@pytest.mark.anyio
+async def test_limits_concurrent_conversions_to_slots():
+    scheduler = ConversionScheduler(slots=2, max_queue=10)
+    running = 0
+    peak = 0
+
+    async def _convert() -> None:
+        nonlocal running, peak
+        async with scheduler.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(_convert() for _ in range(6)))
+
+    assert peak == 2
+    stats = scheduler.stats()
+    assert stats.completed == 6
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.max_wait_seconds > 0
+
+
+@pytest.mark.anyio
+async def test_rejects_when_queue_is_full():
+    scheduler = ConversionScheduler(slots=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def _hold() -> None:
+        async with scheduler.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(_hold())
+    waiter = asyncio.create_task(_hold())
+    await asyncio.sleep(0)
+    assert scheduler.stats().queued == 1
+
+    with pytest.raises(ConversionQueueFullError) as exc_info:
+        async with scheduler.slot():
+            pass
+
+    assert exc_info.value.retry_after >= 1
+    assert scheduler.stats().rejected == 1
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_leaves_the_queue():
+    scheduler = ConversionScheduler(slots=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def _hold() -> None:
+        async with scheduler.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(_hold())
+    waiter = asyncio.create_task(_hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The cancelled request freed its queue position for the next one.
+    assert scheduler.stats().queued == 0
+    release.set()
+    await holder
+    async with scheduler.slot():
+        assert scheduler.stats().running == 1
@@ -0,0 +1,112 @@
+"""Tests for the content checks uploads have to pass before they are accepted."""
+
+import asyncio
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from transcribo_backend.helpers.file_type import (
+    MEDIA_CHECK_BYTES,
+    UnsupportedMediaError,
+    check_media_content,
+    detect_media_container,
+)
+from transcribo_backend.models.audio_container import AudioContainer
+
+ASSETS = Path(__file__).parent / "assets"
+_PROBE = "transcribo_backend.helpers.file_type.probe_header_streams"
+# MPEG-1 layer III, 128 kbit/s, 44.1 kHz: a 417-byte frame.
+_FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+
+
+@pytest.mark.parametrize(
+    ("name", "container"),
+    [
+        ("sample-3s.mp3", AudioContainer.MP3),
+        ("sample-3s.wav", AudioContainer.WAV),
+        ("sample-5s.flac", AudioContainer.FLAC),
+        ("sample-5s.ogg", AudioContainer.OGG),
+        ("sample-5s.m4a", AudioContainer.MP4),
+    ],
+)
+def test_detects_real_media(name, container):
+    assert detect_media_container((ASSETS / name).read_bytes()[:4096]) == container
+
+
+def test_headerless_mp3_needs_consecutive_frames():
+    assert detect_media_container(_FRAME * 3) == AudioContainer.MP3
+    # A lone sync word in arbitrary data is not an MP3.
+    stray = b"%PDF-1.7 " + _FRAME[:4] + b"\x01" * 2000
+    assert detect_media_container(stray) is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("streams", [[], None])
+async def test_unknown_magic_is_rejected_unless_ffprobe_finds_audio(streams):
+    with patch(_PROBE, AsyncMock(return_value=streams)), pytest.raises(UnsupportedMediaError, match="unrecognised"):
+        await check_media_content(b"<html><body>not audio</body></html>")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("header", "codec"),
+    [
+        # ADTS AAC: a sync word ffmpeg knows but no container magic.
+        (b"\xff\xf1\x50\x80\x02\x1f\xfc" + b"\x00" * 512, "aac"),
+        (b"FORM\x00\x00\x10\x00AIFFCOMM" + b"\x00" * 512, "pcm_s16be"),
+    ],
+)
+async def test_formats_without_known_magic_are_accepted_if_ffprobe_finds_audio(header, codec):
+    assert detect_media_container(header) is None
+    with patch(_PROBE, AsyncMock(return_value=[{"codec_type": "audio", "codec_name": codec}])):
+        assert await check_media_content(header) is None
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None, reason="ffmpeg not installed")
+@pytest.mark.parametrize(("suffix", "codec"), [(".aac", "aac"), (".aiff", "pcm_s16be")])
+async def test_real_aac_and_aiff_uploads_are_accepted(tmp_path, suffix, codec):
+    output = tmp_path / f"sample{suffix}"
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-v", "error", "-i", str(ASSETS / "sample-3s.wav"), "-c:a", codec, str(output)
+    )
+    assert await process.wait() == 0
+
+    assert await check_media_content(output.read_bytes()[:262144]) is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "streams", [[{"codec_type": "video", "codec_name": "h264"}], [{"codec_type": "subtitle", "codec_name": "ass"}]]
+)
+async def test_media_without_decodable_audio_is_rejected(streams):
+    header = b"\x1a\x45\xdf\xa3" + b"\x00" * 4096
+    with patch(_PROBE, AsyncMock(return_value=streams)), pytest.raises(UnsupportedMediaError, match="audio"):
+        await check_media_content(header)
+
+
+@pytest.mark.anyio
+async def test_media_is_accepted_by_magic_alone_without_ffprobe():
+    with patch(_PROBE, AsyncMock(return_value=None)):
+        assert await check_media_content(b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 64) == AudioContainer.WAV
+
+
+@pytest.mark.anyio
+async def test_mp4_with_trailing_index_is_not_probed():
+    header = b"\x00\x00\x00\x18ftypisom" + b"\x00" * 12 + b"\x00\x00\x10\x00mdat" + b"\x00" * 64
+    with patch(_PROBE, AsyncMock()) as probe:
+        assert await check_media_content(header) == AudioContainer.MP4
+    probe.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_known_container_is_accepted_when_its_header_runs_past_the_checked_bytes():
+    # A faststart M4A of a long recording: the sample index in ``moov`` is bigger than the bytes checked.
+    moov_size = MEDIA_CHECK_BYTES + 64 * 1024
+    upload = b"\x00\x00\x00\x18ftypM4A " + b"\x00" * 12 + moov_size.to_bytes(4, "big") + b"moov" + b"\x00" * moov_size
+    # ffprobe cannot decode the truncated box and exits with an error.
+    with patch(_PROBE, AsyncMock(return_value=[])) as probe:
+        assert await check_media_content(upload[:MEDIA_CHECK_BYTES]) == AudioContainer.MP4
+    probe.assert_awaited_once()
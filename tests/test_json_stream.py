@@ -0,0 +1,51 @@
+"""Tests for parsing the items of a JSON array while its bytes arrive."""
+
+import json
+
+import pytest
+
+from transcribo_backend.helpers.json_stream import iter_json_array
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _items(data: bytes, key: str = "segments", size: int = 7) -> list:
+    return [item async for item in iter_json_array(_chunks(data, size), key)]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 4096])
+async def test_items_are_parsed_across_any_chunk_boundaries(size: int):
+    document = {
+        "language": "de",
+        "meta": {"nested": [1, 2, {"segments": "not this one"}]},
+        "segments": [{"text": "Grüezi mitenand", "start": 0.0, "end": 12345.125}, {"text": "Strasse"}, 42, None],
+        "text": "ignored",
+    }
+
+    items = await _items(json.dumps(document, ensure_ascii=False).encode(), size=size)
+
+    assert items == document["segments"]
+
+
+@pytest.mark.anyio
+async def test_empty_array_and_whitespace():
+    assert await _items(b' {\n "segments" : [ ] } ') == []
+
+
+@pytest.mark.anyio
+async def test_number_split_at_a_chunk_boundary_is_not_cut_short():
+    assert await _items(b'{"segments":[12345678,9]}', size=16) == [12345678, 9]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "data",
+    [b'{"text": "no segments"}', b'["segments"]', b'{"segments": [{"text": "cut off', b'{"segments": [1 2]}'],
+)
+async def test_malformed_streams_raise_value_error(data: bytes):
+    with pytest.raises(ValueError):
+        await _items(data)
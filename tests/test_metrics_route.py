@@ -0,0 +1,129 @@
+"""Unit tests for the /metrics route."""
+
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from transcribo_backend.models.metrics import (
+    ConversionStats,
+    DedupStats,
+    ResultCacheStats,
+    SpoolStats,
+    StatusCacheStats,
+    SummaryCacheStats,
+    SummaryQueueStats,
+    SummaryTokenStats,
+    WhisperBackendStats,
+    WhisperClientStats,
+)
+from transcribo_backend.routes import metrics_route
+
+
+def test_metrics_reports_dedup_and_conversion_counters():
+    whisper_service = MagicMock()
+    whisper_service.dedup_index.stats.return_value = DedupStats(hits=3, misses=5, entries=5)
+    whisper_service.conversion_scheduler.stats.return_value = ConversionStats(
+        slots=4,
+        running=4,
+        queued=2,
+        max_queue=32,
+        completed=10,
+        rejected=1,
+        avg_wait_seconds=0.5,
+        max_wait_seconds=2.0,
+        avg_run_seconds=12.0,
+        max_run_seconds=30.0,
+    )
+    whisper_service.spool_stats.return_value = SpoolStats(in_memory=7, on_disk=2)
+    whisper_service.status_cache.stats.return_value = StatusCacheStats(fetches=4, hits=90, coalesced=6)
+    whisper_service.result_cache.stats.return_value = ResultCacheStats(
+        hits=12,
+        misses=3,
+        entries=3,
+        bytes=90_000,
+        max_bytes=64 * 1024 * 1024,
+        disk_entries=0,
+        disk_bytes=0,
+        evictions=0,
+    )
+    whisper_service.backends.stats.return_value = [
+        WhisperBackendStats(
+            url="http://gpu-1",
+            healthy=True,
+            circuit="closed",
+            outstanding_seconds=5400.0,
+            outstanding_tasks=2,
+            submitted=9,
+            failures=0,
+            circuit_opened=1,
+            rejected=4,
+        )
+    ]
+    whisper_service.backends.client_stats.return_value = WhisperClientStats(retries=2, hedged=5, hedge_wins=3)
+    summarization_service = MagicMock()
+    summarization_service.summary_cache.stats.return_value = SummaryCacheStats(
+        hits=4, misses=2, coalesced=1, entries=2, bytes=9000, max_bytes=16 * 1024 * 1024
+    )
+    summarization_service.budget.stats.return_value = SummaryTokenStats(
+        requests=2, transcript_tokens=50_000, prompt_tokens=41_000, saved_tokens=9000, model_tokenizer=True
+    )
+    summarization_service.scheduler.stats.return_value = SummaryQueueStats(
+        slots=1,
+        running=1,
+        queued=3,
+        clients=2,
+        max_queue=16,
+        completed=8,
+        rejected=1,
+        avg_wait_seconds=40.0,
+        max_wait_seconds=95.0,
+        avg_run_seconds=30.0,
+    )
+    app = FastAPI()
+    app.include_router(
+        metrics_route.create_router(whisper_service=whisper_service, summarization_service=summarization_service)
+    )
+
+    resp = TestClient(app).get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.json()["dedup"] == {"hits": 3, "misses": 5, "entries": 5}
+    assert resp.json()["conversion"]["queued"] == 2
+    assert resp.json()["conversion"]["rejected"] == 1
+    assert resp.json()["spool"] == {"in_memory": 7, "on_disk": 2}
+    assert resp.json()["status"] == {"fetches": 4, "hits": 90, "coalesced": 6}
+    assert resp.json()["results"]["hits"] == 12
+    assert resp.json()["results"]["bytes"] == 90_000
+    assert resp.json()["backends"][0]["outstanding_seconds"] == 5400.0
+    assert resp.json()["backends"][0]["rejected"] == 4
+    assert resp.json()["whisper_client"] == {"retries": 2, "hedged": 5, "hedge_wins": 3}
+    assert resp.json()["summaries"]["hits"] == 4
+    assert resp.json()["summary_tokens"]["saved_tokens"] == 9000
+    assert resp.json()["summary_queue"]["queued"] == 3
+
+
+def test_backend_health_is_unavailable_while_every_circuit_is_open():
+    whisper_service = MagicMock()
+    whisper_service.backends.available = False
+    whisper_service.backends.stats.return_value = [
+        WhisperBackendStats(
+            url="http://gpu-1",
+            healthy=False,
+            circuit="open",
+            outstanding_seconds=0.0,
+            outstanding_tasks=0,
+            submitted=3,
+            failures=3,
+            circuit_opened=1,
+            rejected=7,
+        )
+    ]
+    app = FastAPI()
+    app.include_router(metrics_route.create_router(whisper_service=whisper_service, summarization_service=MagicMock()))
+
+    resp = TestClient(app).get("/health/backends")
+
+    assert resp.status_code == 503
+    assert resp.json()["status"] == "unavailable"
+    assert resp.json()["backends"][0]["circuit"] == "open"
@@ -0,0 +1,43 @@
+"""Tests for counting the tokens of summarization prompts."""
+
+import httpx
+import pytest
+
+from transcribo_backend.services.prompt_budget import PromptBudget
+
+_TOKENIZE_URL = "http://llm.test/tokenize"
+
+
+def test_tokens_are_estimated_from_words_punctuation_and_non_ascii_characters():
+    budget = PromptBudget(context_tokens=1000, reserved_tokens=200, chars_per_token=4.0)
+
+    assert budget.transcript_budget == 800
+    assert budget.estimate("") == 0
+    # "Guten" 2, "Morgen" 2, "," 1, "Grüezi" 2, "." 1
+    assert budget.estimate("Guten Morgen, Grüezi.") == 8
+    # "Überprüfung" counts its umlauts twice: 13 / 4
+    assert budget.estimate("Überprüfung") == 4
+    assert budget.estimate("S1: Ja.\n\nS2: Nein.") == 9
+
+
+@pytest.mark.anyio
+async def test_tokens_are_counted_by_the_model_tokenizer_when_configured():
+    statuses = [200, 500]
+    requests: list[bytes] = []
+
+    def _tokenize(request: httpx.Request) -> httpx.Response:
+        requests.append(request.read())
+        return httpx.Response(statuses.pop(0), json={"count": 42, "tokens": []})
+
+    budget = PromptBudget(1000, 200, 4.0, tokenize_url=_TOKENIZE_URL, model="test-model")
+    await budget.aclose()
+    budget._client = httpx.AsyncClient(transport=httpx.MockTransport(_tokenize))
+
+    assert await budget.count("Guten Morgen") == 42
+    assert requests == [b'{"model":"test-model","prompt":"Guten Morgen"}']
+    # When the tokenizer fails, the estimate is used instead.
+    assert await budget.count("Guten Morgen") == 4
+    budget.record(transcript_tokens=120, prompt_tokens=90)
+    assert budget.stats().saved_tokens == 30
+    assert budget.stats().model_tokenizer
+    await budget.aclose()
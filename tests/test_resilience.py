@@ -0,0 +1,109 @@
+"""Tests for the circuit breaker, the retry backoff and hedged calls."""
+
+import asyncio
+import time
+
+import pytest
+
+from transcribo_backend.services.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    HedgeOutcome,
+    RetryPolicy,
+    first_completed,
+)
+
+_BROKEN = "broken"
+
+
+def test_the_circuit_opens_after_consecutive_failures_and_a_success_resets_the_count():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    assert not breaker.available
+    assert (breaker.opened, breaker.rejected) == (1, 1)
+
+
+def test_after_the_reset_time_a_single_probe_decides_whether_the_circuit_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30.0)
+    breaker.record_failure()
+    breaker.opened_at = time.monotonic() - 31
+
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened == 2
+
+    breaker.opened_at = time.monotonic() - 31
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_the_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(attempts=5, backoff_seconds=0.5, max_backoff_seconds=1.5)
+
+    delays = [policy.delay(retry) for retry in (1, 2, 3, 4) for _ in range(50)]
+
+    assert all(0 <= delay <= 1.5 for delay in delays)
+    assert max(policy.delay(1) for _ in range(50)) <= 0.5
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.anyio
+async def test_a_fast_call_is_not_hedged():
+    calls: list[int] = []
+
+    async def _send() -> int:
+        calls.append(len(calls))
+        return 7
+
+    assert await first_completed(_send, 1.0) == (7, HedgeOutcome.NOT_NEEDED)
+    assert calls == [0]
+
+
+@pytest.mark.anyio
+async def test_a_slow_call_is_hedged_and_the_slower_one_cancelled():
+    cancelled: list[int] = []
+
+    async def _send() -> int:
+        call = len(cancelled)
+        cancelled.append(-1)
+        try:
+            await asyncio.sleep(1 if call == 0 else 0)
+        except asyncio.CancelledError:
+            cancelled[call] = call
+            raise
+        return call
+
+    assert await first_completed(_send, 0.01) == (1, HedgeOutcome.HEDGE)
+    await asyncio.sleep(0)
+    assert cancelled == [0, -1]
+
+
+@pytest.mark.anyio
+async def test_a_hedged_call_only_fails_when_both_calls_failed():
+    calls: list[int] = []
+
+    async def _send() -> int:
+        calls.append(len(calls))
+        await asyncio.sleep(0.02)
+        if len(calls) < 3:
+            raise RuntimeError(_BROKEN)
+        return 1
+
+    with pytest.raises(RuntimeError):
+        await first_completed(_send, 0.01)
+    assert len(calls) == 2
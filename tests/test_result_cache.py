@@ -0,0 +1,99 @@
+"""Tests for the byte-budgeted, compressed transcription result cache."""
+
+import gzip
+import json
+
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
+from transcribo_backend.services.result_cache import ResultCache
+
+
+def _result(text: str, segments: int = 50) -> TranscriptionResponse:
+    return TranscriptionResponse(
+        segments=[
+            Segment(start=float(index), end=index + 1.0, text=f"{text} {index}", speaker="Anna")
+            for index in range(segments)
+        ]
+    )
+
+
+def _compressed_size(result: TranscriptionResponse) -> int:
+    cache = ResultCache(max_bytes=10 * 1024 * 1024)
+    cache.put("probe", result)
+    return cache.stats().bytes
+
+
+def test_result_round_trips_through_compressed_storage():
+    cache = ResultCache(max_bytes=1024 * 1024)
+    result = _result("Grüezi")
+
+    cache.put("task-1", result)
+
+    assert cache.get("task-1") == result
+    assert json.loads(gzip.decompress(cache.get_compressed("task-1"))) == result.model_dump()
+    assert cache.stats().bytes < len(result.model_dump_json())
+    assert cache.get("unknown") is None
+    assert (cache.stats().hits, cache.stats().misses) == (2, 1)
+
+
+def test_eviction_follows_the_byte_budget_in_lru_order():
+    size = _compressed_size(_result("task-0"))
+    cache = ResultCache(max_bytes=int(size * 2.5))
+    cache.put("task-0", _result("task-0"))
+    cache.put("task-1", _result("task-1"))
+    cache.get_compressed("task-0")
+
+    cache.put("task-2", _result("task-2"))
+
+    assert "task-0" in cache
+    assert "task-1" not in cache
+    assert "task-2" in cache
+    stats = cache.stats()
+    assert stats.bytes <= stats.max_bytes
+    assert stats.evictions == 1
+
+
+def test_evicted_results_spill_to_disk_and_come_back(tmp_path):
+    size = _compressed_size(_result("task-0"))
+    cache = ResultCache(max_bytes=int(size * 1.5), spill_dir=str(tmp_path), max_disk_bytes=10 * size)
+    cache.put("task-0", _result("task-0"))
+    cache.put("task-1", _result("task-1"))
+
+    assert cache.stats().disk_entries == 1
+    assert cache.get("task-0") == _result("task-0")
+    # Task ids never become file names.
+    assert all("task" not in path.name for path in tmp_path.iterdir())
+
+
+def test_spill_directory_keeps_to_its_budget(tmp_path):
+    size = _compressed_size(_result("task-0"))
+    cache = ResultCache(max_bytes=0, spill_dir=str(tmp_path), max_disk_bytes=int(size * 2.5))
+
+    for index in range(5):
+        cache.put(f"task-{index}", _result(f"task-{index}"))
+
+    assert cache.stats().disk_entries == 2
+    assert cache.stats().disk_bytes <= int(size * 2.5)
+    assert len(list(tmp_path.iterdir())) == 2
+    assert "task-4" in cache
+    assert "task-0" not in cache
+
+
+def test_spilled_results_survive_a_restart(tmp_path):
+    first = ResultCache(max_bytes=0, spill_dir=str(tmp_path), max_disk_bytes=1024 * 1024)
+    first.put("task-1", _result("task-1"))
+
+    second = ResultCache(max_bytes=1024 * 1024, spill_dir=str(tmp_path), max_disk_bytes=1024 * 1024)
+
+    assert second.stats().disk_entries == 1
+    assert second.get("task-1") == _result("task-1")
+
+
+def test_discard_drops_memory_and_disk_copies(tmp_path):
+    cache = ResultCache(max_bytes=0, spill_dir=str(tmp_path), max_disk_bytes=1024 * 1024)
+    cache.put("task-1", _result("task-1"))
+
+    cache.discard("task-1")
+
+    assert "task-1" not in cache
+    assert list(tmp_path.iterdir()) == []
+    assert cache.stats().disk_bytes == 0
@@ -0,0 +1,40 @@
+"""Tests for the single-pass segment rewrite rules."""
+
+from transcribo_backend.services.segment_rewriter import SegmentRewriter
+
+
+def _segment(text: str, speaker: str | None = "speaker_00") -> dict:
+    return {"start": 0.0, "end": 1.0, "text": text, "speaker": speaker}
+
+
+def test_builtin_cleanup_matches_the_former_loop():
+    segments = SegmentRewriter().rewrite([_segment("  Die Straße ist groß.  ", None), _segment("ok", " bob ")])
+
+    assert segments[0]["text"] == "Die Strasse ist gross."
+    assert segments[0]["speaker"] == "Unknown"
+    assert segments[1]["speaker"] == "Bob"
+
+
+def test_configured_replacements_match_whole_words_and_prefer_longer_keys():
+    rewriter = SegmentRewriter({"Kanton BS": "Kanton Basel-Stadt", "BS": "Basel-Stadt", "Großrat": "Grosser Rat"})
+
+    segments = rewriter.rewrite([_segment("Der Großrat vom Kanton BS und BS, nicht BSc.")])
+
+    assert segments[0]["text"] == "Der Grosser Rat vom Kanton Basel-Stadt und Basel-Stadt, nicht BSc."
+
+
+def test_filler_words_are_removed_in_any_case():
+    rewriter = SegmentRewriter(filler_words=["äh", "ähm"])
+
+    segments = rewriter.rewrite([_segment("Äh, wir haben ähm das Budget, äh, geprüft"), _segment("ähnlich äh")])
+
+    assert segments[0]["text"] == "wir haben das Budget, geprüft"
+    assert segments[1]["text"] == "ähnlich"
+
+
+def test_texts_of_a_batch_stay_separate():
+    rewriter = SegmentRewriter(filler_words=["äh"])
+
+    segments = rewriter.rewrite([_segment("äh"), _segment(""), _segment("äh weiter"), _segment("mit \x00 darin")])
+
+    assert [segment["text"] for segment in segments] == ["", "", "weiter", "mit \x00 darin"]
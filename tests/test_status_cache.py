@@ -0,0 +1,107 @@
+"""Tests for coalescing and caching task status polls."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
+from transcribo_backend.services.status_cache import StatusCache
+
+_MONOTONIC = "transcribo_backend.services.status_cache.time.monotonic"
+
+
+class _Upstream:
+    """Counts fetches; each fetch blocks until ``release`` is set."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def fetch(self) -> TaskStatus:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return TaskStatus(task_id="task-1", status=TaskStatusEnum.IN_PROGRESS, progress=0.5)
+
+
+@pytest.mark.anyio
+async def test_concurrent_polls_share_one_fetch():
+    cache = StatusCache(ttl=0.5)
+    upstream = _Upstream()
+
+    polls = [asyncio.create_task(cache.get("task-1", upstream.fetch)) for _ in range(50)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    statuses = await asyncio.gather(*polls)
+
+    assert upstream.calls == 1
+    assert {status.progress for status in statuses} == {0.5}
+    assert cache.stats().coalesced == 49
+    # Every poll gets its own copy.
+    statuses[0].duration = 12.0
+    assert statuses[1].duration is None
+
+
+@pytest.mark.anyio
+async def test_status_is_cached_for_the_ttl_only():
+    cache = StatusCache(ttl=0.5)
+    upstream = _Upstream()
+    upstream.release.set()
+
+    with patch(_MONOTONIC, return_value=100.0):
+        await cache.get("task-1", upstream.fetch)
+    with patch(_MONOTONIC, return_value=100.4):
+        await cache.get("task-1", upstream.fetch)
+    assert upstream.calls == 1
+    assert cache.stats().hits == 1
+
+    with patch(_MONOTONIC, return_value=100.6):
+        await cache.get("task-1", upstream.fetch)
+    assert upstream.calls == 2
+
+
+@pytest.mark.anyio
+async def test_failed_fetch_reaches_every_waiter_and_is_not_cached():
+    cache = StatusCache(ttl=10.0)
+    upstream = _Upstream(error=RuntimeError("whisper down"))
+
+    polls = [asyncio.create_task(cache.get("task-1", upstream.fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    outcomes = await asyncio.gather(*polls, return_exceptions=True)
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    upstream.error = None
+    await cache.get("task-1", upstream.fetch)
+    assert upstream.calls == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_poll_does_not_cancel_the_shared_fetch():
+    cache = StatusCache(ttl=0.5)
+    upstream = _Upstream()
+
+    first = asyncio.create_task(cache.get("task-1", upstream.fetch))
+    second = asyncio.create_task(cache.get("task-1", upstream.fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    upstream.release.set()
+
+    assert (await second).progress == 0.5
+    assert upstream.calls == 1
+
+
+@pytest.mark.anyio
+async def test_invalidate_forces_a_fresh_fetch():
+    cache = StatusCache(ttl=10.0)
+    upstream = _Upstream()
+    upstream.release.set()
+
+    await cache.get("task-1", upstream.fetch)
+    cache.invalidate("task-1")
+    await cache.get("task-1", upstream.fetch)
+
+    assert upstream.calls == 2
@@ -1,16 +1,44 @@
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models.function import AgentInfo, FunctionModel
 
+from transcribo_backend.agents.summarize_agent import SummarizeAgent
 from transcribo_backend.models.language import Language
-from transcribo_backend.models.summary import SummaryDeps, SummaryType
-from transcribo_backend.services.summarization_service import SummarizationService
+from transcribo_backend.models.summary import SummaryDeps, SummaryEvent, SummaryType
+from transcribo_backend.services.summarization_service import SummarizationService, split_transcript
+from transcribo_backend.services.summary_scheduler import SummaryQueueFullError
 from transcribo_backend.utils.app_config import AppConfig
 
 
+def _app_config(context_tokens: int = 32_000, concurrency: int = 4, slots: int = 1) -> MagicMock:
+    app_config = MagicMock(spec=AppConfig)
+    app_config.summary_context_tokens = context_tokens
+    app_config.summary_reserved_tokens = 0
+    app_config.summary_chars_per_token = 4.0
+    app_config.summary_tokenize_url = ""
+    app_config.summary_filler_words = ["äh", "ähm"]
+    app_config.summary_concurrency = concurrency
+    app_config.summary_slots = slots
+    app_config.summary_queue_size = 16
+    app_config.summary_queue_per_client = 4
+    app_config.summary_cache_bytes = 1024 * 1024
+    app_config.summary_cache_ttl_seconds = 3600
+    app_config.llm_model = "test-model"
+    return app_config
+
+
+_SPEAKERS = ("Gemeinderätin Anna Muster", "Gemeinderat Beat Beispiel", "Stadtschreiberin Clara Zeller")
+_LLM_GONE = "LLM gone"
+
+
 @pytest.mark.anyio
 async def test_summarize_calls_agent():
-    app_config = MagicMock(spec=AppConfig)
+    app_config = _app_config()
 
     mock_agent = MagicMock()
     mock_agent.run = AsyncMock(return_value="This is a summary.")
@@ -29,7 +57,7 @@ async def test_summarize_calls_agent():
 
 @pytest.mark.anyio
 async def test_summarize_with_language():
-    app_config = MagicMock(spec=AppConfig)
+    app_config = _app_config()
 
     mock_agent = MagicMock()
     mock_agent.run = AsyncMock(return_value="This is an English summary.")
@@ -48,7 +76,7 @@ async def test_summarize_with_language():
 
 @pytest.mark.anyio
 async def test_summarize_with_type_and_language():
-    app_config = MagicMock(spec=AppConfig)
+    app_config = _app_config()
 
     mock_agent = MagicMock()
     mock_agent.run = AsyncMock(return_value="This is a Kurzprotokoll in French.")
@@ -63,3 +91,316 @@ async def test_summarize_with_type_and_language():
     mock_agent.run.assert_called_once_with(transcript, deps=expected_deps)
 
     assert result.summary == "This is a Kurzprotokoll in French."
+
+
+def test_long_transcripts_are_split_at_speaker_turns():
+    turns = [f"Speaker_{i % 2:02d}: " + "Wort " * 20 + "\n\n" for i in range(10)]
+    transcript = "".join(turns)
+
+    parts = split_transcript(transcript, 300)
+
+    assert len(parts) == 5
+    assert all(len(part) <= 300 for part in parts)
+    assert all(part.startswith("Speaker_") for part in parts)
+    assert " ".join(parts).split() == transcript.split()
+    # A single turn longer than a part is split at sentences, then words.
+    assert split_transcript("Eins zwei. Drei vier.", 12) == ["Eins zwei.", "Drei vier."]
+    assert split_transcript("Donaudampfschifffahrt", 10) == ["Donaudampf", "schifffahr", "t"]
+
+
+@pytest.mark.anyio
+async def test_long_transcripts_are_summarized_map_reduce_with_bounded_concurrency():
+    running = 0
+    peak = 0
+    calls: list[SummaryDeps] = []
+
+    async def _run(text: str, deps: SummaryDeps) -> str:
+        nonlocal running, peak
+        calls.append(deps)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"Notizen {deps.part}" if deps.part is not None else f"Protokoll aus: {text}"
+
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(side_effect=_run)
+    service = SummarizationService(_app_config(context_tokens=110, concurrency=2, slots=4), mock_agent)
+    transcript = "".join(f"{_SPEAKERS[i % 3]}: " + "Satz. " * 20 + "\n\n" for i in range(8))
+
+    result = (await service.summarize(transcript, language=Language.DE)).unwrap()._inner_value
+
+    parts = [deps for deps in calls if deps.part is not None]
+    assert len(parts) == 8
+    assert {deps.parts for deps in parts} == {8}
+    assert peak == 2
+    assert calls[-1] == SummaryDeps(summary_type=SummaryType.ERGEBNISPROTOKOLL, language=Language.DE, from_notes=True)
+    # The notes reach the final prompt in transcript order, headed by the legend of the speaker aliases.
+    legend = "Sprecherkürzel (im Protokoll die vollen Namen verwenden): " + "; ".join(
+        f"S{number} = {speaker}" for number, speaker in enumerate(_SPEAKERS, start=1)
+    )
+    assert result.summary == f"Protokoll aus: {legend}\n\n" + "\n\n".join(f"Notizen {part}" for part in range(1, 9))
+    assert all(call.args[0].startswith(f"{legend}\n\nS") for call in mock_agent.run.call_args_list[:-1])
+
+
+@pytest.mark.anyio
+async def test_part_notes_share_the_llm_slots_with_the_other_summaries():
+    running = 0
+    peak = 0
+
+    async def _run(text: str, deps: SummaryDeps) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "Notizen" if deps.part is not None else "Protokoll"
+
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(side_effect=_run)
+    service = SummarizationService(_app_config(context_tokens=110, concurrency=4, slots=2), mock_agent)
+    transcripts = [
+        "".join(f"{_SPEAKERS[i % 3]}: {topic} " + "Satz. " * 20 + "\n\n" for i in range(8))
+        for topic in ("Budget.", "Schulhaus.")
+    ]
+
+    await asyncio.gather(*(service.summarize(transcript) for transcript in transcripts))
+
+    # Two summaries of eight parts each, with four parts in flight per summary, still send two requests at most.
+    assert mock_agent.run.await_count == 2 * 8 + 2
+    assert peak == 2
+
+
+@pytest.mark.anyio
+async def test_notes_too_long_for_one_prompt_are_condensed_first():
+    async def _run(text: str, deps: SummaryDeps) -> str:
+        return "N" * 60 if deps.part is not None else "Protokoll"
+
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(side_effect=_run)
+    service = SummarizationService(_app_config(context_tokens=50), mock_agent)
+    transcript = "".join(f"Speaker_00: {'Satz. ' * 20}\n\n" for _ in range(6))
+
+    result = (await service.summarize(transcript)).unwrap()._inner_value
+
+    rounds = [call.kwargs["deps"].parts for call in mock_agent.run.call_args_list]
+    # Six part notes of 60 characters do not fit one prompt of 50 tokens, so they are condensed in pairs until they do.
+    assert rounds == [6] * 6 + [3] * 3 + [2] * 2 + [None]
+    assert result.summary == "Protokoll"
+
+
+@pytest.mark.anyio
+async def test_repeated_requests_are_answered_from_the_cache_unless_regenerated():
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(side_effect=["Erste Fassung.", "Zweite Fassung.", "Auf Englisch."])
+    service = SummarizationService(_app_config(), mock_agent)
+    transcript = "Speaker_00: Wir beschliessen das Budget.\n\n"
+
+    first = await service.summarize(transcript, SummaryType.KURZPROTOKOLL)
+    # Only whitespace differs, so the cached summary is served.
+    again = await service.summarize("  Speaker_00: Wir beschliessen  das Budget.", SummaryType.KURZPROTOKOLL)
+    regenerated = await service.summarize(transcript, SummaryType.KURZPROTOKOLL, regenerate=True)
+    after = await service.summarize(transcript, SummaryType.KURZPROTOKOLL)
+    english = await service.summarize(transcript, SummaryType.KURZPROTOKOLL, Language.EN)
+
+    summaries = [result.unwrap()._inner_value.summary for result in (first, again, regenerated, after, english)]
+    assert summaries == ["Erste Fassung.", "Erste Fassung.", "Zweite Fassung.", "Zweite Fassung.", "Auf Englisch."]
+    assert mock_agent.run.await_count == 3
+    stats = service.summary_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 3, 2)
+
+
+def _streaming_agent(deltas: list[str], error: Exception | None = None) -> MagicMock:
+    async def _stream(prompt: str, deps: SummaryDeps):
+        for delta in deltas:
+            yield delta
+        if error is not None:
+            raise error
+
+    mock_agent = MagicMock()
+    mock_agent.stream_summary = MagicMock(side_effect=_stream)
+    return mock_agent
+
+
+async def _collect(stream: AsyncIterator[SummaryEvent]) -> list[SummaryEvent]:
+    return [event async for event in stream]
+
+
+@pytest.mark.anyio
+async def test_streamed_summaries_end_with_the_complete_summary_and_are_cached():
+    mock_agent = _streaming_agent(["# Kurz", "protokoll\n", "- Budget beschlossen"])
+    service = SummarizationService(_app_config(), mock_agent)
+
+    events = [event async for event in service.summarize_stream("Speaker_00: Budget?", SummaryType.KURZPROTOKOLL)]
+    again = [event async for event in service.summarize_stream("Speaker_00: Budget?", SummaryType.KURZPROTOKOLL)]
+
+    assert [event.type for event in events] == ["delta", "delta", "delta", "summary"]
+    assert events[-1].summary.summary == "# Kurzprotokoll\n- Budget beschlossen"
+    # The second request is answered from the cache in one piece, and so is a non-streamed one.
+    assert (again[0].type, again[0].delta) == ("delta", "# Kurzprotokoll\n- Budget beschlossen")
+    assert mock_agent.stream_summary.call_count == 1
+    cached = await service.summarize("Speaker_00: Budget?", SummaryType.KURZPROTOKOLL)
+    assert cached.unwrap()._inner_value.summary == "# Kurzprotokoll\n- Budget beschlossen"
+
+
+@pytest.mark.anyio
+async def test_a_failed_stream_ends_with_an_error_event_and_is_not_cached():
+    mock_agent = _streaming_agent(["# Kurz"], error=RuntimeError(_LLM_GONE))
+    service = SummarizationService(_app_config(), mock_agent)
+
+    events = [event async for event in service.summarize_stream("Speaker_00: Budget?")]
+
+    assert [event.type for event in events] == ["delta", "error"]
+    assert service.summary_cache.stats().entries == 0
+
+
+@pytest.mark.anyio
+async def test_agent_streams_deltas_that_add_up_to_the_post_processed_summary():
+    async def _tokens(messages: list[ModelMessage], info: AgentInfo):
+        for token in ("\n\n# Grüsse", " an die", " Straße", "\n- Punkt"):
+            yield token
+
+    agent = SummarizeAgent(SimpleNamespace(llm_model="test-model", llm_url="http://llm.test/v1", llm_api_key="key"))
+    deps = SummaryDeps(summary_type=SummaryType.KURZPROTOKOLL)
+
+    with agent._agent.override(model=FunctionModel(stream_function=_tokens)):
+        deltas = [delta async for delta in agent.stream_summary("Speaker_00: Hallo", deps)]
+
+    assert "".join(deltas) == "# Grüsse an die Strasse\n- Punkt"
+
+
+@pytest.mark.anyio
+async def test_transcripts_are_compacted_before_summarization_and_the_saved_tokens_counted():
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(return_value="Protokoll")
+    service = SummarizationService(_app_config(), mock_agent)
+    transcript = (
+        "Anna Muster: Äh, guten Morgen.\nAnna Muster: Wir beginnen ähm pünktlich.\n\n"
+        "Beat Beispiel: Danke.\nAnna Muster: Gut.\n"
+    )
+
+    await service.summarize(transcript)
+
+    assert mock_agent.run.call_args.args[0] == (
+        "Anna Muster: guten Morgen. Wir beginnen pünktlich.\n\nBeat Beispiel: Danke.\n\nAnna Muster: Gut."
+    )
+    stats = service.budget.stats()
+    assert stats.requests == 1
+    assert stats.saved_tokens == stats.transcript_tokens - stats.prompt_tokens > 0
+    assert not stats.model_tokenizer
+
+
+@pytest.mark.anyio
+async def test_streamed_summaries_report_their_queue_position_while_waiting_for_the_llm():
+    mock_agent = _streaming_agent(["# Kurzprotokoll"])
+    service = SummarizationService(_app_config(), mock_agent)
+    holder = service.scheduler.enqueue("beat")
+
+    stream = service.summarize_stream("Speaker_00: Budget?", client_id="anna")
+    queued = await anext(stream)
+    assert queued.type == "queued"
+    assert (queued.queue.position, queued.queue.running) == (1, 1)
+
+    service.scheduler.release(holder)
+    events = [event async for event in stream]
+    assert [event.type for event in events] == ["delta", "summary"]
+    assert service.scheduler.stats().running == 0
+
+
+@pytest.mark.anyio
+async def test_summaries_over_the_queue_limit_fail_without_running_the_llm():
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(return_value="Protokoll")
+    app_config = _app_config()
+    app_config.summary_queue_size = 0
+    service = SummarizationService(app_config, mock_agent)
+    holder = service.scheduler.enqueue("beat")
+
+    result = await service.summarize("Speaker_00: Budget?", client_id="anna")
+    events = [event async for event in service.summarize_stream("Speaker_00: Budget?", client_id="anna")]
+
+    assert isinstance(result.failure()._inner_value, SummaryQueueFullError)
+    assert [event.type for event in events] == ["error"]
+    mock_agent.run.assert_not_called()
+    service.scheduler.release(holder)
+
+
+@pytest.mark.anyio
+async def test_notes_that_do_not_get_shorter_are_cut_to_fit_one_prompt():
+    async def _run(text: str, deps: SummaryDeps) -> str:
+        # Every note is longer than the text it was taken on, and longer than one prompt.
+        return "Notiz " * 100 if deps.part is not None else f"Protokoll aus: {text}"
+
+    mock_agent = MagicMock()
+    mock_agent.run = AsyncMock(side_effect=_run)
+    service = SummarizationService(_app_config(context_tokens=50), mock_agent)
+    transcript = "".join(f"Speaker_00: {'Satz. ' * 20}\n\n" for _ in range(4))
+
+    result = (await service.summarize(transcript)).unwrap()._inner_value
+
+    calls = mock_agent.run.call_args_list
+    parts = calls[0].kwargs["deps"].parts
+    # The oversize notes are split and condensed once more; as that does not shorten them, they are cut.
+    assert [call.kwargs["deps"].parts for call in calls[parts:-1]] == [len(calls) - parts - 1] * (
+        len(calls) - parts - 1
+    )
+    assert calls[-1].kwargs["deps"].from_notes
+    # So the final prompt fits as well as a part of the transcript does.
+    assert len(calls[-1].args[0]) <= max(len(call.args[0]) for call in calls[:parts])
+    assert result.summary.startswith("Protokoll aus: Notiz")
+
+
+@pytest.mark.anyio
+async def test_identical_requests_wait_for_a_streamed_summary_instead_of_running_the_llm_again():
+    release = asyncio.Event()
+
+    async def _stream(prompt: str, deps: SummaryDeps):
+        yield "# Kurz"
+        await release.wait()
+        yield "protokoll"
+
+    mock_agent = MagicMock()
+    mock_agent.stream_summary = MagicMock(side_effect=_stream)
+    mock_agent.run = AsyncMock(return_value="Zweiter Lauf")
+    service = SummarizationService(_app_config(), mock_agent)
+
+    stream = service.summarize_stream("Speaker_00: Budget?")
+    assert (await anext(stream)).delta == "# Kurz"
+    waiting_stream = asyncio.ensure_future(_collect(service.summarize_stream("Speaker_00: Budget?")))
+    waiting_request = asyncio.ensure_future(service.summarize("Speaker_00: Budget?"))
+    await asyncio.sleep(0)
+    release.set()
+    events = [event async for event in stream]
+
+    assert [event.type for event in events] == ["delta", "summary"]
+    waited = await waiting_stream
+    assert [event.type for event in waited] == ["delta", "summary"]
+    assert waited[0].delta == "# Kurzprotokoll"
+    assert (await waiting_request).unwrap()._inner_value.summary == "# Kurzprotokoll"
+    assert mock_agent.stream_summary.call_count == 1
+    mock_agent.run.assert_not_called()
+    stats = service.summary_cache.stats()
+    assert (stats.misses, stats.coalesced, stats.entries) == (1, 2, 1)
+
+
+@pytest.mark.anyio
+async def test_streams_wait_for_a_summary_in_flight_and_share_its_failure():
+    release = asyncio.Event()
+
+    async def _run(prompt: str, deps: SummaryDeps) -> str:
+        await release.wait()
+        raise RuntimeError(_LLM_GONE)
+
+    mock_agent = _streaming_agent(["nie gesendet"])
+    mock_agent.run = AsyncMock(side_effect=_run)
+    service = SummarizationService(_app_config(), mock_agent)
+
+    request = asyncio.ensure_future(service.summarize("Speaker_00: Budget?"))
+    await asyncio.sleep(0)
+    waiting_stream = asyncio.ensure_future(_collect(service.summarize_stream("Speaker_00: Budget?")))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [event.type for event in await waiting_stream] == ["error"]
+    assert isinstance((await request).failure()._inner_value, RuntimeError)
+    mock_agent.stream_summary.assert_not_called()
@@ -0,0 +1,104 @@
+"""Unit tests for the /summarize routes, driven with a mocked summarization service."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from dcc_backend_common.fastapi_error_handling import inject_api_error_handler
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from returns.io import IOFailure, IOSuccess
+
+from transcribo_backend.helpers.api_errors import inject_retry_after_error_handler
+from transcribo_backend.models.summary import Summary, SummaryEvent, SummaryEventType, SummaryQueuePosition
+from transcribo_backend.routes import summarize_route
+from transcribo_backend.services.summary_scheduler import SummaryQueueFullError
+
+
+def _build_client(summarization_service) -> TestClient:
+    app = FastAPI()
+    inject_api_error_handler(app)
+    inject_retry_after_error_handler(app)
+    app.include_router(
+        summarize_route.create_router(summarization_service=summarization_service, usage_tracking_service=MagicMock())
+    )
+    return TestClient(app)
+
+
+def _make_service(max_chars: int = 2_000_000) -> MagicMock:
+    summarization_service = MagicMock()
+    summarization_service.app_config.summary_max_chars = max_chars
+    return summarization_service
+
+
+def test_summary_is_returned_and_regenerate_is_forwarded():
+    summarization_service = _make_service()
+    summarization_service.summarize = AsyncMock(return_value=IOSuccess(Summary(summary="# Protokoll")))
+    client = _build_client(summarization_service)
+
+    resp = client.post(
+        "/summarize", json={"transcript": "Speaker_00: Hallo", "regenerate": True}, headers={"X-Client-Id": "anna"}
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"summary": "# Protokoll"}
+    assert summarization_service.summarize.await_args.kwargs == {"regenerate": True, "client_id": "anna"}
+
+
+def test_summary_is_streamed_as_server_sent_events():
+    summarization_service = _make_service()
+
+    async def _stream(*args, **kwargs):
+        for delta in ("# Proto", "koll\n", "- Budget"):
+            yield SummaryEvent(type=SummaryEventType.DELTA, delta=delta)
+        yield SummaryEvent(type=SummaryEventType.SUMMARY, summary=Summary(summary="# Protokoll\n- Budget"))
+
+    summarization_service.summarize_stream = MagicMock(side_effect=_stream)
+    client = _build_client(summarization_service)
+
+    with client.stream("POST", "/summarize/stream", json={"transcript": "Speaker_00: Hallo"}) as resp:
+        body = "".join(resp.iter_text())
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert body.count("event: delta") == 3
+    assert '"delta":"# Proto"' in body
+    assert body.rstrip().endswith('"summary":{"summary":"# Protokoll\\n- Budget"},"error":null}')
+
+
+def test_too_long_transcripts_are_rejected_before_streaming():
+    summarization_service = _make_service(max_chars=10)
+    client = _build_client(summarization_service)
+
+    resp = client.post("/summarize/stream", json={"transcript": "Speaker_00: viel zu lang"})
+
+    assert resp.status_code == 400
+    summarization_service.summarize_stream.assert_not_called()
+
+
+def test_summaries_are_rejected_with_retry_after_when_the_queue_is_full():
+    summarization_service = _make_service()
+    summarization_service.summarize = AsyncMock(return_value=IOFailure(SummaryQueueFullError(120)))
+    summarization_service.check_admission.side_effect = SummaryQueueFullError(90)
+    client = _build_client(summarization_service)
+
+    resp = client.post("/summarize", json={"transcript": "Speaker_00: Hallo"})
+    streamed = client.post("/summarize/stream", json={"transcript": "Speaker_00: Hallo"})
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "120"
+    assert streamed.status_code == 429
+    assert streamed.headers["Retry-After"] == "90"
+    summarization_service.summarize_stream.assert_not_called()
+
+
+def test_queue_position_of_the_client_is_reported():
+    summarization_service = _make_service()
+    summarization_service.scheduler.client_position.return_value = SummaryQueuePosition(
+        position=2, eta_seconds=120, queued=3, running=1
+    )
+    client = _build_client(summarization_service)
+
+    resp = client.get("/summarize/queue", headers={"X-Client-Id": "anna"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"position": 2, "eta_seconds": 120, "queued": 3, "running": 1}
+    summarization_service.scheduler.client_position.assert_called_once_with("anna")
@@ -0,0 +1,94 @@
+"""Tests for caching and coalescing generated summaries."""
+
+import asyncio
+
+import pytest
+
+from transcribo_backend.models.language import Language
+from transcribo_backend.models.summary import SummaryType
+from transcribo_backend.services.summary_cache import SummaryCache
+
+_OVERLOADED = "LLM overloaded"
+
+
+class _Llm:
+    """Counts runs; each run blocks until ``release`` is set."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def generate(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return f"Protokoll {self.calls}"
+
+
+def test_the_key_covers_everything_the_summary_depends_on():
+    key = SummaryCache.make_key("Grüezi\n\nmitenand ", SummaryType.KURZPROTOKOLL, None, "model-a", "1")
+
+    assert key == SummaryCache.make_key(" Grüezi mitenand", SummaryType.KURZPROTOKOLL, None, "model-a", "1")
+    assert key != SummaryCache.make_key("Grüezi mitenand", SummaryType.ERGEBNISPROTOKOLL, None, "model-a", "1")
+    assert key != SummaryCache.make_key("Grüezi mitenand", SummaryType.KURZPROTOKOLL, Language.DE, "model-a", "1")
+    assert key != SummaryCache.make_key("Grüezi mitenand", SummaryType.KURZPROTOKOLL, None, "model-b", "1")
+    assert key != SummaryCache.make_key("Grüezi mitenand", SummaryType.KURZPROTOKOLL, None, "model-a", "2")
+
+
+@pytest.mark.anyio
+async def test_identical_requests_share_one_run_and_later_ones_hit_the_cache():
+    cache = SummaryCache(max_bytes=1024, ttl=60)
+    llm = _Llm()
+
+    requests = [asyncio.create_task(cache.get("key", llm.generate)) for _ in range(5)]
+    await asyncio.sleep(0)
+    llm.release.set()
+
+    assert set(await asyncio.gather(*requests)) == {"Protokoll 1"}
+    assert await cache.get("key", llm.generate) == "Protokoll 1"
+    assert llm.calls == 1
+    stats = cache.stats()
+    assert (stats.misses, stats.coalesced, stats.hits) == (1, 4, 1)
+    assert stats.bytes == len(b"Protokoll 1")
+
+
+@pytest.mark.anyio
+async def test_refresh_replaces_the_cached_summary():
+    cache = SummaryCache(max_bytes=1024, ttl=60)
+    llm = _Llm()
+    llm.release.set()
+
+    await cache.get("key", llm.generate)
+    assert await cache.get("key", llm.generate, refresh=True) == "Protokoll 2"
+    assert await cache.get("key", llm.generate) == "Protokoll 2"
+
+
+@pytest.mark.anyio
+async def test_failures_are_not_cached():
+    cache = SummaryCache(max_bytes=1024, ttl=60)
+    llm = _Llm(error=RuntimeError(_OVERLOADED))
+    llm.release.set()
+
+    with pytest.raises(RuntimeError):
+        await cache.get("key", llm.generate)
+    llm.error = None
+
+    assert await cache.get("key", llm.generate) == "Protokoll 2"
+
+
+@pytest.mark.anyio
+async def test_summaries_are_evicted_by_size_and_age():
+    cache = SummaryCache(max_bytes=25, ttl=0.05)
+    llm = _Llm()
+    llm.release.set()
+
+    for key in ("a", "b", "c"):
+        await cache.get(key, llm.generate)
+    # Three summaries of 11 bytes do not fit 25, so the least recently used one went.
+    assert cache.stats().entries == 2
+    assert await cache.get("a", llm.generate) == "Protokoll 4"
+
+    await asyncio.sleep(0.06)
+    assert cache.stats().entries == 0
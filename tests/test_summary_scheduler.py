@@ -0,0 +1,87 @@
+"""Unit tests for the summary scheduler (admission control, fair turns and queue positions)."""
+
+import asyncio
+
+import pytest
+
+from transcribo_backend.services.summary_scheduler import SummaryQueueFullError, SummaryScheduler
+
+
+@pytest.mark.anyio
+async def test_waiting_clients_take_turns():
+    scheduler = SummaryScheduler(slots=1, max_queue=10, max_per_client=5)
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _summarize(client_id: str, name: str) -> None:
+        async with scheduler.slot(client_id):
+            started.append(name)
+            await release.wait()
+
+    holder = asyncio.create_task(_summarize("anna", "anna-0"))
+    await asyncio.sleep(0)
+    # Anna queues three summaries before Beat and Clara queue one each.
+    waiters = [asyncio.create_task(_summarize("anna", f"anna-{i}")) for i in range(1, 4)]
+    await asyncio.sleep(0)
+    waiters += [asyncio.create_task(_summarize(client, f"{client}-1")) for client in ("beat", "clara")]
+    await asyncio.sleep(0)
+    assert scheduler.stats().queued == 5
+    assert scheduler.client_position("clara").position == 3
+    assert scheduler.client_position("anna").position == 1
+
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert started == ["anna-0", "anna-1", "beat-1", "clara-1", "anna-2", "anna-3"]
+    stats = scheduler.stats()
+    assert (stats.completed, stats.running, stats.queued, stats.clients) == (6, 0, 0, 0)
+
+
+@pytest.mark.anyio
+async def test_rejects_when_the_queue_or_the_clients_share_is_full():
+    scheduler = SummaryScheduler(slots=1, max_queue=2, max_per_client=1)
+    holder = scheduler.enqueue("anna")
+    scheduler.enqueue("anna")
+
+    with pytest.raises(SummaryQueueFullError) as exc_info:
+        scheduler.enqueue("anna")
+    assert exc_info.value.retry_after >= 1
+
+    scheduler.enqueue(None)
+    assert not scheduler.admits("beat")
+    with pytest.raises(SummaryQueueFullError):
+        scheduler.enqueue("beat")
+    assert scheduler.stats().rejected == 2
+
+    scheduler.release(holder)
+    assert scheduler.admits("beat")
+
+
+@pytest.mark.anyio
+async def test_positions_are_reported_until_the_slot_is_granted_and_cancelled_waiters_leave():
+    scheduler = SummaryScheduler(slots=1, max_queue=10, max_per_client=5)
+    holder = scheduler.enqueue("anna")
+    ahead = scheduler.enqueue("beat")
+    ticket = scheduler.enqueue("clara")
+    positions: list[int | None] = []
+
+    async def _follow() -> None:
+        async for position in scheduler.positions(ticket):
+            positions.append(position.position)
+
+    follower = asyncio.create_task(_follow())
+    await asyncio.sleep(0)
+    assert positions == [2]
+    assert scheduler.position(ticket).eta_seconds == 120
+
+    scheduler.release(ahead)
+    await asyncio.sleep(0)
+    assert positions == [2, 1]
+
+    scheduler.release(holder)
+    await follower
+    assert ticket.granted
+    assert scheduler.stats().running == 1
+    scheduler.release(ticket)
+    scheduler.release(ticket)
+    assert scheduler.stats().running == 0
@@ -0,0 +1,124 @@
+"""Tests for pushing task status changes to subscribers with one poller per task."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from transcribo_backend.models.task_event import TaskEvent, TaskEventType
+from transcribo_backend.models.task_status import TaskStatus, TaskStatusEnum
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
+from transcribo_backend.services.task_events import TaskEventHub
+
+
+class _Upstream:
+    """Replays a script of statuses, repeating the last one, and counts the fetches."""
+
+    def __init__(self, script: list[TaskStatus | Exception]) -> None:
+        self.script = script
+        self.status_calls = 0
+        self.result_calls = 0
+
+    async def fetch_status(self, task_id: str) -> TaskStatus:
+        step = self.script[min(self.status_calls, len(self.script) - 1)]
+        self.status_calls += 1
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    async def fetch_result(self, task_id: str) -> TranscriptionResponse:
+        self.result_calls += 1
+        return TranscriptionResponse(segments=[Segment(start=0.0, end=1.0, text="Hallo")])
+
+
+def _status(status: TaskStatusEnum, progress: float | None = None) -> TaskStatus:
+    return TaskStatus(task_id="task-1", status=status, progress=progress)
+
+
+async def _collect(hub: TaskEventHub, task_id: str = "task-1") -> list[TaskEvent]:
+    return [event async for event in hub.subscribe(task_id)]
+
+
+@pytest.mark.anyio
+async def test_stream_sends_changes_only_and_ends_with_the_result():
+    upstream = _Upstream([
+        _status(TaskStatusEnum.IN_PROGRESS, 0.1),
+        _status(TaskStatusEnum.IN_PROGRESS, 0.1),
+        _status(TaskStatusEnum.IN_PROGRESS, 0.6),
+        _status(TaskStatusEnum.COMPLETED, 1.0),
+    ])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    events = await _collect(hub)
+
+    assert [event.type for event in events] == [TaskEventType.STATUS] * 3 + [TaskEventType.RESULT]
+    assert [event.status.progress for event in events[:3]] == [0.1, 0.6, 1.0]
+    assert events[-1].result.segments[0].text == "Hallo"
+    assert upstream.result_calls == 1
+    assert hub.active_tasks == 0
+
+
+@pytest.mark.anyio
+async def test_subscribers_of_a_task_share_one_poller():
+    upstream = _Upstream([_status(TaskStatusEnum.IN_PROGRESS, 0.5)] * 5 + [_status(TaskStatusEnum.COMPLETED, 1.0)])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    streams = await asyncio.gather(*(_collect(hub) for _ in range(20)))
+
+    assert all(stream[-1].type == TaskEventType.RESULT for stream in streams)
+    # One poller served all subscribers: one fetch per poll, not one per subscriber.
+    assert upstream.status_calls == 6
+    assert upstream.result_calls == 1
+
+
+@pytest.mark.anyio
+async def test_failed_task_ends_with_a_failure_event():
+    upstream = _Upstream([_status(TaskStatusEnum.IN_PROGRESS, 0.2), _status(TaskStatusEnum.FAILED)])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    events = await _collect(hub)
+
+    assert events[-1].type == TaskEventType.FAILED
+    assert events[-1].status.status == TaskStatusEnum.FAILED
+    assert upstream.result_calls == 0
+
+
+@pytest.mark.anyio
+async def test_unknown_task_ends_with_a_failure_event():
+    upstream = _Upstream([HTTPException(status_code=404, detail="Task not found")])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    events = await _collect(hub)
+
+    assert len(events) == 1
+    assert events[0].type == TaskEventType.FAILED
+    assert upstream.status_calls == 1
+
+
+@pytest.mark.anyio
+async def test_transient_errors_are_retried():
+    upstream = _Upstream([RuntimeError("connection reset"), _status(TaskStatusEnum.COMPLETED, 1.0)])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    events = await _collect(hub)
+
+    assert [event.type for event in events] == [TaskEventType.STATUS, TaskEventType.RESULT]
+
+
+@pytest.mark.anyio
+async def test_poller_stops_when_the_last_subscriber_leaves():
+    upstream = _Upstream([_status(TaskStatusEnum.IN_PROGRESS, 0.5)])
+    hub = TaskEventHub(upstream.fetch_status, upstream.fetch_result, interval=0.001)
+
+    stream = hub.subscribe("task-1")
+    first = await anext(stream)
+    assert first.status.progress == 0.5
+    assert hub.active_tasks == 1
+
+    await stream.aclose()
+    await asyncio.sleep(0.01)
+    calls = upstream.status_calls
+    await asyncio.sleep(0.01)
+
+    assert hub.active_tasks == 0
+    assert upstream.status_calls == calls
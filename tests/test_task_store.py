@@ -0,0 +1,117 @@
+"""Tests for the task registries behind status and result lookups."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from transcribo_backend.services.chunked_transcription import AudioChunk, ChunkedTask
+from transcribo_backend.services.task_store import (
+    InMemoryTaskStore,
+    SqliteTaskStore,
+    TaskRecord,
+    TaskStore,
+)
+
+_TTL = 60.0
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path: Path):
+    task_store: TaskStore = (
+        InMemoryTaskStore(ttl=_TTL) if request.param == "memory" else SqliteTaskStore(str(tmp_path / "t.db"), ttl=_TTL)
+    )
+    yield task_store
+    task_store.close()
+
+
+def _record(task_id: str = "task-1", **kwargs) -> TaskRecord:
+    return TaskRecord(
+        task_id=task_id,
+        progress_id="progress-1",
+        params={"language": "de", "diarization": True},
+        content_hash="ab" * 32,
+        duration=12.5,
+        **kwargs,
+    )
+
+
+def test_stored_record_is_returned_with_all_fields(store):
+    record = _record(backend="http://gpu-2", holders=3)
+    store.put(record)
+
+    assert store.get("task-1") == record
+    assert "task-1" in store
+    assert store.get("task-2") is None
+
+
+def test_deleted_record_is_gone(store):
+    store.put(_record())
+    store.delete("task-1")
+    store.delete("unknown")
+
+    assert "task-1" not in store
+
+
+def test_records_expire_after_the_ttl(store):
+    store.put(_record())
+
+    with patch("transcribo_backend.services.task_store.time.time", return_value=_record().created_at + _TTL + 1):
+        assert store.get("task-1") is None
+
+
+def test_live_tasks_are_never_evicted_by_newer_ones(store):
+    for index in range(2000):
+        store.put(_record(f"task-{index}"))
+
+    assert "task-0" in store
+
+
+def test_chunked_task_round_trips(store):
+    chunked = ChunkedTask(
+        task_id="parent",
+        chunks=[AudioChunk(start=0.0, end=600.0, audio_end=604.0), AudioChunk(start=600.0, end=900.0, audio_end=900.0)],
+        child_task_ids=["task-1", "task-2"],
+    )
+    store.put(TaskRecord(task_id="parent", chunked=chunked))
+
+    assert store.get("parent").chunked == chunked
+
+
+def test_sqlite_store_is_shared_between_processes_and_survives_restarts(tmp_path):
+    path = str(tmp_path / "tasks.db")
+    worker_a = SqliteTaskStore(path, ttl=_TTL)
+    worker_b = SqliteTaskStore(path, ttl=_TTL)
+
+    record = _record()
+    worker_a.put(record)
+    assert worker_b.get("task-1") == record
+    worker_a.close()
+    worker_b.close()
+
+    restarted = SqliteTaskStore(path, ttl=_TTL)
+    assert "task-1" in restarted
+    restarted.close()
+    assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_store_adds_the_new_columns_to_an_existing_database(tmp_path):
+    path = str(tmp_path / "old.db")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE tasks (task_id TEXT PRIMARY KEY, progress_id TEXT, params TEXT NOT NULL, content_hash TEXT, "
+        "duration REAL, chunked TEXT, created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+    )
+    connection.execute("INSERT INTO tasks VALUES ('old-task', 'p', '{}', NULL, NULL, NULL, 0, 1e12)")
+    connection.commit()
+    connection.close()
+
+    store = SqliteTaskStore(path, ttl=_TTL)
+    store.put(_record(backend="http://gpu-2"))
+
+    old = store.get("old-task")
+    assert old is not None
+    assert (old.backend, old.holders) == (None, 1)
+    assert store.get("task-1").backend == "http://gpu-2"
+    store.close()
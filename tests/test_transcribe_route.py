@@ -2,25 +2,38 @@
 
 The router is built with injected mocks (no DI container, no Whisper backend) and driven
 through a FastAPI TestClient. These cover the request-side fixes: oversized uploads are
-rejected early with 413, unsupported types with 415, and a valid upload is forwarded to
+rejected early with 413, unsupported types and content that is not decodable media with
+415, and a valid upload is forwarded to
 the service as an UploadFile (not pre-read bytes).
 """
 
+import gzip
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from dcc_backend_common.fastapi_error_handling import inject_api_error_handler
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
-from returns.io import IOSuccess
+from returns.io import IOFailure, IOSuccess
 from starlette.datastructures import UploadFile
 
+from transcribo_backend.helpers.api_errors import inject_retry_after_error_handler
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.estimate import TranscriptionEstimate
+from transcribo_backend.models.export_format import ExportFormat
+from transcribo_backend.models.task_event import TaskEvent, TaskEventType
 from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.models.transcription_response import Segment, TranscriptionResponse
 from transcribo_backend.routes import transcribe_route
+from transcribo_backend.services.resilience import CircuitOpenError
+
+pytestmark = pytest.mark.usefixtures("audio_probe")
 
 
 def _build_client(whisper_service, usage_service) -> TestClient:
     app = FastAPI()
     inject_api_error_handler(app)
+    inject_retry_after_error_handler(app)
     app.include_router(
         transcribe_route.create_router(
             whisper_service=whisper_service,
@@ -34,6 +47,7 @@ def _make_services(max_upload_bytes: int = 50 * 1024 * 1024):
     whisper_service = MagicMock()
     whisper_service.app_config.max_upload_bytes = max_upload_bytes
     whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+    whisper_service.cached_task_result = MagicMock(return_value=None)
     usage_service = MagicMock()
     return whisper_service, usage_service
 
@@ -60,6 +74,45 @@ def test_rejects_oversized_upload():
     usage_service.log_event.assert_not_called()
 
 
+def test_rejects_content_that_is_not_media(audio_probe):
+    audio_probe.return_value = []
+    whisper_service, usage_service = _make_services()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post("/transcribe", files={"audio_file": ("audio.mp3", b"MZ" + b"\x90" * 4096, "audio/mpeg")})
+
+    assert resp.status_code == 415
+    assert "unrecognised" in resp.json()["debugMessage"]
+    whisper_service.transcribe_submit_task.assert_not_called()
+    usage_service.log_event.assert_not_called()
+
+
+def test_accepts_formats_only_ffprobe_recognises(audio_probe):
+    audio_probe.return_value = [{"codec_type": "audio", "codec_name": "pcm_s16be"}]
+    whisper_service, usage_service = _make_services()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post(
+        "/transcribe", files={"audio_file": ("minutes.aiff", b"FORM\x00\x00\x10\x00AIFF" + b"\x00" * 100, "audio/aiff")}
+    )
+
+    assert resp.status_code == 200
+    whisper_service.transcribe_submit_task.assert_called_once()
+
+
+def test_rejects_media_without_audio_stream(audio_probe):
+    audio_probe.return_value = [{"codec_type": "video", "codec_name": "h264"}]
+    whisper_service, usage_service = _make_services()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post(
+        "/transcribe", files={"audio_file": ("clip.mkv", b"\x1a\x45\xdf\xa3" + b"\x00" * 100, "video/x-matroska")}
+    )
+
+    assert resp.status_code == 415
+    whisper_service.transcribe_submit_task.assert_not_called()
+
+
 def test_valid_upload_is_forwarded_to_service():
     whisper_service, usage_service = _make_services()
     client = _build_client(whisper_service, usage_service)
@@ -80,6 +133,21 @@ def test_valid_upload_is_forwarded_to_service():
     assert call.kwargs["max_upload_bytes"] == whisper_service.app_config.max_upload_bytes
     assert call.kwargs["diarization_speaker_count"] == 2
     assert call.kwargs["language"] == "de"
+    assert call.kwargs["chunked"] is False
+
+
+def test_chunked_flag_is_forwarded_to_service():
+    whisper_service, usage_service = _make_services()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post(
+        "/transcribe",
+        files={"audio_file": ("audio.mp3", b"ID3" + b"\x00" * 100, "audio/mpeg")},
+        data={"chunked": "true"},
+    )
+
+    assert resp.status_code == 200
+    assert whisper_service.transcribe_submit_task.await_args.kwargs["chunked"] is True
 
 
 def test_happy_path_logs_usage():
@@ -90,3 +158,248 @@ def test_happy_path_logs_usage():
 
     assert response.status_code == 200
     usage_service.log_event.assert_called_once()
+
+
+def test_full_conversion_queue_returns_429_with_retry_after():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_submit_task = AsyncMock(
+        return_value=IOFailure(
+            HTTPException(status_code=429, detail="Too many concurrent audio conversions", headers={"Retry-After": "7"})
+        )
+    )
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post(
+        "/transcribe", files={"audio_file": ("audio.wav", b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 100, "audio/wav")}
+    )
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "7"
+    assert resp.json()["errorId"] == "rate_limit_exceeded"
+
+
+def test_unavailable_whisper_returns_503_with_retry_after():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_submit_task = AsyncMock(return_value=IOFailure(CircuitOpenError("http://gpu-1", 12.3)))
+    whisper_service.transcribe_get_task_status = AsyncMock(return_value=IOFailure(CircuitOpenError("http://gpu-1", 4)))
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post(
+        "/transcribe", files={"audio_file": ("audio.wav", b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 100, "audio/wav")}
+    )
+    status = client.get("/task/task-1/status")
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "13"
+    assert resp.json()["errorId"] == "service_unavailable"
+    assert status.status_code == 503
+    assert status.headers["Retry-After"] == "4"
+
+
+def test_estimate_returns_duration_without_submitting():
+    whisper_service, usage_service = _make_services()
+    estimate = TranscriptionEstimate(
+        container=AudioContainer.MP3, duration=90.0, audio_minutes=1.5, estimated_processing_seconds=18.0
+    )
+    whisper_service.transcribe_estimate = AsyncMock(return_value=IOSuccess(estimate))
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post("/transcribe/estimate", files={"audio_file": ("audio.mp3", b"ID3" + b"\x00" * 64, "audio/mpeg")})
+
+    assert resp.status_code == 200
+    assert resp.json()["duration"] == 90.0
+    assert resp.json()["estimated_processing_seconds"] == 18.0
+    assert isinstance(whisper_service.transcribe_estimate.call_args.args[0], UploadFile)
+    whisper_service.transcribe_submit_task.assert_not_called()
+
+
+def test_estimate_rejects_unsupported_content_type():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_estimate = AsyncMock()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post("/transcribe/estimate", files={"audio_file": ("note.txt", b"hello", "text/plain")})
+
+    assert resp.status_code == 415
+    whisper_service.transcribe_estimate.assert_not_called()
+
+
+def _watching_services(events: list[TaskEvent]):
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_get_task_status = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+
+    async def _watch(task_id: str):
+        for event in events:
+            yield event
+
+    whisper_service.watch_task = MagicMock(side_effect=_watch)
+    return whisper_service, usage_service
+
+
+_EVENTS = [
+    TaskEvent(type=TaskEventType.STATUS, status=TaskStatus(task_id="task-1", status="in_progress", progress=0.5)),
+    TaskEvent(
+        type=TaskEventType.RESULT,
+        status=TaskStatus(task_id="task-1", status="completed", progress=1.0),
+        result=TranscriptionResponse(segments=[Segment(start=0.0, end=1.0, text="Hallo")]),
+    ),
+]
+
+
+def test_task_events_are_streamed_as_server_sent_events():
+    whisper_service, usage_service = _watching_services(_EVENTS)
+    client = _build_client(whisper_service, usage_service)
+
+    with client.stream("GET", "/task/task-1/events") as resp:
+        body = "".join(resp.iter_text())
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert "event: status" in body
+    assert "event: result" in body
+    assert body.index("event: status") < body.index("event: result")
+    assert '"text":"Hallo"' in body
+    whisper_service.watch_task.assert_called_once_with("task-1")
+
+
+def test_task_events_of_unknown_task_return_404():
+    whisper_service, usage_service = _watching_services(_EVENTS)
+    whisper_service.transcribe_get_task_status = AsyncMock(
+        return_value=IOFailure(HTTPException(status_code=404, detail="Task not found"))
+    )
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/unknown/events")
+
+    assert resp.status_code == 404
+    whisper_service.watch_task.assert_not_called()
+
+
+def test_task_events_over_websocket():
+    whisper_service, usage_service = _watching_services(_EVENTS)
+    client = _build_client(whisper_service, usage_service)
+
+    with client.websocket_connect("/task/task-1/ws") as websocket:
+        messages = [websocket.receive_json(), websocket.receive_json()]
+
+    assert [message["type"] for message in messages] == ["status", "result"]
+    assert messages[1]["result"]["segments"][0]["text"] == "Hallo"
+
+
+def test_batch_status_reports_each_task_in_request_order():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_get_task_statuses = AsyncMock(
+        return_value={
+            "task-1": TaskStatus(task_id="task-1", progress=0.5),
+            "missing": HTTPException(status_code=404, detail="Task not found"),
+            "broken": RuntimeError("connection reset"),
+        }
+    )
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post("/tasks/status", json={"task_ids": ["broken", "task-1", "missing"]})
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [item["task_id"] for item in results] == ["broken", "task-1", "missing"]
+    assert results[0]["status"] is None
+    assert results[0]["error_code"] == 500
+    assert results[1]["status"]["progress"] == 0.5
+    assert results[1]["error"] is None
+    assert results[2]["error_code"] == 404
+
+
+def test_batch_status_rejects_an_empty_batch():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_get_task_statuses = AsyncMock(return_value={})
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.post("/tasks/status", json={"task_ids": []})
+
+    assert resp.status_code == 422
+    whisper_service.transcribe_get_task_statuses.assert_not_called()
+
+
+def test_cached_result_is_served_compressed_without_asking_the_service():
+    whisper_service, usage_service = _make_services()
+    result = TranscriptionResponse(segments=[Segment(start=0.0, end=1.0, text="Hallo")])
+    whisper_service.cached_task_result = MagicMock(return_value=gzip.compress(result.model_dump_json().encode()))
+    whisper_service.transcribe_stream_task_result = AsyncMock()
+    client = _build_client(whisper_service, usage_service)
+
+    compressed = client.get("/task/task-1/result", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/task/task-1/result", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert compressed.json() == plain.json() == result.model_dump()
+    whisper_service.transcribe_stream_task_result.assert_not_called()
+
+
+def test_uncached_result_is_streamed_from_the_service():
+    whisper_service, usage_service = _make_services()
+    result = TranscriptionResponse(segments=[Segment(start=0.0, end=1.0, text="Hallo")])
+
+    async def _chunks():
+        yield result.model_dump_json().encode()
+
+    whisper_service.transcribe_stream_task_result = AsyncMock(return_value=IOSuccess(_chunks()))
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/task-1/result")
+
+    assert resp.status_code == 200
+    assert resp.json() == result.model_dump()
+
+
+def test_result_of_unknown_task_returns_404():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_stream_task_result = AsyncMock(
+        return_value=IOFailure(HTTPException(status_code=404, detail="Task not found"))
+    )
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/unknown/result")
+
+    assert resp.status_code == 404
+
+
+def test_export_streams_the_rendered_file_as_a_download():
+    whisper_service, usage_service = _make_services()
+
+    async def _chunks():
+        yield b"WEBVTT\n\n"
+
+    whisper_service.transcribe_export_task_result = AsyncMock(return_value=IOSuccess(_chunks()))
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/task-1/export", params={"format": "vtt"})
+
+    assert resp.status_code == 200
+    assert resp.text == "WEBVTT\n\n"
+    assert resp.headers["content-type"].startswith("text/vtt")
+    assert resp.headers["content-disposition"] == 'attachment; filename="task-1.vtt"'
+    whisper_service.transcribe_export_task_result.assert_awaited_once_with("task-1", ExportFormat.VTT)
+
+
+def test_export_rejects_unknown_formats():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_export_task_result = AsyncMock()
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/task-1/export", params={"format": "pdf"})
+
+    assert resp.status_code == 422
+    whisper_service.transcribe_export_task_result.assert_not_called()
+
+
+def test_export_of_unknown_task_returns_404():
+    whisper_service, usage_service = _make_services()
+    whisper_service.transcribe_export_task_result = AsyncMock(
+        return_value=IOFailure(HTTPException(status_code=404, detail="Task not found"))
+    )
+    client = _build_client(whisper_service, usage_service)
+
+    resp = client.get("/task/unknown/export", params={"format": "docx"})
+
+    assert resp.status_code == 404
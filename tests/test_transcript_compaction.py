@@ -0,0 +1,53 @@
+"""Tests for compacting transcripts before they are summarized."""
+
+from transcribo_backend.services.transcript_compaction import TranscriptCompactor
+
+_LEGEND = "Sprecherkürzel (im Protokoll die vollen Namen verwenden): "
+
+
+def test_consecutive_turns_of_a_speaker_are_merged_and_fillers_dropped():
+    compactor = TranscriptCompactor(["äh", "ähm", "hm"])
+    transcript = (
+        "Speaker_00: Äh, guten Morgen   zusammen.\n"
+        "Speaker_00: Wir beginnen ähm pünktlich.\n\n"
+        "Speaker_01 [00:01:02]: Hm.\n"
+        "Speaker_01: Ähnlich wie letztes Mal.\n"
+        "noch eine Zeile\n"
+    )
+
+    compact = compactor.compact(transcript)
+
+    assert compact.body == (
+        "Speaker_00: guten Morgen zusammen. Wir beginnen pünktlich.\n\n"
+        "Speaker_01: Ähnlich wie letztes Mal. noch eine Zeile"
+    )
+    assert compact.legend == ""
+    assert compact.text == compact.body
+
+
+def test_repeated_speaker_labels_are_aliased_without_clashing_with_existing_ones():
+    compactor = TranscriptCompactor()
+    name = "Gemeinderätin Anna Muster"
+    transcript = "".join(f"{name}: Frage {i}.\nS1: Antwort {i}.\n" for i in range(5)) + "Beat: Danke.\nBeat: Tschüss."
+
+    compact = compactor.compact(transcript)
+
+    assert compact.legend == f"{_LEGEND}S2 = {name}"
+    assert compact.body.startswith("S2: Frage 0.\n\nS1: Antwort 0.\n\nS2: Frage 1.")
+    assert compact.body.endswith("S1: Antwort 4.\n\nBeat: Danke. Tschüss.")
+    assert compact.with_legend("S2: Frage 1.") == f"{_LEGEND}S2 = {name}\n\nS2: Frage 1."
+    assert len(compact.text) < len(transcript)
+
+
+def test_labels_are_kept_when_aliasing_them_would_not_pay_for_the_legend():
+    compact = TranscriptCompactor().compact("Anna Muster: Eins.\nBeat: Zwei.\nAnna Muster: Drei.")
+
+    assert compact.legend == ""
+    assert compact.body == "Anna Muster: Eins.\n\nBeat: Zwei.\n\nAnna Muster: Drei."
+
+
+def test_text_without_speakers_only_loses_fillers_and_whitespace():
+    compactor = TranscriptCompactor(["äh"])
+    transcript = "Punkt 3 der heutigen Traktandenliste: das Budget.\n\nÄh   es ist genehmigt."
+
+    assert compactor.compact(transcript).text == "Punkt 3 der heutigen Traktandenliste: das Budget. es ist genehmigt."
@@ -0,0 +1,82 @@
+"""Tests for rendering transcripts as subtitle and document files while the segments arrive."""
+
+import io
+import zipfile
+
+import pytest
+
+from transcribo_backend.models.export_format import ExportFormat
+from transcribo_backend.models.transcription_response import Segment
+from transcribo_backend.services.transcript_export import render_transcript
+
+_SEGMENTS = [
+    Segment(start=0.0, end=1.5, text="Grüezi mitenand.", speaker="Speaker_00"),
+    Segment(start=1.5, end=3725.25, text="Wir beginnen <pünktlich> & zügig.", speaker="Speaker_00"),
+    Segment(start=3726.0, end=3727.0, text="Danke.", speaker=None),
+]
+
+
+async def _render(export_format: ExportFormat, segments: list[Segment] = _SEGMENTS) -> bytes:
+    async def _segments():
+        for segment in segments:
+            yield segment
+
+    return b"".join([piece async for piece in render_transcript(_segments(), export_format)])
+
+
+@pytest.mark.anyio
+async def test_srt_has_one_numbered_cue_per_segment():
+    srt = (await _render(ExportFormat.SRT)).decode()
+
+    assert srt.startswith("1\n00:00:00,000 --> 00:00:01,500\nSpeaker_00: Grüezi mitenand.\n\n2\n")
+    assert "00:00:01,500 --> 01:02:05,250\nSpeaker_00: Wir beginnen <pünktlich> & zügig." in srt
+    assert srt.endswith("3\n01:02:06,000 --> 01:02:07,000\nUnknown: Danke.\n\n")
+
+
+@pytest.mark.anyio
+async def test_vtt_carries_the_speaker_as_voice_and_escapes_the_text():
+    vtt = (await _render(ExportFormat.VTT)).decode()
+
+    assert vtt.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:01.500\n<v Speaker_00>Grüezi mitenand.\n\n")
+    assert "<v Speaker_00>Wir beginnen &lt;pünktlich&gt; &amp; zügig." in vtt
+
+
+@pytest.mark.anyio
+async def test_txt_has_one_paragraph_per_speaker_turn():
+    txt = (await _render(ExportFormat.TXT)).decode()
+
+    assert txt == (
+        "Speaker_00 [00:00:00]\nGrüezi mitenand. Wir beginnen <pünktlich> & zügig.\n\nUnknown [01:02:06]\nDanke.\n\n"
+    )
+
+
+@pytest.mark.anyio
+async def test_docx_is_a_valid_word_document():
+    docx = await _render(ExportFormat.DOCX)
+
+    with zipfile.ZipFile(io.BytesIO(docx)) as archive:
+        assert archive.testzip() is None
+        assert "word/document.xml" in archive.namelist()
+        assert "[Content_Types].xml" in archive.namelist()
+        document = archive.read("word/document.xml").decode()
+    assert "<w:t>Speaker_00</w:t>" in document
+    assert "Grüezi mitenand. Wir beginnen &lt;pünktlich&gt; &amp; zügig." in document
+    assert document.endswith("</w:body></w:document>")
+
+
+@pytest.mark.anyio
+async def test_large_exports_are_handed_on_in_pieces():
+    segments = [
+        Segment(start=float(i), end=i + 1.0, text=f"Satz Nummer {i} der Sitzung.", speaker=f"Speaker_{i % 2:02d}")
+        for i in range(20_000)
+    ]
+
+    async def _segments():
+        for segment in segments:
+            yield segment
+
+    pieces = [piece async for piece in render_transcript(_segments(), ExportFormat.DOCX)]
+
+    assert len(pieces) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(pieces))) as archive:
+        assert "Satz Nummer 19999 der Sitzung." in archive.read("word/document.xml").decode()
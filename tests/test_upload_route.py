@@ -0,0 +1,193 @@
+"""Unit tests for the resumable upload API.
+
+The real ``UploadSessionService`` assembles the uploads in a temporary spool directory; only
+the Whisper service is mocked, so the tests check what the finalize hands to the
+transcription pipeline.
+"""
+
+import hashlib
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dcc_backend_common.fastapi_error_handling import inject_api_error_handler
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from returns.io import IOSuccess
+
+from transcribo_backend.helpers.api_errors import inject_retry_after_error_handler
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.routes import upload_route
+from transcribo_backend.services.upload_session_service import UploadSessionService
+from transcribo_backend.services.whisper_service import AssembledUpload
+from transcribo_backend.utils.app_config import AppConfig
+
+pytestmark = pytest.mark.usefixtures("audio_probe")
+
+AUDIO = b"ID3" + bytes(range(256)) * 40
+
+
+def _make_upload_service(spool_dir: Path, max_upload_bytes: int = 50 * 1024 * 1024) -> UploadSessionService:
+    cfg = MagicMock(spec=AppConfig)
+    cfg.max_upload_bytes = max_upload_bytes
+    cfg.upload_spool_dir = str(spool_dir)
+    cfg.upload_session_ttl_seconds = 3600
+    cfg.passthrough_formats = [AudioContainer.MP3]
+    cfg.ffmpeg_slots = 2
+    cfg.normalization_target = NormalizationTarget.MP3
+    whisper_service = MagicMock()
+    whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+    return UploadSessionService(cfg, whisper_service)
+
+
+@pytest.fixture
+def upload_service(tmp_path: Path) -> UploadSessionService:
+    return _make_upload_service(tmp_path)
+
+
+@pytest.fixture
+def client(upload_service: UploadSessionService) -> TestClient:
+    app = FastAPI()
+    inject_api_error_handler(app)
+    inject_retry_after_error_handler(app)
+    app.include_router(
+        upload_route.create_router(upload_session_service=upload_service, usage_tracking_service=MagicMock())
+    )
+    return TestClient(app)
+
+
+def _create(client: TestClient, size: int = len(AUDIO)) -> str:
+    resp = client.post("/uploads", json={"filename": "meeting.mp3", "content_type": "audio/mpeg", "size": size})
+    assert resp.status_code == 201
+    assert resp.json()["offset"] == 0
+    return resp.json()["upload_id"]
+
+
+def _patch(client: TestClient, upload_id: str, start: int, data: bytes, **headers: str):
+    content_range = f"bytes {start}-{start + len(data) - 1}/{len(AUDIO)}"
+    return client.patch(f"/uploads/{upload_id}", content=data, headers={"Content-Range": content_range, **headers})
+
+
+def test_chunks_are_assembled_and_handed_to_the_transcription_pipeline(client, upload_service):
+    upload_id = _create(client)
+
+    first = _patch(client, upload_id, 0, AUDIO[:4000], **{"X-Content-SHA256": hashlib.sha256(AUDIO[:4000]).hexdigest()})
+    assert first.status_code == 200
+    assert first.json()["offset"] == 4000
+    assert first.json()["container"] == "mp3"
+    assert _patch(client, upload_id, 4000, AUDIO[4000:]).json()["offset"] == len(AUDIO)
+
+    submitted: dict = {}
+
+    async def _submit(upload, **kwargs):
+        submitted["content"] = Path(upload.path).read_bytes()
+        submitted["upload"] = upload
+        submitted["kwargs"] = kwargs
+        return IOSuccess(TaskStatus(task_id="task-1"))
+
+    upload_service.whisper_service.transcribe_submit_task = AsyncMock(side_effect=_submit)
+    resp = client.post(f"/uploads/{upload_id}/finalize", json={"num_speakers": 2, "language": "de"})
+
+    assert resp.status_code == 200
+    assert resp.json()["task_id"] == "task-1"
+    upload = submitted["upload"]
+    assert isinstance(upload, AssembledUpload)
+    assert submitted["content"] == AUDIO
+    # The hash was computed while the chunks arrived, not by re-reading the file.
+    assert upload.content_hash == hashlib.sha256(AUDIO).hexdigest()
+    assert submitted["kwargs"]["diarization_speaker_count"] == 2
+    # A submitted upload is cleaned up.
+    assert not Path(upload.path).exists()
+    assert client.get(f"/uploads/{upload_id}").status_code == 404
+
+
+def test_chunk_at_wrong_offset_is_rejected_with_current_offset(client):
+    upload_id = _create(client)
+    _patch(client, upload_id, 0, AUDIO[:1000])
+
+    resp = _patch(client, upload_id, 2000, AUDIO[2000:3000])
+
+    assert resp.status_code == 409
+    assert "1000" in resp.json()["debugMessage"]
+
+
+def test_corrupted_chunk_is_discarded_and_upload_can_resume(client, upload_service):
+    upload_id = _create(client)
+    _patch(client, upload_id, 0, AUDIO[:1000])
+
+    resp = _patch(client, upload_id, 1000, AUDIO[1000:2000], **{"X-Content-SHA256": "0" * 64})
+
+    assert resp.status_code == 400
+    state = client.get(f"/uploads/{upload_id}").json()
+    assert state["offset"] == 1000
+    assert (upload_service.spool_dir / f"{upload_id}.part").stat().st_size == 1000
+    assert _patch(client, upload_id, 1000, AUDIO[1000:]).json()["offset"] == len(AUDIO)
+
+
+def test_chunk_shorter_than_its_content_range_is_rejected(client):
+    upload_id = _create(client)
+
+    resp = client.patch(
+        f"/uploads/{upload_id}", content=AUDIO[:500], headers={"Content-Range": f"bytes 0-999/{len(AUDIO)}"}
+    )
+
+    assert resp.status_code == 400
+    assert client.get(f"/uploads/{upload_id}").json()["offset"] == 0
+
+
+def test_finalize_before_all_bytes_arrived_is_rejected(client, upload_service):
+    upload_id = _create(client)
+    _patch(client, upload_id, 0, AUDIO[:1000])
+
+    resp = client.post(f"/uploads/{upload_id}/finalize", json={})
+
+    assert resp.status_code == 409
+    upload_service.whisper_service.transcribe_submit_task.assert_not_called()
+
+
+def test_upload_that_is_not_media_is_aborted_once_the_leading_bytes_are_in(client, upload_service, audio_probe):
+    # Unknown magic bytes are left to ffprobe, which cannot decode them.
+    audio_probe.return_value = []
+    upload_id = _create(client)
+
+    resp = _patch(client, upload_id, 0, b"PK\x03\x04" + b"\x00" * (len(AUDIO) - 4))
+
+    assert resp.status_code == 415
+    assert client.get(f"/uploads/{upload_id}").status_code == 404
+    assert not list(upload_service.spool_dir.iterdir())
+
+
+def test_upload_without_audio_stream_is_aborted_once_the_leading_bytes_are_in(client, audio_probe):
+    audio_probe.return_value = [{"codec_type": "video", "codec_name": "h264"}]
+    upload_id = _create(client)
+
+    resp = _patch(client, upload_id, 0, AUDIO)
+
+    assert resp.status_code == 415
+    assert "audio" in resp.json()["debugMessage"]
+    assert client.get(f"/uploads/{upload_id}").status_code == 404
+
+
+def test_create_rejects_oversized_and_unsupported_files(tmp_path):
+    app = FastAPI()
+    inject_api_error_handler(app)
+    service = _make_upload_service(tmp_path, max_upload_bytes=100)
+    app.include_router(upload_route.create_router(upload_session_service=service, usage_tracking_service=MagicMock()))
+    client = TestClient(app)
+
+    too_large = client.post("/uploads", json={"filename": "a.mp3", "content_type": "audio/mpeg", "size": 101})
+    unsupported = client.post("/uploads", json={"filename": "a.txt", "content_type": "text/plain", "size": 10})
+
+    assert too_large.status_code == 413
+    assert unsupported.status_code == 415
+
+
+def test_aborted_upload_is_gone(client, upload_service):
+    upload_id = _create(client)
+    _patch(client, upload_id, 0, AUDIO[:1000])
+
+    assert client.delete(f"/uploads/{upload_id}").status_code == 204
+    assert client.get(f"/uploads/{upload_id}").status_code == 404
+    assert not list(upload_service.spool_dir.iterdir())
@@ -0,0 +1,174 @@
+"""Tests for converting a resumable upload while it is still arriving."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from returns.io import IOSuccess
+
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.services.conversion_scheduler import ConversionScheduler
+from transcribo_backend.services.upload_session_service import UploadSessionService
+from transcribo_backend.utils.app_config import AppConfig
+
+pytestmark = pytest.mark.usefixtures("audio_probe")
+
+WAV = b"RIFF\x00\x00\x00\x00WAVE" + b"\x01" * 8000
+_TRANSCODE = "transcribo_backend.services.upload_session_service.transcode_stream"
+
+
+def _make_service(spool_dir: Path) -> UploadSessionService:
+    cfg = MagicMock(spec=AppConfig)
+    cfg.upload_spool_dir = str(spool_dir)
+    cfg.upload_session_ttl_seconds = 3600
+    cfg.passthrough_formats = [AudioContainer.MP3]
+    cfg.ffmpeg_slots = 2
+    cfg.normalization_target = NormalizationTarget.MP3
+    whisper_service = MagicMock()
+    whisper_service.conversion_scheduler = ConversionScheduler(slots=cfg.ffmpeg_slots, max_queue=0)
+    return UploadSessionService(cfg, whisper_service)
+
+
+async def _one(data: bytes):
+    yield data
+
+
+@pytest.mark.anyio
+async def test_wav_upload_is_converted_while_it_arrives(tmp_path):
+    service = _make_service(tmp_path)
+    seen: list[bytes] = []
+
+    async def _fake_transcode(chunks, target):
+        async for chunk in chunks:
+            seen.append(chunk)
+            yield chunk.upper()
+
+    submitted: dict = {}
+
+    async def _submit(upload, **_):
+        submitted["mp3"] = Path(upload.converted_path).read_bytes()
+        submitted["path"] = upload.converted_path
+        return IOSuccess(TaskStatus(task_id="task-1"))
+
+    service.whisper_service.transcribe_submit_task = AsyncMock(side_effect=_submit)
+
+    with patch(_TRANSCODE, _fake_transcode):
+        session = service.create("meeting.wav", "audio/wav", len(WAV))
+        await service.append(session.upload_id, 0, 4000, _one(WAV[:4000]))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # ffmpeg already got the first chunk before the rest of the upload arrived.
+        assert b"".join(seen) == WAV[:4000]
+
+        await service.append(session.upload_id, 4000, len(WAV) - 4000, _one(WAV[4000:]))
+        result = await service.finalize(session.upload_id)
+
+    assert isinstance(result, IOSuccess)
+    assert submitted["mp3"] == WAV.upper()
+    assert not Path(submitted["path"]).exists()
+
+
+@pytest.mark.anyio
+async def test_passthrough_upload_is_not_converted_early(tmp_path):
+    service = _make_service(tmp_path)
+    service.whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+    mp3 = b"ID3" + b"\x00" * 4000
+
+    with patch(_TRANSCODE) as transcode:
+        session = service.create("meeting.mp3", "audio/mpeg", len(mp3))
+        await service.append(session.upload_id, 0, len(mp3), _one(mp3))
+        await service.finalize(session.upload_id)
+
+    transcode.assert_not_called()
+    upload = service.whisper_service.transcribe_submit_task.await_args.args[0]
+    assert upload.converted_path is None
+
+
+@pytest.mark.anyio
+async def test_failed_early_conversion_falls_back_to_converting_at_finalize(tmp_path):
+    service = _make_service(tmp_path)
+    service.whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+
+    async def _broken_transcode(chunks, target):
+        async for _ in chunks:
+            raise RuntimeError
+        yield b""
+
+    with patch(_TRANSCODE, _broken_transcode):
+        session = service.create("meeting.wav", "audio/wav", len(WAV))
+        await service.append(session.upload_id, 0, len(WAV), _one(WAV))
+        result = await service.finalize(session.upload_id)
+
+    assert isinstance(result, IOSuccess)
+    upload = service.whisper_service.transcribe_submit_task.await_args.args[0]
+    assert upload.converted_path is None
+
+
+@pytest.mark.anyio
+async def test_early_conversion_holds_an_ffmpeg_slot(tmp_path):
+    service = _make_service(tmp_path)
+    scheduler = service.whisper_service.conversion_scheduler
+    service.whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+
+    async def _fake_transcode(chunks, target):
+        async for chunk in chunks:
+            yield chunk
+
+    with patch(_TRANSCODE, _fake_transcode):
+        session = service.create("meeting.wav", "audio/wav", len(WAV))
+        await service.append(session.upload_id, 0, 4000, _one(WAV[:4000]))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert scheduler.stats().running == 1
+
+        await service.append(session.upload_id, 4000, len(WAV) - 4000, _one(WAV[4000:]))
+        await service.finalize(session.upload_id)
+
+    assert scheduler.stats().running == 0
+    assert scheduler.stats().completed == 1
+
+
+@pytest.mark.anyio
+async def test_upload_is_not_converted_early_while_every_ffmpeg_slot_is_busy(tmp_path):
+    service = _make_service(tmp_path)
+    scheduler = service.whisper_service.conversion_scheduler
+    service.whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+
+    with patch(_TRANSCODE) as transcode:
+        async with scheduler.slot(), scheduler.slot():
+            session = service.create("meeting.wav", "audio/wav", len(WAV))
+            await service.append(session.upload_id, 0, len(WAV), _one(WAV))
+        await service.finalize(session.upload_id)
+
+    transcode.assert_not_called()
+    upload = service.whisper_service.transcribe_submit_task.await_args.args[0]
+    assert upload.converted_path is None
+
+
+@pytest.mark.anyio
+async def test_early_conversion_of_a_stalled_upload_is_stopped(tmp_path):
+    service = _make_service(tmp_path)
+    service.early_conversion_idle_seconds = 0.01
+    scheduler = service.whisper_service.conversion_scheduler
+    service.whisper_service.transcribe_submit_task = AsyncMock(return_value=IOSuccess(TaskStatus(task_id="task-1")))
+
+    async def _fake_transcode(chunks, target):
+        async for chunk in chunks:
+            yield chunk
+
+    with patch(_TRANSCODE, _fake_transcode):
+        session = service.create("meeting.wav", "audio/wav", len(WAV))
+        await service.append(session.upload_id, 0, 4000, _one(WAV[:4000]))
+        await asyncio.sleep(0.1)
+        # The stalled upload no longer keeps ffmpeg running or holds a slot.
+        assert scheduler.stats().running == 0
+
+        await service.append(session.upload_id, 4000, len(WAV) - 4000, _one(WAV[4000:]))
+        result = await service.finalize(session.upload_id)
+
+    assert isinstance(result, IOSuccess)
+    upload = service.whisper_service.transcribe_submit_task.await_args.args[0]
+    assert upload.converted_path is None
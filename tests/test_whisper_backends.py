@@ -0,0 +1,228 @@
+"""Tests for spreading submits over several Whisper backends by outstanding audio."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from transcribo_backend.models.task_status import TaskStatus
+from transcribo_backend.services.resilience import CircuitOpenError, RetryPolicy
+from transcribo_backend.services.whisper_backends import DEFAULT_WORK_SECONDS, WhisperBackend, WhisperBackendPool
+
+_REFUSED = "Connection refused"
+_TIMED_OUT = "Read timed out"
+
+
+def _pool(
+    *urls: str, cooldown: float = 30.0, failures: int = 1, attempts: int = 1, hedge_after: float = 0.0
+) -> WhisperBackendPool:
+    return WhisperBackendPool(
+        urls or ("http://gpu-1", "http://gpu-2"),
+        work_ttl=3600.0,
+        retry=RetryPolicy(attempts=attempts, backoff_seconds=0.0),
+        failure_threshold=failures,
+        reset_seconds=cooldown,
+        hedge_after=hedge_after,
+    )
+
+
+def _accept(task_ids: list[str]):
+    async def _send(backend: WhisperBackend) -> TaskStatus:
+        task_ids.append(f"{backend.url}/{len(task_ids)}")
+        return TaskStatus(task_id=task_ids[-1])
+
+    return _send
+
+
+def _seconds(pool: WhisperBackendPool) -> dict[str, float]:
+    return {stats.url: stats.outstanding_seconds for stats in pool.stats()}
+
+
+def test_urls_are_deduplicated_and_unknown_owners_map_to_the_primary_backend():
+    pool = _pool("http://gpu-1/", "http://gpu-2", "http://gpu-1")
+
+    assert [backend.url for backend in pool.backends] == ["http://gpu-1", "http://gpu-2"]
+    assert pool.get("http://gpu-2/").url == "http://gpu-2"
+    assert pool.get(None) is pool.get("http://elsewhere") is pool.primary
+
+
+@pytest.mark.anyio
+async def test_submits_go_to_the_backend_with_the_least_outstanding_audio():
+    pool = _pool("http://gpu-1", "http://gpu-2", "http://gpu-3")
+    task_ids: list[str] = []
+
+    for seconds in (3600, 600, 600, 1200, 300):
+        await pool.submit(seconds, _accept(task_ids))
+
+    assert _seconds(pool) == {"http://gpu-1": 3600, "http://gpu-2": 1800, "http://gpu-3": 900}
+    pool.finish(task_ids[0])
+    _, backend = await pool.submit(None, _accept(task_ids))
+    assert backend.url == "http://gpu-1"
+    assert _seconds(pool)["http://gpu-1"] == DEFAULT_WORK_SECONDS
+
+
+@pytest.mark.anyio
+async def test_concurrent_submits_spread_while_their_uploads_are_in_flight():
+    pool = _pool()
+    release = asyncio.Event()
+
+    async def _slow(backend: WhisperBackend) -> TaskStatus:
+        await release.wait()
+        return TaskStatus(task_id=f"{backend.url}/task")
+
+    submits = [asyncio.ensure_future(pool.submit(600, _slow)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert _seconds(pool) == {"http://gpu-1": 600, "http://gpu-2": 600}
+    release.set()
+
+    backends = {backend.url for _, backend in await asyncio.gather(*submits)}
+    assert backends == {"http://gpu-1", "http://gpu-2"}
+
+
+@pytest.mark.anyio
+async def test_a_failing_backend_is_skipped_until_its_circuit_lets_a_probe_through():
+    pool = _pool(cooldown=0.05)
+    attempts: list[str] = []
+
+    async def _send(backend: WhisperBackend) -> TaskStatus:
+        attempts.append(backend.url)
+        if backend.url == "http://gpu-1":
+            raise httpx.ConnectError(_REFUSED)
+        return TaskStatus(task_id=f"task-{len(attempts)}")
+
+    _, backend = await pool.submit(60, _send)
+    await pool.submit(60, _send)
+    assert backend.url == "http://gpu-2"
+    assert attempts == ["http://gpu-1", "http://gpu-2", "http://gpu-2"]
+    assert _seconds(pool) == {"http://gpu-1": 0, "http://gpu-2": 120}
+
+    await asyncio.sleep(0.06)
+    await pool.submit(60, _send)
+    assert attempts[-2:] == ["http://gpu-1", "http://gpu-2"]
+    assert [stats.failures for stats in pool.stats()] == [2, 0]
+
+
+@pytest.mark.anyio
+async def test_client_errors_and_unreplayable_submits_do_not_fail_over():
+    pool = _pool()
+    attempts: list[str] = []
+
+    async def _reject(backend: WhisperBackend) -> TaskStatus:
+        attempts.append(backend.url)
+        request = httpx.Request("POST", backend.url)
+        raise httpx.HTTPStatusError(_REFUSED, request=request, response=httpx.Response(413, request=request))
+
+    async def _refuse(backend: WhisperBackend) -> TaskStatus:
+        attempts.append(backend.url)
+        raise httpx.ConnectError(_REFUSED)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await pool.submit(60, _reject)
+    with pytest.raises(httpx.ConnectError):
+        await pool.submit(60, _refuse, failover=False)
+
+    assert attempts == ["http://gpu-1", "http://gpu-1"]
+    assert [stats.healthy for stats in pool.stats()] == [False, True]
+    assert _seconds(pool) == {"http://gpu-1": 0, "http://gpu-2": 0}
+
+
+@pytest.mark.anyio
+async def test_the_last_error_is_raised_when_every_backend_fails():
+    pool = _pool()
+
+    async def _refuse(backend: WhisperBackend) -> TaskStatus:
+        raise httpx.ConnectError(backend.url)
+
+    with pytest.raises(httpx.ConnectError, match="gpu-2"):
+        await pool.submit(60, _refuse)
+    assert not any(stats.healthy for stats in pool.stats())
+
+    # With every circuit open, the next submit fails fast without being sent.
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await pool.submit(60, _refuse)
+    assert 1 <= excinfo.value.retry_after <= 30
+    assert [stats.rejected for stats in pool.stats()] == [0, 0]
+
+
+@pytest.mark.anyio
+async def test_a_submit_is_sent_again_after_a_backoff_only_if_whisper_cannot_have_received_it():
+    pool = _pool("http://gpu-1", failures=3, attempts=3)
+    errors: list[Exception] = [httpx.ConnectError(_REFUSED), httpx.ConnectError(_REFUSED)]
+
+    async def _send(backend: WhisperBackend) -> TaskStatus:
+        if errors:
+            raise errors.pop(0)
+        return TaskStatus(task_id="task-1")
+
+    status, _ = await pool.submit(60, _send)
+    assert status.task_id == "task-1"
+    assert pool.client_stats().retries == 2
+    assert pool.stats()[0].circuit == "closed"
+
+    # The upload may have arrived when the answer timed out, so it is not sent twice.
+    errors.append(httpx.ReadTimeout(_TIMED_OUT))
+    with pytest.raises(httpx.ReadTimeout):
+        await pool.submit(60, _send)
+    assert pool.client_stats().retries == 2
+
+
+def _responder(statuses: list[int], calls: list[int]):
+    async def _send() -> httpx.Response:
+        calls.append(len(calls))
+        return httpx.Response(statuses.pop(0) if statuses else 200, request=httpx.Request("GET", "http://gpu-1"))
+
+    return _send
+
+
+@pytest.mark.anyio
+async def test_idempotent_requests_are_retried_on_gateway_errors_but_commands_are_not():
+    pool = _pool("http://gpu-1", failures=5, attempts=3)
+    calls: list[int] = []
+
+    response = await pool.request(pool.primary, _responder([503, 502], calls))
+    assert response.status_code == 200
+    assert len(calls) == 3
+
+    calls.clear()
+    response = await pool.request(pool.primary, _responder([503], calls), idempotent=False)
+    assert response.status_code == 503
+    assert len(calls) == 1
+    assert pool.client_stats().retries == 2
+    assert pool.stats()[0].failures == 3
+
+
+@pytest.mark.anyio
+async def test_requests_to_a_backend_with_an_open_circuit_fail_fast():
+    pool = _pool("http://gpu-1", failures=2, attempts=2)
+    calls: list[int] = []
+
+    response = await pool.request(pool.primary, _responder([503, 503], calls))
+    assert response.status_code == 503
+    with pytest.raises(CircuitOpenError):
+        await pool.request(pool.primary, _responder([], calls))
+
+    assert len(calls) == 2
+    assert pool.stats()[0].circuit == "open"
+    assert pool.stats()[0].rejected == 1
+    assert not pool.available
+
+
+@pytest.mark.anyio
+async def test_slow_status_reads_are_hedged():
+    pool = _pool("http://gpu-1", hedge_after=0.01)
+    calls: list[int] = []
+
+    async def _send() -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, request=httpx.Request("GET", "http://gpu-1"))
+
+    response = await pool.request(pool.primary, _send, hedge=True)
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert pool.client_stats().hedged == pool.client_stats().hedge_wins == 1
+
+    calls.clear()
+    await pool.request(pool.primary, _send, hedge=False)
+    assert len(calls) == 1
@@ -8,33 +8,82 @@ the memory-safety fixes:
   * non-MP3 uploads are converted and the temp files are cleaned up,
   * oversized uploads are rejected with HTTP 413 before any request is sent,
   * ``transcribe_get_task_result`` returns the *normalized* transcription (regression
-    for the old double-parse bug that discarded the mutations).
+    for the old double-parse bug that discarded the mutations),
+  * byte-identical re-uploads are deduplicated onto the existing task or cached result.
 """
 
+import asyncio
+import gzip
+import hashlib
+import json
 import os
 import tempfile
+import wave
 from io import BytesIO
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi import HTTPException, UploadFile
 from returns.io import IOFailure, IOSuccess
 
-from transcribo_backend.services.whisper_service import WhisperService
+from transcribo_backend.models.audio_container import AudioContainer
+from transcribo_backend.models.export_format import ExportFormat
+from transcribo_backend.models.normalization_target import NormalizationTarget
+from transcribo_backend.models.transcription_response import TranscriptionResponse
+from transcribo_backend.services.audio_converter import ConversionAction, ConversionPlan
+from transcribo_backend.services.conversion_scheduler import ConversionScheduler
+from transcribo_backend.services.task_store import TaskRecord
+from transcribo_backend.services.whisper_service import AssembledUpload, WhisperService
 from transcribo_backend.utils.app_config import AppConfig
 
 # An MP3 file detected via its ID3 tag (see audio_converter.is_mp3_format).
 MP3_BYTES = b"ID3" + b"\x00" * 4096
 # A non-MP3 payload (WAV-ish header) that should trigger conversion.
 NON_MP3_BYTES = b"RIFF" + b"\x00" * 4096
+# An Ogg stream, forwarded unchanged with the default passthrough formats.
+OGG_BYTES = b"OggS" + b"\x00" * 4096
 
 
-def _make_service(max_upload_bytes: int = 50 * 1024 * 1024) -> WhisperService:
+def _make_service(
+    max_upload_bytes: int = 50 * 1024 * 1024,
+    streaming_transcode: bool = False,
+    memory_spool_bytes: int = 0,
+    task_store_path: str = "",
+    whisper_backend_urls: list[str] | None = None,
+) -> WhisperService:
     cfg = MagicMock(spec=AppConfig)
     cfg.whisper_url = "http://whisper.test"
     cfg.llm_api_key = "test-key"
     cfg.max_upload_bytes = max_upload_bytes
+    cfg.streaming_transcode = streaming_transcode
+    # Most tests exercise the disk path; the in-memory path has its own tests.
+    cfg.memory_spool_bytes = memory_spool_bytes
+    cfg.dedup_index_size = 1024
+    cfg.ffmpeg_slots = 2
+    cfg.ffmpeg_queue_size = 8
+    cfg.passthrough_formats = [AudioContainer.MP3, AudioContainer.OGG, AudioContainer.FLAC, AudioContainer.MP4]
+    cfg.chunk_minutes = 10
+    cfg.chunk_overlap_seconds = 4
+    cfg.normalization_target = NormalizationTarget.MP3
+    cfg.realtime_factor = 0.2
+    cfg.task_store_path = task_store_path
+    cfg.task_ttl_seconds = 24 * 60 * 60
+    cfg.status_cache_seconds = 0.0
+    cfg.event_poll_seconds = 0.01
+    cfg.batch_status_concurrency = 4
+    cfg.result_cache_bytes = 1024 * 1024
+    cfg.result_cache_dir = ""
+    cfg.result_cache_disk_bytes = 0
+    cfg.segment_replacements = {}
+    cfg.segment_filler_words = []
+    cfg.whisper_backend_urls = whisper_backend_urls or []
+    cfg.whisper_backend_cooldown_seconds = 30.0
+    cfg.whisper_retry_attempts = 3
+    cfg.whisper_retry_backoff_seconds = 0.0
+    cfg.whisper_breaker_failures = 3
+    cfg.whisper_hedge_seconds = 0.0
     return WhisperService(cfg)
 
 
@@ -51,6 +100,7 @@ def _capturing_post(captured: dict):
         captured["url"] = url
         captured["data"] = data
         captured["filename"] = files["file"][0]
+        captured["content_type"] = files["file"][2]
         # The fix forwards a file handle, not raw bytes. Record both facts.
         captured["is_file_handle"] = hasattr(fh, "read") and not isinstance(fh, bytes | bytearray)
         captured["body"] = fh.read()
@@ -62,13 +112,35 @@ def _capturing_post(captured: dict):
     return AsyncMock(side_effect=_post)
 
 
+def _capturing_stream_post(captured: dict):
+    """Return an AsyncMock side effect that drains a streamed multipart body."""
+
+    async def _post(url, content=None, headers=None):
+        assert content is not None
+        captured["url"] = url
+        captured["content_type"] = headers["Content-Type"]
+        captured["body"] = b"".join([chunk async for chunk in content])
+        resp = MagicMock()
+        resp.json.return_value = {"task_id": "task-1", "status": "in_progress"}
+        resp.raise_for_status = MagicMock()
+        return resp
+
+    return AsyncMock(side_effect=_post)
+
+
+async def _fake_transcode(chunks, target=NormalizationTarget.MP3):
+    """Stand-in for the ffmpeg pipe: upper-cases the input so the test can see it ran."""
+    async for chunk in chunks:
+        yield chunk.upper()
+
+
 @pytest.mark.anyio
 async def test_submit_streams_mp3_as_file_handle_without_conversion():
     svc = _make_service()
     captured: dict = {}
     svc.client.post = _capturing_post(captured)
 
-    with patch("transcribo_backend.services.whisper_service.convert_to_mp3") as convert:
+    with patch("transcribo_backend.services.whisper_service.normalize_audio") as convert:
         result = await svc.transcribe_submit_task(
             _make_upload(MP3_BYTES, "audio.mp3"), max_upload_bytes=svc.app_config.max_upload_bytes
         )
@@ -82,7 +154,7 @@ async def test_submit_streams_mp3_as_file_handle_without_conversion():
     # Task id mapped to a progress id for later status lookups.
     status = result.unwrap()._inner_value
     assert status.task_id == "task-1"
-    assert svc.taskId_to_progressId[status.task_id]
+    assert svc.task_store.get(status.task_id).progress_id
 
     await svc.aclose()
 
@@ -98,7 +170,7 @@ async def test_submit_converts_non_mp3_and_cleans_up_temp_file():
         f.write(b"CONVERTED_MP3")
         converted_path = f.name
 
-    with patch("transcribo_backend.services.whisper_service.convert_to_mp3") as convert:
+    with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
         convert.return_value = IOSuccess(converted_path)
         result = await svc.transcribe_submit_task(
             _make_upload(NON_MP3_BYTES, "audio.wav"), max_upload_bytes=svc.app_config.max_upload_bytes
@@ -107,7 +179,8 @@ async def test_submit_converts_non_mp3_and_cleans_up_temp_file():
     assert isinstance(result, IOSuccess), result
     # Conversion was invoked with a path on disk (streamed input), not bytes.
     convert.assert_called_once()
-    (input_path,) = convert.call_args.args
+    input_path, target = convert.call_args.args
+    assert target == NormalizationTarget.MP3
     assert isinstance(input_path, str)
     # The converted file was the one uploaded.
     assert captured["body"] == b"CONVERTED_MP3"
@@ -119,6 +192,29 @@ async def test_submit_converts_non_mp3_and_cleans_up_temp_file():
     await svc.aclose()
 
 
+@pytest.mark.anyio
+async def test_submit_announces_the_configured_normalization_target():
+    svc = _make_service()
+    svc.app_config.normalization_target = NormalizationTarget.OPUS
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".ogg") as f:
+        f.write(b"OggS" + b"\x00" * 100)
+        converted_path = f.name
+
+    with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
+        convert.return_value = IOSuccess(converted_path)
+        result = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "audio.wav"))
+
+    assert isinstance(result, IOSuccess), result
+    assert convert.call_args.args[1] == NormalizationTarget.OPUS
+    assert captured["filename"] == "audio.ogg"
+    assert captured["content_type"] == "audio/ogg"
+
+    await svc.aclose()
+
+
 @pytest.mark.anyio
 async def test_submit_rejects_oversized_upload_before_sending():
     svc = _make_service(max_upload_bytes=8)
@@ -142,9 +238,10 @@ async def test_submit_rejects_oversized_upload_before_sending():
 async def test_get_task_result_returns_normalized_transcription():
     """Regression: the old code built the response twice and discarded normalization."""
     svc = _make_service()
-    svc.taskId_to_progressId["task-1"] = "progress-1"
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
 
     resp = MagicMock()
+    resp.status_code = 200
     resp.raise_for_status = MagicMock()
     resp.json.return_value = {
         "segments": [
@@ -163,7 +260,988 @@ async def test_get_task_result_returns_normalized_transcription():
     assert transcription.segments[0].speaker == "Bob"
     # Missing speaker defaults to "Unknown".
     assert transcription.segments[1].speaker == "Unknown"
-    # Completed result is evicted from the progress cache.
-    assert "task-1" not in svc.taskId_to_progressId
+    # Completed result is evicted from the task store.
+    assert "task-1" not in svc.task_store
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_forwards_mp3_without_ffmpeg():
+    svc = _make_service(streaming_transcode=True)
+    captured: dict = {}
+    svc.client.post = _capturing_stream_post(captured)
+
+    with patch("transcribo_backend.services.whisper_service.transcode_stream") as transcode:
+        result = await svc.transcribe_submit_task(
+            _make_upload(MP3_BYTES, "audio.mp3"), max_upload_bytes=svc.app_config.max_upload_bytes
+        )
+
+    assert isinstance(result, IOSuccess), result
+    transcode.assert_not_called()
+    assert captured["content_type"].startswith("multipart/form-data; boundary=")
+    # Form fields and the untouched MP3 payload are both in the streamed body.
+    assert b'name="model"' in captured["body"]
+    assert b'filename="audio.mp3"' in captured["body"]
+    assert MP3_BYTES in captured["body"]
+    assert svc.task_store.get("task-1").progress_id
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_pipes_non_mp3_through_ffmpeg():
+    svc = _make_service(streaming_transcode=True)
+    captured: dict = {}
+    svc.client.post = _capturing_stream_post(captured)
+
+    with (
+        patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode),
+        patch("transcribo_backend.services.whisper_service.normalize_audio") as convert,
+    ):
+        result = await svc.transcribe_submit_task(
+            _make_upload(NON_MP3_BYTES, "audio.wav"), max_upload_bytes=svc.app_config.max_upload_bytes
+        )
+
+    assert isinstance(result, IOSuccess), result
+    # No disk conversion: the transcoded stream went straight into the request.
+    convert.assert_not_called()
+    assert NON_MP3_BYTES.upper() in captured["body"]
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_small_upload_is_converted_and_forwarded_from_memory():
+    svc = _make_service(memory_spool_bytes=64 * 1024)
+    captured: dict = {}
+    svc.client.post = _capturing_stream_post(captured)
+
+    with (
+        patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode),
+        patch("transcribo_backend.services.whisper_service.tempfile.NamedTemporaryFile") as spool,
+    ):
+        first = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "audio.wav"))
+        second = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "audio.wav"))
+
+    assert isinstance(first, IOSuccess), first
+    spool.assert_not_called()
+    assert NON_MP3_BYTES.upper() in captured["body"]
+    # The hash is known before submitting, so the re-upload is deduplicated.
+    assert svc.client.post.await_count == 1
+    assert second.unwrap()._inner_value.task_id == "task-1"
+    assert svc.spool_stats().in_memory == 2
+    assert svc.spool_stats().on_disk == 0
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_upload_above_memory_threshold_and_mp4_are_spooled_to_disk():
+    svc = _make_service(memory_spool_bytes=1024)
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+    small_mp4 = b"\x00\x00\x00\x18ftypisom" + b"\x00" * 100
+
+    with patch("transcribo_backend.services.audio_converter.probe_streams", new_callable=AsyncMock) as probe:
+        probe.return_value = [{"codec_type": "audio", "codec_name": "aac"}]
+        await svc.transcribe_submit_task(_make_upload(MP3_BYTES, "audio.mp3"))
+        await svc.transcribe_submit_task(_make_upload(small_mp4, "audio.m4a"))
+
+    assert captured["is_file_handle"] is True
+    assert svc.spool_stats().in_memory == 0
+    assert svc.spool_stats().on_disk == 2
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_falls_back_to_disk_for_mp4_with_trailing_moov():
+    svc = _make_service(streaming_transcode=True)
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+    mp4_bytes = b"\x00\x00\x00\x18ftypisom" + b"\x00" * 12 + b"\x00\x00\x10\x00mdat" + b"\x00" * 4096
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
+        f.write(b"CONVERTED_MP3")
+        converted_path = f.name
+
+    with (
+        patch("transcribo_backend.services.whisper_service.transcode_stream") as transcode,
+        patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert,
+    ):
+        convert.return_value = IOSuccess(converted_path)
+        result = await svc.transcribe_submit_task(
+            _make_upload(mp4_bytes, "video.mp4"), max_upload_bytes=svc.app_config.max_upload_bytes
+        )
+
+    assert isinstance(result, IOSuccess), result
+    transcode.assert_not_called()
+    convert.assert_called_once()
+    assert captured["body"] == b"CONVERTED_MP3"
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_rejects_oversized_upload():
+    svc = _make_service(max_upload_bytes=1024, streaming_transcode=True)
+    svc.client.post = _capturing_stream_post({})
+
+    result = await svc.transcribe_submit_task(
+        _make_upload(MP3_BYTES + b"\x00" * (2 * 1024 * 1024), "audio.mp3"),
+        max_upload_bytes=svc.app_config.max_upload_bytes,
+    )
+
+    assert isinstance(result, IOFailure), result
+    error = result.failure()._inner_value
+    assert isinstance(error, HTTPException)
+    assert error.status_code == 413
+    assert "task-1" not in svc.task_store
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_deduplicates_before_piping():
+    svc = _make_service(streaming_transcode=True)
+    svc.client.post = _capturing_stream_post({})
+
+    with patch(
+        "transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode
+    ) as transcode:
+        first = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "a.wav"))
+        second = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "b.wav"))
+
+    assert second.unwrap()._inner_value.task_id == first.unwrap()._inner_value.task_id
+    # The re-upload is recognised by its hash before ffmpeg or Whisper see it.
+    assert transcode.call_count == 1
+    assert svc.client.post.await_count == 1
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_identical_uploads_arriving_during_a_submit_wait_for_its_task():
+    svc = _make_service()
+    post = _capturing_post({})
+
+    async def _slow_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await post(*args, **kwargs)
+
+    svc.client.post = AsyncMock(side_effect=_slow_post)
+
+    results = await asyncio.gather(
+        *(svc.transcribe_submit_task(_make_upload(MP3_BYTES, f"{index}.mp3")) for index in range(3))
+    )
+
+    assert {result.unwrap()._inner_value.task_id for result in results} == {"task-1"}
+    assert svc.client.post.await_count == 1
+    assert svc.dedup_index.stats().hits == 2
+
+    await svc.aclose()
+
+
+def _result_response() -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.raise_for_status = MagicMock()
+    resp.json.return_value = {"segments": [{"start": 0.0, "end": 1.0, "text": "hallo", "speaker": "anna"}]}
+    return resp
+
+
+@pytest.mark.anyio
+async def test_identical_upload_reuses_pending_task():
+    svc = _make_service()
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    first = await svc.transcribe_submit_task(_make_upload(MP3_BYTES, "a.mp3"), diarization_speaker_count=2)
+    second = await svc.transcribe_submit_task(_make_upload(MP3_BYTES, "b.mp3"), diarization_speaker_count=2)
+
+    assert isinstance(first, IOSuccess), first
+    assert isinstance(second, IOSuccess), second
+    assert second.unwrap()._inner_value.task_id == first.unwrap()._inner_value.task_id
+    # Only the first upload reached Whisper.
+    assert svc.client.post.await_count == 1
+    stats = svc.dedup_index.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_upload_with_different_parameters_is_not_deduplicated():
+    svc = _make_service()
+    svc.client.post = _capturing_post({})
+
+    await svc.transcribe_submit_task(_make_upload(MP3_BYTES), diarization_speaker_count=2)
+    await svc.transcribe_submit_task(_make_upload(MP3_BYTES), diarization_speaker_count=3)
+    await svc.transcribe_submit_task(_make_upload(MP3_BYTES), diarization_speaker_count=2, language="de")
+
+    assert svc.client.post.await_count == 3
+    assert svc.dedup_index.stats().hits == 0
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_duplicate_of_fetched_task_is_served_from_cached_result():
+    svc = _make_service()
+    svc.client.post = _capturing_post({})
+    first = await svc.transcribe_submit_task(_make_upload(MP3_BYTES))
+    task_id = first.unwrap()._inner_value.task_id
+    svc.client.get = cast(Any, AsyncMock(return_value=_result_response()))
+    await svc.transcribe_get_task_result(task_id)
+
+    duplicate = await svc.transcribe_submit_task(_make_upload(MP3_BYTES))
+    status = await svc.transcribe_get_task_status(task_id)
+    result = await svc.transcribe_get_task_result(task_id)
+
+    assert duplicate.unwrap()._inner_value.status == "completed"
+    assert status.unwrap()._inner_value.status == "completed"
+    assert result.unwrap()._inner_value.segments[0].speaker == "Anna"
+    # Neither the duplicate nor the second status/result call went upstream.
+    assert svc.client.post.await_count == 1
+    assert svc.client.get.await_count == 1
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_failed_task_is_not_reused_for_duplicates():
+    svc = _make_service()
+    svc.client.post = _capturing_post({})
+    await svc.transcribe_submit_task(_make_upload(MP3_BYTES))
+
+    not_found = MagicMock()
+    not_found.status_code = 404
+    svc.client.get = cast(Any, AsyncMock(return_value=not_found))
+    status = await svc.transcribe_get_task_status("task-1")
+    assert status.unwrap()._inner_value.status == "failed"
+
+    await svc.transcribe_submit_task(_make_upload(MP3_BYTES))
+
+    assert svc.client.post.await_count == 2
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_submit_rejects_with_429_when_conversion_queue_is_full():
+    svc = _make_service()
+    svc.client.post = _capturing_post({})
+    svc.conversion_scheduler = ConversionScheduler(slots=1, max_queue=0)
+
+    async with svc.conversion_scheduler.slot():
+        with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
+            result = await svc.transcribe_submit_task(_make_upload(NON_MP3_BYTES, "audio.wav"))
+
+    assert isinstance(result, IOFailure), result
+    error = result.failure()._inner_value
+    assert isinstance(error, HTTPException)
+    assert error.status_code == 429
+    assert error.headers is not None
+    assert int(error.headers["Retry-After"]) >= 1
+    convert.assert_not_called()
+    svc.client.post.assert_not_called()
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_submit_passes_through_ogg_with_its_own_format():
+    svc = _make_service()
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
+        result = await svc.transcribe_submit_task(_make_upload(OGG_BYTES, "voice.ogg"))
+
+    assert isinstance(result, IOSuccess), result
+    convert.assert_not_called()
+    assert captured["filename"] == "audio.ogg"
+    assert captured["body"] == OGG_BYTES
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_submit_reencodes_formats_missing_from_passthrough_list():
+    svc = _make_service()
+    svc.app_config.passthrough_formats = [AudioContainer.MP3]
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
+        f.write(b"CONVERTED_MP3")
+        converted_path = f.name
+
+    with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
+        convert.return_value = IOSuccess(converted_path)
+        result = await svc.transcribe_submit_task(_make_upload(OGG_BYTES, "voice.ogg"))
+
+    assert isinstance(result, IOSuccess), result
+    convert.assert_called_once()
+    assert captured["filename"] == "audio.mp3"
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_submit_remuxes_video_audio_track_instead_of_reencoding():
+    svc = _make_service()
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".m4a") as f:
+        f.write(b"\x00\x00\x00\x18ftypM4A " + b"\x00" * 64)
+        extracted_path = f.name
+
+    with (
+        patch(
+            "transcribo_backend.services.whisper_service.plan_conversion",
+            new_callable=AsyncMock,
+            return_value=ConversionPlan(ConversionAction.REMUX, AudioContainer.MP4, "aac"),
+        ),
+        patch("transcribo_backend.services.whisper_service.extract_audio", new_callable=AsyncMock) as extract,
+        patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert,
+    ):
+        extract.return_value = IOSuccess(extracted_path)
+        result = await svc.transcribe_submit_task(_make_upload(b"\x00\x00\x00\x18ftypisom" + b"\x00" * 64))
+
+    assert isinstance(result, IOSuccess), result
+    convert.assert_not_called()
+    assert extract.call_args.args[1] == "aac"
+    assert (captured["filename"], captured["body"][4:8]) == ("audio.m4a", b"ftyp")
+    assert not os.path.exists(extracted_path)
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streaming_submit_forwards_passthrough_ogg_without_ffmpeg():
+    svc = _make_service(streaming_transcode=True)
+    captured: dict = {}
+    svc.client.post = _capturing_stream_post(captured)
+
+    with patch("transcribo_backend.services.whisper_service.transcode_stream") as transcode:
+        result = await svc.transcribe_submit_task(_make_upload(OGG_BYTES, "voice.ogg"))
+
+    assert isinstance(result, IOSuccess), result
+    transcode.assert_not_called()
+    assert b'filename="audio.ogg"' in captured["body"]
+    assert b"Content-Type: audio/ogg" in captured["body"]
+
+    await svc.aclose()
+
+
+def _chunk_file(created: list[str] | None = None) -> IOSuccess:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as f:
+        f.write(b"CHUNK_MP3")
+    if created is not None:
+        created.append(f.name)
+    return IOSuccess(f.name)
+
+
+def _counting_post():
+    """Return an AsyncMock post that hands out task-1, task-2, ... per submitted chunk."""
+    posted: list[dict] = []
+
+    async def _post(url, data=None, files=None):
+        posted.append(data)
+        resp = MagicMock()
+        resp.json.return_value = {"task_id": f"task-{len(posted)}", "status": "in_progress"}
+        resp.raise_for_status = MagicMock()
+        return resp
+
+    return AsyncMock(side_effect=_post), posted
+
+
+@pytest.mark.anyio
+async def test_chunked_submit_splits_long_recording_into_concurrent_tasks():
+    svc = _make_service()
+    svc.client.post, posted = _counting_post()
+    created: list[str] = []
+
+    with (
+        patch(
+            "transcribo_backend.services.whisper_service.probe_duration", new_callable=AsyncMock, return_value=1500.0
+        ),
+        patch(
+            "transcribo_backend.services.whisper_service.detect_silences",
+            new_callable=AsyncMock,
+            # A pause 5s after every ideal cut (the search window starts 30s before it).
+            side_effect=lambda _path, start, _length: [(start + 34.0, start + 37.0)],
+        ),
+        patch("transcribo_backend.services.whisper_service.cut_audio", new_callable=AsyncMock) as cut,
+    ):
+        cut.side_effect = lambda *_: _chunk_file(created)
+        result = await svc.transcribe_submit_task(_make_upload(MP3_BYTES), chunked=True)
+
+    assert isinstance(result, IOSuccess), result
+    status = result.unwrap()._inner_value
+    assert len(posted) == 3
+    # Every chunk has its own progress id, and the parent id hides the chunk tasks.
+    assert len({data["progress_id"] for data in posted}) == 3
+    assert svc.task_store.get(status.task_id).chunked.child_task_ids == ["task-1", "task-2", "task-3"]
+    # The first cut moved to the middle of the pause; every chunk but the last carries the overlap.
+    starts_and_lengths = sorted(call.args[1:3] for call in cut.await_args_list)
+    assert starts_and_lengths[1] == (505.5, 1005.5 - 505.5 + 4)
+    # The chunk files are removed once they are uploaded.
+    assert len(created) == 3
+    assert not any(os.path.exists(path) for path in created)
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_chunked_submit_of_more_chunks_than_the_conversion_queue_holds_is_not_rejected():
+    svc = _make_service()
+    scheduler = svc.conversion_scheduler
+    svc.client.post, posted = _counting_post()
+    running = 0
+    peak = 0
+
+    async def _ffmpeg() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running, scheduler.stats().running + scheduler.stats().queued)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    async def _detect_silences(*_):
+        await _ffmpeg()
+        return []
+
+    async def _cut_audio(*_):
+        await _ffmpeg()
+        return _chunk_file()
+
+    # Seven hours at ten minutes per chunk: far more chunks than slots plus queue.
+    duration = 7 * 60 * 60.0
+    assert duration / 600 > scheduler.slots + scheduler.max_queue
+    with (
+        patch(
+            "transcribo_backend.services.whisper_service.probe_duration", new_callable=AsyncMock, return_value=duration
+        ),
+        patch("transcribo_backend.services.whisper_service.detect_silences", side_effect=_detect_silences),
+        patch("transcribo_backend.services.whisper_service.cut_audio", side_effect=_cut_audio),
+    ):
+        result = await svc.transcribe_submit_task(_make_upload(MP3_BYTES), chunked=True)
+
+    assert isinstance(result, IOSuccess), result
+    assert len(posted) == 42
+    # The recording kept to its share of ffmpeg slots and never queued behind them.
+    assert peak == scheduler.slots
+    assert scheduler.stats().rejected == 0
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_chunked_submit_of_short_recording_uses_a_single_task():
+    svc = _make_service()
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+
+    with (
+        patch("transcribo_backend.services.whisper_service.probe_duration", new_callable=AsyncMock, return_value=60.0),
+        patch("transcribo_backend.services.whisper_service.cut_audio", new_callable=AsyncMock) as cut,
+    ):
+        result = await svc.transcribe_submit_task(_make_upload(MP3_BYTES), chunked=True)
+
+    assert isinstance(result, IOSuccess), result
+    assert result.unwrap()._inner_value.task_id == "task-1"
+    cut.assert_not_called()
+    assert svc.task_store.get("task-1").chunked is None
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_chunked_task_status_and_result_cover_all_chunks():
+    svc = _make_service()
+    svc.client.post, _ = _counting_post()
+    with (
+        patch(
+            "transcribo_backend.services.whisper_service.probe_duration", new_callable=AsyncMock, return_value=1200.0
+        ),
+        patch("transcribo_backend.services.whisper_service.detect_silences", new_callable=AsyncMock, return_value=[]),
+        patch("transcribo_backend.services.whisper_service.cut_audio", new_callable=AsyncMock) as cut,
+    ):
+        cut.side_effect = lambda *_: _chunk_file()
+        submitted = await svc.transcribe_submit_task(_make_upload(MP3_BYTES), chunked=True)
+    parent_id = submitted.unwrap()._inner_value.task_id
+
+    async def _get(url):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.raise_for_status = MagicMock()
+        if "/status" in url:
+            resp.json.return_value = {"task_id": url.rsplit("=", 1)[1], "status": "completed"}
+        elif "/progress/" in url:
+            resp.json.return_value = {"progress": 1.0, "currentTime": 0.0, "duration": 0.0}
+        else:
+            resp.json.return_value = {
+                "segments": [{"start": 10.0, "end": 12.0, "text": url[-6:], "speaker": "SPEAKER_00"}]
+            }
+        return resp
+
+    svc.client.get = cast(Any, AsyncMock(side_effect=_get))
+    status = await svc.transcribe_get_task_status(parent_id)
+    result = await svc.transcribe_get_task_result(parent_id)
+
+    assert status.unwrap()._inner_value.status == "completed"
+    assert status.unwrap()._inner_value.progress == 1.0
+    segments = result.unwrap()._inner_value.segments
+    assert [(s.start, s.text, s.speaker) for s in segments] == [
+        (10.0, "task-1", "Speaker_00"),
+        (610.0, "task-2", "Speaker_00"),
+    ]
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_assembled_upload_uses_its_early_mp3_and_keeps_the_source():
+    svc = _make_service()
+    captured: dict = {}
+    svc.client.post = _capturing_post(captured)
+    with tempfile.NamedTemporaryFile(delete=False) as source, tempfile.NamedTemporaryFile(delete=False) as mp3:
+        source.write(NON_MP3_BYTES)
+        mp3.write(b"EARLY_MP3")
+
+    with patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert:
+        result = await svc.transcribe_submit_task(
+            AssembledUpload(path=source.name, content_hash="abc", converted_path=mp3.name)
+        )
+
+    assert isinstance(result, IOSuccess), result
+    convert.assert_not_called()
+    assert (captured["filename"], captured["body"]) == ("audio.mp3", b"EARLY_MP3")
+    # Both files belong to the upload session, which removes them itself.
+    assert os.path.exists(source.name)
+    assert os.path.exists(mp3.name)
+    os.unlink(source.name)
+    os.unlink(mp3.name)
+
+    await svc.aclose()
+
+
+def _wav_bytes(seconds: float, rate: int = 8000) -> bytes:
+    buf = BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buf.getvalue()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("memory_spool_bytes", [0, 1024 * 1024])
+async def test_duration_is_recorded_at_submit_and_reported_with_the_status(memory_spool_bytes: int):
+    svc = _make_service(memory_spool_bytes=memory_spool_bytes)
+    svc.client.post = _capturing_post({}) if not memory_spool_bytes else _capturing_stream_post({})
+
+    async def _get(url):
+        resp = MagicMock()
+        resp.status_code = 200
+        if "/status" in url:
+            resp.json.return_value = {"task_id": "task-1", "status": "in_progress"}
+        else:
+            resp.json.return_value = {"progress": 0.5, "currentTime": 1.0, "duration": 2.0}
+        return resp
+
+    svc.client.get = cast(Any, AsyncMock(side_effect=_get))
+
+    with (
+        patch("transcribo_backend.services.whisper_service.normalize_audio", new_callable=AsyncMock) as convert,
+        patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode),
+    ):
+        convert.return_value = _chunk_file()
+        submitted = await svc.transcribe_submit_task(_make_upload(_wav_bytes(2.5), "audio.wav"))
+    status = await svc.transcribe_get_task_status("task-1")
+
+    assert submitted.unwrap()._inner_value.duration == pytest.approx(2.5)
+    assert status.unwrap()._inner_value.duration == pytest.approx(2.5)
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_estimate_reads_the_duration_from_the_headers():
+    svc = _make_service()
+
+    with patch("transcribo_backend.services.whisper_service.probe_duration", new_callable=AsyncMock) as probe:
+        result = await svc.transcribe_estimate(_make_upload(_wav_bytes(90.0), "audio.wav"))
+
+    estimate = result.unwrap()._inner_value
+    probe.assert_not_called()
+    assert estimate.container == AudioContainer.WAV
+    assert estimate.duration == pytest.approx(90.0)
+    assert estimate.audio_minutes == 1.5
+    assert estimate.estimated_processing_seconds == 18.0
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_estimate_falls_back_to_probing_a_spooled_copy():
+    svc = _make_service()
+    probed: list[bytes] = []
+
+    async def _probe(path):
+        with open(path, "rb") as fh:
+            probed.append(fh.read())
+        return 30.0
+
+    with patch("transcribo_backend.services.whisper_service.probe_duration", side_effect=_probe):
+        result = await svc.transcribe_estimate(_make_upload(b"\x1a\x45\xdf\xa3" + b"\x00" * 100, "video.webm"))
+
+    assert probed == [b"\x1a\x45\xdf\xa3" + b"\x00" * 100]
+    assert result.unwrap()._inner_value.duration == 30.0
+
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_status_of_a_task_submitted_by_another_worker(tmp_path):
+    store_path = str(tmp_path / "tasks.sqlite3")
+    submitting = _make_service(memory_spool_bytes=1024 * 1024, task_store_path=store_path)
+    polling = _make_service(task_store_path=store_path)
+    submitting.client.post = _capturing_stream_post({})
+
+    with patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode):
+        await submitting.transcribe_submit_task(_make_upload(_wav_bytes(2.5), "audio.wav"), language="de")
+    record = submitting.task_store.get("task-1")
+
+    async def _get(url):
+        resp = MagicMock()
+        resp.status_code = 200
+        if "/status" in url:
+            resp.json.return_value = {"task_id": "task-1", "status": "in_progress"}
+        else:
+            assert url.endswith(f"/progress/{record.progress_id}")
+            resp.json.return_value = {"progress": 0.5, "currentTime": 1.0, "duration": 2.0}
+        return resp
+
+    polling.client.get = cast(Any, AsyncMock(side_effect=_get))
+    status = await polling.transcribe_get_task_status("task-1")
+
+    assert isinstance(status, IOSuccess), status
+    assert status.unwrap()._inner_value.duration == pytest.approx(2.5)
+    assert record.params["language"] == "de"
+    assert record.content_hash == hashlib.sha256(_wav_bytes(2.5)).hexdigest()
+
+    await submitting.aclose()
+    await polling.aclose()
+
+
+@pytest.mark.anyio
+async def test_status_and_progress_are_requested_concurrently():
+    svc = _make_service()
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    in_flight: list[str] = []
+    both_sent = asyncio.Event()
+
+    async def _get(url):
+        in_flight.append(url)
+        if len(in_flight) == 2:
+            both_sent.set()
+        # Neither request finishes before the other one was sent.
+        await asyncio.wait_for(both_sent.wait(), timeout=1)
+        resp = MagicMock()
+        resp.status_code = 200
+        if "/status" in url:
+            resp.json.return_value = {"task_id": "task-1", "status": "in_progress"}
+        else:
+            resp.json.return_value = {"progress": 0.25, "currentTime": 1.0, "duration": 4.0}
+        return resp
+
+    svc.client.get = cast(Any, AsyncMock(side_effect=_get))
+    result = await svc.transcribe_get_task_status("task-1")
+
+    assert isinstance(result, IOSuccess), result
+    assert result.unwrap()._inner_value.progress == 0.25
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_watch_task_streams_progress_and_ends_with_the_normalized_result():
+    svc = _make_service()
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    polls = 0
+
+    async def _get(url):
+        nonlocal polls
+        resp = MagicMock()
+        resp.status_code = 200
+        if "/status" in url:
+            polls += 1
+            status = "completed" if polls >= 3 else "in_progress"
+            resp.json.return_value = {"task_id": "task-1", "status": status}
+        elif "/progress/" in url:
+            resp.json.return_value = {"progress": min(1.0, polls / 3), "currentTime": 1.0, "duration": 4.0}
+        else:
+            resp.json.return_value = {"segments": [{"start": 0.0, "end": 1.0, "text": " Straße ", "speaker": "bob"}]}
+        return resp
+
+    svc.client.get = cast(Any, AsyncMock(side_effect=_get))
+    events = [event async for event in svc.watch_task("task-1")]
+
+    assert [event.type for event in events] == ["status", "status", "status", "result"]
+    assert events[-1].result.segments[0].text == "Strasse"
+    assert svc.task_events.active_tasks == 0
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_batch_status_bounds_concurrency_and_reports_failures_per_task():
+    svc = _make_service()
+    for index in range(10):
+        svc.task_store.put(TaskRecord(task_id=f"task-{index}", progress_id=f"progress-{index}"))
+    in_flight = 0
+    peak = 0
+
+    async def _get(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        resp = MagicMock()
+        resp.status_code = 200
+        if "/status" in url:
+            task_id = url.split("task_id=")[1]
+            resp.json.return_value = {"task_id": task_id, "status": "in_progress"}
+        else:
+            resp.json.return_value = {"progress": 0.5, "currentTime": 1.0, "duration": 2.0}
+        return resp
+
+    svc.client.get = cast(Any, AsyncMock(side_effect=_get))
+    task_ids = [f"task-{index}" for index in range(10)] + ["task-0", "unknown"]
+    statuses = await svc.transcribe_get_task_statuses(task_ids)
+
+    assert set(statuses) == {f"task-{index}" for index in range(10)} | {"unknown"}
+    assert all(statuses[f"task-{index}"].progress == 0.5 for index in range(10))
+    assert isinstance(statuses["unknown"], HTTPException)
+    # 4 tasks at a time (cfg.batch_status_concurrency), each with a status and a progress request.
+    assert peak <= 8
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_fetched_result_is_kept_compressed_for_repeated_fetches():
+    svc = _make_service()
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    svc.client.get = cast(Any, AsyncMock(return_value=_result_response()))
+
+    assert svc.cached_task_result("task-1") is None
+    first = await svc.transcribe_get_task_result("task-1")
+    cached = svc.cached_task_result("task-1")
+
+    assert cached is not None
+    assert TranscriptionResponse.model_validate_json(gzip.decompress(cached)) == first.unwrap()._inner_value
+    assert svc.client.get.await_count == 1
+    await svc.aclose()
+
+
+def _streaming_result_client(svc: WhisperService, body: bytes, status_code: int = 200) -> list[str]:
+    """Serve ``body`` in small pieces for result requests; returns the requested URLs."""
+    requested: list[str] = []
+
+    async def _pieces():
+        for start in range(0, len(body), 5):
+            yield body[start : start + 5]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(status_code, content=_pieces())
+
+    svc.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    return requested
+
+
+@pytest.mark.anyio
+async def test_streamed_result_is_cleaned_segment_by_segment_and_cached():
+    svc = _make_service()
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    segments = [{"start": float(i), "end": i + 1.0, "text": f"  Straße {i} ", "speaker": "anna"} for i in range(300)]
+    requested = _streaming_result_client(svc, json.dumps({"segments": segments}, ensure_ascii=False).encode())
+
+    result = await svc.transcribe_stream_task_result("task-1")
+    assert isinstance(result, IOSuccess), result
+    body = b"".join([chunk async for chunk in result.unwrap()._inner_value])
+
+    transcription = TranscriptionResponse.model_validate_json(body)
+    assert len(transcription.segments) == 300
+    assert transcription.segments[7].text == "Strasse 7"
+    assert transcription.segments[7].speaker == "Anna"
+    assert svc.result_cache.get("task-1") == transcription
+    assert "task-1" not in svc.task_store
+    # A second fetch is served from the cache.
+    again = await svc.transcribe_stream_task_result("task-1")
+    assert b"".join([chunk async for chunk in again.unwrap()._inner_value]) == body
+    assert len(requested) == 1
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_streamed_result_raises_upstream_errors_before_streaming():
+    svc = _make_service()
+    _streaming_result_client(svc, b'{"detail": "not found"}', status_code=404)
+
+    result = await svc.transcribe_stream_task_result("task-1")
+
+    assert not isinstance(result, IOSuccess)
+    assert isinstance(result.failure()._inner_value, httpx.HTTPStatusError)
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_export_renders_the_cleaned_result_and_caches_it():
+    svc = _make_service()
+    svc.task_store.put(TaskRecord(task_id="task-1", progress_id="progress-1"))
+    segments = [{"start": 0.0, "end": 1.5, "text": " Grüss Gott, Straße ", "speaker": "anna"}]
+    requested = _streaming_result_client(svc, json.dumps({"segments": segments}, ensure_ascii=False).encode())
+
+    result = await svc.transcribe_export_task_result("task-1", ExportFormat.SRT)
+    assert isinstance(result, IOSuccess), result
+    body = b"".join([chunk async for chunk in result.unwrap()._inner_value])
+
+    assert body.decode() == "1\n00:00:00,000 --> 00:00:01,500\nAnna: Grüss Gott, Strasse\n\n"
+    assert svc.result_cache.get("task-1") is not None
+    # Another format of the same task is rendered from the cache.
+    again = await svc.transcribe_export_task_result("task-1", ExportFormat.TXT)
+    assert b"".join([chunk async for chunk in again.unwrap()._inner_value]).startswith(b"Anna [00:00:00]\n")
+    assert len(requested) == 1
+    await svc.aclose()
+
+
+class _WhisperStub:
+    """A Whisper API on one host that accepts submits and only knows its own tasks."""
+
+    def __init__(self, host: str, down: bool = False) -> None:
+        self.host = host
+        self.down = down
+        self.tasks: dict[str, str] = {}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.down:
+            raise httpx.ConnectError(self.host, request=request)
+        path = request.url.path
+        if path.endswith("/submit"):
+            await request.aread()
+            task_id = f"{self.host}-{len(self.tasks) + 1}"
+            self.tasks[task_id] = "in_progress"
+            return httpx.Response(200, json={"task_id": task_id, "status": "in_progress"})
+        if path.startswith("/progress/"):
+            return httpx.Response(200, json={"progress": 0.5, "currentTime": 1.0, "duration": 2.0})
+        task_id = request.url.params["task_id"]
+        if task_id not in self.tasks:
+            return httpx.Response(404, json={"detail": "Task not found"})
+        if path.endswith("/cancel"):
+            self.tasks[task_id] = "cancelled"
+        return httpx.Response(200, json={"task_id": task_id, "status": self.tasks[task_id]})
+
+
+def _whisper_stubs(svc: WhisperService, *stubs: _WhisperStub) -> None:
+    by_host = {stub.host: stub for stub in stubs}
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        return await by_host[request.url.host].handle(request)
+
+    svc.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+
+async def _submit_wav(svc: WhisperService, seconds: float) -> str:
+    upload = _make_upload(_wav_bytes(seconds, rate=100), "audio.wav")
+    with patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode):
+        result = await svc.transcribe_submit_task(upload)
+    assert isinstance(result, IOSuccess), result
+    return result.unwrap()._inner_value.task_id
+
+
+@pytest.mark.anyio
+async def test_submits_go_to_the_backend_with_the_least_outstanding_audio_and_skip_a_dead_one():
+    svc = _make_service(memory_spool_bytes=1024 * 1024, whisper_backend_urls=["http://gpu-2", "http://gpu-3"])
+    gpu_1, gpu_2, gpu_3 = _WhisperStub("whisper.test"), _WhisperStub("gpu-2"), _WhisperStub("gpu-3", down=True)
+    _whisper_stubs(svc, gpu_1, gpu_2, gpu_3)
+
+    # One long recording keeps the first backend busy while the short ones pile up on gpu-2; gpu-3 refuses
+    # every submit it gets, which then goes on to gpu-2, until three failures in a row open its circuit.
+    task_ids = [await _submit_wav(svc, seconds) for seconds in (600, 60, 120, 180, 240)]
+
+    assert list(gpu_1.tasks) == task_ids[:1]
+    assert list(gpu_2.tasks) == task_ids[1:]
+    assert gpu_3.tasks == {}
+    loads = {backend.url: backend for backend in svc.backends.stats()}
+    assert loads["http://whisper.test"].outstanding_seconds == loads["http://gpu-2"].outstanding_seconds == 600
+    assert not loads["http://gpu-3"].healthy
+    assert loads["http://gpu-3"].failures == 3
+    assert loads["http://gpu-3"].circuit == "open"
+
+    # Every task is looked up on the backend that owns it (the others would answer 404).
+    statuses = await svc.transcribe_get_task_statuses(task_ids)
+    assert all(status.status == "in_progress" for status in statuses.values())
+
+    # Once its task is done its audio no longer counts, so the next submit goes there.
+    gpu_1.tasks[task_ids[0]] = "completed"
+    await svc.transcribe_get_task_status(task_ids[0])
+    assert await _submit_wav(svc, 30) == "whisper.test-2"
+
+    # Cancelling reaches the owning backend and frees its share.
+    cancelled = await svc.transcribe_cancel_task(task_ids[4])
+    assert cancelled.unwrap()._inner_value.status == "cancelled"
+    assert gpu_2.tasks[task_ids[4]] == "cancelled"
+    assert {backend.url: backend.outstanding_seconds for backend in svc.backends.stats()}["http://gpu-2"] == 360
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_a_task_shared_by_deduplicated_uploads_is_only_cancelled_by_its_last_holder():
+    svc = _make_service(memory_spool_bytes=1024 * 1024)
+    whisper = _WhisperStub("whisper.test")
+    _whisper_stubs(svc, whisper)
+
+    task_id = await _submit_wav(svc, 60)
+    assert await _submit_wav(svc, 60) == task_id
+
+    # The other client still waits for the transcription.
+    first = await svc.transcribe_cancel_task(task_id)
+    assert first.unwrap()._inner_value.status == "in_progress"
+    assert whisper.tasks[task_id] == "in_progress"
+    # So later uploads of the same bytes are still deduplicated onto it.
+    assert await _submit_wav(svc, 60) == task_id
+    await svc.transcribe_cancel_task(task_id)
+
+    last = await svc.transcribe_cancel_task(task_id)
+    assert last.unwrap()._inner_value.status == "cancelled"
+    assert whisper.tasks[task_id] == "cancelled"
+    # Once retried, the task takes identical uploads again.
+    await svc.transcribe_retry_task(task_id)
+    assert await _submit_wav(svc, 60) == task_id
+    assert len(whisper.tasks) == 1
+    await svc.aclose()
+
+
+@pytest.mark.anyio
+async def test_a_streamed_submit_does_not_fail_over():
+    svc = _make_service(streaming_transcode=True, whisper_backend_urls=["http://gpu-2"])
+    gpu_1, gpu_2 = _WhisperStub("whisper.test", down=True), _WhisperStub("gpu-2")
+    _whisper_stubs(svc, gpu_1, gpu_2)
+    upload = _make_upload(_wav_bytes(10, rate=100), "audio.wav")
+    svc.backends.primary.breaker.failure_threshold = 1
+
+    with patch("transcribo_backend.services.whisper_service.transcode_stream", side_effect=_fake_transcode):
+        failed = await svc.transcribe_submit_task(upload)
+        assert isinstance(failed, IOFailure)
+        # The failure opened the circuit of the backend, so the next upload skips it.
+        retried = await svc.transcribe_submit_task(upload)
 
+    assert retried.unwrap()._inner_value.task_id == "gpu-2-1"
+    assert gpu_1.tasks == {}
     await svc.aclose()